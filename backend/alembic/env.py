@@ -26,6 +26,9 @@ from infrastructure.database.models import telegram_notification_settings_model
 from infrastructure.database.models import telegram_link_token_model  # noqa: F401
 from infrastructure.database.models import llm_call_model  # noqa: F401
 from infrastructure.database.models import user_automation_settings_model  # noqa: F401
+from infrastructure.database.models import vacancy_detail_cache_model  # noqa: F401
+from infrastructure.database.models import resume_processing_lease_model  # noqa: F401
+from infrastructure.database.models import llm_response_cache_model  # noqa: F401
 
 target_metadata = Base.metadata
 
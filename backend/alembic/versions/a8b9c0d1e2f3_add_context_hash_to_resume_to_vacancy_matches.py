@@ -0,0 +1,49 @@
+"""add_context_hash_to_resume_to_vacancy_matches
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8b9c0d1e2f3'
+down_revision: Union[str, Sequence[str], None] = 'f7a8b9c0d1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Мэтчи кешируются по содержимому резюме: старые строки без context_hash
+    # больше не находятся и остаются только как история
+    op.add_column(
+        'resume_to_vacancy_matches',
+        sa.Column('context_hash', sa.String(length=64), nullable=True, comment='Hash резюме, требований пользователя, модели и версии промпта'),
+    )
+    op.drop_index('ix_resume_to_vacancy_matches_resume_vacancy', table_name='resume_to_vacancy_matches')
+    op.create_index('ix_resume_to_vacancy_matches_resume_vacancy', 'resume_to_vacancy_matches', ['resume_id', 'vacancy_hash'], unique=False)
+    op.create_index('ix_resume_to_vacancy_matches_context_vacancy', 'resume_to_vacancy_matches', ['context_hash', 'vacancy_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_to_vacancy_matches_context_vacancy', table_name='resume_to_vacancy_matches')
+    op.drop_index('ix_resume_to_vacancy_matches_resume_vacancy', table_name='resume_to_vacancy_matches')
+    # Для уникального индекса по резюме оставляем по одной (последней вставленной) строке на пару
+    op.execute(
+        """
+        DELETE FROM resume_to_vacancy_matches a
+        USING resume_to_vacancy_matches b
+        WHERE a.resume_id = b.resume_id
+          AND a.vacancy_hash = b.vacancy_hash
+          AND a.ctid < b.ctid
+        """
+    )
+    op.create_index('ix_resume_to_vacancy_matches_resume_vacancy', 'resume_to_vacancy_matches', ['resume_id', 'vacancy_hash'], unique=True)
+    op.drop_column('resume_to_vacancy_matches', 'context_hash')
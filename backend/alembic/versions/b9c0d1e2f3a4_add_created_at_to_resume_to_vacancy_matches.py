@@ -0,0 +1,36 @@
+"""add_created_at_to_resume_to_vacancy_matches
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9c0d1e2f3a4'
+down_revision: Union[str, Sequence[str], None] = 'a8b9c0d1e2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # На пару (resume_id, vacancy_hash) бывает несколько мэтчей: выбираем последний
+    op.add_column(
+        'resume_to_vacancy_matches',
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    op.drop_index('ix_resume_to_vacancy_matches_resume_vacancy', table_name='resume_to_vacancy_matches')
+    op.create_index('ix_resume_to_vacancy_matches_resume_vacancy', 'resume_to_vacancy_matches', ['resume_id', 'vacancy_hash', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_to_vacancy_matches_resume_vacancy', table_name='resume_to_vacancy_matches')
+    op.create_index('ix_resume_to_vacancy_matches_resume_vacancy', 'resume_to_vacancy_matches', ['resume_id', 'vacancy_hash'], unique=False)
+    op.drop_column('resume_to_vacancy_matches', 'created_at')
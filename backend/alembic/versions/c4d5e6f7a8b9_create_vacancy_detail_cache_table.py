@@ -0,0 +1,37 @@
+"""create_vacancy_detail_cache_table
+
+Revision ID: c4d5e6f7a8b9
+Revises: 751385366dc9
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d5e6f7a8b9'
+down_revision: Union[str, Sequence[str], None] = '751385366dc9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'vacancy_detail_cache',
+        sa.Column('vacancy_id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Сериализованная сущность VacancyDetail'),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('vacancy_id'),
+    )
+    op.create_index(op.f('ix_vacancy_detail_cache_fetched_at'), 'vacancy_detail_cache', ['fetched_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_vacancy_detail_cache_fetched_at'), table_name='vacancy_detail_cache')
+    op.drop_table('vacancy_detail_cache')
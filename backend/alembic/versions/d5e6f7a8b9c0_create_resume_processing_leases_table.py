@@ -0,0 +1,39 @@
+"""create_resume_processing_leases_table
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e6f7a8b9c0'
+down_revision: Union[str, Sequence[str], None] = 'c4d5e6f7a8b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'resume_processing_leases',
+        sa.Column('resume_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('owner', sa.String(length=255), nullable=False, comment='Идентификатор процесса воркера (host:pid:uuid)'),
+        sa.Column('leased_until', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('resume_id'),
+    )
+    op.create_index(op.f('ix_resume_processing_leases_leased_until'), 'resume_processing_leases', ['leased_until'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_resume_processing_leases_leased_until'), table_name='resume_processing_leases')
+    op.drop_table('resume_processing_leases')
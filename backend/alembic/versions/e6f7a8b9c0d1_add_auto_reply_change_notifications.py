@@ -0,0 +1,60 @@
+"""add_auto_reply_change_notifications
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f7a8b9c0d1'
+down_revision: Union[str, Sequence[str], None] = 'd5e6f7a8b9c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Воркер автооткликов слушает канал auto_reply_changes (payload — id резюме)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_auto_reply_change() RETURNS trigger AS $$
+        DECLARE
+            changed_resume_id uuid;
+        BEGIN
+            IF TG_TABLE_NAME = 'resumes' THEN
+                changed_resume_id := CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END;
+            ELSE
+                changed_resume_id := CASE WHEN TG_OP = 'DELETE' THEN OLD.resume_id ELSE NEW.resume_id END;
+            END IF;
+            PERFORM pg_notify('auto_reply_changes', changed_resume_id::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER resumes_auto_reply_notify
+        AFTER INSERT OR DELETE OR UPDATE OF is_auto_reply ON resumes
+        FOR EACH ROW EXECUTE FUNCTION notify_auto_reply_change();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER resume_filter_settings_auto_reply_notify
+        AFTER INSERT OR UPDATE OR DELETE ON resume_filter_settings
+        FOR EACH ROW EXECUTE FUNCTION notify_auto_reply_change();
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS resume_filter_settings_auto_reply_notify ON resume_filter_settings")
+    op.execute("DROP TRIGGER IF EXISTS resumes_auto_reply_notify ON resumes")
+    op.execute("DROP FUNCTION IF EXISTS notify_auto_reply_change()")
@@ -0,0 +1,40 @@
+"""create_llm_response_cache_table
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a8b9c0d1e2'
+down_revision: Union[str, Sequence[str], None] = 'e6f7a8b9c0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'llm_response_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False, comment='sha256 от (model, messages, temperature, response_format)'),
+        sa.Column('agent_name', sa.String(length=100), nullable=False),
+        sa.Column('model', sa.String(length=200), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False, comment='Текст ответа модели'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('cache_key'),
+    )
+    op.create_index(op.f('ix_llm_response_cache_agent_name'), 'llm_response_cache', ['agent_name'], unique=False)
+    op.create_index(op.f('ix_llm_response_cache_created_at'), 'llm_response_cache', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_llm_response_cache_created_at'), table_name='llm_response_cache')
+    op.drop_index(op.f('ix_llm_response_cache_agent_name'), table_name='llm_response_cache')
+    op.drop_table('llm_response_cache')
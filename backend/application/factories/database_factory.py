@@ -4,7 +4,18 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config import DatabaseConfig
+from config import AppConfig, DatabaseConfig
+from infrastructure.cache.handled_vacancies_cache import (
+    InMemoryHandledVacanciesCache,
+    get_handled_vacancies_cache,
+)
+from infrastructure.database.auto_reply_change_feed import PostgresAutoReplyChangeFeed
+from infrastructure.database.repositories.resume_lease_repository import (
+    ResumeLeaseRepository,
+)
+from infrastructure.database.repositories.vacancy_response_repository import (
+    VacancyResponseRepository,
+)
 from infrastructure.database.session import create_session_factory
 from infrastructure.database.unit_of_work import UnitOfWork
 
@@ -35,3 +46,39 @@ async def get_db_session(config: DatabaseConfig) -> AsyncSession:
     async with session_factory() as session:
         yield session
 
+
+def create_handled_vacancies_cache(config: AppConfig) -> InMemoryHandledVacanciesCache:
+    """Возвращает общий кеш вакансий с прежними откликами (загрузка через standalone репозиторий).
+
+    Args:
+        config: Конфигурация приложения.
+
+    Returns:
+        Кеш обработанных вакансий уровня процесса.
+    """
+    repository = VacancyResponseRepository(create_session_factory(config.database))
+    return get_handled_vacancies_cache(config.hh, repository)
+
+
+def create_resume_lease_repository(config: DatabaseConfig) -> ResumeLeaseRepository:
+    """Создает standalone репозиторий аренды резюме (каждый вызов — своя транзакция).
+
+    Args:
+        config: Конфигурация базы данных.
+
+    Returns:
+        Репозиторий аренды резюме процессами воркера автооткликов.
+    """
+    return ResumeLeaseRepository(create_session_factory(config))
+
+
+def create_auto_reply_change_feed(config: DatabaseConfig) -> PostgresAutoReplyChangeFeed:
+    """Создает ленту изменений автооткликов (LISTEN на отдельном соединении).
+
+    Args:
+        config: Конфигурация базы данных.
+
+    Returns:
+        Лента изменений резюме с автооткликом.
+    """
+    return PostgresAutoReplyChangeFeed(config.get_db_url())
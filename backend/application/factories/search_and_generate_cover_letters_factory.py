@@ -14,8 +14,13 @@ from domain.use_cases.search_and_get_filtered_vacancies import (
 )
 from infrastructure.agents.cover_letter_agent import CoverLetterAgent
 from infrastructure.agents.vacancy_filter_agent import VacancyFilterAgent
+from infrastructure.cache.vacancy_detail_cache import get_vacancy_detail_cache
 from infrastructure.clients.hh_client import RateLimitedHHHttpClient
+from infrastructure.clients.hh_client_coalescing import CoalescingHHClient
 from domain.use_cases.fetch_vacancies import FetchVacanciesUseCase
+from infrastructure.database.repositories.vacancy_detail_cache_repository import (
+    VacancyDetailCacheRepository,
+)
 from infrastructure.database.session import create_session_factory
 from infrastructure.database.unit_of_work import UnitOfWork
 
@@ -32,21 +37,25 @@ def create_search_and_generate_cover_letters_usecase(
     Returns:
         Инстанс SearchAndGenerateCoverLettersUseCase с настроенными зависимостями.
     """
-    # Создаем HH клиент
-    hh_client = RateLimitedHHHttpClient(base_url=config.hh.base_url)
+    # Создаем HH клиент (одинаковые одновременные GET объединяются)
+    hh_client = CoalescingHHClient(RateLimitedHHHttpClient(base_url=config.hh.base_url))
+
+    # Создаем session_factory для работы с репозиториями мэтчей и кеша карточек
+    session_factory = create_session_factory(config.database)
 
-    # Создаем FetchVacanciesUseCase
+    # Создаем FetchVacanciesUseCase с общим кешем карточек вакансий
     fetch_vacancies_uc = FetchVacanciesUseCase(
         hh_client,
         max_vacancies=config.hh.max_vacancies,
+        detail_cache=get_vacancy_detail_cache(
+            config.hh,
+            store=VacancyDetailCacheRepository(session_factory),
+        ),
     )
 
     # Создаем VacancyFilterAgent с unit_of_work для логирования вызовов LLM
     vacancy_filter_service = VacancyFilterAgent(config.openai, unit_of_work=unit_of_work)
 
-    # Создаем session_factory для работы с репозиторием мэтчей
-    session_factory = create_session_factory(config.database)
-
     # Создаем функцию-фабрику для создания UnitOfWork
     def create_unit_of_work() -> UnitOfWork:
         return UnitOfWork(session_factory)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from config import AppConfig, DatabaseConfig
+from domain.interfaces.vacancy_list_filter_service_port import VacancyListFilterServicePort
 from domain.use_cases.get_filtered_vacancy_list import GetFilteredVacancyListUseCase
 from domain.use_cases.get_filtered_vacancy_list_with_cache import (
     GetFilteredVacancyListWithCacheUseCase,
@@ -10,7 +11,9 @@ from domain.use_cases.search_and_get_filtered_vacancy_list import (
     SearchAndGetFilteredVacancyListUseCase,
 )
 from infrastructure.agents.vacancy_list_filter_agent import VacancyListFilterAgent
+from infrastructure.cache.vacancy_search_cache import get_vacancy_search_cache
 from infrastructure.clients.hh_client import RateLimitedHHHttpClient
+from infrastructure.clients.hh_client_coalescing import CoalescingHHClient
 from infrastructure.database.session import create_session_factory
 from infrastructure.database.unit_of_work import UnitOfWork
 
@@ -18,17 +21,21 @@ from infrastructure.database.unit_of_work import UnitOfWork
 def create_search_and_get_filtered_vacancy_list_usecase(
     config: AppConfig,
     unit_of_work=None,
+    vacancy_list_filter_service: VacancyListFilterServicePort | None = None,
 ) -> SearchAndGetFilteredVacancyListUseCase:
     """Фабрика для создания SearchAndGetFilteredVacancyListUseCase со всеми зависимостями.
 
     Args:
         config: Конфигурация приложения.
+        unit_of_work: UnitOfWork для логирования вызовов LLM.
+        vacancy_list_filter_service: Сервис фильтрации вместо VacancyListFilterAgent
+            (например, с замером времени в симуляции).
 
     Returns:
         Инстанс SearchAndGetFilteredVacancyListUseCase с настроенными зависимостями.
     """
-    # Создаем HH клиент
-    hh_client = RateLimitedHHHttpClient(base_url=config.hh.base_url)
+    # Создаем HH клиент (одинаковые одновременные GET объединяются)
+    hh_client = CoalescingHHClient(RateLimitedHHHttpClient(base_url=config.hh.base_url))
 
     # Создаем GetVacancyListUseCase
     internal_api_base_url = getattr(config.hh, "internal_api_base_url", None) or "https://krasnoyarsk.hh.ru"
@@ -36,10 +43,12 @@ def create_search_and_get_filtered_vacancy_list_usecase(
         hh_client,
         max_vacancies=config.hh.max_vacancies,
         internal_api_base_url=internal_api_base_url,
+        search_cache=get_vacancy_search_cache(config.hh),
     )
 
     # Создаем VacancyListFilterAgent с unit_of_work для логирования вызовов LLM
-    vacancy_list_filter_service = VacancyListFilterAgent(config.openai, unit_of_work=unit_of_work)
+    if vacancy_list_filter_service is None:
+        vacancy_list_filter_service = VacancyListFilterAgent(config.openai, unit_of_work=unit_of_work)
 
     # Создаем session_factory для работы с репозиторием мэтчей
     session_factory = create_session_factory(config.database)
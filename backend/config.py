@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
+import tempfile
 
 from dotenv import load_dotenv
 
@@ -11,6 +12,33 @@ class HHConfig:
     base_url: str = "https://api.hh.ru"
     max_vacancies: int = 50
     default_pages_depth: int = 1
+    http2: bool = False
+    pool_max_connections_per_host: int = 20
+    pool_max_keepalive_connections_per_host: int = 10
+    pool_keepalive_expiry_seconds: float = 30.0
+    rate_limit_user_rps: float = 1.0
+    rate_limit_user_burst: int = 3
+    rate_limit_host_rps: float = 10.0
+    rate_limit_host_burst: int = 20
+    rate_limit_backoff_factor: float = 0.5
+    rate_limit_recovery_step: float = 0.05
+    rate_limit_min_factor: float = 0.05
+    search_cache_ttl_seconds: float = 120.0
+    search_cache_max_entries: int = 5000
+    detail_cache_ttl_seconds: float = 1800.0
+    detail_cache_max_entries: int = 2000
+    detail_cache_persistent: bool = False
+    areas_cache_path: str = ""
+    areas_revalidate_seconds: float = 86400.0
+    reply_send_concurrency: int = 8
+    reply_user_interval_seconds: float = 30.0
+    reply_prepare_lookahead: int = 2
+    discovery_wave_pages: int = 2
+    discovery_full_rescan_seconds: float = 3600.0
+    handled_cache_ttl_seconds: float = 600.0
+    resume_context_ttl_seconds: float = 30.0
+    response_quota_lease_size: int = 1
+    response_quota_lease_ttl_seconds: float = 60.0
     login_trust_flags_public_key: str = """-----BEGIN PUBLIC KEY-----
 MIICIjANBgkqhkiG9w0BAQEFAAOCAg8AMIICCgKCAgEArfxXPfnUIiXXnopK1tHq
 rYX4mjfSrM+m24rRcsIbZc0f9ZgZsca9cVy1afJe3f91FeJLKstE/hdexMLogUTq
@@ -35,6 +63,21 @@ class OpenAIConfig:
     api_key: str | None = None
     resume_edit_model: str | None = None
     agent_models: dict[str, str] | None = None
+    pool_max_connections: int = 100
+    pool_max_keepalive_connections: int = 20
+    pool_keepalive_expiry_seconds: float = 30.0
+    scheduler_max_concurrency: int = 16
+    scheduler_tokens_per_minute: int = 0
+    scheduler_interactive_reserved_slots: int = 2
+    model_concurrency: dict[str, int] | None = None
+    model_tokens_per_minute: dict[str, int] | None = None
+    response_cache_agents: dict[str, bool] | None = None
+    response_cache_ttl_seconds: float = 86400.0
+    response_cache_max_entries: int = 2000
+    response_cache_persistent: bool = True
+    context_tokens: int = 32768
+    model_context_tokens: dict[str, int] | None = None
+    filter_batch_max_prompt_tokens: int = 12000
 
     def get_model_for_agent(self, agent_name: str) -> str:
         """Получить модель для агента с fallback на дефолтную.
@@ -58,6 +101,16 @@ class OpenAIConfig:
         
         return self.model
 
+    def is_response_cache_enabled(self, agent_name: str) -> bool:
+        """Включен ли кеш ответов LLM для агента (по умолчанию выключен)."""
+        return bool(self.response_cache_agents and self.response_cache_agents.get(agent_name))
+
+    def get_context_tokens(self, model: str) -> int:
+        """Размер контекста модели в токенах (промпт и ответ) с fallback на общий."""
+        if self.model_context_tokens and model in self.model_context_tokens:
+            return self.model_context_tokens[model]
+        return self.context_tokens
+
 
 @dataclass(slots=True)
 class DatabaseConfig:
@@ -83,12 +136,27 @@ class TelegramConfig:
     frontend_url: str = "http://localhost:5173"
 
 
+@dataclass(slots=True)
+class WorkerConfig:
+    auto_reply_in_process: bool = True
+    auto_reply_processes: int = 1
+    auto_reply_max_resumes: int = 50
+    auto_reply_lease_seconds: float = 120.0
+    auto_reply_change_feed: bool = True
+    auto_reply_reconcile_seconds: float = 300.0
+    auto_reply_resume_cooldown_seconds: float = 10.0
+    auto_reply_metrics_port: int = 0
+    api_metrics_port: int = 9100
+    metrics_host: str = "127.0.0.1"
+
+
 @dataclass(slots=True)
 class AppConfig:
     hh: HHConfig
     openai: OpenAIConfig
     database: DatabaseConfig
     telegram: TelegramConfig
+    worker: WorkerConfig
 
 
 def _get_env_int(name: str, default: int) -> int:
@@ -101,6 +169,13 @@ def _get_env_int(name: str, default: int) -> int:
         return default
 
 
+def _get_env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
 def _get_env_float(name: str, default: float) -> float:
     raw = os.getenv(name)
     if raw is None:
@@ -111,6 +186,23 @@ def _get_env_float(name: str, default: float) -> float:
         return default
 
 
+def _get_env_int_mapping(name: str) -> dict[str, int] | None:
+    """Разобрать переменную вида "model-a=4,model-b=8" (некорректные пары пропускаются)."""
+    raw = os.getenv(name)
+    if not raw:
+        return None
+    result: dict[str, int] = {}
+    for item in raw.split(","):
+        key, sep, value = item.rpartition("=")
+        if not sep or not key.strip():
+            continue
+        try:
+            result[key.strip()] = int(value)
+        except ValueError:
+            continue
+    return result or None
+
+
 def load_config() -> AppConfig:
     """Загрузка общего конфига приложения из переменных окружения с дефолтами."""
 
@@ -122,6 +214,35 @@ def load_config() -> AppConfig:
     hh_base_url = os.getenv("HH_BASE_URL", "https://api.hh.ru")
     hh_max_vacancies = _get_env_int("HH_MAX_VACANCIES", 50)
     hh_default_pages_depth = _get_env_int("HH_DEFAULT_PAGES_DEPTH", 1)
+    hh_http2 = _get_env_bool("HH_HTTP2", False)
+    hh_pool_max_connections = _get_env_int("HH_POOL_MAX_CONNECTIONS_PER_HOST", 20)
+    hh_pool_max_keepalive = _get_env_int("HH_POOL_MAX_KEEPALIVE_PER_HOST", 10)
+    hh_pool_keepalive_expiry = _get_env_float("HH_POOL_KEEPALIVE_EXPIRY_SECONDS", 30.0)
+    hh_rate_limit_user_rps = _get_env_float("HH_RATE_LIMIT_USER_RPS", 1.0)
+    hh_rate_limit_user_burst = _get_env_int("HH_RATE_LIMIT_USER_BURST", 3)
+    hh_rate_limit_host_rps = _get_env_float("HH_RATE_LIMIT_HOST_RPS", 10.0)
+    hh_rate_limit_host_burst = _get_env_int("HH_RATE_LIMIT_HOST_BURST", 20)
+    hh_rate_limit_backoff_factor = _get_env_float("HH_RATE_LIMIT_BACKOFF_FACTOR", 0.5)
+    hh_rate_limit_recovery_step = _get_env_float("HH_RATE_LIMIT_RECOVERY_STEP", 0.05)
+    hh_rate_limit_min_factor = _get_env_float("HH_RATE_LIMIT_MIN_FACTOR", 0.05)
+    hh_search_cache_ttl = _get_env_float("HH_SEARCH_CACHE_TTL_SECONDS", 120.0)
+    hh_search_cache_max_entries = _get_env_int("HH_SEARCH_CACHE_MAX_ENTRIES", 5000)
+    hh_detail_cache_ttl = _get_env_float("HH_DETAIL_CACHE_TTL_SECONDS", 1800.0)
+    hh_detail_cache_max_entries = _get_env_int("HH_DETAIL_CACHE_MAX_ENTRIES", 2000)
+    hh_detail_cache_persistent = _get_env_bool("HH_DETAIL_CACHE_PERSISTENT", False)
+    hh_areas_cache_path = os.getenv(
+        "HH_AREAS_CACHE_PATH", os.path.join(tempfile.gettempdir(), "hh_areas.json")
+    )
+    hh_areas_revalidate_seconds = _get_env_float("HH_AREAS_REVALIDATE_SECONDS", 86400.0)
+    hh_reply_send_concurrency = _get_env_int("HH_REPLY_SEND_CONCURRENCY", 8)
+    hh_reply_user_interval = _get_env_float("HH_REPLY_USER_INTERVAL_SECONDS", 30.0)
+    hh_reply_prepare_lookahead = _get_env_int("HH_REPLY_PREPARE_LOOKAHEAD", 2)
+    hh_discovery_wave_pages = _get_env_int("HH_DISCOVERY_WAVE_PAGES", 2)
+    hh_discovery_full_rescan = _get_env_float("HH_DISCOVERY_FULL_RESCAN_SECONDS", 3600.0)
+    hh_handled_cache_ttl = _get_env_float("HH_HANDLED_CACHE_TTL_SECONDS", 600.0)
+    hh_resume_context_ttl = _get_env_float("HH_RESUME_CONTEXT_TTL_SECONDS", 30.0)
+    hh_response_quota_lease_size = _get_env_int("HH_RESPONSE_QUOTA_LEASE_SIZE", 1)
+    hh_response_quota_lease_ttl = _get_env_float("HH_RESPONSE_QUOTA_LEASE_TTL_SECONDS", 60.0)
     
     # Дефолтный публичный ключ для login_trust_flags
     default_login_trust_flags_public_key = """-----BEGIN PUBLIC KEY-----
@@ -145,6 +266,15 @@ X2LjGaXPbBkAr9b7b+VZlMMCAwEAAQ==
     openai_model = os.getenv("OPENAI_MODEL", "gpt-oss-120b:exacto")
     openai_min_conf = _get_env_float("OPENAI_MIN_CONFIDENCE", 0.0)
     openai_api_key = os.getenv("OPENAI_API_KEY")
+    openai_pool_max_connections = _get_env_int("OPENAI_POOL_MAX_CONNECTIONS", 100)
+    openai_pool_max_keepalive = _get_env_int("OPENAI_POOL_MAX_KEEPALIVE", 20)
+    openai_pool_keepalive_expiry = _get_env_float("OPENAI_POOL_KEEPALIVE_EXPIRY_SECONDS", 30.0)
+    # Планировщик LLM: общие лимиты на модель и переопределения вида "model=N,model2=M"
+    openai_scheduler_concurrency = _get_env_int("OPENAI_SCHEDULER_MAX_CONCURRENCY", 16)
+    openai_scheduler_tpm = _get_env_int("OPENAI_SCHEDULER_TOKENS_PER_MINUTE", 0)
+    openai_scheduler_reserved = _get_env_int("OPENAI_SCHEDULER_INTERACTIVE_RESERVED_SLOTS", 2)
+    openai_model_concurrency = _get_env_int_mapping("OPENAI_MODEL_CONCURRENCY")
+    openai_model_tpm = _get_env_int_mapping("OPENAI_MODEL_TOKENS_PER_MINUTE")
     # resume_edit_model = os.getenv("RESUME_EDIT_MODEL", "gpt-oss-120b:exacto")
     resume_edit_model = os.getenv("RESUME_EDIT_MODEL", "glm-4.7")  # Опциональная модель для чата редактирования резюме
 
@@ -160,6 +290,22 @@ X2LjGaXPbBkAr9b7b+VZlMMCAwEAAQ==
             if agent_name and value:
                 agent_models[agent_name] = value  # Переменные окружения переопределяют дефолты
 
+    # Кеш ответов LLM включается для отдельных агентов
+    # Формат: AGENT_RESPONSE_CACHE_<AgentName>=true
+    response_cache_agents: dict[str, bool] = {}
+    for key in os.environ:
+        if key.startswith("AGENT_RESPONSE_CACHE_"):
+            agent_name = key[len("AGENT_RESPONSE_CACHE_"):]
+            if agent_name:
+                response_cache_agents[agent_name] = _get_env_bool(key, False)
+    openai_response_cache_ttl = _get_env_float("OPENAI_RESPONSE_CACHE_TTL_SECONDS", 86400.0)
+    openai_response_cache_max_entries = _get_env_int("OPENAI_RESPONSE_CACHE_MAX_ENTRIES", 2000)
+    openai_response_cache_persistent = _get_env_bool("OPENAI_RESPONSE_CACHE_PERSISTENT", True)
+    # Размер контекста моделей для упаковки батчей: общий и переопределения "model=N"
+    openai_context_tokens = _get_env_int("OPENAI_CONTEXT_TOKENS", 32768)
+    openai_model_context_tokens = _get_env_int_mapping("OPENAI_MODEL_CONTEXT_TOKENS")
+    openai_filter_batch_max_prompt = _get_env_int("OPENAI_FILTER_BATCH_MAX_PROMPT_TOKENS", 12000)
+
     # Нормализуем confidence в диапазон [0.0, 1.0]
     if openai_min_conf < 0.0:
         openai_min_conf = 0.0
@@ -170,6 +316,33 @@ X2LjGaXPbBkAr9b7b+VZlMMCAwEAAQ==
         base_url=hh_base_url,
         max_vacancies=hh_max_vacancies,
         default_pages_depth=hh_default_pages_depth,
+        http2=hh_http2,
+        pool_max_connections_per_host=hh_pool_max_connections,
+        pool_max_keepalive_connections_per_host=hh_pool_max_keepalive,
+        pool_keepalive_expiry_seconds=hh_pool_keepalive_expiry,
+        rate_limit_user_rps=hh_rate_limit_user_rps,
+        rate_limit_user_burst=hh_rate_limit_user_burst,
+        rate_limit_host_rps=hh_rate_limit_host_rps,
+        rate_limit_host_burst=hh_rate_limit_host_burst,
+        rate_limit_backoff_factor=hh_rate_limit_backoff_factor,
+        rate_limit_recovery_step=hh_rate_limit_recovery_step,
+        rate_limit_min_factor=hh_rate_limit_min_factor,
+        search_cache_ttl_seconds=hh_search_cache_ttl,
+        search_cache_max_entries=hh_search_cache_max_entries,
+        detail_cache_ttl_seconds=hh_detail_cache_ttl,
+        detail_cache_max_entries=hh_detail_cache_max_entries,
+        detail_cache_persistent=hh_detail_cache_persistent,
+        areas_cache_path=hh_areas_cache_path,
+        areas_revalidate_seconds=hh_areas_revalidate_seconds,
+        reply_send_concurrency=hh_reply_send_concurrency,
+        reply_user_interval_seconds=hh_reply_user_interval,
+        reply_prepare_lookahead=hh_reply_prepare_lookahead,
+        discovery_wave_pages=hh_discovery_wave_pages,
+        discovery_full_rescan_seconds=hh_discovery_full_rescan,
+        handled_cache_ttl_seconds=hh_handled_cache_ttl,
+        resume_context_ttl_seconds=hh_resume_context_ttl,
+        response_quota_lease_size=hh_response_quota_lease_size,
+        response_quota_lease_ttl_seconds=hh_response_quota_lease_ttl,
         login_trust_flags_public_key=hh_login_trust_flags_public_key,
     )
     openai_cfg = OpenAIConfig(
@@ -179,6 +352,21 @@ X2LjGaXPbBkAr9b7b+VZlMMCAwEAAQ==
         api_key=openai_api_key,
         resume_edit_model=resume_edit_model,
         agent_models=agent_models if agent_models else None,
+        pool_max_connections=openai_pool_max_connections,
+        pool_max_keepalive_connections=openai_pool_max_keepalive,
+        pool_keepalive_expiry_seconds=openai_pool_keepalive_expiry,
+        scheduler_max_concurrency=openai_scheduler_concurrency,
+        scheduler_tokens_per_minute=openai_scheduler_tpm,
+        scheduler_interactive_reserved_slots=openai_scheduler_reserved,
+        model_concurrency=openai_model_concurrency,
+        model_tokens_per_minute=openai_model_tpm,
+        response_cache_agents=response_cache_agents or None,
+        response_cache_ttl_seconds=openai_response_cache_ttl,
+        response_cache_max_entries=openai_response_cache_max_entries,
+        response_cache_persistent=openai_response_cache_persistent,
+        context_tokens=openai_context_tokens,
+        model_context_tokens=openai_model_context_tokens,
+        filter_batch_max_prompt_tokens=openai_filter_batch_max_prompt,
     )
 
     # Конфигурация БД
@@ -210,4 +398,26 @@ X2LjGaXPbBkAr9b7b+VZlMMCAwEAAQ==
         frontend_url=frontend_url,
     )
 
-    return AppConfig(hh=hh_cfg, openai=openai_cfg, database=db_cfg, telegram=telegram_cfg)
+    # Воркер автооткликов: внутри API или отдельными процессами с арендой резюме в БД
+    worker_cfg = WorkerConfig(
+        auto_reply_in_process=_get_env_bool("AUTO_REPLY_WORKER_IN_PROCESS", True),
+        auto_reply_processes=max(1, _get_env_int("AUTO_REPLY_WORKER_PROCESSES", 1)),
+        auto_reply_max_resumes=max(1, _get_env_int("AUTO_REPLY_WORKER_MAX_RESUMES", 50)),
+        auto_reply_lease_seconds=_get_env_float("AUTO_REPLY_WORKER_LEASE_SECONDS", 120.0),
+        auto_reply_change_feed=_get_env_bool("AUTO_REPLY_WORKER_CHANGE_FEED", True),
+        auto_reply_reconcile_seconds=_get_env_float("AUTO_REPLY_WORKER_RECONCILE_SECONDS", 300.0),
+        auto_reply_resume_cooldown_seconds=_get_env_float(
+            "AUTO_REPLY_WORKER_RESUME_COOLDOWN_SECONDS", 10.0
+        ),
+        auto_reply_metrics_port=_get_env_int("AUTO_REPLY_WORKER_METRICS_PORT", 0),
+        api_metrics_port=_get_env_int("API_METRICS_PORT", 9100),
+        metrics_host=os.getenv("METRICS_HOST", "127.0.0.1"),
+    )
+
+    return AppConfig(
+        hh=hh_cfg,
+        openai=openai_cfg,
+        database=db_cfg,
+        telegram=telegram_cfg,
+        worker=worker_cfg,
+    )
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class Area:
+    """Регион HH из справочника /areas (узел дерева без дочерних элементов)."""
+
+    area_id: str
+    name: str
+    parent_id: Optional[str] = None
+    # Названия предков от корня (страны) до родителя
+    path: List[str] | None = None
+    has_children: bool = False
@@ -0,0 +1,36 @@
+"""Доменная сущность контекста резюме для автооткликов."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from domain.entities.resume import Resume
+from domain.entities.resume_filter_settings import ResumeFilterSettings
+from domain.entities.user_hh_auth_data import UserHhAuthData
+
+
+@dataclass(slots=True)
+class ResumeContext:
+    """Состояние, которое нужно циклу автооткликов резюме.
+
+    Загружается один раз и переиспользуется для всех вакансий резюме,
+    поэтому при обработке вакансии к БД обращается только сохранение отклика.
+    responses_count/response_limit — снимок подписки для ранней остановки;
+    окончательную проверку лимита выполняет транзакция отклика.
+    """
+
+    resume: Resume
+    auth_data: UserHhAuthData | None = None
+    settings: ResumeFilterSettings | None = None
+    responses_count: int | None = None
+    response_limit: int | None = None
+
+    @property
+    def is_auto_reply(self) -> bool:
+        return self.resume.is_auto_reply
+
+    @property
+    def limit_exhausted(self) -> bool:
+        if self.responses_count is None or self.response_limit is None:
+            return False
+        return self.responses_count >= self.response_limit
@@ -12,9 +12,15 @@ class ResumeToVacancyMatch:
 
     Хранит результат нейронной фильтрации вакансии для конкретного резюме.
     Используется для кэширования результатов, чтобы избежать повторных запросов к нейросети.
+
+    Ключ кеша — context_hash (содержимое резюме, требования пользователя, модель
+    и версия промпта) и vacancy_hash: после правки резюме мэтчи перестают находиться,
+    а резюме с одинаковым содержимым используют общие мэтчи. resume_id указывает
+    резюме, для которого мэтч был посчитан.
     """
 
     resume_id: UUID
     vacancy_hash: str
     confidence: float
     reason: str | None = None
+    context_hash: str | None = None
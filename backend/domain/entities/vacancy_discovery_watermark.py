@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class VacancyDiscoveryWatermark:
+    """Граница уже просмотренной выдачи резюме (выдача по дате публикации).
+
+    Все, что опубликовано раньше newest_publication_time_iso, считается
+    просмотренным; seen_vacancy_ids (от новых к старым) уточняет границу
+    для вакансий с одинаковым временем публикации.
+    """
+
+    newest_publication_time_iso: Optional[str] = None
+    seen_vacancy_ids: List[int] = field(default_factory=list)
@@ -6,17 +6,26 @@ from __future__ import annotations
 class AgentParseError(Exception):
     """Исключение при неудачном парсинге ответа агента после всех retry попыток."""
 
-    def __init__(self, agent_name: str, attempts: int, last_error: str | None = None) -> None:
+    def __init__(
+        self,
+        agent_name: str,
+        attempts: int,
+        last_error: str | None = None,
+        response_received: bool = False,
+    ) -> None:
         """Инициализация исключения.
 
         Args:
             agent_name: Имя агента.
             attempts: Количество попыток.
             last_error: Последняя ошибка (опционально).
+            response_received: Модель ответила, но ответ не разобран или невалиден
+                (False — ошибка запроса или пустой ответ).
         """
         self.agent_name = agent_name
         self.attempts = attempts
         self.last_error = last_error
+        self.response_received = response_received
         message = f"Агент {agent_name} не смог распарсить ответ после {attempts} попыток"
         if last_error:
             message += f": {last_error}"
@@ -0,0 +1,34 @@
+"""Интерфейс кеша справочника регионов HH."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from domain.entities.area import Area
+
+
+class AreasCachePort(ABC):
+    """Порт кеша дерева регионов /areas.
+
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get_tree(self) -> List[Dict[str, Any]]:
+        """Получить дерево регионов в формате HH API.
+
+        Returns:
+            Корневой список регионов (страны) с вложенными areas.
+        """
+
+    @abstractmethod
+    async def get_area(self, area_id: str) -> Optional[Area]:
+        """Найти регион по id за O(1).
+
+        Args:
+            area_id: ID региона из /areas.
+
+        Returns:
+            Регион или None, если такого id нет в справочнике.
+        """
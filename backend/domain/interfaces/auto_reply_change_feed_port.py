@@ -0,0 +1,37 @@
+"""Интерфейс ленты изменений настроек автооткликов."""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Callable
+from uuid import UUID
+
+
+class AutoReplyChangeFeedPort(ABC):
+    """Порт ленты изменений резюме с автооткликом.
+
+    Сообщает воркеру о включении/выключении автооткликов и изменении настроек
+    фильтра резюме, чтобы он реагировал сразу, а не при следующем опросе.
+
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @property
+    @abstractmethod
+    def is_listening(self) -> bool:
+        """Подписка активна и изменения доставляются."""
+
+    @abstractmethod
+    async def run(
+        self,
+        on_change: Callable[[UUID | None], None],
+        shutdown_event: asyncio.Event,
+    ) -> None:
+        """Слушать изменения до установки shutdown_event.
+
+        Args:
+            on_change: Колбэк с ID измененного резюме. None означает, что изменения
+                могли быть пропущены (например, при переподключении) и нужна сверка.
+            shutdown_event: Событие остановки.
+        """
@@ -0,0 +1,36 @@
+"""Интерфейс кеша уже обработанных вакансий резюме."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import FrozenSet
+from uuid import UUID
+
+
+class HandledVacanciesCachePort(ABC):
+    """Порт кеша ID вакансий, на которые резюме уже откликалось (успешно или с ошибкой).
+
+    Позволяет отсеять такие вакансии до LLM-фильтрации и постановки откликов
+    в очередь одной проверкой в памяти вместо запроса к БД на каждую вакансию.
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get_handled_ids(self, resume_id: UUID) -> FrozenSet[int]:
+        """Получить ID обработанных вакансий резюме (при промахе — одним запросом к БД).
+
+        Args:
+            resume_id: ID резюме.
+
+        Returns:
+            Множество vacancy_id.
+        """
+
+    @abstractmethod
+    def mark_handled(self, resume_id: UUID, vacancy_id: int) -> None:
+        """Отметить вакансию обработанной после сохранения отклика.
+
+        Args:
+            resume_id: ID резюме.
+            vacancy_id: ID вакансии.
+        """
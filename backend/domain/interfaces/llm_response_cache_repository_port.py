@@ -0,0 +1,46 @@
+"""Интерфейс репозитория персистентного кеша ответов LLM."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class LlmResponseCacheRepositoryPort(ABC):
+    """Порт репозитория для хранения ответов LLM между перезапусками.
+
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get_fresh(self, cache_key: str, max_age_seconds: float) -> str | None:
+        """Получить ответ, если он сохранен не раньше чем max_age_seconds назад.
+
+        Args:
+            cache_key: Хеш запроса к LLM.
+            max_age_seconds: Максимальный возраст записи в секундах.
+
+        Returns:
+            Текст ответа модели или None, если записи нет или она устарела.
+        """
+
+    @abstractmethod
+    async def upsert(self, cache_key: str, agent_name: str, model: str, content: str) -> None:
+        """Сохранить или обновить ответ LLM.
+
+        Args:
+            cache_key: Хеш запроса к LLM.
+            agent_name: Имя агента (для диагностики и очистки).
+            model: Модель, которая дала ответ.
+            content: Текст ответа модели.
+        """
+
+    @abstractmethod
+    async def delete_expired(self, max_age_seconds: float) -> int:
+        """Удалить ответы старше max_age_seconds.
+
+        Args:
+            max_age_seconds: Максимальный возраст записи в секундах.
+
+        Returns:
+            Количество удаленных записей.
+        """
@@ -0,0 +1,49 @@
+"""Интерфейс планировщика отправки автооткликов."""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+from uuid import UUID
+
+
+class ReplySendSchedulerPort(ABC):
+    """Порт общей для процесса очереди отправки откликов.
+
+    Задания выполняются в порядке убывания confidence с ограничением
+    общего числа одновременных отправок и темпа отправки для каждого пользователя.
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    def submit(
+        self,
+        *,
+        user_id: UUID,
+        resume_id: UUID,
+        vacancy_id: int,
+        confidence: float,
+        run: Callable[[], Awaitable[None]],
+    ) -> asyncio.Future[None]:
+        """Поставить отклик в очередь.
+
+        Args:
+            user_id: ID пользователя (отклики одного пользователя отправляются с паузой).
+            resume_id: ID резюме.
+            vacancy_id: ID вакансии.
+            confidence: Приоритет задания, больше — раньше.
+            run: Отправка отклика.
+
+        Returns:
+            Future, который завершается вместе с заданием (с результатом или
+            исключением run). Отмена future снимает задание из очереди.
+        """
+
+    @abstractmethod
+    def cancel_resume(self, resume_id: UUID) -> int:
+        """Снять из очереди все ожидающие задания резюме.
+
+        Returns:
+            Количество снятых заданий.
+        """
@@ -0,0 +1,42 @@
+"""Интерфейс квоты откликов пользователя."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class ResponseQuotaPort(ABC):
+    """Порт квоты откликов по подписке.
+
+    Отклик занимает квоту до отправки и возвращает ее, если отправка не удалась,
+    поэтому одновременные отправки одного пользователя не превышают лимит плана.
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def acquire(self, user_id: UUID) -> bool:
+        """Занять квоту на один отклик.
+
+        Args:
+            user_id: UUID пользователя.
+
+        Returns:
+            True, если квота занята (при неудачной отправке ее нужно вернуть через refund),
+            False, если лимит не проверялся (подписка или план не найдены).
+
+        Raises:
+            SubscriptionLimitExceededError: Если лимит откликов исчерпан.
+        """
+
+    @abstractmethod
+    async def refund(self, user_id: UUID) -> None:
+        """Вернуть квоту отклика, который не был отправлен.
+
+        Args:
+            user_id: UUID пользователя.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Вернуть в БД все заранее зарезервированные, но не использованные отклики."""
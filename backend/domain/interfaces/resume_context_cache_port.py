@@ -0,0 +1,49 @@
+"""Интерфейс кеша контекста резюме для автооткликов."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from domain.entities.resume_context import ResumeContext
+
+
+class ResumeContextCachePort(ABC):
+    """Порт кеша контекста резюме (резюме, auth данные, фильтры, снимок подписки).
+
+    Записи живут недолго и сбрасываются по уведомлениям об изменении резюме.
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get_or_load(
+        self,
+        resume_id: UUID,
+        loader: Callable[[], Awaitable[ResumeContext | None]],
+    ) -> ResumeContext | None:
+        """Получить контекст резюме, при промахе загрузив его через loader.
+
+        Args:
+            resume_id: ID резюме.
+            loader: Загрузка контекста из БД (None — резюме не найдено, не кешируется).
+
+        Returns:
+            Контекст резюме или None.
+        """
+
+    @abstractmethod
+    def invalidate(self, resume_id: UUID | None = None) -> None:
+        """Сбросить контекст резюме (None — сбросить все).
+
+        Args:
+            resume_id: ID резюме.
+        """
+
+    @abstractmethod
+    def note_reply_sent(self, user_id: UUID) -> None:
+        """Учесть отправленный отклик в снимках подписки резюме пользователя.
+
+        Args:
+            user_id: ID пользователя.
+        """
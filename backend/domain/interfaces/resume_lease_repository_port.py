@@ -0,0 +1,53 @@
+"""Интерфейс репозитория аренды резюме процессами воркера автооткликов."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Set
+from uuid import UUID
+
+
+class ResumeLeaseRepositoryPort(ABC):
+    """Порт репозитория аренды резюме.
+
+    Несколько процессов воркера делят резюме с автооткликом через аренду
+    с ограниченным сроком: резюме обрабатывает только владелец действующей
+    аренды, а аренда упавшего процесса истекает и достается другому.
+
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def claim(self, owner: str, limit: int, lease_seconds: float) -> List[UUID]:
+        """Захватить свободные резюме с автооткликом.
+
+        Args:
+            owner: Идентификатор процесса воркера.
+            limit: Максимальное количество резюме.
+            lease_seconds: Срок аренды в секундах.
+
+        Returns:
+            ID захваченных резюме (сначала те, что дольше всех не обрабатывались).
+        """
+
+    @abstractmethod
+    async def renew(self, owner: str, resume_ids: Iterable[UUID], lease_seconds: float) -> Set[UUID]:
+        """Продлить аренду резюме (heartbeat).
+
+        Args:
+            owner: Идентификатор процесса воркера.
+            resume_ids: ID резюме, которые процесс обрабатывает.
+            lease_seconds: Новый срок аренды в секундах.
+
+        Returns:
+            ID резюме, аренда которых по-прежнему принадлежит owner.
+        """
+
+    @abstractmethod
+    async def release(self, owner: str, resume_ids: Iterable[UUID]) -> None:
+        """Освободить аренду резюме, если она принадлежит owner.
+
+        Args:
+            owner: Идентификатор процесса воркера.
+            resume_ids: ID освобождаемых резюме.
+        """
@@ -43,6 +43,22 @@ class ResumeToVacancyMatchRepositoryPort(ABC):
             Словарь vacancy_hash -> ResumeToVacancyMatch для найденных мэтчей.
         """
 
+    @abstractmethod
+    async def get_batch_by_context_and_vacancy_hashes(
+        self, context_hash: str, vacancy_hashes: List[str]
+    ) -> Dict[str, ResumeToVacancyMatch]:
+        """Батчевое получение мэтчей по hash контекста оценки и списку vacancy_hash.
+
+        Мэтчи находятся независимо от того, для какого резюме они были посчитаны.
+
+        Args:
+            context_hash: Hash контекста (см. calculate_match_context_hash).
+            vacancy_hashes: Список hash вакансий.
+
+        Returns:
+            Словарь vacancy_hash -> ResumeToVacancyMatch для найденных мэтчей.
+        """
+
     @abstractmethod
     async def create(self, match: ResumeToVacancyMatch) -> ResumeToVacancyMatch:
         """Создать новый мэтч.
@@ -60,6 +76,9 @@ class ResumeToVacancyMatchRepositoryPort(ABC):
     ) -> List[ResumeToVacancyMatch]:
         """Батчевое создание мэтчей.
 
+        Мэтчи, уже сохраненные для того же context_hash и vacancy_hash
+        (например, параллельно для резюме с тем же содержимым), пропускаются.
+
         Args:
             matches: Список доменных сущностей ResumeToVacancyMatch для создания.
 
@@ -49,3 +49,30 @@ class UserSubscriptionRepositoryPort(ABC):
         Raises:
             ValueError: Если подписка с таким user_id не найдена.
         """
+
+    @abstractmethod
+    async def reserve_responses(self, user_id: UUID, limit: int, count: int = 1) -> int:
+        """Атомарно зарезервировать до count откликов в пределах лимита.
+
+        Увеличивает responses_count одним запросом, не превышая limit, и начинает
+        период лимита, если он еще не начат. Одновременные резервирования одного
+        пользователя не могут вместе превысить лимит.
+
+        Args:
+            user_id: UUID пользователя.
+            limit: Лимит откликов плана.
+            count: Сколько откликов зарезервировать.
+
+        Returns:
+            Количество зарезервированных откликов (0, если лимит исчерпан
+            или подписка не найдена).
+        """
+
+    @abstractmethod
+    async def release_responses(self, user_id: UUID, count: int) -> None:
+        """Вернуть неиспользованные зарезервированные отклики.
+
+        Args:
+            user_id: UUID пользователя.
+            count: Сколько откликов вернуть (счетчик не опускается ниже нуля).
+        """
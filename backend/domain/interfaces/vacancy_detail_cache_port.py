@@ -0,0 +1,34 @@
+"""Интерфейс кеша детальных карточек вакансий."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional
+
+from domain.entities.vacancy_detail import VacancyDetail
+
+
+class VacancyDetailCachePort(ABC):
+    """Порт кеша карточек /vacancies/{id}, общего для всех пользователей.
+
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get_or_fetch(
+        self,
+        vacancy_id: int,
+        fetch: Callable[[], Awaitable[Optional[VacancyDetail]]],
+    ) -> Optional[VacancyDetail]:
+        """Получить карточку из кеша или загрузить ее через fetch.
+
+        Одновременные вызовы для одного vacancy_id должны приводить
+        к единственному вызову fetch.
+
+        Args:
+            vacancy_id: ID вакансии.
+            fetch: Загрузка карточки из HH при промахе кеша.
+
+        Returns:
+            Карточка вакансии или None, если загрузить не удалось.
+        """
@@ -0,0 +1,45 @@
+"""Интерфейс репозитория персистентного кеша карточек вакансий."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from domain.entities.vacancy_detail import VacancyDetail
+
+
+class VacancyDetailCacheRepositoryPort(ABC):
+    """Порт репозитория для хранения карточек вакансий между перезапусками.
+
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get_fresh(self, vacancy_id: int, max_age_seconds: float) -> VacancyDetail | None:
+        """Получить карточку, если она сохранена не раньше чем max_age_seconds назад.
+
+        Args:
+            vacancy_id: ID вакансии.
+            max_age_seconds: Максимальный возраст записи в секундах.
+
+        Returns:
+            Доменная сущность VacancyDetail или None, если записи нет или она устарела.
+        """
+
+    @abstractmethod
+    async def upsert(self, detail: VacancyDetail) -> None:
+        """Сохранить или обновить карточку вакансии.
+
+        Args:
+            detail: Доменная сущность VacancyDetail.
+        """
+
+    @abstractmethod
+    async def delete_expired(self, max_age_seconds: float) -> int:
+        """Удалить карточки старше max_age_seconds.
+
+        Args:
+            max_age_seconds: Максимальный возраст записи в секундах.
+
+        Returns:
+            Количество удаленных записей.
+        """
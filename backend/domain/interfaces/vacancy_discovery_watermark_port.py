@@ -0,0 +1,37 @@
+"""Интерфейс хранилища границ просмотренной выдачи резюме."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.entities.vacancy_discovery_watermark import VacancyDiscoveryWatermark
+
+
+class VacancyDiscoveryWatermarkPort(ABC):
+    """Порт хранилища границ выдачи, до которых резюме уже просмотрено.
+
+    Отсутствие границы означает полный просмотр выдачи.
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get(self, resume_id: UUID) -> Optional[VacancyDiscoveryWatermark]:
+        """Получить границу резюме.
+
+        Args:
+            resume_id: ID резюме.
+
+        Returns:
+            Граница или None, если выдачу нужно просмотреть полностью.
+        """
+
+    @abstractmethod
+    async def set(self, resume_id: UUID, watermark: VacancyDiscoveryWatermark) -> None:
+        """Сохранить границу резюме.
+
+        Args:
+            resume_id: ID резюме.
+            watermark: Новая граница.
+        """
@@ -33,3 +33,12 @@ class VacancyFilterServicePort(ABC):
             user_id: ID пользователя для логирования (опционально).
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def match_cache_version(self) -> str:
+        """Версия оценок сервиса (агент, модель, версия промпта).
+
+        Входит в ключ кеша мэтчей: при смене модели или промпта
+        сохраненные оценки перестают использоваться.
+        """
+        raise NotImplementedError
@@ -21,7 +21,7 @@ class VacancyListFilterServicePort(ABC):
     ) -> List[FilteredVacancyListDto]:
         """Оценить релевантность списка list-вакансий к резюме.
 
-        Предполагается, что в одном вызове передаётся не более ~50 вакансий,
+        Предполагается, что в одном вызове передаётся один батч из plan_batches,
         чтобы не раздувать контекст модели.
 
         Args:
@@ -33,3 +33,28 @@ class VacancyListFilterServicePort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def plan_batches(
+        self,
+        vacancies: List[VacancyListItem],
+        resume: str,
+        user_filter_params: str | None = None,
+        max_batch_size: int = 50,
+    ) -> List[List[VacancyListItem]]:
+        """Разбить вакансии на батчи для filter_vacancy_list.
+
+        Батчи упаковываются по оценке токенов промпта под контекст модели
+        сервиса, но не больше max_batch_size вакансий в батче. Порядок
+        вакансий сохраняется.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def match_cache_version(self) -> str:
+        """Версия оценок сервиса (агент, модель, версия промпта).
+
+        Входит в ключ кеша мэтчей: при смене модели или промпта
+        сохраненные оценки перестают использоваться.
+        """
+        raise NotImplementedError
+
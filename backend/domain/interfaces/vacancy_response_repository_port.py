@@ -98,3 +98,14 @@ class VacancyResponseRepositoryPort(ABC):
         Returns:
             Доменная сущность VacancyResponse с status='failed' или None, если не найдено.
         """
+
+    @abstractmethod
+    async def get_handled_vacancy_ids(self, resume_id: UUID) -> set[int]:
+        """Получить ID всех вакансий, на которые резюме уже откликалось (успешно или с ошибкой).
+
+        Args:
+            resume_id: UUID резюме.
+
+        Returns:
+            Множество vacancy_id.
+        """
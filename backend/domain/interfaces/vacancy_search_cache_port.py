@@ -0,0 +1,36 @@
+"""Интерфейс кеша страниц поисковой выдачи HH."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.entities.vacancy_list import VacancyList
+
+
+class VacancySearchCachePort(ABC):
+    """Порт кеша страниц /search/vacancy, общего для всех пользователей.
+
+    Ключ — нормализованный query запроса (без cookies и searchSessionId).
+    Инфраструктура должна реализовать этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[VacancyList]:
+        """Получить страницу выдачи из кеша.
+
+        Args:
+            key: Нормализованный ключ запроса.
+
+        Returns:
+            Страница выдачи или None, если записи нет или она устарела.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, vacancy_list: VacancyList) -> None:
+        """Сохранить страницу выдачи в кеш.
+
+        Args:
+            key: Нормализованный ключ запроса.
+            vacancy_list: Страница выдачи.
+        """
@@ -5,6 +5,7 @@ from __future__ import annotations
 from loguru import logger
 
 from domain.entities.vacancy_response import VacancyResponse
+from domain.interfaces.handled_vacancies_cache_port import HandledVacanciesCachePort
 from domain.interfaces.vacancy_response_repository_port import (
     VacancyResponseRepositoryPort,
 )
@@ -16,13 +17,20 @@ class CreateVacancyResponseUseCase:
     Базовый use case для сохранения отклика в базе данных.
     """
 
-    def __init__(self, vacancy_response_repository: VacancyResponseRepositoryPort) -> None:
+    def __init__(
+        self,
+        vacancy_response_repository: VacancyResponseRepositoryPort,
+        handled_vacancies: HandledVacanciesCachePort | None = None,
+    ) -> None:
         """Инициализация use case.
 
         Args:
             vacancy_response_repository: Репозиторий для работы с откликами.
+            handled_vacancies: Кеш обработанных вакансий резюме, который
+                пополняется после сохранения отклика (опционально).
         """
         self._vacancy_response_repository = vacancy_response_repository
+        self._handled_vacancies = handled_vacancies
 
     async def execute(self, vacancy_response: VacancyResponse) -> VacancyResponse:
         """Создать отклик на вакансию в БД.
@@ -43,6 +51,10 @@ class CreateVacancyResponseUseCase:
                 f"user_id={vacancy_response.user_id}"
             )
             result = await self._vacancy_response_repository.create(vacancy_response)
+            if self._handled_vacancies is not None:
+                self._handled_vacancies.mark_handled(
+                    vacancy_response.resume_id, vacancy_response.vacancy_id
+                )
             logger.info(
                 f"Успешно создан отклик vacancy_id={vacancy_response.vacancy_id}, "
                 f"resume_id={vacancy_response.resume_id}, resume_hash={vacancy_response.resume_hash}, "
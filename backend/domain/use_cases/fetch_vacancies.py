@@ -6,6 +6,7 @@ from typing import Dict, List
 from domain.entities.resume_filter_settings import ResumeFilterSettings
 from domain.entities.vacancy_detail import VacancyDetail
 from domain.interfaces.hh_client_port import HHClientPort
+from domain.interfaces.vacancy_detail_cache_port import VacancyDetailCachePort
 
 
 class FetchVacanciesUseCase:
@@ -15,16 +16,23 @@ class FetchVacanciesUseCase:
     загружает детальные карточки /vacancies/{id} параллельно.
     """
 
-    def __init__(self, hh_client: HHClientPort, max_vacancies: int = 50) -> None:
+    def __init__(
+        self,
+        hh_client: HHClientPort,
+        max_vacancies: int = 50,
+        detail_cache: VacancyDetailCachePort | None = None,
+    ) -> None:
         """Инициализация use case.
 
         Args:
             hh_client: Клиент для работы с HeadHunter API.
                       Может быть обычным клиентом или клиентом с автообновлением cookies.
             max_vacancies: Максимальное количество вакансий для загрузки.
+            detail_cache: Опциональный кеш карточек вакансий, общий для пользователей.
         """
         self._hh_client = hh_client
         self._max_vacancies = max_vacancies
+        self._detail_cache = detail_cache
 
     async def execute(
         self,
@@ -85,7 +93,12 @@ class FetchVacanciesUseCase:
         items = vacancy_list.items[: self._max_vacancies]
 
         async def _fetch_one(vacancy_id: int) -> VacancyDetail | None:
-            return await client.fetch_vacancy_detail(vacancy_id, headers, cookies)
+            if self._detail_cache is None:
+                return await client.fetch_vacancy_detail(vacancy_id, headers, cookies)
+            return await self._detail_cache.get_or_fetch(
+                vacancy_id,
+                lambda: client.fetch_vacancy_detail(vacancy_id, headers, cookies),
+            )
 
         tasks = [
             asyncio.create_task(_fetch_one(item.vacancy_id))
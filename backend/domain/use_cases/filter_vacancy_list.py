@@ -15,7 +15,7 @@ from domain.interfaces.vacancy_list_filter_service_port import VacancyListFilter
 class FilterVacancyListUseCase:
     """Use case батчевой нейронной фильтрации list-вакансий.
 
-    Принимает список list-вакансий и резюме, бьёт вакансии на чанки по batch_size
+    Принимает список list-вакансий и резюме, бьёт вакансии на батчи (plan_batches)
     и для каждого чанка вызывает сервис нейронной фильтрации. Затем применяет
     минимальный порог confidence и возвращает список отфильтрованных list-вакансий
     (list_item + confidence).
@@ -46,11 +46,10 @@ class FilterVacancyListUseCase:
 
         all_dtos: list[FilteredVacancyListDto] = []
 
-        # Чанкуем по batch_size, чтобы не раздувать контекст модели
-        chunks: list[List[VacancyListItem]] = [
-            vacancies[i : i + self._batch_size]
-            for i in range(0, len(vacancies), self._batch_size)
-        ]
+        # Батчи по оценке токенов, чтобы не раздувать контекст модели
+        chunks = self._filter_service.plan_batches(
+            vacancies, resume, user_filter_params, max_batch_size=self._batch_size
+        )
 
         # Кидаем запросы в нейронку по чанкам асинхронно
         tasks = [
@@ -1,35 +1,64 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 
+from domain.entities.area import Area
+from domain.interfaces.areas_cache_port import AreasCachePort
 from domain.interfaces.hh_client_port import HHClientPort
+from domain.use_cases.update_user_hh_auth_cookies import UpdateUserHhAuthCookiesUseCase
 
 
 class GetAreasUseCase:
     """Use case для получения дерева регионов из HH API."""
 
-    def __init__(self, hh_client: HHClientPort) -> None:
+    def __init__(
+        self,
+        hh_client: HHClientPort,
+        areas_cache: AreasCachePort | None = None,
+    ) -> None:
         """Инициализация use case.
 
         Args:
             hh_client: Клиент для работы с HeadHunter API.
                       Может быть обычным клиентом или клиентом с автообновлением cookies.
+            areas_cache: Опциональный кеш справочника регионов. Если задан,
+                      дерево отдается из кеша без запроса к HH.
         """
         self._hh_client = hh_client
+        self._areas_cache = areas_cache
 
     async def execute(
         self,
         headers: Dict[str, str],
         cookies: Dict[str, str],
+        user_id: Optional[UUID] = None,
+        update_cookies_uc: Optional[UpdateUserHhAuthCookiesUseCase] = None,
     ) -> List[Dict[str, Any]]:
-        """Возвращает дерево регионов как есть из публичного API /areas.
+        """Возвращает дерево регионов в формате публичного API /areas.
 
         Args:
             headers: HTTP заголовки для запроса к HH API.
             cookies: HTTP cookies для запроса к HH API.
+            user_id: ID пользователя (не используется при чтении из кеша).
+            update_cookies_uc: Use case обновления cookies (не используется при чтении из кеша).
 
         Returns:
             Дерево регионов из HH API.
         """
+        if self._areas_cache is not None:
+            return await self._areas_cache.get_tree()
         return await self._hh_client.fetch_areas(headers, cookies)
 
+    async def get_area(self, area_id: str) -> Optional[Area]:
+        """Находит регион по id (например, ResumeFilterSettings.area).
+
+        Args:
+            area_id: ID региона из /areas.
+
+        Returns:
+            Регион или None, если такого id нет в справочнике.
+        """
+        if self._areas_cache is None:
+            raise RuntimeError("Поиск региона по id требует кеша справочника регионов")
+        return await self._areas_cache.get_area(area_id)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import Dict, List
-from uuid import UUID
 
 from domain.entities.resume_to_vacancy_match import ResumeToVacancyMatch
 from domain.interfaces.resume_to_vacancy_match_repository_port import (
@@ -25,17 +24,18 @@ class GetBatchResumeToVacancyMatchesUseCase:
         self._repository = repository
 
     async def execute(
-        self, resume_id: UUID, vacancy_hashes: List[str]
+        self, context_hash: str, vacancy_hashes: List[str]
     ) -> Dict[str, ResumeToVacancyMatch]:
-        """Получить мэтчи по resume_id и списку vacancy_hash.
+        """Получить мэтчи по hash контекста оценки и списку vacancy_hash.
 
         Args:
-            resume_id: UUID резюме.
+            context_hash: Hash резюме, требований пользователя и версии фильтра
+                (см. calculate_match_context_hash).
             vacancy_hashes: Список hash вакансий.
 
         Returns:
             Словарь vacancy_hash -> ResumeToVacancyMatch для найденных мэтчей.
         """
-        return await self._repository.get_batch_by_resume_and_vacancy_hashes(
-            resume_id, vacancy_hashes
+        return await self._repository.get_batch_by_context_and_vacancy_hashes(
+            context_hash, vacancy_hashes
         )
@@ -13,7 +13,7 @@ from domain.entities.vacancy_detail import VacancyDetail
 from domain.exceptions.agent_exceptions import AgentParseError
 from domain.interfaces.unit_of_work_port import UnitOfWorkPort
 from domain.interfaces.vacancy_filter_service_port import VacancyFilterServicePort
-from domain.utils.vacancy_hash import calculate_vacancy_hash
+from domain.utils.vacancy_hash import calculate_match_context_hash, calculate_vacancy_hash
 
 
 class GetFilteredVacanciesWithCacheUseCase:
@@ -70,6 +70,11 @@ class GetFilteredVacanciesWithCacheUseCase:
             v.vacancy_id: calculate_vacancy_hash(v.vacancy_id) for v in vacancies
         }
         vacancy_hash_list = list(vacancy_hashes.values())
+        # Мэтчи ищутся по содержимому резюме и требований, а не по resume_id:
+        # правка резюме сбрасывает кеш, одинаковые резюме используют общие мэтчи
+        context_hash = calculate_match_context_hash(
+            resume, user_filter_params, self._filter_service.match_cache_version()
+        )
 
         # 2. Получаем мэтчи из БД
         from domain.use_cases.get_batch_resume_to_vacancy_matches import (
@@ -81,7 +86,7 @@ class GetFilteredVacanciesWithCacheUseCase:
                 uow.resume_to_vacancy_match_repository
             )
             found_matches = await get_batch_matches_uc.execute(
-                resume_id, vacancy_hash_list
+                context_hash, vacancy_hash_list
             )
 
         # 3. Разделяем вакансии на найденные и не найденные
@@ -141,6 +146,7 @@ class GetFilteredVacanciesWithCacheUseCase:
                         vacancy_hash=vacancy_hash,
                         confidence=dto.confidence,
                         reason=dto.reason,
+                        context_hash=context_hash,
                     )
                     new_matches.append(match)
 
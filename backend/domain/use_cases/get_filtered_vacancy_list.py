@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, List, Optional
 from uuid import UUID
 
 from domain.entities.filtered_vacancy_list import FilteredVacancyListItem
 from domain.entities.resume_filter_settings import ResumeFilterSettings
+from domain.entities.vacancy_list import VacancyList, VacancyListItem
 from domain.use_cases.get_filtered_vacancy_list_with_cache import (
     GetFilteredVacancyListWithCacheUseCase,
 )
@@ -44,9 +45,10 @@ class GetFilteredVacancyListUseCase:
         order_by: str | None = None,
         user_id: Optional[UUID] = None,
         update_cookies_uc: Optional[UpdateUserHhAuthCookiesUseCase] = None,
+        exclude_vacancy_ids: Optional[AbstractSet[int]] = None,
     ) -> List[FilteredVacancyListItem]:
         # 1. Получаем list-вакансии через существующий use case
-        vacancy_list = await self._get_vacancy_list_uc.execute(
+        vacancy_list = await self.fetch(
             headers=headers,
             cookies=cookies,
             settings=settings,
@@ -57,14 +59,58 @@ class GetFilteredVacancyListUseCase:
             order_by=order_by,
         )
 
-        # 2. Фильтруем их через use case с кэшированием
-        filtered: List[FilteredVacancyListItem] = await self._filter_vacancy_list_with_cache_uc.execute(
-            vacancies=vacancy_list.items,
+        # 2. Отбрасываем уже обработанные вакансии до LLM-фильтрации
+        vacancies = vacancy_list.items
+        if exclude_vacancy_ids:
+            vacancies = [v for v in vacancies if v.vacancy_id not in exclude_vacancy_ids]
+
+        # 3. Фильтруем их через use case с кэшированием
+        return await self.filter(
+            vacancies=vacancies,
             resume_id=resume_id,
-            resume=user_resume,
+            user_resume=user_resume,
             user_filter_params=user_filter_params,
             user_id=user_id,
         )
 
-        return filtered
+    async def fetch(
+        self,
+        *,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        settings: ResumeFilterSettings,
+        text: str,
+        page: str,
+        search_session_id: str,
+        resume_hash: str | None = None,
+        order_by: str | None = None,
+    ) -> VacancyList:
+        """Одна страница выдачи без фильтрации."""
+        return await self._get_vacancy_list_uc.execute(
+            headers=headers,
+            cookies=cookies,
+            settings=settings,
+            text=text,
+            page=page,
+            search_session_id=search_session_id,
+            resume_hash=resume_hash,
+            order_by=order_by,
+        )
 
+    async def filter(
+        self,
+        *,
+        vacancies: List[VacancyListItem],
+        resume_id: UUID,
+        user_resume: str,
+        user_filter_params: str | None = None,
+        user_id: Optional[UUID] = None,
+    ) -> List[FilteredVacancyListItem]:
+        """Фильтрация уже полученных list-вакансий (мэтчи из БД, остальные — через LLM)."""
+        return await self._filter_vacancy_list_with_cache_uc.execute(
+            vacancies=vacancies,
+            resume_id=resume_id,
+            resume=user_resume,
+            user_filter_params=user_filter_params,
+            user_id=user_id,
+        )
@@ -15,7 +15,7 @@ from domain.interfaces.unit_of_work_port import UnitOfWorkPort
 from domain.interfaces.vacancy_list_filter_service_port import (
     VacancyListFilterServicePort,
 )
-from domain.utils.vacancy_hash import calculate_vacancy_hash
+from domain.utils.vacancy_hash import calculate_match_context_hash, calculate_vacancy_hash
 
 
 class GetFilteredVacancyListWithCacheUseCase:
@@ -38,7 +38,7 @@ class GetFilteredVacancyListWithCacheUseCase:
             create_unit_of_work: Фабрика для создания UnitOfWork.
             filter_service: Сервис нейронной фильтрации.
             minimal_confidence: Минимальный порог confidence.
-            batch_size: Размер батча для нейронной фильтрации.
+            batch_size: Максимум вакансий в батче нейронной фильтрации.
         """
         self._create_uow = create_unit_of_work
         self._filter_service = filter_service
@@ -72,6 +72,11 @@ class GetFilteredVacancyListWithCacheUseCase:
             v.vacancy_id: calculate_vacancy_hash(v.vacancy_id) for v in vacancies
         }
         vacancy_hash_list = list(vacancy_hashes.values())
+        # Мэтчи ищутся по содержимому резюме и требований, а не по resume_id:
+        # правка резюме сбрасывает кеш, одинаковые резюме используют общие мэтчи
+        context_hash = calculate_match_context_hash(
+            resume, user_filter_params, self._filter_service.match_cache_version()
+        )
 
         # 2. Получаем мэтчи из БД
         from domain.use_cases.get_batch_resume_to_vacancy_matches import (
@@ -83,7 +88,7 @@ class GetFilteredVacancyListWithCacheUseCase:
                 uow.resume_to_vacancy_match_repository
             )
             found_matches = await get_batch_matches_uc.execute(
-                resume_id, vacancy_hash_list
+                context_hash, vacancy_hash_list
             )
 
         # 3. Разделяем вакансии на найденные и не найденные
@@ -103,11 +108,10 @@ class GetFilteredVacancyListWithCacheUseCase:
         # 4. Для вакансий без мэтчей вызываем нейронку
         new_matches: List[ResumeToVacancyMatch] = []
         if not_found_vacancies:
-            # Чанкуем по batch_size
-            chunks: List[List[VacancyListItem]] = [
-                not_found_vacancies[i : i + self._batch_size]
-                for i in range(0, len(not_found_vacancies), self._batch_size)
-            ]
+            # Батчи по оценке токенов под контекст модели, не больше batch_size
+            chunks = self._filter_service.plan_batches(
+                not_found_vacancies, resume, user_filter_params, max_batch_size=self._batch_size
+            )
 
             import asyncio
 
@@ -129,6 +133,7 @@ class GetFilteredVacancyListWithCacheUseCase:
                         vacancy_hash=vacancy_hash,
                         confidence=dto.confidence,
                         reason=dto.reason,
+                        context_hash=context_hash,
                     )
                     new_matches.append(match)
 
@@ -5,6 +5,10 @@ from typing import Dict
 from domain.entities.resume_filter_settings import ResumeFilterSettings
 from domain.entities.vacancy_list import VacancyList
 from domain.interfaces.hh_client_port import HHClientPort
+from domain.interfaces.vacancy_search_cache_port import VacancySearchCachePort
+
+# Параметры запроса, которые не влияют на выдачу и не должны попадать в ключ кеша
+_NON_CACHE_KEY_PARAMS = frozenset({"searchSessionId"})
 
 
 class GetVacancyListUseCase:
@@ -12,6 +16,10 @@ class GetVacancyListUseCase:
 
     Получает список вакансий через внутренний API /search/vacancy и возвращает
     краткую информацию без дополнительных запросов к /vacancies/{id}.
+
+    Если передан search_cache, одинаковые запросы разных пользователей и циклов
+    обслуживаются из кеша. Персонализированные запросы (с resume hash) кешируются
+    отдельно для каждого резюме, т.к. hash входит в ключ.
     """
 
     def __init__(
@@ -19,6 +27,7 @@ class GetVacancyListUseCase:
         hh_client: HHClientPort,
         max_vacancies: int = 50,
         internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
+        search_cache: VacancySearchCachePort | None = None,
     ) -> None:
         """Инициализация use case.
 
@@ -27,10 +36,21 @@ class GetVacancyListUseCase:
                       Может быть обычным клиентом или клиентом с автообновлением cookies.
             max_vacancies: Максимальное количество вакансий на странице.
             internal_api_base_url: Базовый URL внутреннего API HH.
+            search_cache: Опциональный кеш страниц выдачи.
         """
         self._hh_client = hh_client
         self._max_vacancies = max_vacancies
         self._internal_api_base_url = internal_api_base_url
+        self._search_cache = search_cache
+
+    def _build_cache_key(self, query: Dict[str, str]) -> str:
+        """Нормализованный ключ запроса: отсортированные параметры без searchSessionId."""
+        parts = [
+            f"{name}={value}"
+            for name, value in sorted(query.items())
+            if name not in _NON_CACHE_KEY_PARAMS
+        ]
+        return f"{self._internal_api_base_url}/search/vacancy?" + "&".join(parts)
 
     async def execute(
         self,
@@ -94,9 +114,19 @@ class GetVacancyListUseCase:
         if final_order_by:
             query["order_by"] = final_order_by
 
+        cache_key: str | None = None
+        if self._search_cache is not None:
+            cache_key = self._build_cache_key(query)
+            cached = await self._search_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Используем внутренний API /search/vacancy
         vacancy_list = await self._hh_client.fetch_vacancy_list_front(
             headers, cookies, query, internal_api_base_url=self._internal_api_base_url
         )
 
+        if cache_key is not None:
+            await self._search_cache.set(cache_key, vacancy_list)
+
         return vacancy_list
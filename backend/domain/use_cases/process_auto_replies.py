@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import time
 import uuid
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import AbstractSet, Awaitable, Dict, List
 
 from loguru import logger
 
 from domain.entities.filtered_vacancy_list import FilteredVacancyListItem
 from domain.entities.resume import Resume
+from domain.entities.resume_context import ResumeContext
 from domain.entities.resume_filter_settings import ResumeFilterSettings
 from domain.entities.user_hh_auth_data import UserHhAuthData
 from domain.exceptions.subscription_limit_exceeded import SubscriptionLimitExceededError
@@ -22,7 +25,12 @@ from domain.interfaces.resume_repository_port import ResumeRepositoryPort
 from domain.interfaces.user_hh_auth_data_repository_port import (
     UserHhAuthDataRepositoryPort,
 )
+from domain.interfaces.handled_vacancies_cache_port import HandledVacanciesCachePort
 from domain.interfaces.hh_client_port import HHClientPort
+from domain.interfaces.reply_send_scheduler_port import ReplySendSchedulerPort
+from domain.interfaces.response_quota_port import ResponseQuotaPort
+from domain.interfaces.resume_context_cache_port import ResumeContextCachePort
+from domain.interfaces.vacancy_discovery_watermark_port import VacancyDiscoveryWatermarkPort
 from domain.use_cases.generate_test_answers import GenerateTestAnswersUseCase
 from domain.use_cases.get_vacancy_test import GetVacancyTestUseCase
 from domain.use_cases.search_and_get_filtered_vacancy_list import (
@@ -38,6 +46,67 @@ class AutoReplyDisabledError(Exception):
     """Исключение, которое бросается когда автоотклик выключен во время обработки."""
 
 
+@dataclass(slots=True)
+class _PreparedReply:
+    """Письмо и ответы на тест, готовые к отправке отклика."""
+
+    cover_letter: str
+    test_answers: Dict[str, str | List[str]] | None
+    test_metadata: Dict[str, str] | None
+    internal_api_base_url: str
+
+
+class _ReplyLookahead:
+    """Подготовка откликов резюме на несколько вакансий вперед.
+
+    Пока отклик ждет своей очереди (паузы между откликами пользователя),
+    письма и ответы на тесты для следующих depth вакансий генерируются
+    параллельно, и отправка не ждет LLM. Вакансии готовятся в порядке списка.
+    """
+
+    def __init__(
+        self,
+        vacancies: List[FilteredVacancyListItem],
+        prepare: Callable[[FilteredVacancyListItem], Awaitable[Optional[_PreparedReply]]],
+        depth: int,
+    ) -> None:
+        self._vacancies = vacancies
+        self._prepare = prepare
+        self._depth = max(0, depth)
+        self._positions = {v.vacancy_id: i for i, v in enumerate(vacancies)}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._next_index = 0
+        self._fill()
+
+    async def take(self, vacancy: FilteredVacancyListItem) -> Optional[_PreparedReply]:
+        """Получить подготовленный отклик (или подготовить его сейчас) и начать следующие."""
+        task = self._tasks.pop(vacancy.vacancy_id, None)
+        position = self._positions.get(vacancy.vacancy_id)
+        if position is not None:
+            self._next_index = max(self._next_index, position + 1)
+        self._fill()
+        if task is None:
+            return await self._prepare(vacancy)
+        return await task
+
+    def cancel(self) -> None:
+        """Отменить подготовку, результат которой уже не понадобится."""
+        for task in self._tasks.values():
+            if task.done():
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
+        self._tasks.clear()
+
+    def _fill(self) -> None:
+        while len(self._tasks) < self._depth and self._next_index < len(self._vacancies):
+            vacancy = self._vacancies[self._next_index]
+            self._next_index += 1
+            if vacancy.vacancy_id not in self._tasks:
+                self._tasks[vacancy.vacancy_id] = asyncio.create_task(self._prepare(vacancy))
+
+
 class ProcessAutoRepliesUseCase:
     """Use case для автоматической обработки откликов на вакансии.
 
@@ -47,7 +116,8 @@ class ProcessAutoRepliesUseCase:
     3. Сортирует по confidence (сначала самые подходящие)
     4. Для каждой вакансии генерирует письмо и отправляет отклик
     5. Для вакансий с тестами получает тест, генерирует ответы и отправляет их с откликом
-    6. Делает паузу 30 секунд между откликами
+    6. Делает паузу 30 секунд между откликами (или ставит отклики в общую очередь
+       reply_scheduler, которая сама соблюдает паузы и приоритеты)
     """
 
     def __init__(
@@ -67,6 +137,13 @@ class ProcessAutoRepliesUseCase:
         increment_response_count_uc=None,
         max_vacancies_per_resume: int = 200,
         delay_between_replies_seconds: int = 30,
+        reply_scheduler: Optional[ReplySendSchedulerPort] = None,
+        prepare_lookahead: int = 0,
+        discovery_watermarks: Optional[VacancyDiscoveryWatermarkPort] = None,
+        discovery_wave_pages: int = 2,
+        handled_vacancies: Optional[HandledVacanciesCachePort] = None,
+        resume_contexts: Optional[ResumeContextCachePort] = None,
+        response_quota: Optional[ResponseQuotaPort] = None,
     ) -> None:
         """Инициализация use case.
 
@@ -85,7 +162,21 @@ class ProcessAutoRepliesUseCase:
             check_subscription_uc: Use case для проверки подписки (опционально).
             increment_response_count_uc: Use case для инкремента счетчика откликов (опционально).
             max_vacancies_per_resume: Максимальное количество вакансий для обработки на одно резюме.
-            delay_between_replies_seconds: Задержка между откликами в секундах.
+            delay_between_replies_seconds: Задержка между откликами в секундах (без reply_scheduler).
+            reply_scheduler: Общая очередь отправки откликов (опционально).
+            prepare_lookahead: На сколько вакансий вперед заранее готовить письма
+                и ответы на тесты (0 — готовить только в момент отклика).
+            discovery_watermarks: Границы просмотренной выдачи резюме. Если заданы,
+                каждый цикл запрашивает выдачу по дате только до уже просмотренной части.
+            discovery_wave_pages: Сколько страниц выдачи запрашивать параллельно
+                при инкрементальном поиске.
+            handled_vacancies: Кеш вакансий с прежними откликами резюме (опционально).
+                Если задан, такие вакансии отсеиваются до LLM-фильтрации и очереди.
+            resume_contexts: Кеш контекста резюме (опционально). Если задан, проверки
+                перед каждым откликом читают состояние резюме из памяти, а не из БД.
+            response_quota: Квота откликов по подписке (опционально). Если задана,
+                отклик атомарно занимает квоту до отправки вместо проверки и инкремента
+                счетчика в транзакции отклика.
         """
         self._resume_repository = resume_repository
         self._user_hh_auth_data_repository = user_hh_auth_data_repository
@@ -102,6 +193,13 @@ class ProcessAutoRepliesUseCase:
         self._increment_response_count_uc = increment_response_count_uc
         self._max_vacancies_per_resume = max_vacancies_per_resume
         self._delay_between_replies_seconds = delay_between_replies_seconds
+        self._reply_scheduler = reply_scheduler
+        self._prepare_lookahead = prepare_lookahead
+        self._discovery_watermarks = discovery_watermarks
+        self._discovery_wave_pages = discovery_wave_pages
+        self._handled_vacancies = handled_vacancies
+        self._resume_contexts = resume_contexts
+        self._response_quota = response_quota
 
     async def execute(self) -> None:
         """Выполнить обработку автооткликов для всех активных резюме."""
@@ -135,28 +233,23 @@ class ProcessAutoRepliesUseCase:
         """
         logger.info(f"Обработка резюме {resume.id}")
 
-        # 0. Проверяем лимит подписки перед началом обработки
-        if self._check_subscription_uc is not None:
-            try:
-                user_subscription, plan = await self._check_subscription_uc.execute(
-                    resume.user_id
-                )
-                if user_subscription.responses_count >= plan.response_limit:
-                    logger.info(
-                        f"Лимит откликов для пользователя {resume.user_id} исчерпан: "
-                        f"{user_subscription.responses_count}/{plan.response_limit}. "
-                        f"Пропускаем резюме {resume.id}"
-                    )
-                    return
-            except ValueError as exc:
-                # Если подписка не найдена, логируем и продолжаем
-                logger.warning(
-                    f"Не удалось проверить лимит подписки для user_id={resume.user_id}: {exc}. "
-                    "Продолжаем без проверки лимита."
-                )
+        # 0. Загружаем контекст резюме: подписку, auth данные и настройки фильтров
+        context = await self._get_resume_context(resume)
+        if context is None:
+            logger.warning(f"Резюме {resume.id} не найдено. Пропускаем обработку.")
+            return
+
+        # Проверяем лимит подписки перед началом обработки
+        if context.limit_exhausted:
+            logger.info(
+                f"Лимит откликов для пользователя {resume.user_id} исчерпан: "
+                f"{context.responses_count}/{context.response_limit}. "
+                f"Пропускаем резюме {resume.id}"
+            )
+            return
 
         # 1. Получаем auth данные пользователя
-        auth_data = await self._user_hh_auth_data_repository.get_by_user_id(resume.user_id)
+        auth_data = context.auth_data
         if not auth_data:
             logger.warning(
                 f"Для резюме {resume.id} не найдены auth данные пользователя {resume.user_id}"
@@ -164,7 +257,7 @@ class ProcessAutoRepliesUseCase:
             return
 
         # 2. Получаем настройки фильтров резюме
-        settings = await self._resume_filter_settings_repository.get_by_resume_id(resume.id)
+        settings = context.settings
         if not settings:
             logger.warning(
                 f"Для резюме {resume.id} не найдены настройки фильтров. "
@@ -220,20 +313,44 @@ class ProcessAutoRepliesUseCase:
             )
             logger.warning(f"UpdateUserHhAuthCookiesUseCase создан с транзакционным репозиторием (standalone_cookies_uow_factory не передан)")
 
+        # Вакансии с прежними откликами отсеиваются до LLM-фильтрации
+        handled_ids: AbstractSet[int] = frozenset()
+        if self._handled_vacancies is not None:
+            handled_ids = await self._handled_vacancies.get_handled_ids(resume.id)
+
         try:
-            vacancies = await self._search_and_get_filtered_vacancy_list_uc.execute(
-                user_resume=resume.content,
-                headers=auth_data.headers,
-                cookies=auth_data.cookies,
-                settings=settings,
-                page_indices=page_indices,
-                search_session_id=search_session_id,
-                resume_id=resume.id,
-                resume_hash=resume.headhunter_hash,
-                user_filter_params=resume.user_parameters,
-                user_id=resume.user_id,
-                update_cookies_uc=update_cookies_uc,
-            )
+            if self._discovery_watermarks is not None:
+                # Только вакансии, опубликованные после прошлого цикла резюме
+                vacancies = await self._search_and_get_filtered_vacancy_list_uc.execute_incremental(
+                    user_resume=resume.content,
+                    headers=auth_data.headers,
+                    cookies=auth_data.cookies,
+                    settings=settings,
+                    max_pages=pages_needed,
+                    search_session_id=search_session_id,
+                    resume_id=resume.id,
+                    watermarks=self._discovery_watermarks,
+                    wave_pages=self._discovery_wave_pages,
+                    resume_hash=resume.headhunter_hash,
+                    user_filter_params=resume.user_parameters,
+                    user_id=resume.user_id,
+                    exclude_vacancy_ids=handled_ids,
+                )
+            else:
+                vacancies = await self._search_and_get_filtered_vacancy_list_uc.execute(
+                    user_resume=resume.content,
+                    headers=auth_data.headers,
+                    cookies=auth_data.cookies,
+                    settings=settings,
+                    page_indices=page_indices,
+                    search_session_id=search_session_id,
+                    resume_id=resume.id,
+                    resume_hash=resume.headhunter_hash,
+                    user_filter_params=resume.user_parameters,
+                    user_id=resume.user_id,
+                    update_cookies_uc=update_cookies_uc,
+                    exclude_vacancy_ids=handled_ids,
+                )
         except Exception as exc:
             logger.error(
                 f"Ошибка при получении вакансий для резюме {resume.id}: {exc}",
@@ -241,11 +358,13 @@ class ProcessAutoRepliesUseCase:
             )
             return
 
-        # 4. Фильтруем вакансии: с confidence >= порог из резюме
+        # 4. Фильтруем вакансии: с confidence >= порог из резюме и без прежних откликов
+        if self._handled_vacancies is not None:
+            handled_ids = await self._handled_vacancies.get_handled_ids(resume.id)
         threshold = resume.autolike_threshold / 100.0
         suitable_vacancies = [
             v for v in vacancies 
-            if (v.confidence or 0.0) >= threshold
+            if (v.confidence or 0.0) >= threshold and v.vacancy_id not in handled_ids
         ]
 
         # Ограничиваем количество вакансий
@@ -269,10 +388,7 @@ class ProcessAutoRepliesUseCase:
             return
 
         # 6.1. Проверяем актуальное состояние автоотклика перед началом откликов
-        current_resume = await self._resume_repository.get_by_headhunter_hash(
-            user_id=resume.user_id,
-            headhunter_hash=resume.headhunter_hash,
-        )
+        current_resume = await self._get_current_resume(resume)
         if not current_resume:
             logger.warning(
                 f"Резюме с headhunter_hash {resume.headhunter_hash} для пользователя "
@@ -288,27 +404,19 @@ class ProcessAutoRepliesUseCase:
             return
 
         # 7. Обрабатываем каждую вакансию (каждый отклик в отдельной транзакции)
+        lookahead = self._create_lookahead(suitable_vacancies, resume, auth_data)
+        if self._reply_scheduler is not None:
+            try:
+                await self._schedule_replies(suitable_vacancies, resume, auth_data, lookahead)
+            finally:
+                if lookahead is not None:
+                    lookahead.cancel()
+            return
+
         for vacancy in suitable_vacancies:
             try:
                 # Проверяем лимит перед каждым откликом
-                if self._check_subscription_uc is not None:
-                    try:
-                        user_subscription, plan = await self._check_subscription_uc.execute(
-                            resume.user_id
-                        )
-                        if user_subscription.responses_count >= plan.response_limit:
-                            logger.info(
-                                f"Лимит откликов для пользователя {resume.user_id} исчерпан: "
-                                f"{user_subscription.responses_count}/{plan.response_limit}. "
-                                f"Прекращаем обработку резюме {resume.id}"
-                            )
-                            raise SubscriptionLimitExceededError(
-                                count=user_subscription.responses_count,
-                                limit=plan.response_limit,
-                            )
-                    except ValueError:
-                        # Если подписка не найдена, продолжаем
-                        pass
+                await self._ensure_reply_limit_not_exceeded(resume)
 
                 # Запускаем обработку вакансии в асинхронной задаче
                 task = asyncio.create_task(
@@ -316,6 +424,7 @@ class ProcessAutoRepliesUseCase:
                         vacancy=vacancy,
                         resume=resume,
                         auth_data=auth_data,
+                        lookahead=lookahead,
                     )
                 )
                 
@@ -351,11 +460,171 @@ class ProcessAutoRepliesUseCase:
             # Пауза между откликами
             await asyncio.sleep(self._delay_between_replies_seconds)
 
+        if lookahead is not None:
+            lookahead.cancel()
+
+    def _create_lookahead(
+        self,
+        vacancies: List[FilteredVacancyListItem],
+        resume: Resume,
+        auth_data: UserHhAuthData,
+    ) -> Optional[_ReplyLookahead]:
+        if self._prepare_lookahead <= 0 or not vacancies:
+            return None
+        return _ReplyLookahead(
+            vacancies,
+            functools.partial(self._prepare_reply, resume=resume, auth_data=auth_data),
+            self._prepare_lookahead,
+        )
+
+    async def _load_resume_context(self, resume: Resume) -> Optional[ResumeContext]:
+        """Прочитать из БД актуальное состояние резюме, auth данные, фильтры и подписку."""
+        current_resume = await self._resume_repository.get_by_id(resume.id)
+        if current_resume is None:
+            return None
+        context = ResumeContext(
+            resume=current_resume,
+            auth_data=await self._user_hh_auth_data_repository.get_by_user_id(resume.user_id),
+            settings=await self._resume_filter_settings_repository.get_by_resume_id(resume.id),
+        )
+        if self._check_subscription_uc is not None:
+            try:
+                user_subscription, plan = await self._check_subscription_uc.execute(resume.user_id)
+                context.responses_count = user_subscription.responses_count
+                context.response_limit = plan.response_limit
+            except ValueError as exc:
+                # Если подписка не найдена, логируем и продолжаем
+                logger.warning(
+                    f"Не удалось проверить лимит подписки для user_id={resume.user_id}: {exc}. "
+                    "Продолжаем без проверки лимита."
+                )
+        return context
+
+    async def _get_resume_context(self, resume: Resume) -> Optional[ResumeContext]:
+        """Контекст резюме из кеша (при промахе — из БД)."""
+        if self._resume_contexts is None:
+            return await self._load_resume_context(resume)
+        return await self._resume_contexts.get_or_load(
+            resume.id, functools.partial(self._load_resume_context, resume)
+        )
+
+    async def _get_current_resume(self, resume: Resume) -> Optional[Resume]:
+        """Актуальное состояние резюме: из кеша контекста или запросом к БД."""
+        if self._resume_contexts is not None:
+            context = await self._get_resume_context(resume)
+            return context.resume if context is not None else None
+        return await self._resume_repository.get_by_headhunter_hash(
+            user_id=resume.user_id,
+            headhunter_hash=resume.headhunter_hash,
+        )
+
+    async def _ensure_reply_limit_not_exceeded(self, resume: Resume) -> None:
+        """Бросает SubscriptionLimitExceededError, если лимит откликов пользователя исчерпан."""
+        if self._check_subscription_uc is None:
+            return
+        if self._resume_contexts is not None:
+            # Снимок подписки из кеша: отправленные отклики учитываются в нем сразу
+            context = await self._get_resume_context(resume)
+            if context is not None and context.limit_exhausted:
+                logger.info(
+                    f"Лимит откликов для пользователя {resume.user_id} исчерпан: "
+                    f"{context.responses_count}/{context.response_limit}. "
+                    f"Прекращаем обработку резюме {resume.id}"
+                )
+                raise SubscriptionLimitExceededError(
+                    count=context.responses_count,
+                    limit=context.response_limit,
+                )
+            return
+        try:
+            user_subscription, plan = await self._check_subscription_uc.execute(resume.user_id)
+        except ValueError:
+            # Если подписка не найдена, продолжаем
+            return
+        if user_subscription.responses_count >= plan.response_limit:
+            logger.info(
+                f"Лимит откликов для пользователя {resume.user_id} исчерпан: "
+                f"{user_subscription.responses_count}/{plan.response_limit}. "
+                f"Прекращаем обработку резюме {resume.id}"
+            )
+            raise SubscriptionLimitExceededError(
+                count=user_subscription.responses_count,
+                limit=plan.response_limit,
+            )
+
+    async def _schedule_replies(
+        self,
+        vacancies: List[FilteredVacancyListItem],
+        resume: Resume,
+        auth_data: UserHhAuthData,
+        lookahead: Optional[_ReplyLookahead] = None,
+    ) -> None:
+        """Поставить отклики резюме в общую очередь и дождаться их завершения.
+
+        Порядок отправки, паузы между откликами пользователя и число одновременных
+        отправок определяет планировщик. Ожидание держит задачу резюме активной,
+        чтобы воркер не запустил повторный поиск, пока отклики еще в очереди.
+        """
+        futures = [
+            self._reply_scheduler.submit(
+                user_id=resume.user_id,
+                resume_id=resume.id,
+                vacancy_id=vacancy.vacancy_id,
+                confidence=vacancy.confidence or 0.0,
+                run=functools.partial(
+                    self._process_scheduled_vacancy, vacancy, resume, auth_data, lookahead
+                ),
+            )
+            for vacancy in vacancies
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        cancelled = sum(1 for r in results if isinstance(r, asyncio.CancelledError))
+        failed = sum(
+            1 for r in results if isinstance(r, BaseException) and not isinstance(r, asyncio.CancelledError)
+        )
+        logger.info(
+            f"Отклики резюме {resume.id} обработаны: всего {len(results)}, "
+            f"снято из очереди {cancelled}, с ошибкой {failed}"
+        )
+
+    async def _process_scheduled_vacancy(
+        self,
+        vacancy: FilteredVacancyListItem,
+        resume: Resume,
+        auth_data: UserHhAuthData,
+        lookahead: Optional[_ReplyLookahead] = None,
+    ) -> None:
+        """Задание планировщика: отклик на вакансию с остановкой очереди резюме при необходимости."""
+        try:
+            await self._ensure_reply_limit_not_exceeded(resume)
+            await self._process_vacancy(
+                vacancy=vacancy, resume=resume, auth_data=auth_data, lookahead=lookahead
+            )
+        except AutoReplyDisabledError:
+            logger.info(
+                f"Обработка вакансий для резюме {resume.id} прекращена: автоотклик выключен"
+            )
+            self._reply_scheduler.cancel_resume(resume.id)
+        except SubscriptionLimitExceededError as exc:
+            logger.info(
+                f"Обработка вакансий для резюме {resume.id} прекращена: "
+                f"лимит откликов исчерпан ({exc.count}/{exc.limit})"
+            )
+            self._reply_scheduler.cancel_resume(resume.id)
+        except Exception as exc:
+            logger.error(
+                f"Ошибка при обработке вакансии {vacancy.vacancy_id} "
+                f"для резюме {resume.id}: {exc}",
+                exc_info=True,
+            )
+            raise
+
     async def _process_vacancy(
         self,
         vacancy: FilteredVacancyListItem,
         resume: Resume,
         auth_data: UserHhAuthData,
+        lookahead: Optional[_ReplyLookahead] = None,
     ) -> None:
         """Обработать одну вакансию: сгенерировать письмо и откликнуться.
 
@@ -363,6 +632,7 @@ class ProcessAutoRepliesUseCase:
             vacancy: Вакансия для обработки (FilteredVacancyListItem).
             resume: Резюме кандидата.
             auth_data: Auth данные пользователя.
+            lookahead: Заранее подготовленные отклики резюме (опционально).
         """
         # Проверяем актуальное состояние автоотклика перед каждым откликом
         if not resume.headhunter_hash:
@@ -372,10 +642,7 @@ class ProcessAutoRepliesUseCase:
             )
             return
 
-        current_resume = await self._resume_repository.get_by_headhunter_hash(
-            user_id=resume.user_id,
-            headhunter_hash=resume.headhunter_hash,
-        )
+        current_resume = await self._get_current_resume(resume)
         if not current_resume:
             logger.warning(
                 f"Резюме с headhunter_hash {resume.headhunter_hash} для пользователя "
@@ -390,6 +657,25 @@ class ProcessAutoRepliesUseCase:
             )
             raise AutoReplyDisabledError("Автоотклик выключен")
 
+        if lookahead is not None:
+            prepared = await lookahead.take(vacancy)
+        else:
+            prepared = await self._prepare_reply(vacancy, resume, auth_data)
+        if prepared is None:
+            return
+        await self._send_reply(vacancy, resume, auth_data, prepared)
+
+    async def _prepare_reply(
+        self,
+        vacancy: FilteredVacancyListItem,
+        resume: Resume,
+        auth_data: UserHhAuthData,
+    ) -> Optional[_PreparedReply]:
+        """Сгенерировать письмо и ответы на тест вакансии (без отправки отклика).
+
+        Returns:
+            Подготовленный отклик или None, если вакансию нужно пропустить.
+        """
         # Формируем описание вакансии для генератора писем
         vacancy_description_parts = [f"Название: {vacancy.name}"]
         if vacancy.company_name:
@@ -463,7 +749,7 @@ class ProcessAutoRepliesUseCase:
                             f"(возможно, форма с тестом отсутствует в HTML-странице). "
                             "Пропускаем вакансию."
                         )
-                        return
+                        return None
                     
                     # Генерируем ответы на тест
                     test_answers = await self._generate_test_answers_uc.execute(
@@ -478,7 +764,7 @@ class ProcessAutoRepliesUseCase:
                             f"Не удалось сгенерировать ответы на тест для вакансии {vacancy.vacancy_id}. "
                             "Пропускаем вакансию."
                         )
-                        return
+                        return None
                     
                     # Подготавливаем метаданные теста
                     test_metadata = {
@@ -498,8 +784,23 @@ class ProcessAutoRepliesUseCase:
                         exc_info=True,
                     )
                     # Пропускаем вакансию при ошибке обработки теста
-                    return
+                    return None
+
+        return _PreparedReply(
+            cover_letter=cover_letter,
+            test_answers=test_answers,
+            test_metadata=test_metadata,
+            internal_api_base_url=internal_api_base_url,
+        )
 
+    async def _send_reply(
+        self,
+        vacancy: FilteredVacancyListItem,
+        resume: Resume,
+        auth_data: UserHhAuthData,
+        prepared: _PreparedReply,
+    ) -> None:
+        """Отправить подготовленный отклик и сохранить его в БД."""
         # Отправляем отклик и сохраняем в БД (в отдельной транзакции для каждого отклика)
         try:
             if not resume.headhunter_hash:
@@ -509,19 +810,28 @@ class ProcessAutoRepliesUseCase:
                 )
                 return
             
-            # Проверяем, не было ли уже ошибки для этой пары резюме+вакансия
-            check_uow = self._create_unit_of_work_factory()
-            async with check_uow:
-                failed_response = await check_uow.vacancy_response_repository.get_failed_by_resume_and_vacancy_id(
-                    resume_id=resume.id,
-                    vacancy_id=vacancy.vacancy_id
-                )
-                if failed_response:
+            # Проверяем, не было ли уже отклика или ошибки для этой пары резюме+вакансия
+            if self._handled_vacancies is not None:
+                handled_ids = await self._handled_vacancies.get_handled_ids(resume.id)
+                if vacancy.vacancy_id in handled_ids:
                     logger.info(
-                        f"Для резюме {resume.id} и вакансии {vacancy.vacancy_id} уже была ошибка "
-                        f"(status_code={failed_response.error_status_code}). Пропускаем."
+                        f"Для резюме {resume.id} и вакансии {vacancy.vacancy_id} уже был отклик "
+                        "или ошибка. Пропускаем."
                     )
                     return
+            else:
+                check_uow = self._create_unit_of_work_factory()
+                async with check_uow:
+                    failed_response = await check_uow.vacancy_response_repository.get_failed_by_resume_and_vacancy_id(
+                        resume_id=resume.id,
+                        vacancy_id=vacancy.vacancy_id
+                    )
+                    if failed_response:
+                        logger.info(
+                            f"Для резюме {resume.id} и вакансии {vacancy.vacancy_id} уже была ошибка "
+                            f"(status_code={failed_response.error_status_code}). Пропускаем."
+                        )
+                        return
             
             logger.info(
                 f"Отправка отклика: vacancy_id={vacancy.vacancy_id}, "
@@ -544,6 +854,7 @@ class ProcessAutoRepliesUseCase:
                 # и не требует атомарности с другими операциями
                 create_vacancy_response_base_uc = CreateVacancyResponseUseCase(
                     vacancy_response_repository=unit_of_work.standalone_vacancy_response_repository,
+                    handled_vacancies=self._handled_vacancies,
                 )
                 create_vacancy_response_uc = CreateVacancyResponseWithNotificationUseCase(
                     create_vacancy_response_uc=create_vacancy_response_base_uc,
@@ -574,6 +885,7 @@ class ProcessAutoRepliesUseCase:
                     create_vacancy_response_uc=create_vacancy_response_uc,
                     check_subscription_uc=check_subscription_uc,
                     increment_response_count_uc=increment_response_count_uc,
+                    response_quota=self._response_quota,
                 )
                 
                 # Отправляем отклик БЕЗ обновления cookies в транзакции
@@ -584,16 +896,19 @@ class ProcessAutoRepliesUseCase:
                     resume_hash=resume.headhunter_hash,
                     headers=auth_data.headers,
                     cookies=auth_data.cookies,
-                    letter=cover_letter,
+                    letter=prepared.cover_letter,
                     vacancy_name=vacancy.name,
                     vacancy_url=vacancy.alternate_url,
-                    test_answers=test_answers,
-                    test_metadata=test_metadata,
-                    internal_api_base_url=internal_api_base_url,
+                    test_answers=prepared.test_answers,
+                    test_metadata=prepared.test_metadata,
+                    internal_api_base_url=prepared.internal_api_base_url,
                     update_cookies_uc=None,  # Не обновляем cookies в транзакции
                 )
                 # Транзакция автоматически коммитится при выходе из async with
             
+            if self._resume_contexts is not None:
+                self._resume_contexts.note_reply_sent(resume.user_id)
+
             # Cookies не обновляются сразу после отклика, чтобы избежать deadlock
             # Они обновятся при следующем запросе к HH API через HHHttpClientWithCookieUpdate
             logger.info(
@@ -12,6 +12,7 @@ from loguru import logger
 
 from domain.entities.vacancy_response import VacancyResponse
 from domain.exceptions.subscription_limit_exceeded import SubscriptionLimitExceededError
+from domain.interfaces.response_quota_port import ResponseQuotaPort
 from domain.use_cases.create_vacancy_response import CreateVacancyResponseUseCase
 from domain.use_cases.respond_to_vacancy import RespondToVacancyUseCase
 from domain.use_cases.update_user_hh_auth_cookies import UpdateUserHhAuthCookiesUseCase
@@ -35,6 +36,7 @@ class RespondToVacancyAndSaveUseCase:
         create_vacancy_response_uc: CreateVacancyResponseUseCase,
         check_subscription_uc: CheckAndUpdateSubscriptionUseCase | None = None,
         increment_response_count_uc: IncrementResponseCountUseCase | None = None,
+        response_quota: ResponseQuotaPort | None = None,
     ) -> None:
         """Инициализация use case.
 
@@ -43,11 +45,15 @@ class RespondToVacancyAndSaveUseCase:
             create_vacancy_response_uc: Use case для сохранения отклика в БД.
             check_subscription_uc: Use case для проверки и обновления подписки (опционально).
             increment_response_count_uc: Use case для инкремента счетчика откликов (опционально).
+            response_quota: Квота откликов (опционально). Если задана, отклик занимает
+                квоту атомарно до отправки вместо проверки и инкремента счетчика,
+                а неотправленный отклик возвращает ее.
         """
         self._respond_to_vacancy_uc = respond_to_vacancy_uc
         self._create_vacancy_response_uc = create_vacancy_response_uc
         self._check_subscription_uc = check_subscription_uc
         self._increment_response_count_uc = increment_response_count_uc
+        self._response_quota = response_quota
 
     async def execute(
         self,
@@ -90,7 +96,11 @@ class RespondToVacancyAndSaveUseCase:
             SubscriptionLimitExceededError: При превышении лимита откликов.
         """
         # 1. Проверяем лимит подписки перед отправкой отклика
-        if self._check_subscription_uc is not None:
+        quota_acquired = False
+        if self._response_quota is not None:
+            # Квота занимается атомарно: конкурентные отправки не превысят лимит
+            quota_acquired = await self._response_quota.acquire(user_id)
+        elif self._check_subscription_uc is not None:
             try:
                 user_subscription, plan = await self._check_subscription_uc.execute(
                     user_id
@@ -119,16 +129,22 @@ class RespondToVacancyAndSaveUseCase:
 
         # 2. Отправляем отклик в HH через существующий use case
         try:
-            hh_response = await self._respond_to_vacancy_uc.execute(
-                vacancy_id=vacancy_id,
-                resume_hash=resume_hash,
-                headers=headers,
-                cookies=cookies,
-                letter=letter,
-                internal_api_base_url=internal_api_base_url,
-                test_answers=test_answers,
-                test_metadata=test_metadata,
-            )
+            try:
+                hh_response = await self._respond_to_vacancy_uc.execute(
+                    vacancy_id=vacancy_id,
+                    resume_hash=resume_hash,
+                    headers=headers,
+                    cookies=cookies,
+                    letter=letter,
+                    internal_api_base_url=internal_api_base_url,
+                    test_answers=test_answers,
+                    test_metadata=test_metadata,
+                )
+            except BaseException:
+                # Отклик не отправлен — квота ему не нужна
+                if quota_acquired:
+                    await self._response_quota.refund(user_id)
+                raise
         except httpx.HTTPStatusError as exc:
             # Если ошибка 400 Bad Request, сохраняем её в БД
             if exc.response.status_code == 400:
@@ -218,8 +234,8 @@ class RespondToVacancyAndSaveUseCase:
                 f"resume_id={resume_id}, resume_hash={resume_hash}, user_id={user_id}"
             )
 
-            # 3. Увеличиваем счетчик откликов в подписке
-            if self._increment_response_count_uc is not None:
+            # 3. Увеличиваем счетчик откликов в подписке (квота уже учтена при резервировании)
+            if self._response_quota is None and self._increment_response_count_uc is not None:
                 try:
                     await self._increment_response_count_uc.execute(user_id)
                 except ValueError as exc:
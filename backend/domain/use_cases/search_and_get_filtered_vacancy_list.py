@@ -1,14 +1,50 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import AbstractSet, Dict, List, Optional, Set
 from uuid import UUID
 
+from loguru import logger
+
 from domain.entities.filtered_vacancy_list import FilteredVacancyListItem
 from domain.entities.resume_filter_settings import ResumeFilterSettings
+from domain.entities.vacancy_discovery_watermark import VacancyDiscoveryWatermark
+from domain.entities.vacancy_list import VacancyListItem
+from domain.interfaces.vacancy_discovery_watermark_port import VacancyDiscoveryWatermarkPort
 from domain.use_cases.get_filtered_vacancy_list import GetFilteredVacancyListUseCase
 from domain.use_cases.update_user_hh_auth_cookies import UpdateUserHhAuthCookiesUseCase
 
+# Сортировка выдачи HH по дате публикации (сначала новые)
+ORDER_BY_PUBLICATION_TIME = "publication_time"
+
+
+def _parse_publication_time(value: str | None) -> datetime | None:
+    """Время публикации HH ("2024-05-01T12:00:00+0300") или None, если не разобрать."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+
+def _is_behind_watermark(
+    item: VacancyListItem,
+    newest: datetime | None,
+    seen_ids: Set[int],
+) -> bool:
+    """True, если вакансия не новее границы: дальше в выдаче только просмотренное."""
+    published = _parse_publication_time(item.publication_time_iso)
+    if published is None or newest is None:
+        return item.vacancy_id in seen_ids
+    if published < newest:
+        return True
+    return published == newest and item.vacancy_id in seen_ids
+
 
 class SearchAndGetFilteredVacancyListUseCase:
     """Верхнеуровневый use case для поиска и получения отфильтрованных list-вакансий.
@@ -42,6 +78,7 @@ class SearchAndGetFilteredVacancyListUseCase:
         order_by: str | None = None,
         user_id: Optional[UUID] = None,
         update_cookies_uc: Optional[UpdateUserHhAuthCookiesUseCase] = None,
+        exclude_vacancy_ids: Optional[AbstractSet[int]] = None,
     ) -> List[FilteredVacancyListItem]:
         """Получает отфильтрованные list-вакансии с нескольких страниц, используя текст из настроек.
 
@@ -54,6 +91,8 @@ class SearchAndGetFilteredVacancyListUseCase:
             search_session_id: ID сессии поиска.
             order_by: Опциональный параметр сортировки.
             user_filter_params: Дополнительные требования пользователя к фильтрации.
+            exclude_vacancy_ids: ID вакансий, которые не нужно фильтровать и возвращать
+                (например, уже откликнутые).
 
         Returns:
             Список отфильтрованных list-вакансий со всех обработанных страниц.
@@ -81,6 +120,7 @@ class SearchAndGetFilteredVacancyListUseCase:
                 order_by=order_by,
                 user_id=user_id,
                 update_cookies_uc=update_cookies_uc,
+                exclude_vacancy_ids=exclude_vacancy_ids,
             )
 
         # 3. Запускаем параллельную обработку всех страниц
@@ -94,3 +134,119 @@ class SearchAndGetFilteredVacancyListUseCase:
 
         return all_filtered
 
+    async def execute_incremental(
+        self,
+        *,
+        user_resume: str,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        settings: ResumeFilterSettings,
+        max_pages: int,
+        search_session_id: str,
+        resume_id: UUID,
+        watermarks: VacancyDiscoveryWatermarkPort,
+        wave_pages: int = 2,
+        max_seen_ids: int = 2000,
+        resume_hash: str | None = None,
+        user_filter_params: str | None = None,
+        user_id: Optional[UUID] = None,
+        exclude_vacancy_ids: Optional[AbstractSet[int]] = None,
+    ) -> List[FilteredVacancyListItem]:
+        """Получает только вакансии, появившиеся после прошлого вызова для этого резюме.
+
+        Выдача запрашивается по дате публикации волнами по wave_pages страниц и
+        обрывается на странице, где начинается уже просмотренная часть (граница
+        резюме из watermarks). Без границы все max_pages страниц запрашиваются
+        сразу. Через LLM фильтруются только новые вакансии, после чего граница
+        сдвигается.
+
+        Args:
+            max_pages: Максимальное количество страниц выдачи.
+            watermarks: Хранилище границ просмотренной выдачи.
+            wave_pages: Сколько страниц запрашивать параллельно при наличии границы.
+            max_seen_ids: Сколько последних ID вакансий хранить в границе.
+            exclude_vacancy_ids: ID вакансий, которые не нужно фильтровать и возвращать.
+
+        Returns:
+            Отфильтрованные новые list-вакансии.
+        """
+        search_text = (settings.text or "").strip()
+        excluded = exclude_vacancy_ids or frozenset()
+        watermark = await watermarks.get(resume_id)
+        seen_ids: Set[int] = set(watermark.seen_vacancy_ids) if watermark else set()
+        newest_seen = _parse_publication_time(watermark.newest_publication_time_iso) if watermark else None
+        wave = max_pages if watermark is None else max(1, wave_pages)
+
+        fresh: List[VacancyListItem] = []
+        fresh_ids: Set[int] = set()
+        newest: datetime | None = newest_seen
+        newest_iso = watermark.newest_publication_time_iso if watermark else None
+        pages_fetched = 0
+        reached_seen = False
+
+        while pages_fetched < max_pages and not reached_seen:
+            wave_indices = range(pages_fetched, min(pages_fetched + wave, max_pages))
+            pages = await asyncio.gather(
+                *(
+                    self._get_filtered_vacancy_list_uc.fetch(
+                        headers=headers,
+                        cookies=cookies,
+                        settings=settings,
+                        text=search_text,
+                        page=str(page_index),
+                        search_session_id=search_session_id,
+                        resume_hash=resume_hash,
+                        order_by=ORDER_BY_PUBLICATION_TIME,
+                    )
+                    for page_index in wave_indices
+                )
+            )
+            pages_fetched += len(wave_indices)
+
+            for vacancy_list in pages:
+                if not vacancy_list.items:
+                    # Выдача закончилась
+                    reached_seen = True
+                    break
+                for item in vacancy_list.items:
+                    published = _parse_publication_time(item.publication_time_iso)
+                    if published is not None and (newest is None or published > newest):
+                        newest, newest_iso = published, item.publication_time_iso
+                    if watermark is not None and _is_behind_watermark(item, newest_seen, seen_ids):
+                        reached_seen = True
+                        continue
+                    if item.vacancy_id in excluded:
+                        continue
+                    if item.vacancy_id not in seen_ids and item.vacancy_id not in fresh_ids:
+                        fresh.append(item)
+                        fresh_ids.add(item.vacancy_id)
+                if reached_seen:
+                    # Следующие страницы волны старше границы
+                    break
+
+        logger.info(
+            f"[discovery] Резюме {resume_id}: страниц {pages_fetched}/{max_pages}, "
+            f"новых вакансий {len(fresh)}"
+            + (" (полный просмотр)" if watermark is None else "")
+        )
+
+        filtered: List[FilteredVacancyListItem] = []
+        if fresh:
+            filtered = await self._get_filtered_vacancy_list_uc.filter(
+                vacancies=fresh,
+                resume_id=resume_id,
+                user_resume=user_resume,
+                user_filter_params=user_filter_params,
+                user_id=user_id,
+            )
+
+        # Граница сдвигается только после успешной фильтрации новых вакансий
+        previous_ids = watermark.seen_vacancy_ids if watermark else []
+        await watermarks.set(
+            resume_id,
+            VacancyDiscoveryWatermark(
+                newest_publication_time_iso=newest_iso,
+                seen_vacancy_ids=([item.vacancy_id for item in fresh] + previous_ids)[:max_seen_ids],
+            ),
+        )
+        return filtered
@@ -1,4 +1,4 @@
-"""Утилиты для вычисления hash вакансий."""
+"""Утилиты для вычисления hash вакансий и контекста мэтчей."""
 
 from __future__ import annotations
 
@@ -20,3 +20,30 @@ def calculate_vacancy_hash(vacancy_id: int) -> str:
     vacancy_id_str = str(vacancy_id)
     hash_obj = hashlib.sha256(vacancy_id_str.encode('utf-8'))
     return hash_obj.hexdigest()
+
+
+def calculate_match_context_hash(
+    resume: str,
+    user_filter_params: str | None,
+    filter_version: str,
+) -> str:
+    """Вычислить hash контекста оценки вакансий.
+
+    Оценка вакансии зависит от текста резюме, требований пользователя,
+    модели и промпта фильтра, поэтому мэтчи кешируются по этому hash,
+    а не по resume_id.
+
+    Args:
+        resume: Текст резюме, который передается фильтру.
+        user_filter_params: Дополнительные требования пользователя к фильтрации.
+        filter_version: Версия фильтра (агент, модель, версия промпта).
+
+    Returns:
+        SHA256 hash контекста в hex формате.
+    """
+    hash_obj = hashlib.sha256()
+    for part in (filter_version, resume.strip(), (user_filter_params or "").strip()):
+        hash_obj.update(part.encode("utf-8"))
+        # Разделитель, чтобы границы частей не сдвигались
+        hash_obj.update(b"\x00")
+    return hash_obj.hexdigest()
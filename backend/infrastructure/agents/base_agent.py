@@ -14,10 +14,18 @@ from loguru import logger
 from config import OpenAIConfig
 from domain.exceptions.agent_exceptions import AgentParseError
 from domain.entities.llm_call import LlmCall
+from domain.interfaces.llm_response_cache_repository_port import LlmResponseCacheRepositoryPort
 from domain.interfaces.unit_of_work_port import UnitOfWorkPort
+from infrastructure.agents.token_estimator import estimate_messages_tokens
+from infrastructure.cache.llm_response_cache import get_llm_response_cache, llm_response_cache_key
+from infrastructure.clients.openai_client_registry import get_openai_client
+from infrastructure.scheduling.llm_scheduler import get_llm_scheduler
 
 T = TypeVar("T")
 
+# Оценка токенов ответа для бюджета планировщика (уточняется по usage ответа)
+_COMPLETION_TOKENS_ESTIMATE = 1024
+
 
 def _format_response_with_diagnostics(
     original_response: str,
@@ -90,21 +98,22 @@ class BaseAgent(ABC):
 
         Args:
             config: Конфигурация OpenAI.
-            client: Опциональный клиент AsyncOpenAI (для тестирования).
+            client: Опциональный клиент AsyncOpenAI (для тестирования); по умолчанию
+                общий клиент процесса из реестра клиентов LLM.
             unit_of_work: Опциональный UnitOfWork для логирования вызовов в БД.
         """
         self._config = config
         if client is None:
-            api_key = self._config.api_key
-            if not api_key:
-                raise RuntimeError("OpenAIConfig.api_key не задан (проверь конфиг/окружение)")
-            client = AsyncOpenAI(
-                base_url=self._config.base_url,
-                api_key=api_key,
-            )
+            client = get_openai_client(self._config)
         self._client = client
         self._unit_of_work = unit_of_work
 
+    def _response_cache_store(self) -> LlmResponseCacheRepositoryPort | None:
+        """Хранилище кеша ответов в БД (если включено и есть UnitOfWork)."""
+        if not self._config.response_cache_persistent or not self._unit_of_work:
+            return None
+        return self._unit_of_work.standalone_llm_response_cache_repository
+
     def set_unit_of_work(self, unit_of_work: UnitOfWorkPort | None) -> None:
         """Обновить UnitOfWork для логирования вызовов LLM.
 
@@ -122,9 +131,14 @@ class BaseAgent(ABC):
         response_format: Dict[str, str] | None = None,
         user_id: UUID | None = None,
         context: dict[str, Any] | None = None,
+        retry_invalid_response: bool = True,
     ) -> T:
         """Вызов LLM с retry при ошибках парсинга.
 
+        Если для агента включен кеш ответов (OpenAIConfig.response_cache_agents),
+        успешно разобранный ответ сохраняется по хешу запроса, а повторный
+        такой же запрос отдается из кеша без вызова модели.
+
         Args:
             messages: Сообщения для LLM.
             parse_func: Функция парсинга ответа -> результат.
@@ -133,6 +147,10 @@ class BaseAgent(ABC):
             response_format: Формат ответа (например {"type": "json_object"}).
             user_id: ID пользователя для логирования (опционально).
             context: Дополнительный контекст для логирования (опционально).
+            retry_invalid_response: Повторять ли запрос, если модель ответила, но ответ
+                не разобран или невалиден. False — сразу AgentParseError с
+                response_received=True (вызывающий сам решает, что повторять);
+                ошибки запроса повторяются в любом случае.
 
         Returns:
             Результат парсинга.
@@ -142,6 +160,28 @@ class BaseAgent(ABC):
         """
         call_id = uuid4()
         last_error: str | None = None
+        model = self._config.get_model_for_agent(self.AGENT_NAME)
+        estimated_tokens = estimate_messages_tokens(messages) + _COMPLETION_TOKENS_ESTIMATE
+        scheduler = get_llm_scheduler(self._config)
+
+        response_cache = None
+        cache_key: str | None = None
+        if self._config.is_response_cache_enabled(self.AGENT_NAME):
+            response_cache = get_llm_response_cache(self._config)
+            cache_key = llm_response_cache_key(model, messages, temperature, response_format)
+            cached_content = await response_cache.get(
+                cache_key, self.AGENT_NAME, self._response_cache_store()
+            )
+            if cached_content is not None:
+                try:
+                    cached_result = parse_func(cached_content)
+                    if not (validate_func and validate_func(cached_result)):
+                        logger.debug(f"[{self.AGENT_NAME}] Ответ LLM взят из кеша")
+                        return cached_result
+                except Exception as exc:
+                    logger.warning(f"[{self.AGENT_NAME}] Ответ из кеша не разобран: {exc}")
+                # Закешированный ответ больше не проходит разбор: запрашиваем заново
+                response_cache.invalidate(cache_key)
 
         for attempt in range(1, self.MAX_RETRIES + 1):
             start_time = time.time()
@@ -153,14 +193,19 @@ class BaseAgent(ABC):
 
             try:
                 kwargs: Dict[str, Any] = {
-                    "model": self._config.get_model_for_agent(self.AGENT_NAME),
+                    "model": model,
                     "messages": messages,
                     "temperature": temperature,
                 }
                 if response_format:
                     kwargs["response_format"] = response_format
 
-                response = await self._client.chat.completions.create(**kwargs)
+                async with scheduler.slot(model, estimated_tokens) as lease:
+                    # Ожидание очереди планировщика не входит в duration_ms вызова
+                    start_time = time.time()
+                    response = await self._client.chat.completions.create(**kwargs)
+                    usage = getattr(response, "usage", None)
+                    lease.used_tokens = getattr(usage, "total_tokens", None)
                 content = response.choices[0].message.content if response.choices else None
 
                 if not content:
@@ -182,6 +227,11 @@ class BaseAgent(ABC):
                 status = "success"
                 last_error = None
 
+                if response_cache is not None:
+                    await response_cache.set(
+                        cache_key, content, self.AGENT_NAME, model, self._response_cache_store()
+                    )
+
                 # Форматируем response с диагностикой
                 response_with_diagnostics = _format_response_with_diagnostics(
                     original_response=content,
@@ -266,8 +316,11 @@ class BaseAgent(ABC):
                     response_obj=response,
                 )
 
-                if attempt == self.MAX_RETRIES:
-                    raise AgentParseError(self.AGENT_NAME, self.MAX_RETRIES, last_error) from e
+                response_received = bool(content)
+                if attempt == self.MAX_RETRIES or (response_received and not retry_invalid_response):
+                    raise AgentParseError(
+                        self.AGENT_NAME, attempt, last_error, response_received=response_received
+                    ) from e
 
         raise AgentParseError(self.AGENT_NAME, self.MAX_RETRIES, last_error)
 
@@ -11,6 +11,7 @@ from loguru import logger
 from config import OpenAIConfig
 from domain.interfaces.cover_letter_generator_port import CoverLetterGeneratorPort
 from infrastructure.agents.base_agent import BaseAgent
+from infrastructure.metrics.pipeline_metrics import observe_stage
 
 
 class CoverLetterGeneratorAgent(BaseAgent, CoverLetterGeneratorPort):
@@ -22,6 +23,7 @@ class CoverLetterGeneratorAgent(BaseAgent, CoverLetterGeneratorPort):
 
     AGENT_NAME = "CoverLetterGeneratorAgent"
 
+    @observe_stage("llm_cover_letter")
     async def generate(
         self,
         resume: str,
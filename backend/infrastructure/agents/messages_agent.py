@@ -16,6 +16,7 @@ from datetime import datetime
 from uuid import uuid4
 from domain.interfaces.messages_agent_service_port import MessagesAgentServicePort
 from infrastructure.agents.base_agent import BaseAgent
+from infrastructure.metrics.pipeline_metrics import observe_stage
 
 
 class MessagesAgent(BaseAgent, MessagesAgentServicePort):
@@ -27,6 +28,7 @@ class MessagesAgent(BaseAgent, MessagesAgentServicePort):
 
     AGENT_NAME = "MessagesAgent"
 
+    @observe_stage("llm_chat_messages")
     async def analyze_chats_and_generate_responses(
         self,
         chats: List[HHChatDetailed],
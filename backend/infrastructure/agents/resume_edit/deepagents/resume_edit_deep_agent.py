@@ -48,6 +48,7 @@ from infrastructure.agents.resume_edit.tools.state_injector import StateInjector
 from infrastructure.agents.resume_edit.tools.validate_patch_tool import (
     validate_resume_patches_tool,
 )
+from infrastructure.clients.openai_client_registry import get_openai_http_client
 
 
 class ResumeEditQuestionModel(BaseModel):
@@ -109,6 +110,8 @@ def init_chat_model_from_config(
         api_key=config.api_key,
         temperature=0.4,
         callbacks=callbacks or None,
+        # Общий пул соединений с агентами на AsyncOpenAI
+        http_async_client=get_openai_http_client(config),
     )
 
 
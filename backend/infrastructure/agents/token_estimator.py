@@ -0,0 +1,30 @@
+"""Грубая оценка числа токенов промпта без токенизатора модели."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+# Кириллица дробится мельче латиницы: ~3 символа на токен вместо ~4
+_CHARS_PER_TOKEN = 3.0
+# Служебные токены на сообщение (роль, разделители)
+_TOKENS_PER_MESSAGE = 4
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Оценка токенов текста (с запасом для русского)."""
+    if not text:
+        return 0
+    return int(len(text) / _CHARS_PER_TOKEN) + 1
+
+
+def estimate_messages_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Оценка токенов промпта chat completions."""
+    total = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_text_tokens(content)
+        elif content is not None:
+            total += estimate_text_tokens(str(content))
+        total += _TOKENS_PER_MESSAGE
+    return total
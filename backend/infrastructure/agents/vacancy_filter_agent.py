@@ -21,6 +21,12 @@ class VacancyFilterAgent(BaseAgent, VacancyFilterServicePort):
     """
 
     AGENT_NAME = "VacancyFilterAgent"
+    # Увеличивать при изменении промпта или разбора ответа: сбрасывает кеш мэтчей
+    PROMPT_VERSION = 1
+
+    def match_cache_version(self) -> str:
+        model = self._config.get_model_for_agent(self.AGENT_NAME)
+        return f"{self.AGENT_NAME}:{model}:v{self.PROMPT_VERSION}"
 
     async def filter_vacancies(
         self,
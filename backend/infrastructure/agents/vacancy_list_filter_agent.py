@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import List, Sequence
+from typing import Any, Dict, List, Sequence, Tuple
 from uuid import UUID
 
 from openai import AsyncOpenAI
@@ -10,8 +11,14 @@ from loguru import logger
 from config import OpenAIConfig
 from domain.entities.filtered_vacancy_list import FilteredVacancyListDto
 from domain.entities.vacancy_list import VacancyListItem
+from domain.exceptions.agent_exceptions import AgentParseError
 from domain.interfaces.vacancy_list_filter_service_port import VacancyListFilterServicePort
 from infrastructure.agents.base_agent import BaseAgent
+from infrastructure.agents.token_estimator import estimate_messages_tokens, estimate_text_tokens
+from infrastructure.metrics.pipeline_metrics import LLM_BATCH_SPLITS, observe_stage
+
+# Ответ на одну вакансию: JSON-объект с reason до 100 символов
+_COMPLETION_TOKENS_PER_VACANCY = 64
 
 
 class VacancyListFilterAgent(BaseAgent, VacancyListFilterServicePort):
@@ -21,7 +28,56 @@ class VacancyListFilterAgent(BaseAgent, VacancyListFilterServicePort):
     """
 
     AGENT_NAME = "VacancyListFilterAgent"
+    # Увеличивать при изменении промпта или разбора ответа: сбрасывает кеш мэтчей
+    PROMPT_VERSION = 1
+
+    def match_cache_version(self) -> str:
+        model = self._config.get_model_for_agent(self.AGENT_NAME)
+        return f"{self.AGENT_NAME}:{model}:v{self.PROMPT_VERSION}"
 
+    def plan_batches(
+        self,
+        vacancies: List[VacancyListItem],
+        resume: str,
+        user_filter_params: str | None = None,
+        max_batch_size: int = 50,
+    ) -> List[List[VacancyListItem]]:
+        """Жадная упаковка вакансий в батчи по оценке токенов.
+
+        Батч ограничен контекстом модели агента (промпт и ответ на каждую
+        вакансию) и OpenAIConfig.filter_batch_max_prompt_tokens: в большом
+        батче ошибка разбора обходится дороже. Вакансия, которая не влезает
+        даже одна, уходит отдельным батчем.
+        """
+        context_tokens = self._config.get_context_tokens(
+            self._config.get_model_for_agent(self.AGENT_NAME)
+        )
+        # Резюме, требования и инструкции повторяются в каждом батче
+        base_tokens = estimate_messages_tokens(self._build_messages([], resume, user_filter_params))
+        prompt_budget = min(self._config.filter_batch_max_prompt_tokens, context_tokens) - base_tokens
+        context_budget = context_tokens - base_tokens
+
+        batches: List[List[VacancyListItem]] = []
+        batch: List[VacancyListItem] = []
+        prompt_tokens = 0
+        total_tokens = 0
+        for vacancy in vacancies:
+            vacancy_tokens = estimate_text_tokens("\n".join(self._format_vacancy(vacancy)))
+            if batch and (
+                len(batch) >= max_batch_size
+                or prompt_tokens + vacancy_tokens > prompt_budget
+                or total_tokens + vacancy_tokens + _COMPLETION_TOKENS_PER_VACANCY > context_budget
+            ):
+                batches.append(batch)
+                batch, prompt_tokens, total_tokens = [], 0, 0
+            batch.append(vacancy)
+            prompt_tokens += vacancy_tokens
+            total_tokens += vacancy_tokens + _COMPLETION_TOKENS_PER_VACANCY
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @observe_stage("llm_filter_batch")
     async def filter_vacancy_list(
         self,
         vacancies: List[VacancyListItem],
@@ -29,13 +85,112 @@ class VacancyListFilterAgent(BaseAgent, VacancyListFilterServicePort):
         user_filter_params: str | None = None,
         user_id: UUID | None = None,
     ) -> List[FilteredVacancyListDto]:
+        """Оценка батча; при неразобранном ответе батч делится пополам.
+
+        Повторяется только половина, на которой модель ошиблась, а не весь
+        батч. Вакансия, которую не удалось оценить и по одной, пропускается
+        (мэтч не сохраняется, она оценится при следующем запросе); если не
+        оценено ничего, пробрасывается AgentParseError.
+        """
         if not vacancies:
             return []
 
-        prompt = self._build_prompt(vacancies, resume, user_filter_params)
         logger.info(
             f"[{self.AGENT_NAME}] filtering {len(vacancies)} list vacancies model={self._config.get_model_for_agent(self.AGENT_NAME)}"
         )
+        result, failed, errors = await self._filter_with_split(
+            list(vacancies), resume, user_filter_params, user_id
+        )
+        if errors:
+            if not result:
+                raise errors[-1]
+            logger.warning(
+                f"[{self.AGENT_NAME}] не оценены вакансии {[v.vacancy_id for v in failed]}: {errors[-1]}"
+            )
+        return result
+
+    async def _filter_with_split(
+        self,
+        vacancies: List[VacancyListItem],
+        resume: str,
+        user_filter_params: str | None,
+        user_id: UUID | None,
+    ) -> Tuple[List[FilteredVacancyListDto], List[VacancyListItem], List[AgentParseError]]:
+        """Оценить батч, деля его пополам после неразобранного ответа.
+
+        Returns:
+            Оценки, неоцененные вакансии и ошибки по ним.
+        """
+        can_split = len(vacancies) > 1
+        try:
+            result = await self._filter_batch(
+                vacancies, resume, user_filter_params, user_id, retry_invalid_response=not can_split
+            )
+            return result, [], []
+        except AgentParseError as exc:
+            # Ошибки запроса уже повторены целиком: делить батч имеет смысл,
+            # только если модель ответила, но ответ не разобран
+            if not (can_split and exc.response_received):
+                return [], vacancies, [exc]
+
+        LLM_BATCH_SPLITS.inc(agent=self.AGENT_NAME)
+        middle = len(vacancies) // 2
+        logger.info(
+            f"[{self.AGENT_NAME}] ответ на {len(vacancies)} вакансий не разобран, "
+            f"делим батч: {middle} + {len(vacancies) - middle}"
+        )
+        halves = await asyncio.gather(
+            self._filter_with_split(vacancies[:middle], resume, user_filter_params, user_id),
+            self._filter_with_split(vacancies[middle:], resume, user_filter_params, user_id),
+        )
+        result: List[FilteredVacancyListDto] = []
+        failed: List[VacancyListItem] = []
+        errors: List[AgentParseError] = []
+        for half_result, half_failed, half_errors in halves:
+            result.extend(half_result)
+            failed.extend(half_failed)
+            errors.extend(half_errors)
+        return result, failed, errors
+
+    async def _filter_batch(
+        self,
+        vacancies: List[VacancyListItem],
+        resume: str,
+        user_filter_params: str | None,
+        user_id: UUID | None,
+        retry_invalid_response: bool,
+    ) -> List[FilteredVacancyListDto]:
+        messages = self._build_messages(vacancies, resume, user_filter_params)
+
+        def parse_func(content: str) -> List[FilteredVacancyListDto]:
+            return self._parse_response(content, vacancies)
+
+        def validate_func(result: List[FilteredVacancyListDto]) -> bool:
+            return not result
+
+        # Формируем контекст для логирования
+        context = {
+            "use_case": "filter_vacancy_list",
+            "vacancy_count": len(vacancies),
+            "vacancy_ids": [v.vacancy_id for v in vacancies],
+        }
+
+        return await self._call_llm_with_retry(
+            messages=messages,
+            parse_func=parse_func,
+            validate_func=validate_func,
+            user_id=user_id,
+            context=context,
+            retry_invalid_response=retry_invalid_response,
+        )
+
+    def _build_messages(
+        self,
+        vacancies: Sequence[VacancyListItem],
+        resume: str,
+        user_filter_params: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        prompt = self._build_prompt(vacancies, resume, user_filter_params)
 
         messages = [
             {
@@ -94,26 +249,7 @@ class VacancyListFilterAgent(BaseAgent, VacancyListFilterServicePort):
             },
         ]
 
-        def parse_func(content: str) -> List[FilteredVacancyListDto]:
-            return self._parse_response(content, vacancies)
-
-        def validate_func(result: List[FilteredVacancyListDto]) -> bool:
-            return not result
-
-        # Формируем контекст для логирования
-        context = {
-            "use_case": "filter_vacancy_list",
-            "vacancy_count": len(vacancies),
-            "vacancy_ids": [v.vacancy_id for v in vacancies],
-        }
-
-        return await self._call_llm_with_retry(
-            messages=messages,
-            parse_func=parse_func,
-            validate_func=validate_func,
-            user_id=user_id,
-            context=context,
-        )
+        return messages
 
     def _build_prompt(
         self,
@@ -142,42 +278,7 @@ class VacancyListFilterAgent(BaseAgent, VacancyListFilterServicePort):
 
         lines.append("СПИСОК ВАКАНСИЙ:")
         for v in vacancies:
-            lines.append(f"- id={v.vacancy_id}")
-            lines.append(f"  Название: {v.name}")
-            if v.company_name:
-                lines.append(f"  Компания: {v.company_name}")
-            if v.area_name:
-                lines.append(f"  Город: {v.area_name}")
-            if v.address_city:
-                lines.append(f"  Адрес (город): {v.address_city}")
-            if v.address_street:
-                lines.append(f"  Адрес (улица): {v.address_street}")
-            
-            # Зарплата
-            salary_parts = []
-            if v.salary_from is not None:
-                salary_parts.append(f"от {v.salary_from}")
-            if v.salary_to is not None:
-                salary_parts.append(f"до {v.salary_to}")
-            if v.salary_currency:
-                salary_parts.append(v.salary_currency)
-            if salary_parts:
-                salary_str = " ".join(salary_parts)
-                if v.salary_gross is not None:
-                    salary_str += " (gross)" if v.salary_gross else " (net)"
-                lines.append(f"  Зарплата: {salary_str}")
-            
-            if v.schedule_name:
-                lines.append(f"  График работы: {v.schedule_name}")
-            if v.professional_roles:
-                lines.append("  Профессиональные роли: " + ", ".join(v.professional_roles))
-            if v.snippet_requirement:
-                lines.append(f"  Требования: {v.snippet_requirement}")
-            if v.snippet_responsibility:
-                lines.append(f"  Обязанности: {v.snippet_responsibility}")
-            if v.vacancy_type_name:
-                lines.append(f"  Тип вакансии: {v.vacancy_type_name}")
-            lines.append("")
+            lines.extend(self._format_vacancy(v))
 
         lines.append(
             "Для каждой вакансии верни JSON-объект с полями 'vacancy_id', 'confidence' (0..1) и 'reason', "
@@ -192,6 +293,48 @@ class VacancyListFilterAgent(BaseAgent, VacancyListFilterServicePort):
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _format_vacancy(v: VacancyListItem) -> list[str]:
+        """Строки промпта с краткой инфой по одной list-вакансии."""
+        lines: list[str] = []
+        lines.append(f"- id={v.vacancy_id}")
+        lines.append(f"  Название: {v.name}")
+        if v.company_name:
+            lines.append(f"  Компания: {v.company_name}")
+        if v.area_name:
+            lines.append(f"  Город: {v.area_name}")
+        if v.address_city:
+            lines.append(f"  Адрес (город): {v.address_city}")
+        if v.address_street:
+            lines.append(f"  Адрес (улица): {v.address_street}")
+
+        # Зарплата
+        salary_parts = []
+        if v.salary_from is not None:
+            salary_parts.append(f"от {v.salary_from}")
+        if v.salary_to is not None:
+            salary_parts.append(f"до {v.salary_to}")
+        if v.salary_currency:
+            salary_parts.append(v.salary_currency)
+        if salary_parts:
+            salary_str = " ".join(salary_parts)
+            if v.salary_gross is not None:
+                salary_str += " (gross)" if v.salary_gross else " (net)"
+            lines.append(f"  Зарплата: {salary_str}")
+
+        if v.schedule_name:
+            lines.append(f"  График работы: {v.schedule_name}")
+        if v.professional_roles:
+            lines.append("  Профессиональные роли: " + ", ".join(v.professional_roles))
+        if v.snippet_requirement:
+            lines.append(f"  Требования: {v.snippet_requirement}")
+        if v.snippet_responsibility:
+            lines.append(f"  Обязанности: {v.snippet_responsibility}")
+        if v.vacancy_type_name:
+            lines.append(f"  Тип вакансии: {v.vacancy_type_name}")
+        lines.append("")
+        return lines
+
     def _parse_response(
         self,
         content: str,
@@ -13,6 +13,7 @@ from config import OpenAIConfig
 from domain.entities.vacancy_test import VacancyTest
 from domain.interfaces.vacancy_test_agent_service_port import VacancyTestAgentServicePort
 from infrastructure.agents.base_agent import BaseAgent
+from infrastructure.metrics.pipeline_metrics import observe_stage
 
 
 class VacancyTestAgent(BaseAgent, VacancyTestAgentServicePort):
@@ -24,6 +25,7 @@ class VacancyTestAgent(BaseAgent, VacancyTestAgentServicePort):
 
     AGENT_NAME = "VacancyTestAgent"
 
+    @observe_stage("llm_test_answers")
     async def generate_test_answers(
         self,
         test: VacancyTest,
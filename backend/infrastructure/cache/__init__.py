@@ -0,0 +1 @@
+"""Кеши в памяти процесса."""
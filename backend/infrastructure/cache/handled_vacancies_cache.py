@@ -0,0 +1,80 @@
+"""Кеш уже обработанных вакансий резюме в памяти процесса."""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Set
+from uuid import UUID
+
+from config import HHConfig
+from domain.interfaces.handled_vacancies_cache_port import HandledVacanciesCachePort
+from domain.interfaces.vacancy_response_repository_port import VacancyResponseRepositoryPort
+from infrastructure.cache.singleflight import SingleFlight
+from infrastructure.cache.ttl_cache import CacheStats, TTLCache
+
+
+class InMemoryHandledVacanciesCache(HandledVacanciesCachePort):
+    """Множества ID откликнутых вакансий по резюме с TTL.
+
+    При промахе множество загружается одним запросом к vacancy_responses
+    (одновременные промахи по резюме объединяются), а отклики, сохраненные
+    в этом процессе, добавляются сразу. TTL ограничивает устаревание из-за
+    откликов, сохраненных другими процессами.
+    """
+
+    def __init__(
+        self,
+        repository: VacancyResponseRepositoryPort,
+        ttl_seconds: float = 600.0,
+        max_entries: int = 10000,
+    ) -> None:
+        self._repository = repository
+        self._cache: TTLCache[UUID, Set[int]] = TTLCache(ttl_seconds, max_entries)
+        self._flight: SingleFlight[UUID, Set[int]] = SingleFlight()
+        # Отметки, сделанные во время загрузки множества из БД
+        self._marked_during_load: Dict[UUID, Set[int]] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def get_handled_ids(self, resume_id: UUID) -> FrozenSet[int]:
+        handled = self._cache.get(resume_id)
+        if handled is None:
+            handled = await self._flight.do(resume_id, lambda: self._load(resume_id))
+        return frozenset(handled)
+
+    def mark_handled(self, resume_id: UUID, vacancy_id: int) -> None:
+        handled = self._cache.get(resume_id)
+        if handled is not None:
+            handled.add(vacancy_id)
+        if resume_id in self._flight:
+            self._marked_during_load.setdefault(resume_id, set()).add(vacancy_id)
+
+    async def _load(self, resume_id: UUID) -> Set[int]:
+        try:
+            handled = await self._repository.get_handled_vacancy_ids(resume_id)
+        finally:
+            marked = self._marked_during_load.pop(resume_id, set())
+        handled |= marked
+        self._cache.set(resume_id, handled)
+        return handled
+
+
+_HANDLED_CACHE: InMemoryHandledVacanciesCache | None = None
+
+
+def get_handled_vacancies_cache(
+    config: HHConfig,
+    repository: VacancyResponseRepositoryPort,
+) -> InMemoryHandledVacanciesCache:
+    """Возвращает кеш обработанных вакансий уровня процесса (создается при первом обращении).
+
+    repository должен работать в standalone режиме: загрузки выполняются вне транзакций вызывающих.
+    """
+    global _HANDLED_CACHE
+    if _HANDLED_CACHE is None:
+        _HANDLED_CACHE = InMemoryHandledVacanciesCache(
+            repository,
+            ttl_seconds=config.handled_cache_ttl_seconds,
+        )
+    return _HANDLED_CACHE
@@ -0,0 +1,133 @@
+"""Кеш ответов LLM по содержимому запроса."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from config import OpenAIConfig
+from domain.interfaces.llm_response_cache_repository_port import LlmResponseCacheRepositoryPort
+from infrastructure.cache.ttl_cache import CacheStats, TTLCache
+from infrastructure.metrics.pipeline_metrics import LLM_RESPONSE_CACHE
+
+
+def llm_response_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: float,
+    response_format: Dict[str, str] | None,
+) -> str:
+    """sha256 от всего, что определяет ответ модели."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "response_format": response_format,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCache:
+    """LRU+TTL кеш текстов ответов LLM с опциональным хранилищем в БД.
+
+    Порядок поиска: память -> персистентное хранилище (если передано).
+    Кешируются только ответы, которые агент успешно разобрал и провалидировал,
+    поэтому попадание можно отдавать без повторного вызова модели.
+    Устаревшие записи хранилища удаляются попутно при записи, не чаще
+    раза в purge_interval_seconds.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 2000,
+        purge_interval_seconds: float = 3600.0,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._cache: TTLCache[str, str] = TTLCache(ttl_seconds, max_entries)
+        self._purge_interval_seconds = purge_interval_seconds
+        self._last_purge_at: float | None = None
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def get(
+        self,
+        cache_key: str,
+        agent_name: str,
+        store: LlmResponseCacheRepositoryPort | None = None,
+    ) -> Optional[str]:
+        content = self._cache.get(cache_key)
+        if content is not None:
+            LLM_RESPONSE_CACHE.inc(agent=agent_name, result="memory_hit")
+            return content
+        if store is not None:
+            try:
+                content = await store.get_fresh(cache_key, self._ttl_seconds)
+            except Exception as exc:
+                # Хранилище — лишь ускорение, без него идем в LLM
+                logger.warning(f"[llm-cache] Ошибка чтения {cache_key[:12]}: {exc}")
+                content = None
+            if content is not None:
+                self._cache.set(cache_key, content)
+                LLM_RESPONSE_CACHE.inc(agent=agent_name, result="store_hit")
+                return content
+        LLM_RESPONSE_CACHE.inc(agent=agent_name, result="miss")
+        return None
+
+    async def set(
+        self,
+        cache_key: str,
+        content: str,
+        agent_name: str,
+        model: str,
+        store: LlmResponseCacheRepositoryPort | None = None,
+    ) -> None:
+        self._cache.set(cache_key, content)
+        if store is not None:
+            try:
+                await store.upsert(cache_key, agent_name, model, content)
+            except Exception as exc:
+                logger.warning(f"[llm-cache] Ошибка записи {cache_key[:12]}: {exc}")
+            await self._purge_expired(store)
+
+    async def _purge_expired(self, store: LlmResponseCacheRepositoryPort) -> None:
+        now = time.monotonic()
+        if self._last_purge_at is not None and now - self._last_purge_at < self._purge_interval_seconds:
+            return
+        self._last_purge_at = now
+        try:
+            deleted = await store.delete_expired(self._ttl_seconds)
+        except Exception as exc:
+            logger.warning(f"[llm-cache] Ошибка очистки устаревших ответов: {exc}")
+            return
+        if deleted:
+            logger.info(f"[llm-cache] Удалено устаревших ответов: {deleted}")
+
+    def invalidate(self, cache_key: str) -> None:
+        self._cache.pop(cache_key)
+
+
+_LLM_RESPONSE_CACHE: LlmResponseCache | None = None
+
+
+def get_llm_response_cache(config: OpenAIConfig) -> LlmResponseCache:
+    """Возвращает кеш ответов LLM уровня процесса (создается при первом обращении)."""
+    global _LLM_RESPONSE_CACHE
+    if _LLM_RESPONSE_CACHE is None:
+        _LLM_RESPONSE_CACHE = LlmResponseCache(
+            ttl_seconds=config.response_cache_ttl_seconds,
+            max_entries=config.response_cache_max_entries,
+        )
+    return _LLM_RESPONSE_CACHE
@@ -0,0 +1,104 @@
+"""Кеш контекста резюме для автооткликов в памяти процесса."""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Dict, Set
+from uuid import UUID
+
+from config import HHConfig
+from domain.entities.resume_context import ResumeContext
+from domain.interfaces.resume_context_cache_port import ResumeContextCachePort
+from infrastructure.cache.singleflight import SingleFlight
+from infrastructure.cache.ttl_cache import CacheStats, TTLCache
+
+
+class InMemoryResumeContextCache(ResumeContextCachePort):
+    """Контексты резюме с коротким TTL.
+
+    Одновременные промахи по резюме объединяются в одну загрузку. Сброс
+    во время загрузки не дает сохранить ее результат: загрузка могла
+    прочитать состояние до изменения.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 1000) -> None:
+        self._cache: TTLCache[UUID, ResumeContext] = TTLCache(ttl_seconds, max_entries)
+        self._flight: SingleFlight[UUID, ResumeContext | None] = SingleFlight()
+        self._generations: Dict[UUID, int] = {}
+        self._global_generation = 0
+        self._resumes_by_user: Dict[UUID, Set[UUID]] = {}
+        self._user_by_resume: Dict[UUID, UUID] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def get_or_load(
+        self,
+        resume_id: UUID,
+        loader: Callable[[], Awaitable[ResumeContext | None]],
+    ) -> ResumeContext | None:
+        context = self._cache.get(resume_id)
+        if context is None:
+            context = await self._flight.do(resume_id, lambda: self._load(resume_id, loader))
+        return context
+
+    def invalidate(self, resume_id: UUID | None = None) -> None:
+        if resume_id is None:
+            self._global_generation += 1
+            self._cache.clear()
+            self._resumes_by_user.clear()
+            self._user_by_resume.clear()
+            return
+        self._generations[resume_id] = self._generations.get(resume_id, 0) + 1
+        self._cache.pop(resume_id)
+        self._forget(resume_id)
+
+    def note_reply_sent(self, user_id: UUID) -> None:
+        for resume_id in list(self._resumes_by_user.get(user_id, ())):
+            context = self._cache.get(resume_id)
+            if context is None:
+                # Запись вытеснена по TTL или размеру: индекс по пользователю ей не нужен
+                self._forget(resume_id)
+            elif context.responses_count is not None:
+                context.responses_count += 1
+
+    def _forget(self, resume_id: UUID) -> None:
+        user_id = self._user_by_resume.pop(resume_id, None)
+        if user_id is None:
+            return
+        resume_ids = self._resumes_by_user.get(user_id)
+        if resume_ids is not None:
+            resume_ids.discard(resume_id)
+            if not resume_ids:
+                del self._resumes_by_user[user_id]
+
+    async def _load(
+        self,
+        resume_id: UUID,
+        loader: Callable[[], Awaitable[ResumeContext | None]],
+    ) -> ResumeContext | None:
+        generation = (self._global_generation, self._generations.get(resume_id, 0))
+        context = await loader()
+        if context is None:
+            return None
+        if generation == (self._global_generation, self._generations.get(resume_id, 0)):
+            self._cache.set(resume_id, context)
+            self._forget(resume_id)
+            self._resumes_by_user.setdefault(context.resume.user_id, set()).add(resume_id)
+            self._user_by_resume[resume_id] = context.resume.user_id
+            # Счетчики нужны только пока есть записи, которые их ждут
+            self._generations.pop(resume_id, None)
+        return context
+
+
+_RESUME_CONTEXT_CACHE: InMemoryResumeContextCache | None = None
+
+
+def get_resume_context_cache(config: HHConfig) -> InMemoryResumeContextCache:
+    """Возвращает кеш контекста резюме уровня процесса (создается при первом обращении)."""
+    global _RESUME_CONTEXT_CACHE
+    if _RESUME_CONTEXT_CACHE is None:
+        _RESUME_CONTEXT_CACHE = InMemoryResumeContextCache(
+            ttl_seconds=config.resume_context_ttl_seconds,
+        )
+    return _RESUME_CONTEXT_CACHE
@@ -0,0 +1,42 @@
+"""Объединение одинаковых одновременных запросов (singleflight)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Пока запрос по ключу выполняется, остальные вызовы с тем же ключом ждут его результат.
+
+    fn выполняется отдельной задачей: результат (или исключение) получают все
+    ожидающие, а отмена любого из них, включая инициатора, не отменяет общий
+    запрос. После завершения ключ освобождается, и следующий вызов снова выполнит fn.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[K, asyncio.Task[V]] = {}
+        self.calls = 0
+        self.shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._in_flight
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """Выполнить fn или присоединиться к уже выполняющемуся запросу с этим ключом."""
+        task = self._in_flight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
@@ -0,0 +1,135 @@
+"""Кеш детальных карточек вакансий в памяти процесса."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+from config import HHConfig
+from domain.entities.vacancy_detail import VacancyDetail
+from domain.interfaces.vacancy_detail_cache_port import VacancyDetailCachePort
+from domain.interfaces.vacancy_detail_cache_repository_port import (
+    VacancyDetailCacheRepositoryPort,
+)
+from infrastructure.cache.singleflight import SingleFlight
+from infrastructure.cache.ttl_cache import CacheStats, TTLCache
+
+
+class InMemoryVacancyDetailCache(VacancyDetailCachePort):
+    """LRU+TTL кеш карточек /vacancies/{id} с объединением одновременных загрузок.
+
+    Порядок поиска: память -> персистентное хранилище (если задано) -> HH.
+    Одновременные промахи по одному vacancy_id выполняют одну загрузку.
+    Неудачные загрузки (None) не кешируются. Отдаются копии карточек,
+    чтобы вызывающий код не мог изменить закешированное значение.
+    Устаревшие записи хранилища удаляются попутно при записи, не чаще
+    раза в purge_interval_seconds.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 1800.0,
+        max_entries: int = 2000,
+        store: VacancyDetailCacheRepositoryPort | None = None,
+        report_every: int = 500,
+        purge_interval_seconds: float = 3600.0,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._cache: TTLCache[int, VacancyDetail] = TTLCache(ttl_seconds, max_entries)
+        self._flight: SingleFlight[int, Optional[VacancyDetail]] = SingleFlight()
+        self._store = store
+        self._report_every = report_every
+        self._lookups = 0
+        self._purge_interval_seconds = purge_interval_seconds
+        self._last_purge_at: float | None = None
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def get_or_fetch(
+        self,
+        vacancy_id: int,
+        fetch: Callable[[], Awaitable[Optional[VacancyDetail]]],
+    ) -> Optional[VacancyDetail]:
+        cached = self._cache.get(vacancy_id)
+        self._lookups += 1
+        if self._report_every and self._lookups % self._report_every == 0:
+            stats = self._cache.stats
+            logger.info(
+                f"[detail-cache] hit_ratio={stats.hit_ratio:.2%} hits={stats.hits} "
+                f"misses={stats.misses} size={stats.size} coalesced={self._flight.shared}"
+            )
+        if cached is None:
+            cached = await self._flight.do(vacancy_id, lambda: self._load(vacancy_id, fetch))
+        if cached is None:
+            return None
+        return dataclasses.replace(cached)
+
+    async def _load(
+        self,
+        vacancy_id: int,
+        fetch: Callable[[], Awaitable[Optional[VacancyDetail]]],
+    ) -> Optional[VacancyDetail]:
+        if self._store is not None:
+            try:
+                stored = await self._store.get_fresh(vacancy_id, self._ttl_seconds)
+            except Exception as exc:
+                # Хранилище — лишь ускорение, без него идем в HH
+                logger.warning(f"[detail-cache] Ошибка чтения vacancy_id={vacancy_id}: {exc}")
+                stored = None
+            if stored is not None:
+                self._cache.set(vacancy_id, stored)
+                return stored
+
+        detail = await fetch()
+        if detail is None:
+            return None
+        self._cache.set(vacancy_id, dataclasses.replace(detail))
+        if self._store is not None:
+            try:
+                await self._store.upsert(detail)
+            except Exception as exc:
+                logger.warning(f"[detail-cache] Ошибка записи vacancy_id={vacancy_id}: {exc}")
+            await self._purge_expired(self._store)
+        return detail
+
+    async def _purge_expired(self, store: VacancyDetailCacheRepositoryPort) -> None:
+        now = time.monotonic()
+        if self._last_purge_at is not None and now - self._last_purge_at < self._purge_interval_seconds:
+            return
+        self._last_purge_at = now
+        try:
+            deleted = await store.delete_expired(self._ttl_seconds)
+        except Exception as exc:
+            logger.warning(f"[detail-cache] Ошибка очистки устаревших карточек: {exc}")
+            return
+        if deleted:
+            logger.info(f"[detail-cache] Удалено устаревших карточек: {deleted}")
+
+
+_DETAIL_CACHE: InMemoryVacancyDetailCache | None = None
+
+
+def get_vacancy_detail_cache(
+    config: HHConfig,
+    store: VacancyDetailCacheRepositoryPort | None = None,
+) -> InMemoryVacancyDetailCache:
+    """Возвращает кеш карточек уровня процесса (создается при первом обращении).
+
+    Args:
+        config: Конфигурация HH API.
+        store: Персистентное хранилище; используется, только если включено
+            config.detail_cache_persistent.
+    """
+    global _DETAIL_CACHE
+    if _DETAIL_CACHE is None:
+        _DETAIL_CACHE = InMemoryVacancyDetailCache(
+            ttl_seconds=config.detail_cache_ttl_seconds,
+            max_entries=config.detail_cache_max_entries,
+            store=store if config.detail_cache_persistent else None,
+        )
+    return _DETAIL_CACHE
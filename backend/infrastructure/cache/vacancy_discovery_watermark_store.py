@@ -0,0 +1,52 @@
+"""Границы просмотренной выдачи резюме в памяти процесса."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Optional
+from uuid import UUID
+
+from config import HHConfig
+from domain.entities.vacancy_discovery_watermark import VacancyDiscoveryWatermark
+from domain.interfaces.vacancy_discovery_watermark_port import VacancyDiscoveryWatermarkPort
+from infrastructure.cache.ttl_cache import TTLCache
+
+
+class InMemoryVacancyDiscoveryWatermarkStore(VacancyDiscoveryWatermarkPort):
+    """Границы выдачи с TTL: по истечении TTL резюме снова просматривается полностью.
+
+    Периодический полный просмотр подбирает вакансии, которые были пропущены
+    (например, пока был исчерпан лимит откликов), а после перезапуска процесса
+    первый цикл каждого резюме также выполняется полностью.
+    """
+
+    def __init__(self, full_rescan_seconds: float = 3600.0, max_entries: int = 10000) -> None:
+        self._cache: TTLCache[UUID, VacancyDiscoveryWatermark] = TTLCache(full_rescan_seconds, max_entries)
+
+    async def get(self, resume_id: UUID) -> Optional[VacancyDiscoveryWatermark]:
+        watermark = self._cache.get(resume_id)
+        if watermark is None:
+            return None
+        return replace(watermark, seen_vacancy_ids=list(watermark.seen_vacancy_ids))
+
+    async def set(self, resume_id: UUID, watermark: VacancyDiscoveryWatermark) -> None:
+        # TTL отсчитывается от последнего полного просмотра, а не от обновления границы
+        ttl = self._cache.remaining_ttl(resume_id)
+        self._cache.set(
+            resume_id,
+            replace(watermark, seen_vacancy_ids=list(watermark.seen_vacancy_ids)),
+            ttl_seconds=ttl,
+        )
+
+
+_WATERMARK_STORE: InMemoryVacancyDiscoveryWatermarkStore | None = None
+
+
+def get_vacancy_discovery_watermark_store(config: HHConfig) -> InMemoryVacancyDiscoveryWatermarkStore:
+    """Возвращает хранилище границ уровня процесса (создается при первом обращении)."""
+    global _WATERMARK_STORE
+    if _WATERMARK_STORE is None:
+        _WATERMARK_STORE = InMemoryVacancyDiscoveryWatermarkStore(
+            full_rescan_seconds=config.discovery_full_rescan_seconds,
+        )
+    return _WATERMARK_STORE
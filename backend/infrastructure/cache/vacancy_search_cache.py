@@ -0,0 +1,64 @@
+"""Кеш страниц поисковой выдачи HH в памяти процесса."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from loguru import logger
+
+from config import HHConfig
+from domain.entities.vacancy_list import VacancyList
+from domain.interfaces.vacancy_search_cache_port import VacancySearchCachePort
+from infrastructure.cache.ttl_cache import CacheStats, TTLCache
+
+
+class InMemoryVacancySearchCache(VacancySearchCachePort):
+    """Общий для всех пользователей кеш страниц /search/vacancy с коротким TTL.
+
+    Каждая страница хранится отдельной записью. Отдаются копии списка,
+    чтобы вызывающий код не мог изменить закешированную выдачу.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 120.0,
+        max_entries: int = 5000,
+        report_every: int = 500,
+    ) -> None:
+        self._cache: TTLCache[str, VacancyList] = TTLCache(ttl_seconds, max_entries)
+        self._report_every = report_every
+        self._lookups = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def get(self, key: str) -> Optional[VacancyList]:
+        cached = self._cache.get(key)
+        self._lookups += 1
+        if self._report_every and self._lookups % self._report_every == 0:
+            stats = self._cache.stats
+            logger.info(
+                f"[search-cache] hit_ratio={stats.hit_ratio:.2%} hits={stats.hits} "
+                f"misses={stats.misses} size={stats.size}"
+            )
+        if cached is None:
+            return None
+        return VacancyList(items=list(cached.items))
+
+    async def set(self, key: str, vacancy_list: VacancyList) -> None:
+        self._cache.set(key, VacancyList(items=list(vacancy_list.items)))
+
+
+_SEARCH_CACHE: InMemoryVacancySearchCache | None = None
+
+
+def get_vacancy_search_cache(config: HHConfig) -> InMemoryVacancySearchCache:
+    """Возвращает кеш выдачи уровня процесса (создается при первом обращении)."""
+    global _SEARCH_CACHE
+    if _SEARCH_CACHE is None:
+        _SEARCH_CACHE = InMemoryVacancySearchCache(
+            ttl_seconds=config.search_cache_ttl_seconds,
+            max_entries=config.search_cache_max_entries,
+        )
+    return _SEARCH_CACHE
@@ -0,0 +1,199 @@
+"""Кеш справочника регионов HH (/areas) в памяти и на диске."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config import HHConfig
+from domain.entities.area import Area
+from domain.interfaces.areas_cache_port import AreasCachePort
+from infrastructure.clients import hh_json
+from infrastructure.clients.hh_base_mixin import HHBaseMixin
+from infrastructure.clients.hh_rate_limiter import get_hh_rate_limiter
+
+
+def build_areas_index(tree: List[Dict[str, Any]]) -> Dict[str, Area]:
+    """Строит плоский индекс id -> Area по дереву /areas (обход без рекурсии)."""
+    index: Dict[str, Area] = {}
+    stack: List[Tuple[Dict[str, Any], Optional[str], List[str]]] = [
+        (node, None, []) for node in reversed(tree)
+    ]
+    while stack:
+        node, parent_id, path = stack.pop()
+        area_id = str(node.get("id"))
+        name = node.get("name") or ""
+        children = node.get("areas") or []
+        index[area_id] = Area(
+            area_id=area_id,
+            name=name,
+            parent_id=parent_id,
+            path=path,
+            has_children=bool(children),
+        )
+        child_path = path + [name]
+        stack.extend((child, area_id, child_path) for child in reversed(children))
+    return index
+
+
+def _parse_areas(content: bytes) -> Tuple[List[Dict[str, Any]], Dict[str, Area]]:
+    tree = hh_json.loads(content)
+    if not isinstance(tree, list):
+        raise RuntimeError("[areas] Ожидался список регионов в корне ответа")
+    return tree, build_areas_index(tree)
+
+
+class HHAreasCache(HHBaseMixin, AreasCachePort):
+    """Дерево регионов HH, которое почти не меняется, с условной ревалидацией.
+
+    Дерево хранится в памяти процесса и в JSON файле на диске (для быстрого
+    старта). Устаревшее значение продолжает отдаваться, а проверка свежести
+    выполняется фоновой задачей запросом с If-None-Match/If-Modified-Since:
+    ответ 304 лишь продлевает срок, 200 заменяет дерево и индекс.
+
+    Возвращаемое дерево общее для всех вызывающих и не должно изменяться.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.hh.ru",
+        *,
+        cache_path: str | None = None,
+        revalidate_after_seconds: float = 24 * 60 * 60,
+        timeout: float = 30.0,
+    ) -> None:
+        super().__init__(base_url, timeout)
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._revalidate_after_seconds = revalidate_after_seconds
+        self._tree: List[Dict[str, Any]] | None = None
+        self._index: Dict[str, Area] = {}
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._validated_at = 0.0
+        self._load_lock = asyncio.Lock()
+        self._revalidate_task: asyncio.Task | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() - self._validated_at >= self._revalidate_after_seconds
+
+    async def get_tree(self) -> List[Dict[str, Any]]:
+        await self._ensure_loaded()
+        return self._tree or []
+
+    async def get_area(self, area_id: str) -> Optional[Area]:
+        await self._ensure_loaded()
+        return self._index.get(str(area_id))
+
+    async def _ensure_loaded(self) -> None:
+        if self._tree is None:
+            async with self._load_lock:
+                if self._tree is None and not await asyncio.to_thread(self._load_from_disk):
+                    await self.revalidate()
+                    return
+        if self.is_stale:
+            self._schedule_revalidate()
+
+    def _schedule_revalidate(self) -> None:
+        if self._revalidate_task is not None and not self._revalidate_task.done():
+            return
+        self._revalidate_task = asyncio.get_running_loop().create_task(self._revalidate_quietly())
+
+    async def _revalidate_quietly(self) -> None:
+        try:
+            await self.revalidate()
+        except Exception as exc:
+            # Продолжаем отдавать прежнее дерево; повторим после следующего TTL
+            self._validated_at = time.time()
+            logger.warning(f"[areas] Не удалось обновить дерево регионов: {exc}")
+
+    async def revalidate(self) -> bool:
+        """Проверяет актуальность дерева условным запросом к /areas.
+
+        Returns:
+            True, если дерево было заменено новым.
+        """
+        url = f"{self._base_url}/areas"
+        headers = self._enhance_headers({})
+        if self._tree is not None:
+            if self._etag:
+                headers["if-none-match"] = self._etag
+            if self._last_modified:
+                headers["if-modified-since"] = self._last_modified
+
+        await get_hh_rate_limiter().acquire(url, None)
+        async with self._create_client(headers=headers) as client:
+            resp = await client.get(url)
+
+        if resp.status_code == 304 and self._tree is not None:
+            self._validated_at = time.time()
+            logger.debug("[areas] Дерево регионов не изменилось (304)")
+            return False
+        resp.raise_for_status()
+
+        tree, index = await asyncio.to_thread(_parse_areas, resp.content)
+        self._tree, self._index = tree, index
+        self._etag = resp.headers.get("etag")
+        self._last_modified = resp.headers.get("last-modified")
+        self._validated_at = time.time()
+        logger.info(f"[areas] Загружено дерево регионов: {len(index)} узлов")
+        await asyncio.to_thread(self._save_to_disk, resp.content)
+        return True
+
+    def _load_from_disk(self) -> bool:
+        if self._cache_path is None or not self._cache_path.exists():
+            return False
+        try:
+            data = hh_json.loads(self._cache_path.read_bytes())
+            tree = data["areas"]
+            index = build_areas_index(tree)
+        except Exception as exc:
+            logger.warning(f"[areas] Поврежден файл кеша {self._cache_path}: {exc}")
+            return False
+        self._tree, self._index = tree, index
+        self._etag = data.get("etag")
+        self._last_modified = data.get("last_modified")
+        self._validated_at = float(data.get("validated_at") or 0.0)
+        logger.info(f"[areas] Дерево регионов загружено с диска: {len(index)} узлов")
+        return True
+
+    def _save_to_disk(self, content: bytes) -> None:
+        if self._cache_path is None:
+            return
+        meta = json.dumps(
+            {
+                "etag": self._etag,
+                "last_modified": self._last_modified,
+                "validated_at": self._validated_at,
+            }
+        )
+        # Тело ответа вставляется как есть, без повторной сериализации дерева
+        payload = meta[:-1].encode() + b', "areas": ' + content + b"}"
+        tmp_path = self._cache_path.with_suffix(self._cache_path.suffix + ".tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as exc:
+            logger.warning(f"[areas] Не удалось сохранить кеш в {self._cache_path}: {exc}")
+
+
+_AREAS_CACHE: HHAreasCache | None = None
+
+
+def get_hh_areas_cache(config: HHConfig) -> HHAreasCache:
+    """Возвращает кеш регионов уровня процесса (создается при первом обращении)."""
+    global _AREAS_CACHE
+    if _AREAS_CACHE is None:
+        _AREAS_CACHE = HHAreasCache(
+            config.base_url,
+            cache_path=config.areas_cache_path or None,
+            revalidate_after_seconds=config.areas_revalidate_seconds,
+        )
+    return _AREAS_CACHE
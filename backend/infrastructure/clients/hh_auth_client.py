@@ -58,7 +58,7 @@ class HHAuthClient(HHBaseMixin):
 
         logger.debug(f"[generate_otp] POST {url} phone={phone} files_data={len(files_data)} fields")
 
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -133,7 +133,7 @@ class HHAuthClient(HHBaseMixin):
 
         logger.debug(f"[login_by_code] POST {url} phone={phone}")
 
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -218,7 +218,7 @@ class HHAuthClient(HHBaseMixin):
         
         logger.debug(f"[get_initial_cookies] GET {url} params={params}")
         
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=initial_cookies, timeout=self._timeout, follow_redirects=True
         ) as client:
             try:
@@ -266,7 +266,7 @@ class HHAuthClient(HHBaseMixin):
         
         logger.debug(f"[get_captcha_key] POST {url} params={params}")
         
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -324,7 +324,7 @@ class HHAuthClient(HHBaseMixin):
         
         logger.debug(f"[get_captcha_picture] GET {url} params={params}")
         
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -2,58 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict
-from functools import lru_cache
-import re
-import time
+from typing import Any, Dict
 
 import httpx
-from loguru import logger
-
-
-@lru_cache(maxsize=1)
-def _fetch_hh_front_build_version(cache_slot: int) -> str:
-    """Получает версию фронта HH из HTML и кеширует результат.
-
-    cache_slot используется только для инвалидации кеша по времени.
-    """
-    url = "https://krasnoyarsk.hh.ru/search/vacancy"
-    headers = {
-        "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-        "accept-language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-        "priority": "u=0, i",
-        "sec-ch-ua": '"Google Chrome";v="143", "Chromium";v="143", "Not A(Brand";v="24"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"macOS"',
-        "sec-fetch-dest": "document",
-        "sec-fetch-mode": "navigate",
-        "sec-fetch-site": "none",
-        "sec-fetch-user": "?1",
-        "upgrade-insecure-requests": "1",
-        "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
-    }
-
-    try:
-        resp = httpx.get(url, headers=headers, timeout=10.0)
-        resp.raise_for_status()
-        text = resp.text
-        match = re.search(r'build:\s*"([^"]+)"', text)
-        if match:
-            return match.group(1)
-    except Exception as exc:
-        # В случае ошибок просто вернем пустую строку, чтобы не ломать запросы
-        logger.debug(
-            f"Не удалось получить build версию HH фронта (не критично): {exc}"
-        )
-
-    return ""
-
-
-def get_hh_front_build_version() -> str:
-    """Возвращает версию фронта HH, кешируя результат на ~15 минут."""
-    # Делим время на 15 минут и используем это значение как ключ кеша
-    cache_slot = int(time.time() // (15 * 60))
-    return _fetch_hh_front_build_version(cache_slot) or "25.52.2"
+
+from infrastructure.clients.hh_connection_pool import get_hh_connection_pool
+from infrastructure.clients.hh_front_version import get_hh_front_build_version
+from infrastructure.clients.hh_rate_limiter import get_hh_rate_limiter
 
 
 class HHBaseMixin:
@@ -69,6 +24,23 @@ class HHBaseMixin:
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
 
+    def _create_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Создает httpx клиент поверх общего пула соединений.
+
+        Клиент живет один запрос и держит собственный cookie jar, поэтому cookies
+        разных пользователей не смешиваются, а TCP/TLS соединения переиспользуются.
+        Все ответы передаются в адаптивный лимитер (429/403/капча замедляют запросы).
+
+        Args:
+            **kwargs: Аргументы httpx.AsyncClient (headers, cookies, follow_redirects, ...).
+
+        Returns:
+            httpx AsyncClient, использующий общий транспорт.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        kwargs.setdefault("event_hooks", {"response": [get_hh_rate_limiter().observe_response]})
+        return httpx.AsyncClient(transport=get_hh_connection_pool().transport, **kwargs)
+
     def _enhance_headers(self, headers: Dict[str, str], cookies: Dict[str, str] | None = None) -> Dict[str, str]:
         """Добавляет анти-бот заголовки и XSRF токен ко всем запросам.
         
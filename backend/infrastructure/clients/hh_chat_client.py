@@ -24,11 +24,13 @@ from domain.entities.hh_list_chat import (
     HHWritePossibility,
 )
 from infrastructure.clients.hh_base_mixin import HHBaseMixin
+from infrastructure.metrics.pipeline_metrics import observe_stage
 
 
 class HHChatClient(HHBaseMixin):
     """Клиент для работы с чатами в HH API."""
 
+    @observe_stage("hh_chat_list")
     async def fetch_chat_list(
         self,
         chat_ids: List[int],
@@ -62,7 +64,7 @@ class HHChatClient(HHBaseMixin):
 
         logger.debug(f"[chat_list] GET {url} params={params}")
 
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -144,6 +146,7 @@ class HHChatClient(HHBaseMixin):
             return result, updated_cookies
         return result
 
+    @observe_stage("hh_chat_detail")
     async def fetch_chat_detail(
         self,
         chat_id: int,
@@ -172,7 +175,7 @@ class HHChatClient(HHBaseMixin):
 
         logger.debug(f"[chat_detail] GET {url} chat_id={chat_id}")
 
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -227,6 +230,7 @@ class HHChatClient(HHBaseMixin):
                 return None, updated_cookies
             return None
 
+    @observe_stage("hh_chat_send")
     async def send_chat_message(
         self,
         chat_id: int,
@@ -273,7 +277,7 @@ class HHChatClient(HHBaseMixin):
 
         logger.debug(f"[send_message] POST {url} chat_id={chat_id} text={text[:50]}...")
 
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -347,7 +351,7 @@ class HHChatClient(HHBaseMixin):
             f"[mark_read] POST {url} chat_id={chat_id} message_id={message_id}"
         )
 
-        async with httpx.AsyncClient(
+        async with self._create_client(
             headers=enhanced_headers, cookies=cookies, timeout=self._timeout
         ) as client:
             try:
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import time
 from typing import Any, Dict, List, Optional, Union
 
 from domain.entities.hh_chat_detailed import HHChatDetailed
@@ -16,6 +14,7 @@ from domain.entities.vacancy_test import VacancyTest
 from domain.interfaces.hh_client_port import HHClientPort
 from infrastructure.clients.hh_auth_client import HHAuthClient
 from infrastructure.clients.hh_chat_client import HHChatClient
+from infrastructure.clients.hh_rate_limiter import HHRateLimiter, get_hh_rate_limiter
 from infrastructure.clients.hh_resume_client import HHResumeClient
 from infrastructure.clients.hh_vacancy_client import HHVacancyClient
 
@@ -32,43 +31,21 @@ class HHHttpClient(HHVacancyClient, HHResumeClient, HHChatClient, HHAuthClient,
         super().__init__(base_url=base_url, timeout=timeout)
 
 
-class _RateLimiter:
-    """Простой async‑rate‑лимитер по количеству запросов в секунду.
-
-    Использует минимальный интервал между запросами: 1 / requests_per_second.
-    Все инстансы, создающие его, должны шарить объект, чтобы лимит был общий.
-    """
-
-    def __init__(self, requests_per_second: float) -> None:
-        self._min_interval = 1.0 / requests_per_second
-        self._lock = asyncio.Lock()
-        self._last_ts: float = 0.0
-
-    async def acquire(self) -> None:
-        async with self._lock:
-            now = time.monotonic()
-            wait_for = self._last_ts + self._min_interval - now
-            if wait_for > 0:
-                await asyncio.sleep(wait_for)
-                now = time.monotonic()
-            self._last_ts = now
-
-
 class RateLimitedHHHttpClient(HHHttpClient):
-    """HH‑клиент с ограничением на число запросов в секунду.
+    """HH‑клиент с ограничением на число запросов.
 
-    По умолчанию: не более 1 запроса/секунду.
+    Использует token-bucket лимитер с отдельными бакетами на сессию пользователя
+    и на хост HH. По умолчанию берется общий лимитер приложения (см. HHConfig).
     """
 
     def __init__(
         self,
         base_url: str = "https://api.hh.ru",
         timeout: float = 30.0,
-        requests_per_second: float = 1.0,
-        limiter: _RateLimiter | None = None,
+        limiter: HHRateLimiter | None = None,
     ) -> None:
         super().__init__(base_url=base_url, timeout=timeout)
-        self._limiter = limiter or _RateLimiter(requests_per_second)
+        self._limiter = limiter or get_hh_rate_limiter()
 
     async def fetch_vacancy_list(
         self,
@@ -78,7 +55,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         *,
         return_cookies: bool = False,
     ) -> VacancyList | tuple[VacancyList, Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(self._base_url, cookies)
         return await super().fetch_vacancy_list(headers, cookies, query, return_cookies=return_cookies)
 
     async def fetch_vacancy_list_front(
@@ -90,7 +67,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
         return_cookies: bool = False,
     ) -> VacancyList | tuple[VacancyList, Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().fetch_vacancy_list_front(
             headers, cookies, query, internal_api_base_url=internal_api_base_url, return_cookies=return_cookies
         )
@@ -103,7 +80,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         *,
         return_cookies: bool = False,
     ) -> Optional[VacancyDetail] | tuple[Optional[VacancyDetail], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(self._base_url, cookies)
         return await super().fetch_vacancy_detail(vacancy_id, headers, cookies, return_cookies=return_cookies)
 
     async def fetch_areas(
@@ -113,7 +90,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         *,
         return_cookies: bool = False,
     ) -> List[Dict[str, Any]] | tuple[List[Dict[str, Any]], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(self._base_url, cookies)
         return await super().fetch_areas(headers, cookies, return_cookies=return_cookies)
 
     async def get_vacancy_test(
@@ -125,7 +102,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
         return_cookies: bool = False,
     ) -> Optional[VacancyTest] | tuple[Optional[VacancyTest], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().get_vacancy_test(
             vacancy_id, headers, cookies, internal_api_base_url=internal_api_base_url, return_cookies=return_cookies
         )
@@ -151,7 +128,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         test_metadata: Dict[str, str] | None = None,
         return_cookies: bool = False,
     ) -> Dict[str, Any] | tuple[Dict[str, Any], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().respond_to_vacancy(
             vacancy_id,
             resume_hash,
@@ -180,7 +157,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
         return_cookies: bool = False,
     ) -> List[HHResume] | tuple[List[HHResume], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().fetch_resumes(headers, cookies, internal_api_base_url=internal_api_base_url, return_cookies=return_cookies)
 
     async def fetch_resume_detail(
@@ -192,7 +169,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
         return_cookies: bool = False,
     ) -> Optional[HHResumeDetailed] | tuple[Optional[HHResumeDetailed], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().fetch_resume_detail(resume_hash, headers, cookies, internal_api_base_url=internal_api_base_url, return_cookies=return_cookies)
 
     async def fetch_chat_list(
@@ -205,7 +182,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         return_cookies: bool = False,
         filter_unread: bool = True,
     ) -> HHListChat | tuple[HHListChat, Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(chatik_api_base_url, cookies)
         return await super().fetch_chat_list(chat_ids, headers, cookies, chatik_api_base_url=chatik_api_base_url, return_cookies=return_cookies, filter_unread=filter_unread)
 
     async def fetch_chat_detail(
@@ -217,7 +194,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         chatik_api_base_url: str = "https://chatik.hh.ru",
         return_cookies: bool = False,
     ) -> Optional[HHChatDetailed] | tuple[Optional[HHChatDetailed], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(chatik_api_base_url, cookies)
         return await super().fetch_chat_detail(chat_id, headers, cookies, chatik_api_base_url=chatik_api_base_url, return_cookies=return_cookies)
 
     async def send_chat_message(
@@ -233,7 +210,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         hhtm_source_label: str = "chat",
         return_cookies: bool = False,
     ) -> Dict[str, Any] | tuple[Dict[str, Any], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(chatik_api_base_url, cookies)
         return await super().send_chat_message(
             chat_id, text, headers, cookies, chatik_api_base_url=chatik_api_base_url, idempotency_key=idempotency_key, hhtm_source=hhtm_source, hhtm_source_label=hhtm_source_label, return_cookies=return_cookies
         )
@@ -250,7 +227,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         hhtm_source_label: str = "negotiation_list",
         return_cookies: bool = False,
     ) -> Dict[str, Any] | tuple[Dict[str, Any], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(chatik_api_base_url, cookies)
         return await super().mark_chat_message_read(
             chat_id, message_id, headers, cookies, chatik_api_base_url=chatik_api_base_url, hhtm_source=hhtm_source, hhtm_source_label=hhtm_source_label, return_cookies=return_cookies
         )
@@ -265,7 +242,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         undirectable: bool = True,
         return_cookies: bool = False,
     ) -> Dict[str, Any] | tuple[Dict[str, Any], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().touch_resume(
             resume_hash, headers, cookies, internal_api_base_url=internal_api_base_url, undirectable=undirectable, return_cookies=return_cookies
         )
@@ -281,7 +258,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         return_cookies: bool = False,
         captcha: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any] | tuple[Dict[str, Any], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().generate_otp(
             phone, headers, cookies, internal_api_base_url=internal_api_base_url, login_trust_flags=login_trust_flags, return_cookies=return_cookies, captcha=captcha
         )
@@ -299,7 +276,7 @@ class RateLimitedHHHttpClient(HHHttpClient):
         login_trust_flags: Optional[str] = None,
         return_cookies: bool = False,
     ) -> Dict[str, Any] | tuple[Dict[str, Any], Dict[str, str]]:
-        await self._limiter.acquire()
+        await self._limiter.acquire(internal_api_base_url, cookies)
         return await super().login_by_code(
             phone, code, headers, cookies, internal_api_base_url=internal_api_base_url, backurl=backurl, remember=remember, login_trust_flags=login_trust_flags, return_cookies=return_cookies
         )
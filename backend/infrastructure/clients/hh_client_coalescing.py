@@ -0,0 +1,299 @@
+"""Обертка над HHClientPort, объединяющая одинаковые одновременные запросы на чтение."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from domain.entities.hh_chat_detailed import HHChatDetailed
+from domain.entities.hh_list_chat import HHListChat
+from domain.entities.hh_resume import HHResume
+from domain.entities.hh_resume_detailed import HHResumeDetailed
+from domain.entities.vacancy_detail import VacancyDetail
+from domain.entities.vacancy_list import VacancyList
+from domain.entities.vacancy_test import VacancyTest
+from domain.interfaces.hh_client_port import HHClientPort
+from infrastructure.cache.singleflight import SingleFlight
+from infrastructure.clients.hh_rate_limiter import HHRateLimiter
+
+
+@dataclass(slots=True)
+class CoalescingStats:
+    """Счетчики одного метода: calls — реальные запросы, coalesced — присоединившиеся к ним."""
+
+    calls: int = 0
+    coalesced: int = 0
+
+
+class HHRequestCoalescer:
+    """Общий для процесса реестр выполняющихся запросов на чтение к HH."""
+
+    def __init__(self) -> None:
+        self._flight: SingleFlight[Hashable, Tuple[Any, Dict[str, str]]] = SingleFlight()
+        self._stats: Dict[str, CoalescingStats] = {}
+
+    async def do(
+        self,
+        method: str,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Tuple[Any, Dict[str, str]]]],
+    ) -> Tuple[Any, Dict[str, str]]:
+        stats = self._stats.setdefault(method, CoalescingStats())
+        flight_key = (method, key)
+        if flight_key in self._flight:
+            stats.coalesced += 1
+        else:
+            stats.calls += 1
+        return await self._flight.do(flight_key, fn)
+
+    def stats(self) -> Dict[str, CoalescingStats]:
+        """Снимок счетчиков по методам HHClientPort."""
+        return {
+            method: CoalescingStats(calls=s.calls, coalesced=s.coalesced)
+            for method, s in self._stats.items()
+        }
+
+
+_COALESCER = HHRequestCoalescer()
+
+
+def get_hh_request_coalescer() -> HHRequestCoalescer:
+    return _COALESCER
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class CoalescingHHClient(HHClientPort):
+    """Декоратор HHClientPort: одинаковые одновременные GET выполняются один раз.
+
+    Запросы считаются одинаковыми при совпадении метода, аргументов и сессии
+    пользователя (по cookies, как в лимитере). Результат и обновленные cookies
+    единственного запроса получают все ожидающие, поэтому возвращаемые объекты
+    общие и не должны изменяться. Запросы, меняющие состояние (отклики,
+    сообщения, авторизация), передаются во внутренний клиент без изменений.
+
+    Все обертки с общим HHRequestCoalescer должны оборачивать равнозначные клиенты
+    (один base_url).
+    """
+
+    def __init__(self, hh_client: HHClientPort, coalescer: HHRequestCoalescer | None = None) -> None:
+        self._hh_client = hh_client
+        self._coalescer = coalescer or get_hh_request_coalescer()
+
+    async def _coalesce(
+        self,
+        method: str,
+        cookies: Dict[str, str],
+        args: Tuple[Any, ...],
+        return_cookies: bool,
+        call: Callable[[], Awaitable[Tuple[Any, Dict[str, str]]]],
+    ) -> Any:
+        key = (HHRateLimiter.session_key(cookies), _freeze(args))
+        result, updated_cookies = await self._coalescer.do(method, key, call)
+        if return_cookies:
+            return result, dict(updated_cookies)
+        return result
+
+    async def fetch_vacancy_list(
+        self,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        query: Dict[str, str],
+        *,
+        return_cookies: bool = False,
+    ) -> VacancyList | tuple[VacancyList, Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_vacancy_list",
+            cookies,
+            (query,),
+            return_cookies,
+            lambda: self._hh_client.fetch_vacancy_list(headers, cookies, query, return_cookies=True),
+        )
+
+    async def fetch_vacancy_list_front(
+        self,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        query: Dict[str, str],
+        *,
+        internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
+        return_cookies: bool = False,
+    ) -> VacancyList | tuple[VacancyList, Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_vacancy_list_front",
+            cookies,
+            (query, internal_api_base_url),
+            return_cookies,
+            lambda: self._hh_client.fetch_vacancy_list_front(
+                headers, cookies, query, internal_api_base_url=internal_api_base_url, return_cookies=True
+            ),
+        )
+
+    async def fetch_vacancy_detail(
+        self,
+        vacancy_id: int,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        return_cookies: bool = False,
+    ) -> Optional[VacancyDetail] | tuple[Optional[VacancyDetail], Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_vacancy_detail",
+            cookies,
+            (vacancy_id,),
+            return_cookies,
+            lambda: self._hh_client.fetch_vacancy_detail(vacancy_id, headers, cookies, return_cookies=True),
+        )
+
+    async def fetch_areas(
+        self,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        return_cookies: bool = False,
+    ) -> List[Dict[str, Any]] | tuple[List[Dict[str, Any]], Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_areas",
+            cookies,
+            (),
+            return_cookies,
+            lambda: self._hh_client.fetch_areas(headers, cookies, return_cookies=True),
+        )
+
+    async def get_vacancy_test(
+        self,
+        vacancy_id: int,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
+        return_cookies: bool = False,
+    ) -> Optional[VacancyTest] | tuple[Optional[VacancyTest], Dict[str, str]]:
+        return await self._coalesce(
+            "get_vacancy_test",
+            cookies,
+            (vacancy_id, internal_api_base_url),
+            return_cookies,
+            lambda: self._hh_client.get_vacancy_test(
+                vacancy_id, headers, cookies, internal_api_base_url=internal_api_base_url, return_cookies=True
+            ),
+        )
+
+    async def fetch_resumes(
+        self,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
+        return_cookies: bool = False,
+    ) -> List[HHResume] | tuple[List[HHResume], Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_resumes",
+            cookies,
+            (internal_api_base_url,),
+            return_cookies,
+            lambda: self._hh_client.fetch_resumes(
+                headers, cookies, internal_api_base_url=internal_api_base_url, return_cookies=True
+            ),
+        )
+
+    async def fetch_resume_detail(
+        self,
+        resume_hash: str,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
+        return_cookies: bool = False,
+    ) -> Optional[HHResumeDetailed] | tuple[Optional[HHResumeDetailed], Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_resume_detail",
+            cookies,
+            (resume_hash, internal_api_base_url),
+            return_cookies,
+            lambda: self._hh_client.fetch_resume_detail(
+                resume_hash, headers, cookies, internal_api_base_url=internal_api_base_url, return_cookies=True
+            ),
+        )
+
+    async def fetch_chat_list(
+        self,
+        chat_ids: List[int],
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        chatik_api_base_url: str = "https://chatik.hh.ru",
+        return_cookies: bool = False,
+        filter_unread: bool = True,
+    ) -> HHListChat | tuple[HHListChat, Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_chat_list",
+            cookies,
+            (chat_ids, chatik_api_base_url, filter_unread),
+            return_cookies,
+            lambda: self._hh_client.fetch_chat_list(
+                chat_ids,
+                headers,
+                cookies,
+                chatik_api_base_url=chatik_api_base_url,
+                return_cookies=True,
+                filter_unread=filter_unread,
+            ),
+        )
+
+    async def fetch_chat_detail(
+        self,
+        chat_id: int,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        chatik_api_base_url: str = "https://chatik.hh.ru",
+        return_cookies: bool = False,
+    ) -> Optional[HHChatDetailed] | tuple[Optional[HHChatDetailed], Dict[str, str]]:
+        return await self._coalesce(
+            "fetch_chat_detail",
+            cookies,
+            (chat_id, chatik_api_base_url),
+            return_cookies,
+            lambda: self._hh_client.fetch_chat_detail(
+                chat_id, headers, cookies, chatik_api_base_url=chatik_api_base_url, return_cookies=True
+            ),
+        )
+
+    # Запросы, меняющие состояние, не объединяются
+
+    async def respond_to_vacancy(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.respond_to_vacancy(*args, **kwargs)
+
+    async def touch_resume(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.touch_resume(*args, **kwargs)
+
+    async def edit_resume(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.edit_resume(*args, **kwargs)
+
+    async def generate_otp(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.generate_otp(*args, **kwargs)
+
+    async def get_captcha_key(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.get_captcha_key(*args, **kwargs)
+
+    async def get_captcha_picture(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.get_captcha_picture(*args, **kwargs)
+
+    async def login_by_code(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.login_by_code(*args, **kwargs)
+
+    async def send_chat_message(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.send_chat_message(*args, **kwargs)
+
+    async def mark_chat_message_read(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.mark_chat_message_read(*args, **kwargs)
+
+    async def get_initial_cookies(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._hh_client.get_initial_cookies(*args, **kwargs)
@@ -0,0 +1,174 @@
+"""Общий пул HTTP соединений для всех HH клиентов."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+from loguru import logger
+
+from config import HHConfig
+
+
+@dataclass(slots=True)
+class HHConnectionPoolStats:
+    """Счетчики использования пула соединений.
+
+    requests — количество отправленных запросов,
+    connections_opened — новые TCP соединения (handshake),
+    tls_handshakes — TLS рукопожатия.
+    """
+
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def pool_hits(self) -> int:
+        """Запросы, обслуженные уже открытым keep-alive соединением."""
+        return max(self.requests - self.connections_opened, 0)
+
+
+class HHConnectionPool:
+    """Долгоживущий пул соединений к хостам HH.
+
+    Для каждого хоста (api.hh.ru, krasnoyarsk.hh.ru, chatik.hh.ru, ...) создаётся
+    отдельный httpx транспорт со своими лимитами, поэтому лимиты действуют per-host.
+    Cookies в пуле не хранятся: каждый запрос выполняется через короткоживущий
+    httpx.AsyncClient со своим cookie jar, который лишь заимствует транспорт.
+
+    transport_factory(host) позволяет подменить транспорт хоста (например,
+    httpx.ASGITransport с локальной заглушкой HH в симуляции без сети).
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = False,
+        max_connections_per_host: int = 20,
+        max_keepalive_connections_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        transport_factory: Optional[Callable[[str], httpx.AsyncBaseTransport]] = None,
+    ) -> None:
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("[hh-pool] Пакет h2 не установлен, HTTP/2 отключен")
+                http2 = False
+
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport_factory = transport_factory
+        self._transports: Dict[str, httpx.AsyncBaseTransport] = {}
+        self._stats = HHConnectionPoolStats()
+        self.transport: httpx.AsyncBaseTransport = _BorrowedTransport(self)
+
+    @property
+    def stats(self) -> HHConnectionPoolStats:
+        """Копия текущих счетчиков пула."""
+        return HHConnectionPoolStats(
+            requests=self._stats.requests,
+            connections_opened=self._stats.connections_opened,
+            tls_handshakes=self._stats.tls_handshakes,
+        )
+
+    def _get_transport(self, host: str) -> httpx.AsyncBaseTransport:
+        transport = self._transports.get(host)
+        if transport is None:
+            if self._transport_factory is not None:
+                transport = self._transport_factory(host)
+            else:
+                transport = httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2)
+            self._transports[host] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._stats.requests += 1
+        parent_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                self._stats.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                self._stats.tls_handshakes += 1
+            if parent_trace is not None:
+                await parent_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        return await self._get_transport(request.url.host).handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Закрывает все соединения пула."""
+        transports = list(self._transports.values())
+        self._transports.clear()
+        for transport in transports:
+            await transport.aclose()
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Транспорт, который httpx.AsyncClient может закрыть, не закрывая сам пул."""
+
+    def __init__(self, pool: HHConnectionPool) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # Соединения принадлежат пулу и закрываются в close_hh_connection_pool
+        return None
+
+
+_POOL: HHConnectionPool | None = None
+
+
+def configure_hh_connection_pool(
+    config: HHConfig,
+    transport_factory: Optional[Callable[[str], httpx.AsyncBaseTransport]] = None,
+) -> HHConnectionPool:
+    """Создает (или возвращает уже созданный) пул соединений по конфигу HH.
+
+    Args:
+        config: Конфигурация HH API.
+        transport_factory: Опциональная фабрика транспорта по хосту (для симуляции).
+
+    Returns:
+        Пул соединений уровня приложения.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = HHConnectionPool(
+            http2=config.http2,
+            max_connections_per_host=config.pool_max_connections_per_host,
+            max_keepalive_connections_per_host=config.pool_max_keepalive_connections_per_host,
+            keepalive_expiry=config.pool_keepalive_expiry_seconds,
+            transport_factory=transport_factory,
+        )
+    return _POOL
+
+
+def get_hh_connection_pool() -> HHConnectionPool:
+    """Возвращает пул соединений, создавая его с дефолтами при первом обращении."""
+    global _POOL
+    if _POOL is None:
+        _POOL = HHConnectionPool()
+    return _POOL
+
+
+async def close_hh_connection_pool() -> None:
+    """Закрывает пул соединений (вызывается при остановке приложения)."""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        stats = pool.stats
+        logger.info(
+            f"[hh-pool] Закрытие пула: requests={stats.requests}, "
+            f"connections_opened={stats.connections_opened}, pool_hits={stats.pool_hits}"
+        )
+        await pool.aclose()
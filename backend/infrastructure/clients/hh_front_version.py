@@ -0,0 +1,110 @@
+"""Фоновое обновление версии фронта HH (заголовок x-static-version)."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+
+import httpx
+from loguru import logger
+
+from infrastructure.clients.hh_connection_pool import get_hh_connection_pool
+
+DEFAULT_HH_FRONT_BUILD_VERSION = "25.52.2"
+
+_BUILD_VERSION_URL = "https://krasnoyarsk.hh.ru/search/vacancy"
+_BUILD_VERSION_RE = re.compile(r'build:\s*"([^"]+)"')
+_BUILD_VERSION_HEADERS = {
+    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "accept-language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+    "priority": "u=0, i",
+    "sec-ch-ua": '"Google Chrome";v="143", "Chromium";v="143", "Not A(Brand";v="24"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"macOS"',
+    "sec-fetch-dest": "document",
+    "sec-fetch-mode": "navigate",
+    "sec-fetch-site": "none",
+    "sec-fetch-user": "?1",
+    "upgrade-insecure-requests": "1",
+    "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
+}
+
+
+class HHFrontBuildVersionRefresher:
+    """Держит актуальную версию фронта HH без I/O на пути построения заголовков.
+
+    get() всегда отдает значение из памяти (stale-while-revalidate): если значение
+    устарело, обновление запускается фоновой задачей, а запрос уходит со старой версией.
+    Дополнительно run() периодически обновляет значение заранее.
+    """
+
+    def __init__(self, ttl_seconds: float = 15 * 60, timeout: float = 10.0) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._timeout = timeout
+        self._value = DEFAULT_HH_FRONT_BUILD_VERSION
+        self._fetched_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self._ttl_seconds
+
+    def get(self) -> str:
+        """Возвращает версию из памяти, при необходимости планируя фоновое обновление."""
+        if self.is_stale:
+            self._schedule_refresh()
+        return self._value
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Нет event loop (синхронный контекст) — обновимся при следующем вызове из async кода
+            return
+        self._refresh_task = loop.create_task(self.refresh())
+
+    async def refresh(self) -> str:
+        """Загружает HTML страницы поиска и извлекает версию build."""
+        try:
+            async with httpx.AsyncClient(
+                transport=get_hh_connection_pool().transport,
+                headers=_BUILD_VERSION_HEADERS,
+                timeout=self._timeout,
+            ) as client:
+                resp = await client.get(_BUILD_VERSION_URL)
+                resp.raise_for_status()
+            match = _BUILD_VERSION_RE.search(resp.text)
+            if match:
+                self._value = match.group(1)
+            else:
+                logger.debug("Build версия HH фронта не найдена в HTML (не критично)")
+        except Exception as exc:
+            # В случае ошибок оставляем прежнее значение, чтобы не ломать запросы
+            logger.debug(f"Не удалось получить build версию HH фронта (не критично): {exc}")
+        # Даже при ошибке не повторяем запрос до следующего TTL
+        self._fetched_at = time.monotonic()
+        return self._value
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """Периодически обновляет версию до установки shutdown_event."""
+        while not shutdown_event.is_set():
+            await self.refresh()
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=self._ttl_seconds * 0.9)
+            except asyncio.TimeoutError:
+                continue
+
+
+_REFRESHER = HHFrontBuildVersionRefresher()
+
+
+def get_hh_front_build_version_refresher() -> HHFrontBuildVersionRefresher:
+    return _REFRESHER
+
+
+def get_hh_front_build_version() -> str:
+    """Возвращает версию фронта HH из памяти (без сетевых запросов)."""
+    return _REFRESHER.get()
@@ -0,0 +1,26 @@
+"""Быстрое декодирование JSON ответов HH.
+
+Если установлен orjson, используется он (в разы быстрее стандартного json на
+больших ответах /search/vacancy), иначе — стандартный модуль json.
+orjson.JSONDecodeError наследуется от json.JSONDecodeError, поэтому
+существующие обработчики `except json.JSONDecodeError` продолжают работать.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - зависит от окружения
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def loads(content: bytes | str) -> Any:
+    """Декодирует тело ответа (bytes или str) в объекты Python."""
+    return _loads(content)
@@ -0,0 +1,304 @@
+"""Token-bucket rate-лимитер запросов к HH с отдельными бакетами per-user и per-host.
+
+Скорость бакетов адаптивная (AIMD): при 429/403/капче она уменьшается
+мультипликативно, на успешных ответах восстанавливается аддитивно до базовой.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from config import HHConfig
+from infrastructure.metrics.pipeline_metrics import HH_LIMITER_WAIT
+
+# Cookies, которые идентифицируют сессию пользователя HH (в порядке приоритета)
+_SESSION_COOKIE_NAMES = ("hhtoken", "hhuid", "crypted_id")
+
+
+@dataclass(slots=True)
+class TokenBucketStats:
+    """Метрики ожидания одного бакета."""
+
+    acquired: int = 0
+    waited: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    backoffs: int = 0
+    rate_factor: float = 1.0
+
+
+class TokenBucket:
+    """Классический token bucket: burst токенов, пополнение rate токенов в секунду.
+
+    Ожидающие не держат lock: каждый вызов acquire сразу резервирует токен
+    (баланс может уйти в минус) и спит ровно столько, сколько нужно для его
+    пополнения. Поэтому запросы обслуживаются в порядке вызова.
+
+    Фактическая скорость = rate * rate_factor, где rate_factor управляется
+    через backoff()/recover().
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.05,
+        min_rate_factor: float = 0.05,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate должен быть > 0")
+        self._base_rate = rate
+        self._burst = float(max(burst, 1))
+        self._decrease_factor = decrease_factor
+        self._increase_step = increase_step
+        self._min_rate_factor = min_rate_factor
+        self._rate_factor = 1.0
+        self._blocked_until = 0.0
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self.stats = TokenBucketStats()
+
+    @property
+    def last_used_at(self) -> float:
+        return self._updated_at
+
+    @property
+    def rate(self) -> float:
+        return self._base_rate * self._rate_factor
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Резервирует токен и возвращает время ожидания в секундах."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1.0
+        wait_for = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+        return max(wait_for, self._blocked_until - now)
+
+    def backoff(self, retry_after: float | None = None) -> None:
+        """Мультипликативно снизить скорость и сбросить накопленный burst.
+
+        Args:
+            retry_after: Пауза из заголовка Retry-After в секундах (если есть).
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._rate_factor = max(self._min_rate_factor, self._rate_factor * self._decrease_factor)
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+        self.stats.backoffs += 1
+        self.stats.rate_factor = self._rate_factor
+
+    def recover(self) -> None:
+        """Аддитивно вернуть скорость к базовой после успешного ответа."""
+        if self._rate_factor >= 1.0:
+            return
+        self._refill(time.monotonic())
+        self._rate_factor = min(1.0, self._rate_factor + self._increase_step)
+        self.stats.rate_factor = self._rate_factor
+
+    async def acquire(self) -> float:
+        """Дождаться токена.
+
+        Returns:
+            Фактическое время ожидания в секундах.
+        """
+        wait_for = self._reserve()
+        self.stats.acquired += 1
+        if wait_for > 0:
+            self.stats.waited += 1
+            self.stats.total_wait_seconds += wait_for
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait_for)
+            await asyncio.sleep(wait_for)
+        return wait_for
+
+
+class HHRateLimiter:
+    """Лимитер с независимыми бакетами на каждую сессию пользователя и на каждый хост HH.
+
+    Запрос проходит, когда получил токен и в бакете пользователя, и в бакете хоста:
+    один активный пользователь не тормозит остальных, а суммарная нагрузка на
+    api.hh.ru / krasnoyarsk.hh.ru / chatik.hh.ru ограничена отдельно.
+
+    Ответы HH передаются в observe_response: 429 снижает скорость и сессии, и хоста,
+    403/капча — только сессии (HH выдает их конкретному пользователю).
+    """
+
+    def __init__(
+        self,
+        *,
+        user_rate: float = 1.0,
+        user_burst: int = 3,
+        host_rate: float = 10.0,
+        host_burst: int = 20,
+        backoff_factor: float = 0.5,
+        recovery_step: float = 0.05,
+        min_rate_factor: float = 0.05,
+        max_user_buckets: int = 10_000,
+        idle_bucket_ttl_seconds: float = 600.0,
+    ) -> None:
+        self._user_rate = user_rate
+        self._user_burst = user_burst
+        self._host_rate = host_rate
+        self._host_burst = host_burst
+        self._aimd_params = {
+            "decrease_factor": backoff_factor,
+            "increase_step": recovery_step,
+            "min_rate_factor": min_rate_factor,
+        }
+        self._max_user_buckets = max_user_buckets
+        self._idle_bucket_ttl_seconds = idle_bucket_ttl_seconds
+        self._user_buckets: Dict[str, TokenBucket] = {}
+        self._host_buckets: Dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def session_key(cookies: Mapping[str, str] | None) -> str:
+        """Ключ сессии пользователя по cookies (значения хешируются, чтобы не светить токены)."""
+        if cookies:
+            for name in _SESSION_COOKIE_NAMES:
+                value = cookies.get(name)
+                if value:
+                    return hashlib.sha1(f"{name}={value}".encode()).hexdigest()[:16]
+        return "anonymous"
+
+    @staticmethod
+    def session_key_from_header(cookie_header: str | None) -> str:
+        """Ключ сессии по заголовку Cookie запроса."""
+        cookies: Dict[str, str] = {}
+        for part in (cookie_header or "").split(";"):
+            name, sep, value = part.strip().partition("=")
+            if sep:
+                cookies[name] = value
+        return HHRateLimiter.session_key(cookies)
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        return urlsplit(url).hostname or url
+
+    def _get_user_bucket(self, key: str) -> TokenBucket:
+        bucket = self._user_buckets.get(key)
+        if bucket is None:
+            if len(self._user_buckets) >= self._max_user_buckets:
+                self._evict_idle_user_buckets()
+            bucket = TokenBucket(self._user_rate, self._user_burst, **self._aimd_params)
+            self._user_buckets[key] = bucket
+        return bucket
+
+    def _get_host_bucket(self, key: str) -> TokenBucket:
+        bucket = self._host_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self._host_rate, self._host_burst, **self._aimd_params)
+            self._host_buckets[key] = bucket
+        return bucket
+
+    def _evict_idle_user_buckets(self) -> None:
+        threshold = time.monotonic() - self._idle_bucket_ttl_seconds
+        for key in [k for k, b in self._user_buckets.items() if b.last_used_at < threshold]:
+            del self._user_buckets[key]
+
+    async def acquire(self, url: str, cookies: Mapping[str, str] | None) -> float:
+        """Дождаться разрешения на запрос к url от имени сессии из cookies.
+
+        Returns:
+            Суммарное время ожидания в секундах.
+        """
+        user_waited = await self._get_user_bucket(self.session_key(cookies)).acquire()
+        HH_LIMITER_WAIT.observe(user_waited, scope="user")
+        host_waited = await self._get_host_bucket(self.host_key(url)).acquire()
+        HH_LIMITER_WAIT.observe(host_waited, scope="host")
+        return user_waited + host_waited
+
+    async def observe_response(self, response: httpx.Response) -> None:
+        """Обновить адаптивную скорость по ответу HH (response hook httpx)."""
+        status = response.status_code
+        user_key = self.session_key_from_header(response.request.headers.get("cookie"))
+        if status < 300:
+            self._get_user_bucket(user_key).recover()
+            self._get_host_bucket(response.url.host).recover()
+            return
+
+        captcha = False
+        if status in (400, 403):
+            await response.aread()
+            captcha = b"captcha" in response.content.lower()
+        if status not in (403, 429) and not captcha:
+            return
+
+        retry_after = _parse_retry_after(response.headers.get("retry-after"))
+        self._get_user_bucket(user_key).backoff(retry_after)
+        if status == 429:
+            self._get_host_bucket(response.url.host).backoff(retry_after)
+        logger.warning(
+            f"[hh-limiter] Снижаем скорость: HTTP {status} captcha={captcha} "
+            f"host={response.url.host} user={user_key} retry_after={retry_after}"
+        )
+
+    def stats(self) -> Dict[str, TokenBucketStats]:
+        """Снимок метрик ожидания по бакетам: ключи вида user:<hash> и host:<hostname>."""
+        result: Dict[str, TokenBucketStats] = {}
+        for key, bucket in self._user_buckets.items():
+            result[f"user:{key}"] = bucket.stats
+        for key, bucket in self._host_buckets.items():
+            result[f"host:{key}"] = bucket.stats
+        return result
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Разбирает Retry-After: число секунд или HTTP-дата."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+_LIMITER: HHRateLimiter | None = None
+
+
+def configure_hh_rate_limiter(config: HHConfig) -> HHRateLimiter:
+    """Создает (или возвращает уже созданный) общий лимитер по конфигу HH."""
+    global _LIMITER
+    if _LIMITER is None:
+        _LIMITER = HHRateLimiter(
+            user_rate=config.rate_limit_user_rps,
+            user_burst=config.rate_limit_user_burst,
+            host_rate=config.rate_limit_host_rps,
+            host_burst=config.rate_limit_host_burst,
+            backoff_factor=config.rate_limit_backoff_factor,
+            recovery_step=config.rate_limit_recovery_step,
+            min_rate_factor=config.rate_limit_min_factor,
+        )
+    return _LIMITER
+
+
+def get_hh_rate_limiter() -> HHRateLimiter:
+    """Возвращает общий лимитер, создавая его с дефолтами при первом обращении."""
+    global _LIMITER
+    if _LIMITER is None:
+        _LIMITER = HHRateLimiter()
+    return _LIMITER
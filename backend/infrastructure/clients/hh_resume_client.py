@@ -31,7 +31,7 @@ class HHResumeClient(HHBaseMixin):
         logger.debug(f"[resumes] GET {url}")
 
         enhanced_headers = self._enhance_headers(headers, cookies)
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
             try:
                 resp = await client.get(url)
                 resp.raise_for_status()
@@ -100,7 +100,7 @@ class HHResumeClient(HHBaseMixin):
         logger.debug(f"[resume_detail] GET {url} hash={resume_hash}")
 
         enhanced_headers = self._enhance_headers(headers, cookies)
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
             try:
                 resp = await client.get(url)
             except httpx.HTTPError as exc:
@@ -176,7 +176,7 @@ class HHResumeClient(HHBaseMixin):
         }
 
         enhanced_headers = self._enhance_headers(headers, cookies)
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
             try:
                 resp = await client.post(url, data=form_data)
                 resp.raise_for_status()
@@ -254,7 +254,7 @@ class HHResumeClient(HHBaseMixin):
         enhanced_headers["x-hhtmfrom"] = "resume_view_block"
         enhanced_headers["x-hhtmsource"] = hhtm_source
         
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
             try:
                 resp = await client.post(url, params=params, json=payload)
                 resp.raise_for_status()
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import re
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from domain.entities.vacancy_detail import VacancyDetail
 from domain.entities.vacancy_list import VacancyList, VacancyListItem
-from domain.entities.vacancy_test import VacancyTest, VacancyTestQuestion, VacancyTestQuestionOption
+from domain.entities.vacancy_test import VacancyTest
+from infrastructure.clients import hh_json
 from infrastructure.clients.hh_base_mixin import HHBaseMixin
+from infrastructure.clients.hh_vacancy_test_parser import get_vacancy_test_parser
+from infrastructure.metrics.pipeline_metrics import STAGE_DURATION, observe_stage
 
 
 class HHVacancyClient(HHBaseMixin):
@@ -33,7 +36,7 @@ class HHVacancyClient(HHBaseMixin):
         logger.debug(f"[list] GET {url} params={query}")
 
         enhanced_headers = self._enhance_headers(headers, cookies)
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
             try:
                 resp = await client.get(url, params=query)
                 resp.raise_for_status()
@@ -52,7 +55,7 @@ class HHVacancyClient(HHBaseMixin):
                 raise
 
             try:
-                payload = resp.json()
+                payload = hh_json.loads(resp.content)
             except json.JSONDecodeError as exc:  # pragma: no cover - диагностика
                 text = resp.text
                 logger.error(
@@ -65,6 +68,190 @@ class HHVacancyClient(HHBaseMixin):
             # Извлечь обновленные cookies после запроса
             updated_cookies = self._extract_cookies(client)
 
+        result = self._map_public_vacancy_list(payload)
+        
+        if return_cookies:
+            return result, updated_cookies
+        return result
+
+    @observe_stage("hh_search_page")
+    async def fetch_vacancy_list_front(
+        self,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        query: Dict[str, str],
+        *,
+        internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
+        return_cookies: bool = False,
+    ) -> VacancyList | tuple[VacancyList, Dict[str, str]]:
+        """Получить список вакансий через внутренний API /search/vacancy."""
+        base_url = internal_api_base_url.rstrip("/")
+        url = f"{base_url}/search/vacancy"
+
+        # Обязательные заголовки для внутреннего API
+        enhanced_headers = dict(headers)
+        enhanced_headers.setdefault("Accept", "application/json")
+        enhanced_headers.setdefault("X-Requested-With", "XMLHttpRequest")
+        # Анти-бот заголовки и XSRF токен добавляются через _enhance_headers
+        enhanced_headers = self._enhance_headers(enhanced_headers, cookies)
+
+        async with self._create_client(
+            headers=enhanced_headers, cookies=cookies, timeout=self._timeout
+        ) as client:
+            try:
+                resp = await client.get(url, params=query)
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                response = exc.response
+                logger.error(
+                    f"[list-front] HTTP {response.status_code} for {response.request.url}"
+                )
+                raise
+
+            try:
+                payload = hh_json.loads(resp.content)
+            except json.JSONDecodeError as exc:
+                text = resp.text
+                logger.error(
+                    f"[list-front] Не удалось распарсить JSON: {exc}; body_len={len(text)}"
+                )
+                raise RuntimeError(
+                    f"Не удалось распарсить JSON ответа /search/vacancy: {exc}; body_len={len(text)}"
+                ) from exc
+
+            # Извлечь обновленные cookies после запроса
+            updated_cookies = self._extract_cookies(client)
+
+        result = self._map_front_vacancy_list(payload)
+        
+        if return_cookies:
+            return result, updated_cookies
+        return result
+
+    async def fetch_areas(
+        self,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        return_cookies: bool = False,
+    ) -> List[Dict[str, Any]] | tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """Получить дерево регионов по /areas."""
+
+        url = f"{self._base_url}/areas"
+
+        enhanced_headers = self._enhance_headers(headers, cookies)
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+            try:
+                resp = await client.get(url)
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                response = exc.response
+                logger.error(
+                    f"[areas] HTTP {response.status_code} for {response.request.url}"
+                )
+                ct = response.headers.get("Content-Type", "")
+                logger.debug(f"[areas] Content-Type: {ct}")
+                try:
+                    body_preview = response.text[:500]
+                except Exception:
+                    body_preview = "<unavailable>"
+                logger.debug(f"[areas] Body preview: {body_preview}")
+                raise
+
+            try:
+                payload = hh_json.loads(resp.content)
+            except json.JSONDecodeError as exc:  # pragma: no cover - диагностика
+                text = resp.text
+                logger.error(
+                    f"[areas] Не удалось распарсить JSON дерева регионов: {exc}; body_len={len(text)}"
+                )
+                raise RuntimeError(
+                    f"Не удалось распарсить JSON дерева регионов: {exc}; body_len={len(text)}"
+                ) from exc
+
+            # Извлечь обновленные cookies после запроса
+            updated_cookies = self._extract_cookies(client)
+
+        # /areas возвращает корневой массив регионов (страны), у каждой могут быть дочерние areas.
+        if not isinstance(payload, list):
+            raise RuntimeError("[areas] Ожидался список регионов в корне ответа")
+
+        if return_cookies:
+            return payload, updated_cookies
+        return payload
+
+    async def fetch_vacancy_detail(
+        self,
+        vacancy_id: int,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        *,
+        return_cookies: bool = False,
+    ) -> Optional[VacancyDetail] | tuple[Optional[VacancyDetail], Dict[str, str]]:
+        # Публичное API: GET /vacancies/{id}
+        url = f"{self._base_url}/vacancies/{vacancy_id}"
+
+        enhanced_headers = self._enhance_headers(headers, cookies)
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+            try:
+                resp = await client.get(url)
+            except httpx.HTTPError as exc:  # pragma: no cover - сетевые ошибки
+                logger.error(f"[detail] vacancyId={vacancy_id}: HTTP ошибка {exc}")
+                if return_cookies:
+                    updated_cookies = self._extract_cookies(client)
+                    return None, updated_cookies
+                return None
+
+            if resp.status_code != 200:
+                logger.warning(
+                    f"[detail] vacancyId={vacancy_id}: неожиданный статус HTTP {resp.status_code}"
+                )
+                if return_cookies:
+                    updated_cookies = self._extract_cookies(client)
+                    return None, updated_cookies
+                return None
+
+            try:
+                payload = hh_json.loads(resp.content)
+            except json.JSONDecodeError:
+                text = resp.text
+                logger.error(
+                    f"[detail] vacancyId={vacancy_id}: не удалось распарсить JSON; body_len={len(text)}"
+                )
+                if return_cookies:
+                    updated_cookies = self._extract_cookies(client)
+                    return None, updated_cookies
+                return None
+
+            # Извлечь обновленные cookies после запроса
+            updated_cookies = self._extract_cookies(client)
+
+        if not isinstance(payload, dict):
+            logger.warning(
+                f"[detail] vacancyId={vacancy_id}: ожидался объект в корне ответа"
+            )
+            if return_cookies:
+                return None, updated_cookies
+            return None
+
+        try:
+            detail = self._map_vacancy_view_to_detail(payload)
+        except Exception as exc:
+            logger.error(
+                f"[detail] vacancyId={vacancy_id}: ошибка маппинга вакансии: {exc}"
+            )
+            if return_cookies:
+                return None, updated_cookies
+            return None
+
+        if return_cookies:
+            return detail, updated_cookies
+        return detail
+
+    @staticmethod
+    def _map_public_vacancy_list(payload: Dict[str, Any]) -> VacancyList:
+        """Маппинг ответа публичного API /vacancies в доменную модель."""
+
         # Структура публичного API: корень -> items: [ { id, name, area, published_at, ... } ]
         raw_vacancies = payload.get("items") or []
 
@@ -170,58 +357,11 @@ class HHVacancyClient(HHBaseMixin):
                 )
             )
 
-        result = VacancyList(items=items)
-        
-        if return_cookies:
-            return result, updated_cookies
-        return result
+        return VacancyList(items=items)
 
-    async def fetch_vacancy_list_front(
-        self,
-        headers: Dict[str, str],
-        cookies: Dict[str, str],
-        query: Dict[str, str],
-        *,
-        internal_api_base_url: str = "https://krasnoyarsk.hh.ru",
-        return_cookies: bool = False,
-    ) -> VacancyList | tuple[VacancyList, Dict[str, str]]:
-        """Получить список вакансий через внутренний API /search/vacancy."""
-        base_url = internal_api_base_url.rstrip("/")
-        url = f"{base_url}/search/vacancy"
-
-        # Обязательные заголовки для внутреннего API
-        enhanced_headers = dict(headers)
-        enhanced_headers.setdefault("Accept", "application/json")
-        enhanced_headers.setdefault("X-Requested-With", "XMLHttpRequest")
-        # Анти-бот заголовки и XSRF токен добавляются через _enhance_headers
-        enhanced_headers = self._enhance_headers(enhanced_headers, cookies)
-
-        async with httpx.AsyncClient(
-            headers=enhanced_headers, cookies=cookies, timeout=self._timeout
-        ) as client:
-            try:
-                resp = await client.get(url, params=query)
-                resp.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                response = exc.response
-                logger.error(
-                    f"[list-front] HTTP {response.status_code} for {response.request.url}"
-                )
-                raise
-
-            try:
-                payload = resp.json()
-            except json.JSONDecodeError as exc:
-                text = resp.text
-                logger.error(
-                    f"[list-front] Не удалось распарсить JSON: {exc}; body_len={len(text)}"
-                )
-                raise RuntimeError(
-                    f"Не удалось распарсить JSON ответа /search/vacancy: {exc}; body_len={len(text)}"
-                ) from exc
-
-            # Извлечь обновленные cookies после запроса
-            updated_cookies = self._extract_cookies(client)
+    @staticmethod
+    def _map_front_vacancy_list(payload: Dict[str, Any]) -> VacancyList:
+        """Маппинг ответа внутреннего API /search/vacancy в доменную модель."""
 
         # Структура внутреннего API: vacancySearchResult -> vacancies: [ { vacancyId, name, company, ... } ]
         vacancy_search_result = payload.get("vacancySearchResult")
@@ -234,24 +374,22 @@ class HHVacancyClient(HHBaseMixin):
         if not isinstance(raw_vacancies, list):
             raw_vacancies = []
 
-        # Создаем справочник professional_role ID -> название для маппинга
-        professional_role_map: Dict[int, str] = {}
+        # Справочник professional_role ID -> название. Групп в нем сотни, а в выдаче
+        # используются единицы, поэтому названия ищутся лениво и запоминаются.
+        role_groups: Dict[str, Any] = {}
         professional_role_clusters = payload.get("vacancySearchDictionaries", {}).get("professional_role")
         if isinstance(professional_role_clusters, dict):
             groups = professional_role_clusters.get("groups")
             if isinstance(groups, dict):
-                for role_id_str, role_data in groups.items():
-                    if isinstance(role_data, dict):
-                        role_title = role_data.get("title")
-                        if isinstance(role_title, str):
-                            try:
-                                role_id = int(role_id_str)
-                                professional_role_map[role_id] = role_title
-                            except (ValueError, TypeError) as exc:
-                                logger.debug(
-                                    f"Не удалось распарсить role_id (ожидаемое поведение при некорректных данных от API): "
-                                    f"role_id_str={role_id_str}, error={exc}"
-                                )
+                role_groups = groups
+        professional_role_map: Dict[int, Optional[str]] = {}
+
+        def _role_title(role_id: int) -> Optional[str]:
+            if role_id not in professional_role_map:
+                role_data = role_groups.get(str(role_id))
+                role_title = role_data.get("title") if isinstance(role_data, dict) else None
+                professional_role_map[role_id] = role_title if isinstance(role_title, str) else None
+            return professional_role_map[role_id]
 
         items: list[VacancyListItem] = []
         for raw in raw_vacancies:
@@ -384,13 +522,13 @@ class HHVacancyClient(HHBaseMixin):
                         if isinstance(role_id_list, list):
                             for role_id in role_id_list:
                                 if isinstance(role_id, int):
-                                    role_name = professional_role_map.get(role_id)
+                                    role_name = _role_title(role_id)
                                     if role_name and role_name not in professional_roles:
                                         professional_roles.append(role_name)
                                 elif isinstance(role_id, str):
                                     try:
                                         role_id_int = int(role_id)
-                                        role_name = professional_role_map.get(role_id_int)
+                                        role_name = _role_title(role_id_int)
                                         if role_name and role_name not in professional_roles:
                                             professional_roles.append(role_name)
                                     except (ValueError, TypeError):
@@ -460,131 +598,7 @@ class HHVacancyClient(HHBaseMixin):
                 )
             )
 
-        result = VacancyList(items=items)
-        
-        if return_cookies:
-            return result, updated_cookies
-        return result
-
-    async def fetch_areas(
-        self,
-        headers: Dict[str, str],
-        cookies: Dict[str, str],
-        *,
-        return_cookies: bool = False,
-    ) -> List[Dict[str, Any]] | tuple[List[Dict[str, Any]], Dict[str, str]]:
-        """Получить дерево регионов по /areas."""
-
-        url = f"{self._base_url}/areas"
-
-        enhanced_headers = self._enhance_headers(headers, cookies)
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
-            try:
-                resp = await client.get(url)
-                resp.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                response = exc.response
-                logger.error(
-                    f"[areas] HTTP {response.status_code} for {response.request.url}"
-                )
-                ct = response.headers.get("Content-Type", "")
-                logger.debug(f"[areas] Content-Type: {ct}")
-                try:
-                    body_preview = response.text[:500]
-                except Exception:
-                    body_preview = "<unavailable>"
-                logger.debug(f"[areas] Body preview: {body_preview}")
-                raise
-
-            try:
-                payload = resp.json()
-            except json.JSONDecodeError as exc:  # pragma: no cover - диагностика
-                text = resp.text
-                logger.error(
-                    f"[areas] Не удалось распарсить JSON дерева регионов: {exc}; body_len={len(text)}"
-                )
-                raise RuntimeError(
-                    f"Не удалось распарсить JSON дерева регионов: {exc}; body_len={len(text)}"
-                ) from exc
-
-            # Извлечь обновленные cookies после запроса
-            updated_cookies = self._extract_cookies(client)
-
-        # /areas возвращает корневой массив регионов (страны), у каждой могут быть дочерние areas.
-        if not isinstance(payload, list):
-            raise RuntimeError("[areas] Ожидался список регионов в корне ответа")
-
-        if return_cookies:
-            return payload, updated_cookies
-        return payload
-
-    async def fetch_vacancy_detail(
-        self,
-        vacancy_id: int,
-        headers: Dict[str, str],
-        cookies: Dict[str, str],
-        *,
-        return_cookies: bool = False,
-    ) -> Optional[VacancyDetail] | tuple[Optional[VacancyDetail], Dict[str, str]]:
-        # Публичное API: GET /vacancies/{id}
-        url = f"{self._base_url}/vacancies/{vacancy_id}"
-
-        enhanced_headers = self._enhance_headers(headers, cookies)
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
-            try:
-                resp = await client.get(url)
-            except httpx.HTTPError as exc:  # pragma: no cover - сетевые ошибки
-                logger.error(f"[detail] vacancyId={vacancy_id}: HTTP ошибка {exc}")
-                if return_cookies:
-                    updated_cookies = self._extract_cookies(client)
-                    return None, updated_cookies
-                return None
-
-            if resp.status_code != 200:
-                logger.warning(
-                    f"[detail] vacancyId={vacancy_id}: неожиданный статус HTTP {resp.status_code}"
-                )
-                if return_cookies:
-                    updated_cookies = self._extract_cookies(client)
-                    return None, updated_cookies
-                return None
-
-            try:
-                payload = resp.json()
-            except json.JSONDecodeError:
-                text = resp.text
-                logger.error(
-                    f"[detail] vacancyId={vacancy_id}: не удалось распарсить JSON; body_len={len(text)}"
-                )
-                if return_cookies:
-                    updated_cookies = self._extract_cookies(client)
-                    return None, updated_cookies
-                return None
-
-            # Извлечь обновленные cookies после запроса
-            updated_cookies = self._extract_cookies(client)
-
-        if not isinstance(payload, dict):
-            logger.warning(
-                f"[detail] vacancyId={vacancy_id}: ожидался объект в корне ответа"
-            )
-            if return_cookies:
-                return None, updated_cookies
-            return None
-
-        try:
-            detail = self._map_vacancy_view_to_detail(payload)
-        except Exception as exc:
-            logger.error(
-                f"[detail] vacancyId={vacancy_id}: ошибка маппинга вакансии: {exc}"
-            )
-            if return_cookies:
-                return None, updated_cookies
-            return None
-
-        if return_cookies:
-            return detail, updated_cookies
-        return detail
+        return VacancyList(items=items)
 
     @staticmethod
     def _map_vacancy_view_to_detail(v: Dict[str, object]) -> VacancyDetail:
@@ -737,216 +751,40 @@ class HHVacancyClient(HHBaseMixin):
         
         logger.debug(f"[test] GET {url} vacancyId={vacancy_id}")
         
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
-            try:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                logger.error(f"[test] HTTP {exc.response.status_code} for {exc.response.request.url}")
-                raise
-            
-            html_content = resp.text
-            updated_cookies = self._extract_cookies(client)
-            
-            # Парсим HTML через BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Ищем форму с тестом
-            form = soup.find('form', {'id': 'RESPONSE_MODAL_FORM_ID'})
-            if not form:
-                # Тест отсутствует - сохраняем HTML в файл для отладки
+        with STAGE_DURATION.time(stage="hh_test_fetch"):
+            async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
                 try:
-                    from pathlib import Path
-                    logs_dir = Path("logs")
-                    logs_dir.mkdir(exist_ok=True)
-                    html_file = logs_dir / f"{vacancy_id}.html"
-                    html_file.write_text(html_content, encoding="utf-8")
-                    logger.debug(f"[test] Сохранен HTML в {html_file} для вакансии {vacancy_id}")
-                except Exception as save_exc:
-                    logger.warning(f"[test] Не удалось сохранить HTML для вакансии {vacancy_id}: {save_exc}")
-                
-                # Тест отсутствует
-                if return_cookies:
-                    return None, updated_cookies
-                return None
-            
-            # Извлекаем описание теста
-            test_description_elem = soup.find('div', {'data-qa': 'test-description'})
-            test_description = test_description_elem.get_text(strip=True) if test_description_elem else None
-            
-            # Извлекаем метаданные из скрытых полей формы
-            uid_pk = None
-            guid = None
-            start_time = None
-            test_required = False
-            
-            uid_pk_input = form.find('input', {'name': 'uidPk'})
-            if uid_pk_input and uid_pk_input.get('value'):
-                uid_pk = uid_pk_input['value']
-            
-            guid_input = form.find('input', {'name': 'guid'})
-            if guid_input and guid_input.get('value'):
-                guid = guid_input['value']
-            
-            start_time_input = form.find('input', {'name': 'startTime'})
-            if start_time_input and start_time_input.get('value'):
-                start_time = start_time_input['value']
-            
-            test_required_input = form.find('input', {'name': 'testRequired'})
-            if test_required_input and test_required_input.get('value'):
-                test_required = test_required_input['value'].lower() == 'true'
-            
-            # Ищем все блоки с вопросами
-            questions = []
-            task_bodies = form.find_all('div', {'data-qa': 'task-body'})
-            
-            for task_body in task_bodies:
-                # Извлекаем текст вопроса
-                question_elem = task_body.find('div', {'data-qa': 'task-question'})
-                if not question_elem:
-                    continue
-                
-                question_text = question_elem.get_text(strip=True)
-                
-                # Проверяем, есть ли textarea (текстовый вопрос)
-                textarea = task_body.find('textarea')
-                if textarea and textarea.get('name'):
-                    # Текстовый вопрос
-                    field_name = textarea['name']
-                    
-                    # Извлекаем task_id из имени поля (например, "task_291683492_text" -> "291683492")
-                    match = re.match(r'task_(\d+)_text', field_name)
-                    if not match:
-                        continue
-                    
-                    task_id = match.group(1)
-                    
-                    questions.append(VacancyTestQuestion(
-                        task_id=task_id,
-                        question_text=question_text,
-                        field_name=field_name,
-                        question_type="text",
-                        options=None,
-                    ))
-                else:
-                    # Проверяем, есть ли checkbox кнопки (multiselect вопрос)
-                    checkbox_inputs = task_body.find_all('input', {'type': 'checkbox'})
-                    if checkbox_inputs:
-                        # Извлекаем name первой checkbox (все должны иметь одинаковый name)
-                        first_checkbox = checkbox_inputs[0]
-                        field_name = first_checkbox.get('name')
-                        if not field_name:
-                            continue
-                        
-                        # Извлекаем task_id из имени поля (например, "task_316925806" -> "316925806")
-                        match = re.match(r'task_(\d+)', field_name)
-                        if not match:
-                            continue
-                        
-                        task_id = match.group(1)
-                        
-                        # Извлекаем варианты ответов
-                        options = []
-                        for checkbox_input in checkbox_inputs:
-                            value = checkbox_input.get('value')
-                            if not value:
-                                continue
-                            
-                            # Ищем текст варианта ответа
-                            # Checkbox находится в label, текст в span с data-qa="cell-text-content"
-                            label = checkbox_input.find_parent('label')
-                            if label:
-                                text_elem = label.find('span', {'data-qa': 'cell-text-content'})
-                                if text_elem:
-                                    option_text = text_elem.get_text(strip=True)
-                                    options.append(VacancyTestQuestionOption(
-                                        value=value,
-                                        text=option_text,
-                                    ))
-                        
-                        if options:
-                            questions.append(VacancyTestQuestion(
-                                task_id=task_id,
-                                question_text=question_text,
-                                field_name=field_name,
-                                question_type="multiselect",
-                                options=options,
-                            ))
-                    else:
-                        # Проверяем, есть ли radio кнопки (select вопрос)
-                        radio_inputs = task_body.find_all('input', {'type': 'radio'})
-                        if radio_inputs:
-                            # Извлекаем name первой radio кнопки (все должны иметь одинаковый name)
-                            first_radio = radio_inputs[0]
-                            field_name = first_radio.get('name')
-                            if not field_name:
-                                continue
-                            
-                            # Извлекаем task_id из имени поля (например, "task_296586238" -> "296586238")
-                            match = re.match(r'task_(\d+)', field_name)
-                            if not match:
-                                continue
-                            
-                            task_id = match.group(1)
-                            
-                            # Извлекаем варианты ответов
-                            options = []
-                            for radio_input in radio_inputs:
-                                value = radio_input.get('value')
-                                if not value:
-                                    continue
-                                
-                                # Ищем текст варианта ответа
-                                # Radio кнопка находится в label, текст в span с data-qa="cell-text-content"
-                                label = radio_input.find_parent('label')
-                                if label:
-                                    text_elem = label.find('span', {'data-qa': 'cell-text-content'})
-                                    if text_elem:
-                                        option_text = text_elem.get_text(strip=True)
-                                        options.append(VacancyTestQuestionOption(
-                                            value=value,
-                                            text=option_text,
-                                        ))
-                            
-                            if options:
-                                questions.append(VacancyTestQuestion(
-                                    task_id=task_id,
-                                    question_text=question_text,
-                                    field_name=field_name,
-                                    question_type="select",
-                                    options=options,
-                                ))
-            
-            if not questions:
-                # Вопросы не найдены - сохраняем HTML в файл для отладки
-                try:
-                    from pathlib import Path
-                    logs_dir = Path("logs")
-                    logs_dir.mkdir(exist_ok=True)
-                    html_file = logs_dir / f"{vacancy_id}.html"
-                    html_file.write_text(html_content, encoding="utf-8")
-                    logger.debug(f"[test] Сохранен HTML в {html_file} для вакансии {vacancy_id} (вопросы не найдены)")
-                except Exception as save_exc:
-                    logger.warning(f"[test] Не удалось сохранить HTML для вакансии {vacancy_id}: {save_exc}")
-                
-                # Вопросы не найдены
-                if return_cookies:
-                    return None, updated_cookies
-                return None
-            
-            test = VacancyTest(
-                questions=questions,
-                uid_pk=uid_pk,
-                guid=guid,
-                start_time=start_time,
-                test_required=test_required,
-                description=test_description,
-            )
-            
-            if return_cookies:
-                return test, updated_cookies
-            return test
+                    resp = await client.get(url, params=params)
+                    resp.raise_for_status()
+                except httpx.HTTPStatusError as exc:
+                    logger.error(f"[test] HTTP {exc.response.status_code} for {exc.response.request.url}")
+                    raise
+
+                html_content = resp.text
+                updated_cookies = self._extract_cookies(client)
 
+        # Разбор формы теста выполняется вне event loop и кешируется по vacancy_id
+        test = await get_vacancy_test_parser().parse(vacancy_id, html_content)
+        if test is None:
+            # Тест или вопросы не найдены - сохраняем HTML в файл для отладки
+            await asyncio.to_thread(self._dump_vacancy_html, vacancy_id, html_content)
+
+        if return_cookies:
+            return test, updated_cookies
+        return test
+
+    @staticmethod
+    def _dump_vacancy_html(vacancy_id: int, html_content: str) -> None:
+        try:
+            logs_dir = Path("logs")
+            logs_dir.mkdir(exist_ok=True)
+            html_file = logs_dir / f"{vacancy_id}.html"
+            html_file.write_text(html_content, encoding="utf-8")
+            logger.debug(f"[test] Сохранен HTML в {html_file} для вакансии {vacancy_id} (тест не найден)")
+        except Exception as save_exc:
+            logger.warning(f"[test] Не удалось сохранить HTML для вакансии {vacancy_id}: {save_exc}")
+
+    @observe_stage("hh_respond")
     async def respond_to_vacancy(
         self,
         vacancy_id: int,
@@ -1031,7 +869,7 @@ class HHVacancyClient(HHBaseMixin):
         logger.debug(f"[respond] XSRF token: {xsrf_token[:50] if xsrf_token else 'NOT_FOUND'}")
 
         enhanced_headers = self._enhance_headers(headers, cookies)
-        async with httpx.AsyncClient(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
+        async with self._create_client(headers=enhanced_headers, cookies=cookies, timeout=self._timeout) as client:
             try:
                 resp = await client.post(url, files=files_list)
                 resp.raise_for_status()
@@ -1050,7 +888,7 @@ class HHVacancyClient(HHBaseMixin):
                 raise
 
             try:
-                payload = resp.json()
+                payload = hh_json.loads(resp.content)
             except json.JSONDecodeError as exc:
                 text = resp.text
                 logger.error(
@@ -0,0 +1,194 @@
+"""Извлечение теста вакансии из HTML страницы /applicant/vacancy_response."""
+
+from __future__ import annotations
+
+import asyncio
+import html as html_lib
+import re
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from domain.entities.vacancy_test import VacancyTest, VacancyTestQuestion, VacancyTestQuestionOption
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.metrics.pipeline_metrics import observe_stage
+
+_FORM_MARKER = 'id="RESPONSE_MODAL_FORM_ID"'
+_DESCRIPTION_MARKER = 'data-qa="test-description"'
+_INPUT_TAG_RE = re.compile(r"<input\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"')
+_TEXT_TASK_RE = re.compile(r"task_(\d+)_text")
+_TASK_RE = re.compile(r"task_(\d+)")
+_META_FIELDS = ("uidPk", "guid", "startTime", "testRequired")
+
+
+def slice_element(page: str, marker: str, tag: str) -> Optional[str]:
+    """Вырезает из страницы HTML элемента tag, открывающий тег которого содержит marker.
+
+    Вложенные одноименные теги учитываются подсчетом открывающих/закрывающих тегов,
+    поэтому парсер получает только нужный фрагмент, а не всю страницу.
+    """
+    marker_pos = page.find(marker)
+    if marker_pos == -1:
+        return None
+    start = page.rfind(f"<{tag}", 0, marker_pos)
+    if start == -1:
+        return None
+    depth = 0
+    for match in re.compile(rf"<(/?){tag}\b", re.IGNORECASE).finditer(page, start):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            end = page.find(">", match.end())
+            return page[start : end + 1] if end != -1 else None
+    return None
+
+
+def parse_form_metadata(form_html: str) -> Dict[str, str]:
+    """Значения скрытых полей формы (uidPk, guid, startTime, testRequired) без построения DOM."""
+    meta: Dict[str, str] = {}
+    for tag in _INPUT_TAG_RE.findall(form_html):
+        attrs = dict(_ATTR_RE.findall(tag))
+        name = attrs.get("name")
+        if name in _META_FIELDS and attrs.get("value"):
+            meta[name] = html_lib.unescape(attrs["value"])
+    return meta
+
+
+def _parse_choice_question(
+    task_body, inputs, question_text: str, question_type: str
+) -> Optional[VacancyTestQuestion]:
+    # Берем name первого input (все варианты одного вопроса имеют одинаковый name)
+    field_name = inputs[0].get("name")
+    if not field_name:
+        return None
+    match = _TASK_RE.match(field_name)
+    if not match:
+        return None
+
+    options: List[VacancyTestQuestionOption] = []
+    for choice_input in inputs:
+        value = choice_input.get("value")
+        if not value:
+            continue
+        # Input находится в label, текст варианта — в span с data-qa="cell-text-content"
+        label = choice_input.find_parent("label")
+        if label:
+            text_elem = label.find("span", {"data-qa": "cell-text-content"})
+            if text_elem:
+                options.append(VacancyTestQuestionOption(value=value, text=text_elem.get_text(strip=True)))
+
+    if not options:
+        return None
+    return VacancyTestQuestion(
+        task_id=match.group(1),
+        question_text=question_text,
+        field_name=field_name,
+        question_type=question_type,
+        options=options,
+    )
+
+
+def parse_questions(form_html: str) -> List[VacancyTestQuestion]:
+    """Разбирает вопросы теста из HTML фрагмента формы."""
+    form = BeautifulSoup(form_html, "html.parser")
+    questions: List[VacancyTestQuestion] = []
+    for task_body in form.find_all("div", {"data-qa": "task-body"}):
+        question_elem = task_body.find("div", {"data-qa": "task-question"})
+        if not question_elem:
+            continue
+        question_text = question_elem.get_text(strip=True)
+
+        # Текстовый вопрос (textarea)
+        textarea = task_body.find("textarea")
+        if textarea and textarea.get("name"):
+            field_name = textarea["name"]
+            # Например, "task_291683492_text" -> "291683492"
+            match = _TEXT_TASK_RE.match(field_name)
+            if match:
+                questions.append(
+                    VacancyTestQuestion(
+                        task_id=match.group(1),
+                        question_text=question_text,
+                        field_name=field_name,
+                        question_type="text",
+                        options=None,
+                    )
+                )
+            continue
+
+        # Checkbox — multiselect вопрос, radio — select вопрос
+        checkbox_inputs = task_body.find_all("input", {"type": "checkbox"})
+        if checkbox_inputs:
+            question = _parse_choice_question(task_body, checkbox_inputs, question_text, "multiselect")
+        else:
+            radio_inputs = task_body.find_all("input", {"type": "radio"})
+            question = (
+                _parse_choice_question(task_body, radio_inputs, question_text, "select")
+                if radio_inputs
+                else None
+            )
+        if question is not None:
+            questions.append(question)
+    return questions
+
+
+def parse_description(page: str) -> Optional[str]:
+    """Текст описания теста (div data-qa="test-description")."""
+    fragment = slice_element(page, _DESCRIPTION_MARKER, "div")
+    if fragment is None:
+        return None
+    return BeautifulSoup(fragment, "html.parser").get_text(strip=True)
+
+
+class VacancyTestParser:
+    """Извлекает тест вакансии, разбирая только фрагмент формы и вне event loop.
+
+    Вопросы и описание теста одинаковы для всех пользователей, поэтому кешируются
+    по vacancy_id и при повторных откликах не разбираются заново. Скрытые поля
+    (uidPk, guid, startTime) зависят от сессии и каждый раз читаются из страницы
+    дешевым regex-проходом по фрагменту формы.
+    """
+
+    def __init__(self, ttl_seconds: float = 60 * 60, max_entries: int = 2000) -> None:
+        self._cache: TTLCache[int, Tuple[List[VacancyTestQuestion], Optional[str]]] = TTLCache(
+            ttl_seconds, max_entries
+        )
+
+    def invalidate(self, vacancy_id: int) -> None:
+        self._cache.pop(vacancy_id)
+
+    @observe_stage("test_parse")
+    async def parse(self, vacancy_id: int, page: str) -> Optional[VacancyTest]:
+        """Возвращает тест вакансии или None, если на странице нет формы с вопросами."""
+        form_html = slice_element(page, _FORM_MARKER, "form")
+        if form_html is None:
+            return None
+
+        cached = self._cache.get(vacancy_id)
+        if cached is None:
+            cached = await asyncio.to_thread(self._parse_static_part, page, form_html)
+            self._cache.set(vacancy_id, cached)
+        questions, description = cached
+        if not questions:
+            return None
+
+        meta = parse_form_metadata(form_html)
+        return VacancyTest(
+            questions=list(questions),
+            uid_pk=meta.get("uidPk"),
+            guid=meta.get("guid"),
+            start_time=meta.get("startTime"),
+            test_required=meta.get("testRequired", "").lower() == "true",
+            description=description,
+        )
+
+    @staticmethod
+    def _parse_static_part(page: str, form_html: str) -> Tuple[List[VacancyTestQuestion], Optional[str]]:
+        return parse_questions(form_html), parse_description(page)
+
+
+_PARSER = VacancyTestParser()
+
+
+def get_vacancy_test_parser() -> VacancyTestParser:
+    return _PARSER
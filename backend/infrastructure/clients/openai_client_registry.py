@@ -0,0 +1,121 @@
+"""Общие клиенты OpenAI-совместимого API для всех LLM-агентов процесса."""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import httpx
+from loguru import logger
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from config import OpenAIConfig
+
+
+class OpenAIClientRegistry:
+    """Реестр долгоживущих клиентов LLM, ключ — (base_url, api_key).
+
+    Агенты создаются на каждый запрос API и на каждую задачу воркера; если каждый
+    агент создает свой AsyncOpenAI, у каждого свой пул соединений и keep-alive
+    соединения к шлюзу LLM не переиспользуются. Реестр отдает один httpx клиент
+    на ключ: его используют и AsyncOpenAI агентов, и ChatOpenAI (langchain).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http_clients: Dict[Tuple[str, str], httpx.AsyncClient] = {}
+        self._clients: Dict[Tuple[str, str], AsyncOpenAI] = {}
+
+    def get_http_client(self, base_url: str, api_key: str) -> httpx.AsyncClient:
+        """httpx клиент с общим пулом соединений для (base_url, api_key)."""
+        key = (base_url, api_key)
+        http_client = self._http_clients.get(key)
+        if http_client is None:
+            # Дефолтные таймауты и редиректы SDK, но свои лимиты пула
+            http_client = DefaultAsyncHttpxClient(limits=self._limits)
+            self._http_clients[key] = http_client
+        return http_client
+
+    def get_client(self, base_url: str, api_key: str) -> AsyncOpenAI:
+        """AsyncOpenAI для (base_url, api_key), создается при первом обращении."""
+        key = (base_url, api_key)
+        client = self._clients.get(key)
+        if client is None:
+            client = AsyncOpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                http_client=self.get_http_client(base_url, api_key),
+            )
+            self._clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Закрывает соединения всех клиентов."""
+        http_clients = list(self._http_clients.values())
+        self._http_clients.clear()
+        self._clients.clear()
+        for http_client in http_clients:
+            await http_client.aclose()
+
+
+_REGISTRY: OpenAIClientRegistry | None = None
+
+
+def configure_openai_client_registry(config: OpenAIConfig) -> OpenAIClientRegistry:
+    """Создает (или возвращает уже созданный) реестр клиентов LLM по конфигу.
+
+    Args:
+        config: Конфигурация OpenAI.
+
+    Returns:
+        Реестр клиентов уровня процесса.
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = OpenAIClientRegistry(
+            max_connections=config.pool_max_connections,
+            max_keepalive_connections=config.pool_max_keepalive_connections,
+            keepalive_expiry=config.pool_keepalive_expiry_seconds,
+        )
+    return _REGISTRY
+
+
+def get_openai_client(config: OpenAIConfig) -> AsyncOpenAI:
+    """Общий AsyncOpenAI для base_url и api_key из конфига.
+
+    Raises:
+        RuntimeError: Если api_key не задан.
+    """
+    if not config.api_key:
+        raise RuntimeError("OpenAIConfig.api_key не задан (проверь конфиг/окружение)")
+    return configure_openai_client_registry(config).get_client(config.base_url, config.api_key)
+
+
+def get_openai_http_client(config: OpenAIConfig) -> httpx.AsyncClient:
+    """Общий httpx клиент для ChatOpenAI (параметр http_async_client).
+
+    Raises:
+        RuntimeError: Если api_key не задан.
+    """
+    if not config.api_key:
+        raise RuntimeError("OpenAIConfig.api_key не задан (проверь конфиг/окружение)")
+    registry = configure_openai_client_registry(config)
+    return registry.get_http_client(config.base_url, config.api_key)
+
+
+async def close_openai_client_registry() -> None:
+    """Закрывает клиенты LLM (вызывается при остановке приложения и воркеров)."""
+    global _REGISTRY
+    registry, _REGISTRY = _REGISTRY, None
+    if registry is not None:
+        logger.info(f"[llm-clients] Закрытие клиентов LLM: {len(registry._http_clients)}")
+        await registry.aclose()
@@ -0,0 +1,96 @@
+"""Лента изменений автооткликов на основе PostgreSQL LISTEN/NOTIFY."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+from uuid import UUID
+
+import asyncpg
+from loguru import logger
+
+from domain.interfaces.auto_reply_change_feed_port import AutoReplyChangeFeedPort
+
+# Канал, в который пишут триггеры на resumes и resume_filter_settings
+AUTO_REPLY_CHANGES_CHANNEL = "auto_reply_changes"
+
+
+class PostgresAutoReplyChangeFeed(AutoReplyChangeFeedPort):
+    """Слушает канал auto_reply_changes на выделенном соединении asyncpg.
+
+    Соединение для LISTEN не берется из пула SQLAlchemy: оно живет все время
+    работы воркера. Разрыв обнаруживается периодическим SELECT 1, после
+    переподключения воркеру отправляется сигнал сверки (on_change(None)),
+    так как уведомления за время разрыва потеряны.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        keepalive_seconds: float = 30.0,
+        reconnect_delay_seconds: float = 5.0,
+        max_reconnect_delay_seconds: float = 60.0,
+    ) -> None:
+        # asyncpg не понимает диалект SQLAlchemy в схеме URL
+        self._dsn = db_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self._keepalive_seconds = keepalive_seconds
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._max_reconnect_delay_seconds = max_reconnect_delay_seconds
+        self._listening = False
+
+    @property
+    def is_listening(self) -> bool:
+        return self._listening
+
+    async def run(
+        self,
+        on_change: Callable[[UUID | None], None],
+        shutdown_event: asyncio.Event,
+    ) -> None:
+        delay = self._reconnect_delay_seconds
+        while not shutdown_event.is_set():
+            connection: asyncpg.Connection | None = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                await connection.add_listener(
+                    AUTO_REPLY_CHANGES_CHANNEL,
+                    lambda _conn, _pid, _channel, payload: self._dispatch(on_change, payload),
+                )
+                self._listening = True
+                delay = self._reconnect_delay_seconds
+                logger.info(f"Подписка на канал {AUTO_REPLY_CHANGES_CHANNEL} активна")
+                on_change(None)
+                await self._keep_alive(connection, shutdown_event)
+            except Exception as exc:
+                logger.warning(f"Лента изменений автооткликов недоступна: {exc}")
+            finally:
+                self._listening = False
+                if connection is not None and not connection.is_closed():
+                    try:
+                        await connection.close()
+                    except Exception:
+                        connection.terminate()
+
+            if shutdown_event.is_set():
+                break
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                delay = min(delay * 2, self._max_reconnect_delay_seconds)
+
+    async def _keep_alive(self, connection: asyncpg.Connection, shutdown_event: asyncio.Event) -> None:
+        """Проверять соединение, пока не установлен shutdown_event (ошибка — признак разрыва)."""
+        while not shutdown_event.is_set():
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=self._keepalive_seconds)
+            except asyncio.TimeoutError:
+                await connection.execute("SELECT 1")
+
+    @staticmethod
+    def _dispatch(on_change: Callable[[UUID | None], None], payload: str) -> None:
+        try:
+            resume_id = UUID(payload)
+        except ValueError:
+            logger.warning(f"Некорректное уведомление в {AUTO_REPLY_CHANGES_CHANNEL}: {payload!r}")
+            resume_id = None
+        on_change(resume_id)
@@ -0,0 +1,46 @@
+"""SQLAlchemy модель персистентного кеша ответов LLM."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from infrastructure.database.base import Base
+
+
+class LlmResponseCacheModel(Base):
+    """SQLAlchemy модель для хранения ответов LLM по хешу запроса.
+
+    Позволяет после перезапуска не отправлять в LLM повторно тот же промпт.
+    """
+
+    __tablename__ = "llm_response_cache"
+
+    cache_key: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="sha256 от (model, messages, temperature, response_format)",
+    )
+    agent_name: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        index=True,
+    )
+    model: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+    )
+    content: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="Текст ответа модели",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
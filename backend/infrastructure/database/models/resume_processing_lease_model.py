@@ -0,0 +1,43 @@
+"""SQLAlchemy модель аренды резюме процессами воркера автооткликов."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from infrastructure.database.base import Base
+
+
+class ResumeProcessingLeaseModel(Base):
+    """SQLAlchemy модель аренды резюме.
+
+    Резюме обрабатывает только процесс-владелец, пока не истек leased_until.
+    Освобожденная аренда не удаляется, а истекает сразу: по leased_until
+    следующий захват берет резюме, которые дольше всех не обрабатывались.
+    """
+
+    __tablename__ = "resume_processing_leases"
+
+    resume_id: Mapped[UUID] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    owner: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Идентификатор процесса воркера (host:pid:uuid)",
+    )
+    leased_until: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+    heartbeat_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Float, ForeignKey, Index, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from infrastructure.database.base import Base
 
@@ -14,6 +16,9 @@ class ResumeToVacancyMatchModel(Base):
     """SQLAlchemy модель мэтча резюме-вакансия.
 
     Хранит результаты нейронной фильтрации вакансий для резюме.
+    Уникальный ключ — (context_hash, vacancy_hash), resume_id — резюме,
+    для которого мэтч был посчитан. На пару (resume_id, vacancy_hash) может быть
+    несколько строк (после правок резюме): актуальна последняя по created_at.
     """
 
     __tablename__ = "resume_to_vacancy_matches"
@@ -25,14 +30,30 @@ class ResumeToVacancyMatchModel(Base):
         index=True,
     )
     vacancy_hash: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    context_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Hash резюме, требований пользователя, модели и версии промпта",
+    )
     confidence: Mapped[float] = mapped_column(Float, nullable=False)
     reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
 
     __table_args__ = (
         Index(
             "ix_resume_to_vacancy_matches_resume_vacancy",
             "resume_id",
             "vacancy_hash",
+            "created_at",
+        ),
+        Index(
+            "ix_resume_to_vacancy_matches_context_vacancy",
+            "context_hash",
+            "vacancy_hash",
             unique=True,
         ),
     )
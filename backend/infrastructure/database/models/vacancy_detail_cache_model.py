@@ -0,0 +1,39 @@
+"""SQLAlchemy модель персистентного кеша карточек вакансий."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from infrastructure.database.base import Base
+
+
+class VacancyDetailCacheModel(Base):
+    """SQLAlchemy модель для хранения карточек /vacancies/{id}.
+
+    Позволяет после перезапуска не запрашивать заново свежие карточки у HH.
+    """
+
+    __tablename__ = "vacancy_detail_cache"
+
+    vacancy_id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=False,
+    )
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Сериализованная сущность VacancyDetail",
+    )
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
@@ -0,0 +1,69 @@
+"""Реализация репозитория персистентного кеша ответов LLM."""
+
+from __future__ import annotations
+
+from typing import Union
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql import func
+
+from domain.interfaces.llm_response_cache_repository_port import LlmResponseCacheRepositoryPort
+from infrastructure.database.models.llm_response_cache_model import LlmResponseCacheModel
+from infrastructure.database.repositories.base_repository import BaseRepository
+
+
+def _stale_before(max_age_seconds: float):
+    """Граница свежести по часам БД: ими же проставляется created_at."""
+    return func.now() - func.make_interval(0, 0, 0, 0, 0, 0, float(max_age_seconds))
+
+
+class LlmResponseCacheRepository(BaseRepository, LlmResponseCacheRepositoryPort):
+    """Реализация репозитория кеша ответов LLM для SQLAlchemy."""
+
+    def __init__(
+        self,
+        session_or_factory: Union[AsyncSession, async_sessionmaker[AsyncSession]]
+    ) -> None:
+        """Инициализация репозитория.
+
+        Args:
+            session_or_factory: Либо AsyncSession (для транзакционного режима),
+                               либо async_sessionmaker (для standalone режима).
+        """
+        super().__init__(session_or_factory)
+
+    async def get_fresh(self, cache_key: str, max_age_seconds: float) -> str | None:
+        """Получить ответ, если он сохранен не раньше чем max_age_seconds назад."""
+        async with self._get_session() as session:
+            stmt = select(LlmResponseCacheModel.content).where(
+                LlmResponseCacheModel.cache_key == cache_key,
+                LlmResponseCacheModel.created_at >= _stale_before(max_age_seconds),
+            )
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none()
+
+    async def upsert(self, cache_key: str, agent_name: str, model: str, content: str) -> None:
+        """Сохранить или обновить ответ LLM."""
+        async with self._get_session() as session:
+            stmt = insert(LlmResponseCacheModel).values(
+                cache_key=cache_key,
+                agent_name=agent_name,
+                model=model,
+                content=content,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[LlmResponseCacheModel.cache_key],
+                set_={"content": stmt.excluded.content, "created_at": func.now()},
+            )
+            await session.execute(stmt)
+
+    async def delete_expired(self, max_age_seconds: float) -> int:
+        """Удалить ответы старше max_age_seconds."""
+        async with self._get_session() as session:
+            stmt = delete(LlmResponseCacheModel).where(
+                LlmResponseCacheModel.created_at < _stale_before(max_age_seconds)
+            )
+            result = await session.execute(stmt)
+            return result.rowcount or 0
@@ -0,0 +1,112 @@
+"""Реализация репозитория аренды резюме процессами воркера автооткликов."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Iterable, List, Set, Union
+from uuid import UUID
+
+from sqlalchemy import literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql import func
+
+from domain.interfaces.resume_lease_repository_port import ResumeLeaseRepositoryPort
+from infrastructure.database.models.resume_model import ResumeModel
+from infrastructure.database.models.resume_processing_lease_model import (
+    ResumeProcessingLeaseModel,
+)
+from infrastructure.database.repositories.base_repository import BaseRepository
+
+
+class ResumeLeaseRepository(BaseRepository, ResumeLeaseRepositoryPort):
+    """Реализация репозитория аренды резюме для SQLAlchemy (PostgreSQL).
+
+    Все сроки считаются по часам БД (now()), поэтому расхождение часов
+    между машинами с воркерами не влияет на истечение аренды.
+    """
+
+    def __init__(
+        self,
+        session_or_factory: Union[AsyncSession, async_sessionmaker[AsyncSession]]
+    ) -> None:
+        """Инициализация репозитория.
+
+        Args:
+            session_or_factory: Либо AsyncSession (для транзакционного режима),
+                               либо async_sessionmaker (для standalone режима).
+        """
+        super().__init__(session_or_factory)
+
+    async def claim(self, owner: str, limit: int, lease_seconds: float) -> List[UUID]:
+        """Захватить свободные резюме с автооткликом.
+
+        Кандидаты блокируются FOR UPDATE SKIP LOCKED, поэтому параллельные
+        захваты из разных процессов не ждут друг друга и не пересекаются,
+        а условие ON CONFLICT перезаписывает только истекшую аренду.
+        """
+        if limit <= 0:
+            return []
+        lease = ResumeProcessingLeaseModel
+        leased_until = func.now() + timedelta(seconds=lease_seconds)
+        async with self._get_session() as session:
+            candidates = (
+                select(ResumeModel.id)
+                .outerjoin(lease, lease.resume_id == ResumeModel.id)
+                .where(
+                    ResumeModel.is_auto_reply == True,  # noqa: E712
+                    or_(lease.resume_id.is_(None), lease.leased_until < func.now()),
+                )
+                .order_by(lease.leased_until.asc().nulls_first())
+                .limit(limit)
+                .with_for_update(of=ResumeModel, skip_locked=True)
+                .cte("candidates")
+            )
+            stmt = insert(lease).from_select(
+                ["resume_id", "owner", "leased_until", "heartbeat_at"],
+                select(candidates.c.id, literal(owner), leased_until, func.now()),
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[lease.resume_id],
+                set_={
+                    "owner": stmt.excluded.owner,
+                    "leased_until": stmt.excluded.leased_until,
+                    "heartbeat_at": stmt.excluded.heartbeat_at,
+                },
+                where=lease.leased_until < func.now(),
+            ).returning(lease.resume_id)
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
+    async def renew(self, owner: str, resume_ids: Iterable[UUID], lease_seconds: float) -> Set[UUID]:
+        """Продлить аренду резюме, которые все еще принадлежат owner."""
+        ids = list(resume_ids)
+        if not ids:
+            return set()
+        lease = ResumeProcessingLeaseModel
+        async with self._get_session() as session:
+            stmt = (
+                update(lease)
+                .where(lease.owner == owner, lease.resume_id.in_(ids))
+                .values(
+                    leased_until=func.now() + timedelta(seconds=lease_seconds),
+                    heartbeat_at=func.now(),
+                )
+                .returning(lease.resume_id)
+            )
+            result = await session.execute(stmt)
+            return set(result.scalars().all())
+
+    async def release(self, owner: str, resume_ids: Iterable[UUID]) -> None:
+        """Освободить аренду: запись остается, но истекает сразу."""
+        ids = list(resume_ids)
+        if not ids:
+            return
+        lease = ResumeProcessingLeaseModel
+        async with self._get_session() as session:
+            stmt = (
+                update(lease)
+                .where(lease.owner == owner, lease.resume_id.in_(ids))
+                .values(leased_until=func.now())
+            )
+            await session.execute(stmt)
@@ -6,6 +6,7 @@ from typing import Dict, List, Union
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from domain.entities.resume_to_vacancy_match import ResumeToVacancyMatch
@@ -36,7 +37,7 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
     async def get_by_resume_and_vacancy_hash(
         self, resume_id: UUID, vacancy_hash: str
     ) -> ResumeToVacancyMatch | None:
-        """Получить мэтч по resume_id и vacancy_hash.
+        """Получить последний мэтч по resume_id и vacancy_hash.
 
         Args:
             resume_id: UUID резюме.
@@ -50,9 +51,11 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
                 select(ResumeToVacancyMatchModel)
                 .where(ResumeToVacancyMatchModel.resume_id == resume_id)
                 .where(ResumeToVacancyMatchModel.vacancy_hash == vacancy_hash)
+                .order_by(ResumeToVacancyMatchModel.created_at.desc())
+                .limit(1)
             )
             result = await session.execute(stmt)
-            model = result.scalar_one_or_none()
+            model = result.scalars().first()
 
             if model is None:
                 return None
@@ -69,7 +72,8 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
             vacancy_hashes: Список hash вакансий.
 
         Returns:
-            Словарь vacancy_hash -> ResumeToVacancyMatch для найденных мэтчей.
+            Словарь vacancy_hash -> ResumeToVacancyMatch для найденных мэтчей
+            (для каждой вакансии — последний посчитанный).
         """
         if not vacancy_hashes:
             return {}
@@ -79,6 +83,39 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
                 select(ResumeToVacancyMatchModel)
                 .where(ResumeToVacancyMatchModel.resume_id == resume_id)
                 .where(ResumeToVacancyMatchModel.vacancy_hash.in_(vacancy_hashes))
+                .distinct(ResumeToVacancyMatchModel.vacancy_hash)
+                .order_by(
+                    ResumeToVacancyMatchModel.vacancy_hash,
+                    ResumeToVacancyMatchModel.created_at.desc(),
+                )
+            )
+            result = await session.execute(stmt)
+            models = result.scalars().all()
+
+            return {
+                model.vacancy_hash: self._to_domain(model) for model in models
+            }
+
+    async def get_batch_by_context_and_vacancy_hashes(
+        self, context_hash: str, vacancy_hashes: List[str]
+    ) -> Dict[str, ResumeToVacancyMatch]:
+        """Батчевое получение мэтчей по hash контекста оценки и списку vacancy_hash.
+
+        Args:
+            context_hash: Hash контекста (см. calculate_match_context_hash).
+            vacancy_hashes: Список hash вакансий.
+
+        Returns:
+            Словарь vacancy_hash -> ResumeToVacancyMatch для найденных мэтчей.
+        """
+        if not vacancy_hashes:
+            return {}
+
+        async with self._get_session() as session:
+            stmt = (
+                select(ResumeToVacancyMatchModel)
+                .where(ResumeToVacancyMatchModel.context_hash == context_hash)
+                .where(ResumeToVacancyMatchModel.vacancy_hash.in_(vacancy_hashes))
             )
             result = await session.execute(stmt)
             models = result.scalars().all()
@@ -105,6 +142,7 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
                 vacancy_hash=match.vacancy_hash,
                 confidence=match.confidence,
                 reason=match.reason,
+                context_hash=match.context_hash,
             )
             session.add(model)
             await session.flush()
@@ -116,11 +154,13 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
     ) -> List[ResumeToVacancyMatch]:
         """Батчевое создание мэтчей.
 
+        Мэтчи с уже сохраненной парой (context_hash, vacancy_hash) пропускаются.
+
         Args:
             matches: Список доменных сущностей ResumeToVacancyMatch для создания.
 
         Returns:
-            Список созданных доменных сущностей ResumeToVacancyMatch.
+            Список переданных доменных сущностей ResumeToVacancyMatch.
         """
         if not matches:
             return []
@@ -128,21 +168,28 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
         async with self._get_session() as session:
             from uuid import uuid4
 
-            models = [
-                ResumeToVacancyMatchModel(
-                    id=uuid4(),
-                    resume_id=match.resume_id,
-                    vacancy_hash=match.vacancy_hash,
-                    confidence=match.confidence,
-                    reason=match.reason,
-                )
-                for match in matches
-            ]
-            session.add_all(models)
-            await session.flush()
-            for model in models:
-                await session.refresh(model)
-            return [self._to_domain(model) for model in models]
+            stmt = insert(ResumeToVacancyMatchModel).values(
+                [
+                    {
+                        "id": uuid4(),
+                        "resume_id": match.resume_id,
+                        "vacancy_hash": match.vacancy_hash,
+                        "confidence": match.confidence,
+                        "reason": match.reason,
+                        "context_hash": match.context_hash,
+                    }
+                    for match in matches
+                ]
+            )
+            # Резюме с тем же содержимым могли посчитать эти мэтчи параллельно
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=[
+                    ResumeToVacancyMatchModel.context_hash,
+                    ResumeToVacancyMatchModel.vacancy_hash,
+                ]
+            )
+            await session.execute(stmt)
+            return list(matches)
 
     def _to_domain(self, model: ResumeToVacancyMatchModel) -> ResumeToVacancyMatch:
         """Преобразовать SQLAlchemy модель в доменную сущность.
@@ -158,4 +205,5 @@ class ResumeToVacancyMatchRepository(BaseRepository, ResumeToVacancyMatchReposit
             vacancy_hash=model.vacancy_hash,
             confidence=model.confidence,
             reason=model.reason,
+            context_hash=model.context_hash,
         )
@@ -5,8 +5,9 @@ from __future__ import annotations
 from typing import Union
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql import func
 
 from domain.entities.user_subscription import UserSubscription
 from domain.interfaces.user_subscription_repository_port import (
@@ -107,6 +108,73 @@ class UserSubscriptionRepository(BaseRepository, UserSubscriptionRepositoryPort)
             await session.refresh(model)
             return self._to_domain(model)
 
+    async def reserve_responses(self, user_id: UUID, limit: int, count: int = 1) -> int:
+        """Атомарно зарезервировать до count откликов в пределах лимита.
+
+        Один UPDATE: строка блокируется подзапросом FOR UPDATE, поэтому
+        конкурентные резервирования выполняются по очереди и каждое видит
+        счетчик после предыдущего.
+
+        Args:
+            user_id: UUID пользователя.
+            limit: Лимит откликов плана.
+            count: Сколько откликов зарезервировать.
+
+        Returns:
+            Количество зарезервированных откликов.
+        """
+        if count <= 0:
+            return 0
+        async with self._get_session() as session:
+            locked = (
+                select(
+                    UserSubscriptionModel.user_id,
+                    UserSubscriptionModel.responses_count.label("current_count"),
+                )
+                .where(
+                    UserSubscriptionModel.user_id == user_id,
+                    UserSubscriptionModel.responses_count < limit,
+                )
+                .with_for_update()
+                .subquery("locked_subscription")
+            )
+            granted = func.least(count, limit - locked.c.current_count)
+            stmt = (
+                update(UserSubscriptionModel)
+                .where(UserSubscriptionModel.user_id == locked.c.user_id)
+                .values(
+                    responses_count=locked.c.current_count + granted,
+                    period_started_at=func.coalesce(
+                        UserSubscriptionModel.period_started_at, func.now()
+                    ),
+                )
+                .returning(granted)
+            )
+            result = await session.execute(stmt)
+            reserved = result.scalar_one_or_none()
+            return int(reserved or 0)
+
+    async def release_responses(self, user_id: UUID, count: int) -> None:
+        """Вернуть неиспользованные зарезервированные отклики.
+
+        Args:
+            user_id: UUID пользователя.
+            count: Сколько откликов вернуть.
+        """
+        if count <= 0:
+            return
+        async with self._get_session() as session:
+            stmt = (
+                update(UserSubscriptionModel)
+                .where(UserSubscriptionModel.user_id == user_id)
+                .values(
+                    responses_count=func.greatest(
+                        UserSubscriptionModel.responses_count - count, 0
+                    )
+                )
+            )
+            await session.execute(stmt)
+
     def _to_domain(self, model: UserSubscriptionModel) -> UserSubscription:
         """Преобразовать SQLAlchemy модель в доменную сущность.
 
@@ -0,0 +1,74 @@
+"""Реализация репозитория персистентного кеша карточек вакансий."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Union
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql import func
+
+from domain.entities.vacancy_detail import VacancyDetail
+from domain.interfaces.vacancy_detail_cache_repository_port import (
+    VacancyDetailCacheRepositoryPort,
+)
+from infrastructure.database.models.vacancy_detail_cache_model import VacancyDetailCacheModel
+from infrastructure.database.repositories.base_repository import BaseRepository
+
+
+def _stale_before(max_age_seconds: float):
+    """Граница свежести по часам БД: ими же проставляется fetched_at."""
+    return func.now() - func.make_interval(0, 0, 0, 0, 0, 0, float(max_age_seconds))
+
+
+class VacancyDetailCacheRepository(BaseRepository, VacancyDetailCacheRepositoryPort):
+    """Реализация репозитория кеша карточек вакансий для SQLAlchemy."""
+
+    def __init__(
+        self,
+        session_or_factory: Union[AsyncSession, async_sessionmaker[AsyncSession]]
+    ) -> None:
+        """Инициализация репозитория.
+
+        Args:
+            session_or_factory: Либо AsyncSession (для транзакционного режима),
+                               либо async_sessionmaker (для standalone режима).
+        """
+        super().__init__(session_or_factory)
+
+    async def get_fresh(self, vacancy_id: int, max_age_seconds: float) -> VacancyDetail | None:
+        """Получить карточку, если она сохранена не раньше чем max_age_seconds назад."""
+        async with self._get_session() as session:
+            stmt = select(VacancyDetailCacheModel.payload).where(
+                VacancyDetailCacheModel.vacancy_id == vacancy_id,
+                VacancyDetailCacheModel.fetched_at >= _stale_before(max_age_seconds),
+            )
+            result = await session.execute(stmt)
+            payload = result.scalar_one_or_none()
+            if payload is None:
+                return None
+            return VacancyDetail(**payload)
+
+    async def upsert(self, detail: VacancyDetail) -> None:
+        """Сохранить или обновить карточку вакансии."""
+        async with self._get_session() as session:
+            stmt = insert(VacancyDetailCacheModel).values(
+                vacancy_id=detail.vacancy_id,
+                payload=asdict(detail),
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[VacancyDetailCacheModel.vacancy_id],
+                set_={"payload": stmt.excluded.payload, "fetched_at": func.now()},
+            )
+            await session.execute(stmt)
+
+    async def delete_expired(self, max_age_seconds: float) -> int:
+        """Удалить карточки старше max_age_seconds."""
+        async with self._get_session() as session:
+            stmt = delete(VacancyDetailCacheModel).where(
+                VacancyDetailCacheModel.fetched_at < _stale_before(max_age_seconds)
+            )
+            result = await session.execute(stmt)
+            return result.rowcount or 0
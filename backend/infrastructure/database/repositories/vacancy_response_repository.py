@@ -17,6 +17,7 @@ from domain.interfaces.vacancy_response_repository_port import (
 from infrastructure.database.models.vacancy_response_model import VacancyResponseModel
 from infrastructure.database.models.user_subscription_model import UserSubscriptionModel
 from infrastructure.database.repositories.base_repository import BaseRepository
+from infrastructure.metrics.pipeline_metrics import observe_stage
 
 
 class VacancyResponseRepository(BaseRepository, VacancyResponseRepositoryPort):
@@ -34,6 +35,7 @@ class VacancyResponseRepository(BaseRepository, VacancyResponseRepositoryPort):
         """
         super().__init__(session_or_factory)
 
+    @observe_stage("db_persist")
     async def create(self, vacancy_response: VacancyResponse) -> VacancyResponse:
         """Создать отклик на вакансию.
 
@@ -378,6 +380,24 @@ class VacancyResponseRepository(BaseRepository, VacancyResponseRepositoryPort):
 
             return self._to_domain(model)
 
+    async def get_handled_vacancy_ids(self, resume_id: UUID) -> set[int]:
+        """Получить ID всех вакансий, на которые резюме уже откликалось (успешно или с ошибкой).
+
+        Запрос покрывается индексом (resume_id, vacancy_id, status).
+
+        Args:
+            resume_id: UUID резюме.
+
+        Returns:
+            Множество vacancy_id.
+        """
+        async with self._get_session() as session:
+            stmt = select(distinct(VacancyResponseModel.vacancy_id)).where(
+                VacancyResponseModel.resume_id == resume_id
+            )
+            result = await session.execute(stmt)
+            return set(result.scalars().all())
+
     def _to_domain(self, model: VacancyResponseModel) -> VacancyResponse:
         """Преобразовать SQLAlchemy модель в доменную сущность.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -11,7 +12,7 @@ from sqlalchemy.ext.asyncio import (
 from config import DatabaseConfig
 
 _SESSION_FACTORY_CACHE: dict[str, async_sessionmaker[AsyncSession]] = {}
-_ENGINE_CACHE: dict[str, object] = {}
+_ENGINE_CACHE: dict[str, AsyncEngine] = {}
 
 
 def create_session_factory(config: DatabaseConfig) -> async_sessionmaker[AsyncSession]:
@@ -45,3 +46,11 @@ def create_session_factory(config: DatabaseConfig) -> async_sessionmaker[AsyncSe
 
     return session_factory
 
+
+def get_engine(config: DatabaseConfig) -> AsyncEngine:
+    """Возвращает общий engine для конфига БД (создает его вместе с фабрикой сессий).
+
+    Нужен для наблюдения за пулом соединений (checkedout/size), например в симуляции.
+    """
+    create_session_factory(config)
+    return _ENGINE_CACHE[config.get_db_url()]
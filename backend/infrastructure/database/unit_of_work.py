@@ -37,6 +37,9 @@ from domain.interfaces.telegram_link_token_repository_port import (
 from domain.interfaces.llm_call_repository_port import (
     LlmCallRepositoryPort,
 )
+from domain.interfaces.llm_response_cache_repository_port import (
+    LlmResponseCacheRepositoryPort,
+)
 from domain.interfaces.user_automation_settings_repository_port import (
     UserAutomationSettingsRepositoryPort,
 )
@@ -75,6 +78,9 @@ from infrastructure.database.repositories.telegram_link_token_repository import
 from infrastructure.database.repositories.llm_call_repository import (
     LlmCallRepository,
 )
+from infrastructure.database.repositories.llm_response_cache_repository import (
+    LlmResponseCacheRepository,
+)
 from infrastructure.database.repositories.user_automation_settings_repository import (
     UserAutomationSettingsRepository,
 )
@@ -398,6 +404,13 @@ class UnitOfWork(UnitOfWorkPort):
             self._standalone_repositories["llm_call"] = LlmCallRepository(self._session_factory)
         return self._standalone_repositories["llm_call"]
 
+    @property
+    def standalone_llm_response_cache_repository(self) -> LlmResponseCacheRepositoryPort:
+        """Получить standalone репозиторий персистентного кеша ответов LLM."""
+        if "llm_response_cache" not in self._standalone_repositories:
+            self._standalone_repositories["llm_response_cache"] = LlmResponseCacheRepository(self._session_factory)
+        return self._standalone_repositories["llm_response_cache"]
+
     @property
     def standalone_user_automation_settings_repository(self) -> UserAutomationSettingsRepositoryPort:
         """Получить standalone репозиторий настроек автоматизации пользователя."""
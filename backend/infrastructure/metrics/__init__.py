@@ -0,0 +1 @@
+"""Метрики процесса (реестр и экспорт в формате Prometheus)."""
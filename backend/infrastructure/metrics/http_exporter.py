@@ -0,0 +1,48 @@
+"""Минимальный HTTP сервер /metrics на отдельном внутреннем порту.
+
+Используется и API, и отдельными процессами воркеров: метрики не публикуются
+на порту API, доступ к ним ограничивается сетью (порт не пробрасывается наружу).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from loguru import logger
+
+from infrastructure.metrics.registry import CONTENT_TYPE, get_metrics_registry
+
+_READ_TIMEOUT_SECONDS = 5.0
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_SECONDS)
+        # Заголовки запроса не нужны, но их надо дочитать до пустой строки
+        while True:
+            line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_SECONDS)
+            if line in (b"\r\n", b"\n", b""):
+                break
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?", 1)[0] == "/metrics":
+            status, content_type = "200 OK", CONTENT_TYPE
+            body = get_metrics_registry().render().encode()
+        else:
+            status, content_type, body = "404 Not Found", "text/plain", b"not found\n"
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(host: str, port: int) -> asyncio.AbstractServer:
+    """Запустить сервер метрик процесса на host:port (GET /metrics)."""
+    server = await asyncio.start_server(_handle, host, port)
+    logger.info(f"Метрики процесса доступны на http://{host}:{port}/metrics")
+    return server
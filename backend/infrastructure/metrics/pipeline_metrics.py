@@ -0,0 +1,86 @@
+"""Метрики конвейеров автооткликов и анализа чатов.
+
+Этапы (метка stage гистограммы autooffer_stage_duration_seconds):
+hh_search_page, llm_filter_batch, llm_cover_letter, hh_test_fetch, test_parse,
+llm_test_answers, hh_respond, db_persist, а для чатов — hh_chat_list,
+hh_chat_detail, hh_chat_send, llm_chat_messages.
+
+Метрики autooffer_llm_* описывают очередь планировщика LLM по моделям и классам
+приоритета (interactive, chat, background).
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+from infrastructure.metrics.registry import get_metrics_registry
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+STAGE_DURATION = get_metrics_registry().histogram(
+    "autooffer_stage_duration_seconds",
+    "Длительность этапа конвейера (включая ошибки)",
+    ("stage",),
+)
+HH_LIMITER_WAIT = get_metrics_registry().histogram(
+    "autooffer_hh_limiter_wait_seconds",
+    "Ожидание токена rate-лимитера HH перед запросом",
+    ("scope",),
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
+)
+ACTIVE_RESUME_TASKS = get_metrics_registry().gauge(
+    "autooffer_active_resume_tasks",
+    "Резюме, которые сейчас обрабатывает воркер автооткликов",
+)
+REPLY_QUEUE_JOBS = get_metrics_registry().gauge(
+    "autooffer_reply_queue_jobs",
+    "Задания общей очереди отправки откликов по состоянию",
+    ("state",),
+)
+
+LLM_QUEUE_WAIT = get_metrics_registry().histogram(
+    "autooffer_llm_queue_wait_seconds",
+    "Ожидание слота планировщика LLM перед вызовом модели",
+    ("model", "priority"),
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+LLM_QUEUE_WAITING = get_metrics_registry().gauge(
+    "autooffer_llm_queue_waiting",
+    "Вызовы LLM, ожидающие слота планировщика",
+    ("model", "priority"),
+)
+LLM_IN_FLIGHT = get_metrics_registry().gauge(
+    "autooffer_llm_in_flight",
+    "Выполняющиеся вызовы LLM по модели",
+    ("model",),
+)
+LLM_TOKENS = get_metrics_registry().counter(
+    "autooffer_llm_tokens_total",
+    "Токены LLM по usage ответов",
+    ("model", "priority"),
+)
+LLM_RESPONSE_CACHE = get_metrics_registry().counter(
+    "autooffer_llm_response_cache_total",
+    "Обращения к кешу ответов LLM (memory_hit, store_hit, miss)",
+    ("agent", "result"),
+)
+LLM_BATCH_SPLITS = get_metrics_registry().counter(
+    "autooffer_llm_batch_splits_total",
+    "Деления батча LLM пополам после неразобранного ответа модели",
+    ("agent",),
+)
+
+
+def observe_stage(stage: str) -> Callable[[F], F]:
+    """Декоратор async функции: длительность вызова пишется в этап stage."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with STAGE_DURATION.time(stage=stage):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
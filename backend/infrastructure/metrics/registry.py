@@ -0,0 +1,232 @@
+"""Реестр метрик процесса с выводом в текстовом формате Prometheus.
+
+Метрики хранятся в памяти процесса; внешних зависимостей нет. Каждая метрика
+автоматически получает метку worker — имя воркера из контекста (contextvar),
+в котором она записана: задачи asyncio наследуют контекст, поэтому все вызовы
+внутри воркера автооткликов помечаются worker="auto_reply" без передачи метки
+по цепочке вызовов. Вне воркеров используется worker="api".
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+_WORKER: ContextVar[str] = ContextVar("metrics_worker", default="api")
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def set_metrics_worker(name: str) -> Token:
+    """Пометить текущий контекст (и создаваемые из него задачи) именем воркера."""
+    return _WORKER.set(name)
+
+
+def current_metrics_worker() -> str:
+    return _WORKER.get()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        # Метка worker всегда первая
+        self.labelnames: Tuple[str, ...] = ("worker", *labelnames)
+
+    def _key(self, labels: Mapping[str, str]) -> LabelValues:
+        worker = labels.get("worker") or _WORKER.get()
+        return (worker, *(str(labels[name]) for name in self.labelnames[1:]))
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Строки метрики в текстовом формате Prometheus."""
+
+
+class Counter(_Metric):
+    """Монотонно растущий счетчик."""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Текущее значение; для значений, которые проще прочитать при выгрузке, — callback."""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callbacks: List[Tuple[str, Callable[[], Mapping[LabelValues, float]]]] = []
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, func: Callable[[], Mapping[LabelValues, float]]) -> None:
+        """Значения вычисляются func при выгрузке: {значения меток без worker: значение}.
+
+        Метка worker берется из контекста, в котором зарегистрирован callback.
+        """
+        self._callbacks.append((_WORKER.get(), func))
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        values = dict(self._values)
+        for worker, func in self._callbacks:
+            for key, value in func().items():
+                values[(worker, *key)] = float(value)
+        for key, value in values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Гистограмма с кумулятивными бакетами (как prometheus_client)."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._buckets: Tuple[float, ...] = tuple(sorted(buckets)) + (math.inf,)
+        # Для каждой комбинации меток: счетчики по бакетам (не кумулятивные), сумма
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = ([0] * len(self._buckets), [0.0])
+            self._series[key] = series
+        counts, total = series
+        for index, bound in enumerate(self._buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        total[0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Замерить длительность блока (записывается и при исключении)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        bucket_labelnames = (*self.labelnames, "le")
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self._buckets, counts):
+                cumulative += count
+                labels = _format_labels(bucket_labelnames, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Набор метрик процесса; повторная регистрация имени возвращает ту же метрику."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = cls(name, *args, **kwargs)
+            self._metrics[name] = metric
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Метрика {name} уже зарегистрирована как {metric.TYPE}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """Все метрики в текстовом формате Prometheus (exposition format 0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_REGISTRY = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Реестр метрик уровня процесса."""
+    return _REGISTRY
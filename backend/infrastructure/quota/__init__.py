@@ -0,0 +1 @@
+"""Квоты откликов по подпискам пользователей."""
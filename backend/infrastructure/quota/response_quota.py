@@ -0,0 +1,143 @@
+"""Квота откликов с атомарным резервированием и локальной арендой токенов."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from loguru import logger
+
+from config import HHConfig
+from domain.exceptions.subscription_limit_exceeded import SubscriptionLimitExceededError
+from domain.interfaces.response_quota_port import ResponseQuotaPort
+from domain.interfaces.unit_of_work_port import UnitOfWorkPort
+from domain.use_cases.check_and_update_subscription import CheckAndUpdateSubscriptionUseCase
+
+
+@dataclass(slots=True)
+class _UserLease:
+    tokens: int = 0
+    reserved_at: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class LeasedResponseQuota(ResponseQuotaPort):
+    """Квота откликов, резервируемая в БД пачками по lease_size.
+
+    Резервирование — один UPDATE с условием на лимит (см.
+    UserSubscriptionRepositoryPort.reserve_responses), поэтому отправки
+    из разных процессов не превышают лимит. Зарезервированные токены
+    расходуются локально без обращений к БД; при lease_size=1 каждый отклик
+    резервируется отдельно. Неиспользованные токены возвращаются в БД через
+    lease_ttl_seconds (чтобы не занимать лимит после сброса периода) и в close().
+    """
+
+    def __init__(
+        self,
+        create_unit_of_work_factory: Callable[[], UnitOfWorkPort],
+        lease_size: int = 1,
+        lease_ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._create_unit_of_work_factory = create_unit_of_work_factory
+        self._lease_size = max(1, lease_size)
+        self._lease_ttl_seconds = lease_ttl_seconds
+        self._clock = clock
+        self._leases: Dict[UUID, _UserLease] = {}
+
+    async def acquire(self, user_id: UUID) -> bool:
+        lease = self._leases.setdefault(user_id, _UserLease())
+        async with lease.lock:
+            if lease.tokens > 0 and self._clock() - lease.reserved_at >= self._lease_ttl_seconds:
+                await self._release(user_id, lease)
+            if lease.tokens == 0 and not await self._reserve(user_id, lease):
+                return False
+            lease.tokens -= 1
+            return True
+
+    async def refund(self, user_id: UUID) -> None:
+        lease = self._leases.setdefault(user_id, _UserLease())
+        async with lease.lock:
+            lease.tokens += 1
+            if self._lease_size == 1:
+                await self._release(user_id, lease)
+
+    async def close(self) -> None:
+        for user_id, lease in list(self._leases.items()):
+            async with lease.lock:
+                if lease.tokens > 0:
+                    await self._release(user_id, lease)
+
+    async def _reserve(self, user_id: UUID, lease: _UserLease) -> bool:
+        """Зарезервировать пачку токенов. False — лимит не проверяется (нет подписки/плана)."""
+        exhausted: Optional[SubscriptionLimitExceededError] = None
+        unit_of_work = self._create_unit_of_work_factory()
+        async with unit_of_work:
+            # Срок подписки и сброс периода проверяются перед резервированием
+            check_subscription_uc = CheckAndUpdateSubscriptionUseCase(
+                user_subscription_repository=unit_of_work.user_subscription_repository,
+                subscription_plan_repository=unit_of_work.subscription_plan_repository,
+            )
+            try:
+                user_subscription, plan = await check_subscription_uc.execute(user_id)
+            except ValueError as exc:
+                logger.warning(
+                    f"Не удалось проверить лимит подписки для user_id={user_id}: {exc}. "
+                    "Продолжаем без проверки лимита."
+                )
+                return False
+            reserved = await unit_of_work.user_subscription_repository.reserve_responses(
+                user_id, plan.response_limit, self._lease_size
+            )
+            if reserved == 0:
+                seconds_until_reset = None
+                if user_subscription.period_started_at is not None:
+                    elapsed = (datetime.now(timezone.utc) - user_subscription.period_started_at).total_seconds()
+                    seconds_until_reset = max(0, int(plan.reset_period_seconds - elapsed))
+                exhausted = SubscriptionLimitExceededError(
+                    count=max(user_subscription.responses_count, plan.response_limit),
+                    limit=plan.response_limit,
+                    seconds_until_reset=seconds_until_reset,
+                )
+        # Исключение бросается после коммита, чтобы не откатить сброс периода
+        if exhausted is not None:
+            raise exhausted
+        lease.tokens += reserved
+        lease.reserved_at = self._clock()
+        return True
+
+    async def _release(self, user_id: UUID, lease: _UserLease) -> None:
+        tokens, lease.tokens = lease.tokens, 0
+        try:
+            unit_of_work = self._create_unit_of_work_factory()
+            async with unit_of_work:
+                await unit_of_work.user_subscription_repository.release_responses(user_id, tokens)
+        except Exception as exc:
+            logger.warning(f"Не удалось вернуть {tokens} откликов квоты user_id={user_id}: {exc}")
+
+
+_QUOTA: LeasedResponseQuota | None = None
+
+
+def configure_response_quota(
+    config: HHConfig,
+    create_unit_of_work_factory: Callable[[], UnitOfWorkPort],
+) -> LeasedResponseQuota:
+    """Создает (или возвращает уже созданную) квоту откликов процесса."""
+    global _QUOTA
+    if _QUOTA is None:
+        _QUOTA = LeasedResponseQuota(
+            create_unit_of_work_factory,
+            lease_size=config.response_quota_lease_size,
+            lease_ttl_seconds=config.response_quota_lease_ttl_seconds,
+        )
+    return _QUOTA
+
+
+def get_response_quota() -> Optional[LeasedResponseQuota]:
+    """Возвращает квоту откликов процесса, если она сконфигурирована."""
+    return _QUOTA
@@ -0,0 +1 @@
+"""Планировщики фоновых заданий процесса."""
@@ -0,0 +1,299 @@
+"""Планировщик вызовов LLM: лимиты на модель и классы приоритета.
+
+Для каждой модели действуют лимит одновременных запросов и бюджет токенов
+в минуту (token bucket). Запросы, которые не могут стартовать сразу, ждут в
+очереди модели в порядке приоритета: интерактивные (API, WebSocket) > ответы
+в чатах > фоновые автоотклики. Часть слотов модели зарезервирована под
+интерактивные запросы, поэтому фоновая нагрузка не занимает их целиком.
+
+Приоритет берется из контекста (contextvar), как и метка worker у метрик:
+воркер один раз вызывает set_llm_priority, и все его вызовы LLM получают
+этот класс. Вне воркеров (запросы API) приоритет интерактивный.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import AsyncIterator, Callable, Dict, List, Mapping, Optional
+
+from loguru import logger
+
+from config import OpenAIConfig
+from infrastructure.metrics.pipeline_metrics import (
+    LLM_IN_FLIGHT,
+    LLM_QUEUE_WAIT,
+    LLM_QUEUE_WAITING,
+    LLM_TOKENS,
+)
+
+
+class LlmPriority(IntEnum):
+    """Класс приоритета вызова LLM (меньше — важнее)."""
+
+    INTERACTIVE = 0
+    CHAT = 1
+    BACKGROUND = 2
+
+
+_PRIORITY: ContextVar[LlmPriority] = ContextVar("llm_priority", default=LlmPriority.INTERACTIVE)
+
+
+def set_llm_priority(priority: LlmPriority) -> Token:
+    """Задать класс приоритета LLM для текущего контекста и создаваемых из него задач."""
+    return _PRIORITY.set(priority)
+
+
+def current_llm_priority() -> LlmPriority:
+    return _PRIORITY.get()
+
+
+@dataclass(order=True, slots=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+@dataclass(slots=True)
+class LlmLease:
+    """Выданный слот модели.
+
+    used_tokens заполняет вызывающий по usage ответа: разница с оценкой
+    возвращается в бюджет (или списывается) при освобождении слота.
+    """
+
+    model: str
+    priority: LlmPriority
+    estimated_tokens: int
+    used_tokens: Optional[int] = None
+
+
+class _ModelLane:
+    """Состояние одной модели: занятые слоты, бюджет токенов и очередь ожидания."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        tokens_per_minute: int,
+        interactive_reserved_slots: int,
+        clock: Callable[[], float],
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.background_limit = max(1, self.max_concurrency - max(0, interactive_reserved_slots))
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.tokens = float(self.tokens_per_minute)
+        self.updated_at = clock()
+        self.in_flight = 0
+        self.waiting: List[_Waiter] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self._clock = clock
+
+    def limit_for(self, priority: int) -> int:
+        return self.max_concurrency if priority == LlmPriority.INTERACTIVE else self.background_limit
+
+    def cost(self, tokens: int) -> float:
+        # Запрос больше минутного бюджета пропускается при полном бюджете
+        return float(min(tokens, self.tokens_per_minute))
+
+    def _refill(self) -> None:
+        now = self._clock()
+        rate = self.tokens_per_minute / 60.0
+        self.tokens = min(float(self.tokens_per_minute), self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+
+    def token_wait(self, tokens: int) -> float:
+        """Сколько секунд ждать, пока в бюджете наберется tokens (0 — можно сейчас)."""
+        if not self.tokens_per_minute:
+            return 0.0
+        self._refill()
+        missing = self.cost(tokens) - self.tokens
+        return missing / (self.tokens_per_minute / 60.0) if missing > 0 else 0.0
+
+    def take(self, tokens: int) -> None:
+        if self.tokens_per_minute:
+            self._refill()
+            self.tokens -= self.cost(tokens)
+
+    def adjust(self, estimated_tokens: int, used_tokens: int) -> None:
+        if self.tokens_per_minute:
+            self._refill()
+            self.tokens = min(
+                float(self.tokens_per_minute),
+                self.tokens - (used_tokens - self.cost(estimated_tokens)),
+            )
+
+    def waiting_count(self, priority: LlmPriority) -> int:
+        return sum(
+            1 for waiter in self.waiting if waiter.priority == priority and not waiter.future.done()
+        )
+
+
+class LlmScheduler:
+    """Очереди вызовов LLM по моделям с лимитами конкурентности и токенов в минуту.
+
+    Очередь модели строгая по приоритету: пока лучший ожидающий запрос не может
+    стартовать (нет слота или бюджета), менее важные его не обгоняют. Неинтерактивным
+    запросам доступны не все слоты: interactive_reserved_slots остаются свободными
+    для запросов пользователя.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 16,
+        tokens_per_minute: int = 0,
+        interactive_reserved_slots: int = 2,
+        model_concurrency: Mapping[str, int] | None = None,
+        model_tokens_per_minute: Mapping[str, int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._tokens_per_minute = tokens_per_minute
+        self._interactive_reserved_slots = interactive_reserved_slots
+        self._model_concurrency = dict(model_concurrency or {})
+        self._model_tokens_per_minute = dict(model_tokens_per_minute or {})
+        self._clock = clock
+        self._lanes: Dict[str, _ModelLane] = {}
+        self._seq = itertools.count()
+
+    def _lane(self, model: str) -> _ModelLane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            lane = _ModelLane(
+                max_concurrency=self._model_concurrency.get(model, self._max_concurrency),
+                tokens_per_minute=self._model_tokens_per_minute.get(model, self._tokens_per_minute),
+                interactive_reserved_slots=self._interactive_reserved_slots,
+                clock=self._clock,
+            )
+            self._lanes[model] = lane
+        return lane
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        model: str,
+        estimated_tokens: int,
+        priority: LlmPriority | None = None,
+    ) -> AsyncIterator[LlmLease]:
+        """Дождаться слота модели на время вызова LLM.
+
+        Args:
+            model: Модель, к которой идет запрос.
+            estimated_tokens: Оценка токенов запроса (промпт и ответ).
+            priority: Класс приоритета; по умолчанию — из контекста.
+        """
+        if priority is None:
+            priority = current_llm_priority()
+        lease = LlmLease(model=model, priority=priority, estimated_tokens=estimated_tokens)
+        lane = self._lane(model)
+        started = self._clock()
+        await self._acquire(lane, lease)
+        LLM_QUEUE_WAIT.observe(self._clock() - started, model=model, priority=priority.name.lower())
+        try:
+            yield lease
+        finally:
+            lane.in_flight -= 1
+            if lease.used_tokens is not None:
+                lane.adjust(estimated_tokens, lease.used_tokens)
+                LLM_TOKENS.inc(lease.used_tokens, model=model, priority=priority.name.lower())
+            self._dispatch(lane)
+
+    async def _acquire(self, lane: _ModelLane, lease: LlmLease) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            lane.waiting,
+            _Waiter(
+                priority=int(lease.priority),
+                seq=next(self._seq),
+                tokens=lease.estimated_tokens,
+                future=future,
+            ),
+        )
+        self._dispatch(lane)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Слот уже выдан, но вызывающий отменен: возвращаем его
+                lane.in_flight -= 1
+                self._dispatch(lane)
+            else:
+                future.cancel()
+            raise
+
+    def _dispatch(self, lane: _ModelLane) -> None:
+        if lane.timer is not None:
+            lane.timer.cancel()
+            lane.timer = None
+        while lane.waiting:
+            waiter = lane.waiting[0]
+            if waiter.future.done():
+                heapq.heappop(lane.waiting)
+                continue
+            if lane.in_flight >= lane.limit_for(waiter.priority):
+                return
+            wait_for = lane.token_wait(waiter.tokens)
+            if wait_for > 0:
+                lane.timer = asyncio.get_running_loop().call_later(wait_for, self._dispatch, lane)
+                return
+            heapq.heappop(lane.waiting)
+            lane.take(waiter.tokens)
+            lane.in_flight += 1
+            waiter.future.set_result(None)
+
+    def waiting_by_model(self) -> Dict[tuple, int]:
+        """Ожидающие запросы: {(model, priority): количество}."""
+        return {
+            (model, priority.name.lower()): lane.waiting_count(priority)
+            for model, lane in self._lanes.items()
+            for priority in LlmPriority
+        }
+
+    def in_flight_by_model(self) -> Dict[tuple, int]:
+        """Выполняющиеся запросы: {(model,): количество}."""
+        return {(model,): lane.in_flight for model, lane in self._lanes.items()}
+
+
+_SCHEDULER: LlmScheduler | None = None
+
+
+def configure_llm_scheduler(config: OpenAIConfig) -> LlmScheduler:
+    """Создает (или возвращает уже созданный) планировщик LLM по конфигу OpenAI."""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = LlmScheduler(
+            max_concurrency=config.scheduler_max_concurrency,
+            tokens_per_minute=config.scheduler_tokens_per_minute,
+            interactive_reserved_slots=config.scheduler_interactive_reserved_slots,
+            model_concurrency=config.model_concurrency,
+            model_tokens_per_minute=config.model_tokens_per_minute,
+        )
+        LLM_QUEUE_WAITING.set_function(_waiting_by_model)
+        LLM_IN_FLIGHT.set_function(_in_flight_by_model)
+        logger.info(
+            f"[llm_scheduler] Лимиты LLM: concurrency={config.scheduler_max_concurrency}, "
+            f"tpm={config.scheduler_tokens_per_minute or 'без лимита'}, "
+            f"reserved={config.scheduler_interactive_reserved_slots}"
+        )
+    return _SCHEDULER
+
+
+def _waiting_by_model() -> dict:
+    return _SCHEDULER.waiting_by_model() if _SCHEDULER is not None else {}
+
+
+def _in_flight_by_model() -> dict:
+    return _SCHEDULER.in_flight_by_model() if _SCHEDULER is not None else {}
+
+
+def get_llm_scheduler(config: OpenAIConfig) -> LlmScheduler:
+    """Планировщик LLM процесса (создается по конфигу при первом обращении)."""
+    return configure_llm_scheduler(config)
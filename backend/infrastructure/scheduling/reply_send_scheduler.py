@@ -0,0 +1,234 @@
+"""Общая очередь отправки автооткликов с приоритетами и темпом по пользователям."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+from loguru import logger
+
+from config import HHConfig
+from domain.interfaces.reply_send_scheduler_port import ReplySendSchedulerPort
+from infrastructure.metrics.pipeline_metrics import REPLY_QUEUE_JOBS
+
+
+@dataclass(order=True, slots=True)
+class _ReplyJob:
+    priority: float
+    seq: int
+    user_id: UUID = field(compare=False)
+    resume_id: UUID = field(compare=False)
+    vacancy_id: int = field(compare=False)
+    run: Callable[[], Awaitable[None]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+@dataclass(slots=True)
+class ReplySchedulerStats:
+    """Снимок состояния очереди отправки откликов."""
+
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+
+
+class ReplySendScheduler(ReplySendSchedulerPort):
+    """Приоритетная очередь откликов всех резюме процесса.
+
+    Задания берутся в порядке убывания confidence (при равенстве — в порядке
+    постановки). Одновременно выполняется не более max_concurrency заданий,
+    у одного пользователя — не более одного, а следующее начинается не раньше
+    чем через user_interval_seconds после начала предыдущего.
+
+    Задания пользователя, который сейчас занят или ждет паузу, откладываются
+    в его собственную кучу; когда пауза истекает, лучшее из них возвращается
+    в общую очередь. Отдельного цикла нет: выбор следующих заданий происходит
+    при постановке, завершении задания и окончании паузы.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        user_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_concurrency = max(1, max_concurrency)
+        self._user_interval_seconds = max(0.0, user_interval_seconds)
+        self._clock = clock
+        self._queue: List[_ReplyJob] = []
+        self._deferred: Dict[UUID, List[_ReplyJob]] = {}
+        self._busy_users: Set[UUID] = set()
+        self._next_start: Dict[UUID, float] = {}
+        self._release_handles: Dict[UUID, asyncio.TimerHandle] = {}
+        self._running: Set[asyncio.Task] = set()
+        self._seq = itertools.count()
+        self._stats = ReplySchedulerStats()
+
+    def submit(
+        self,
+        *,
+        user_id: UUID,
+        resume_id: UUID,
+        vacancy_id: int,
+        confidence: float,
+        run: Callable[[], Awaitable[None]],
+    ) -> asyncio.Future[None]:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(self._on_future_done)
+        job = _ReplyJob(
+            priority=-(confidence or 0.0),
+            seq=next(self._seq),
+            user_id=user_id,
+            resume_id=resume_id,
+            vacancy_id=vacancy_id,
+            run=run,
+            future=future,
+        )
+        if self._is_ready(user_id):
+            heapq.heappush(self._queue, job)
+        else:
+            heapq.heappush(self._deferred.setdefault(user_id, []), job)
+        self._dispatch()
+        return future
+
+    def cancel_resume(self, resume_id: UUID) -> int:
+        cancelled = 0
+        for job in itertools.chain(self._queue, *self._deferred.values()):
+            if job.resume_id == resume_id and job.future.cancel():
+                cancelled += 1
+        if cancelled:
+            self._queue = [job for job in self._queue if not job.future.done()]
+            heapq.heapify(self._queue)
+            for user_id, jobs in list(self._deferred.items()):
+                pending = [job for job in jobs if not job.future.done()]
+                if pending:
+                    heapq.heapify(pending)
+                    self._deferred[user_id] = pending
+                else:
+                    del self._deferred[user_id]
+            logger.info(f"[reply_scheduler] Снято {cancelled} заданий резюме {resume_id}")
+        return cancelled
+
+    def stats(self) -> ReplySchedulerStats:
+        queued = sum(
+            1
+            for job in itertools.chain(self._queue, *self._deferred.values())
+            if not job.future.done()
+        )
+        return ReplySchedulerStats(
+            queued=queued,
+            running=len(self._running),
+            completed=self._stats.completed,
+            failed=self._stats.failed,
+            cancelled=self._stats.cancelled,
+        )
+
+    def _is_ready(self, user_id: UUID) -> bool:
+        return user_id not in self._busy_users and self._next_start.get(user_id, 0.0) <= self._clock()
+
+    def _on_future_done(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self._stats.cancelled += 1
+
+    def _dispatch(self) -> None:
+        while self._queue and len(self._running) < self._max_concurrency:
+            job = heapq.heappop(self._queue)
+            if job.future.done():
+                continue
+            if not self._is_ready(job.user_id):
+                heapq.heappush(self._deferred.setdefault(job.user_id, []), job)
+                continue
+            self._start(job)
+
+    def _start(self, job: _ReplyJob) -> None:
+        self._busy_users.add(job.user_id)
+        self._next_start[job.user_id] = self._clock() + self._user_interval_seconds
+        task = asyncio.get_running_loop().create_task(self._run_job(job))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        # Отмена future вызывающим прерывает и уже начатую отправку
+        job.future.add_done_callback(lambda f: task.cancel() if f.cancelled() else None)
+
+    async def _run_job(self, job: _ReplyJob) -> None:
+        try:
+            await job.run()
+        except asyncio.CancelledError:
+            job.future.cancel()
+            raise
+        except Exception as exc:
+            self._stats.failed += 1
+            if not job.future.done():
+                job.future.set_exception(exc)
+        else:
+            self._stats.completed += 1
+            if not job.future.done():
+                job.future.set_result(None)
+        finally:
+            # done-колбэк задачи сработает позже, а слот нужен следующему заданию сейчас
+            self._running.discard(asyncio.current_task())
+            self._busy_users.discard(job.user_id)
+            self._schedule_release(job.user_id)
+            self._dispatch()
+
+    def _schedule_release(self, user_id: UUID) -> None:
+        delay = self._next_start.get(user_id, 0.0) - self._clock()
+        if delay <= 0:
+            self._release(user_id)
+            return
+        if user_id not in self._release_handles:
+            self._release_handles[user_id] = asyncio.get_running_loop().call_later(
+                delay, self._release, user_id
+            )
+
+    def _release(self, user_id: UUID) -> None:
+        """Пауза пользователя истекла: возвращает его лучшее задание в общую очередь."""
+        self._release_handles.pop(user_id, None)
+        if user_id in self._busy_users:
+            # Освободится по завершении текущего задания
+            return
+        if self._next_start.get(user_id, 0.0) > self._clock():
+            # Таймер цикла может сработать чуть раньше срока
+            self._schedule_release(user_id)
+            return
+        self._next_start.pop(user_id, None)
+        deferred = self._deferred.get(user_id)
+        while deferred:
+            job = heapq.heappop(deferred)
+            if not job.future.done():
+                heapq.heappush(self._queue, job)
+                break
+        if not deferred:
+            self._deferred.pop(user_id, None)
+        self._dispatch()
+
+
+_SCHEDULER: ReplySendScheduler | None = None
+
+
+def configure_reply_send_scheduler(config: HHConfig) -> ReplySendScheduler:
+    """Создает (или возвращает уже созданную) общую очередь откликов по конфигу HH."""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = ReplySendScheduler(
+            max_concurrency=config.reply_send_concurrency,
+            user_interval_seconds=config.reply_user_interval_seconds,
+        )
+        REPLY_QUEUE_JOBS.set_function(_queue_jobs_by_state)
+    return _SCHEDULER
+
+
+def _queue_jobs_by_state() -> dict:
+    stats = _SCHEDULER.stats() if _SCHEDULER is not None else ReplySchedulerStats()
+    return {("queued",): stats.queued, ("running",): stats.running}
+
+
+def get_reply_send_scheduler() -> Optional[ReplySendScheduler]:
+    """Возвращает общую очередь откликов, если она сконфигурирована."""
+    return _SCHEDULER
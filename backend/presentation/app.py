@@ -12,6 +12,17 @@ from fastapi.security import HTTPBearer
 from config import load_config
 from infrastructure.auth.fastapi_users_setup import auth_backend, fastapi_users
 from infrastructure.auth.schemas import UserCreate, UserRead, UserUpdate
+from infrastructure.clients.hh_connection_pool import (
+    close_hh_connection_pool,
+    configure_hh_connection_pool,
+)
+from infrastructure.clients.hh_front_version import get_hh_front_build_version_refresher
+from infrastructure.clients.hh_rate_limiter import configure_hh_rate_limiter
+from infrastructure.clients.openai_client_registry import (
+    close_openai_client_registry,
+    configure_openai_client_registry,
+)
+from infrastructure.metrics.http_exporter import start_metrics_server
 from presentation.routers.dictionaries_router import router as dictionaries_router
 from presentation.routers.hh_auth_router import router as hh_auth_router
 from presentation.routers.resumes_router import router as resumes_router
@@ -33,26 +44,56 @@ async def lifespan(app: FastAPI):
     # Startup: запускаем воркеры
     logger.info("Запуск воркеров в lifecycle FastAPI...")
     config = load_config()
+    # Общие пул соединений и rate-лимитер HH для API и воркеров
+    configure_hh_connection_pool(config.hh)
+    configure_hh_rate_limiter(config.hh)
+    # Общие клиенты LLM для агентов API и воркеров
+    configure_openai_client_registry(config.openai)
+    # Метрики не публикуются в API: отдельный внутренний порт
+    metrics_server = None
+    if config.worker.api_metrics_port > 0:
+        try:
+            metrics_server = await start_metrics_server(
+                config.worker.metrics_host, config.worker.api_metrics_port
+            )
+        except OSError as exc:
+            logger.warning(f"Сервер метрик не запущен: {exc}")
     
     # Создаем события для управления остановкой воркеров
     chat_analysis_shutdown = asyncio.Event()
     auto_reply_shutdown = asyncio.Event()
     telegram_bot_shutdown = asyncio.Event()
+    front_version_shutdown = asyncio.Event()
     
-    worker_shutdown_events = [chat_analysis_shutdown, auto_reply_shutdown, telegram_bot_shutdown]
+    worker_shutdown_events = [
+        chat_analysis_shutdown,
+        auto_reply_shutdown,
+        telegram_bot_shutdown,
+        front_version_shutdown,
+    ]
+    
+    # Фоновое обновление x-static-version, чтобы построение заголовков не делало I/O
+    front_version_task = asyncio.create_task(
+        get_hh_front_build_version_refresher().run(front_version_shutdown)
+    )
     
     # Запускаем воркеры как фоновые задачи
     chat_analysis_task = asyncio.create_task(
         run_chat_analysis_worker(config, chat_analysis_shutdown)
     )
-    auto_reply_task = asyncio.create_task(
-        run_auto_reply_worker(config, auto_reply_shutdown)
-    ) 
     telegram_bot_task = asyncio.create_task(
         run_telegram_bot_worker(config, telegram_bot_shutdown)
     )
     
-    worker_tasks = [chat_analysis_task, auto_reply_task, telegram_bot_task]
+    worker_tasks = [chat_analysis_task, telegram_bot_task, front_version_task]
+
+    # Автоотклики можно вынести в отдельные процессы (workers/auto_reply_worker.py)
+    if config.worker.auto_reply_in_process:
+        worker_tasks.append(
+            asyncio.create_task(run_auto_reply_worker(config, auto_reply_shutdown))
+        )
+    else:
+        logger.info("Воркер автооткликов запущен отдельными процессами, в API не стартует")
     
     logger.info("Воркеры запущены")
     
@@ -79,6 +120,11 @@ async def lifespan(app: FastAPI):
         except Exception as exc:
             logger.warning(f"Ошибка при остановке воркеров: {exc}")
 
+    if metrics_server is not None:
+        metrics_server.close()
+    await close_hh_connection_pool()
+    await close_openai_client_registry()
+
 
 app = FastAPI(
     title="AutoOffer API",
@@ -41,6 +41,7 @@ from domain.use_cases.get_resume_evaluation_from_cache import (
 from domain.use_cases.save_resume_evaluation import SaveResumeEvaluationUseCase
 from domain.use_cases.evaluate_resume_with_cache import EvaluateResumeWithCacheUseCase
 from infrastructure.auth.fastapi_users_setup import get_current_active_user
+from infrastructure.clients.hh_areas_cache import get_hh_areas_cache
 from infrastructure.clients.hh_client import RateLimitedHHHttpClient
 from infrastructure.database.models.user_model import UserModel
 from infrastructure.agents.filter_settings_generator_agent import FilterSettingsGeneratorAgent
@@ -96,10 +97,10 @@ def get_vacancies_service(
 
 @lru_cache()
 def get_areas_use_case() -> GetAreasUseCase:
-    """Создаёт и кеширует GetAreasUseCase с RateLimitedHHHttpClient."""
+    """Создаёт и кеширует GetAreasUseCase с RateLimitedHHHttpClient и кешем регионов."""
     config = get_config()
     hh_client = RateLimitedHHHttpClient(base_url=config.hh.base_url)
-    return GetAreasUseCase(hh_client)
+    return GetAreasUseCase(hh_client, areas_cache=get_hh_areas_cache(config.hh))
 
 
 def get_filter_settings_generation_service(
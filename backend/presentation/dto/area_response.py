@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import BaseModel
+
+from domain.entities.area import Area
+
+
+class AreaResponse(BaseModel):
+    """DTO для представления региона HH в JSON ответе."""
+
+    id: str
+    name: str
+    parent_id: str | None = None
+    path: List[str] = []
+    has_children: bool = False
+
+    @classmethod
+    def from_entity(cls, area: Area) -> "AreaResponse":
+        """Создает DTO из сущности региона.
+
+        Args:
+            area: Сущность региона.
+
+        Returns:
+            DTO для JSON ответа.
+        """
+        return cls(
+            id=area.area_id,
+            name=area.name,
+            parent_id=area.parent_id,
+            path=area.path or [],
+            has_children=area.has_children,
+        )
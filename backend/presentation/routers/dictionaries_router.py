@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException
 from loguru import logger
 
 from domain.use_cases.get_areas import GetAreasUseCase
 from domain.use_cases.update_user_hh_auth_cookies import UpdateUserHhAuthCookiesUseCase
 from domain.interfaces.unit_of_work_port import UnitOfWorkPort
+from presentation.dto.area_response import AreaResponse
 from presentation.dependencies import (
     get_areas_use_case,
     get_cookies,
@@ -50,3 +52,30 @@ async def get_areas(
             detail="Внутренняя ошибка при получении справочника регионов",
         ) from exc
 
+
+@router.get("/areas/{area_id}", response_model=AreaResponse)
+async def get_area(
+    area_id: str,
+    use_case: GetAreasUseCase = Depends(get_areas_use_case),
+    current_user=Depends(get_current_user),
+) -> AreaResponse:
+    """Получить регион по id (например, для отображения ResumeFilterSettings.area)."""
+    try:
+        area = await use_case.get_area(area_id)
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 404:
+            raise HTTPException(status_code=404, detail="Регион не найден") from exc
+        logger.error(f"Ошибка HH при получении региона {area_id}: {exc}")
+        raise HTTPException(
+            status_code=502,
+            detail="Не удалось получить справочник регионов HH",
+        ) from exc
+    except Exception as exc:  # pragma: no cover - обёртка ошибок HTTP
+        logger.error(f"Ошибка при получении региона {area_id}: {exc}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Внутренняя ошибка при получении региона",
+        ) from exc
+    if area is None:
+        raise HTTPException(status_code=404, detail="Регион не найден")
+    return AreaResponse.from_entity(area)
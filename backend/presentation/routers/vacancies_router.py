@@ -306,6 +306,7 @@ async def respond_to_vacancy(
         from domain.use_cases.respond_to_vacancy import RespondToVacancyUseCase
         from domain.use_cases.respond_to_vacancy_and_save import RespondToVacancyAndSaveUseCase
         from domain.use_cases.create_vacancy_response import CreateVacancyResponseUseCase
+        from application.factories.database_factory import create_handled_vacancies_cache
         from domain.use_cases.check_and_update_subscription import (
             CheckAndUpdateSubscriptionUseCase,
         )
@@ -322,7 +323,8 @@ async def respond_to_vacancy(
         # Используем standalone репозиторий, так как сохранение происходит после HTTP запроса
         # и не требует атомарности с другими операциями
         create_vacancy_response_uc = CreateVacancyResponseUseCase(
-            vacancy_response_repository=unit_of_work.standalone_vacancy_response_repository
+            vacancy_response_repository=unit_of_work.standalone_vacancy_response_repository,
+            handled_vacancies=create_handled_vacancies_cache(config),
         )
         
         # Создаем use cases для проверки подписки и инкремента счетчика
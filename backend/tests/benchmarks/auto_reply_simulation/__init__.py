@@ -0,0 +1 @@
+"""Офлайн симуляция конвейера автооткликов (заглушки HH и LLM)."""
@@ -0,0 +1,78 @@
+"""Симуляция конвейера автооткликов без сети.
+
+HH и LLM заменяются заглушками с настраиваемой задержкой, БД — локальный
+Postgres из переменных окружения (как у воркера, миграции должны быть применены):
+
+    cd backend
+    python -m tests.benchmarks.auto_reply_simulation --resumes 50 --hh-latency-ms 200 --llm-latency-ms 1500
+
+Отчет: отклики в минуту, p50/p99 по этапам, пик занятых соединений БД и память.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+
+from loguru import logger
+
+from config import load_config
+from tests.benchmarks.auto_reply_simulation.fake_hh import FakeHHSettings
+from tests.benchmarks.auto_reply_simulation.fake_llm import FakeLLMSettings
+from tests.benchmarks.auto_reply_simulation.runner import SimulationSettings, run_simulation
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=20, help="Число синтетических резюме")
+    parser.add_argument("--queries", type=int, default=5, help="Число разных текстов поиска")
+    parser.add_argument("--vacancies-per-query", type=int, default=100, help="Размер выдачи одного запроса")
+    parser.add_argument("--max-vacancies", type=int, default=20, help="Не больше откликов на резюме за цикл")
+    parser.add_argument("--threshold", type=int, default=50, help="Порог autolike_threshold резюме, %%")
+    parser.add_argument("--hh-latency-ms", type=float, default=150.0, help="Задержка ответа HH")
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0, help="Задержка ответа LLM")
+    parser.add_argument("--llm-latency-per-vacancy-ms", type=float, default=20.0, help="Добавка LLM за вакансию фильтра")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Разброс задержек (доля)")
+    parser.add_argument("--reply-interval", type=float, default=0.0, help="Пауза между откликами пользователя, с")
+    parser.add_argument("--trace-memory", action="store_true", help="Замерять пик памяти через tracemalloc")
+    parser.add_argument("--keep-data", action="store_true", help="Не удалять созданные данные из БД")
+    parser.add_argument("--json", action="store_true", help="Вывести отчет в JSON")
+    parser.add_argument("--log-level", default="WARNING", help="Уровень логов конвейера")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level.upper())
+
+    settings = SimulationSettings(
+        resumes=args.resumes,
+        distinct_queries=args.queries,
+        max_vacancies_per_resume=args.max_vacancies,
+        autolike_threshold=args.threshold,
+        reply_interval_seconds=args.reply_interval,
+        trace_memory=args.trace_memory,
+        keep_data=args.keep_data,
+        hh=FakeHHSettings(
+            latency_ms=args.hh_latency_ms,
+            latency_jitter=args.jitter,
+            vacancies_per_query=args.vacancies_per_query,
+        ),
+        llm=FakeLLMSettings(
+            latency_ms=args.llm_latency_ms,
+            latency_per_vacancy_ms=args.llm_latency_per_vacancy_ms,
+            latency_jitter=args.jitter,
+        ),
+    )
+    report = asyncio.run(run_simulation(load_config(), settings))
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        print(report.format_text())
+
+
+if __name__ == "__main__":
+    main()
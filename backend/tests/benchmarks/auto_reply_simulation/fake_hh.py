@@ -0,0 +1,136 @@
+"""Заглушка HH для симуляции автооткликов.
+
+Выдача /search/vacancy строится из записанного ответа внутреннего API
+(docs/hh/internal_api/search-vacancy.json): вакансии страницы клонируются
+с синтетическими id, зависящими от текста запроса, поэтому резюме с одинаковым
+запросом видят одну и ту же выдачу (как в HH). Тест вакансии и отклик отдают
+минимальные ответы в формате, который разбирают клиенты HH.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+DOCS_HH_DIR = Path(__file__).resolve().parents[4] / "docs" / "hh"
+RECORDED_SEARCH_PATH = DOCS_HH_DIR / "internal_api" / "search-vacancy.json"
+
+_VACANCIES_PLACEHOLDER = "__SIMULATION_VACANCIES__"
+_MSK = timezone(timedelta(hours=3))
+
+_TEST_PAGE = """<html><body>
+<div data-qa="test-description">Небольшой тест от работодателя</div>
+<form id="RESPONSE_MODAL_FORM_ID" method="post">
+  <input type="hidden" name="uidPk" value="{vacancy_id}">
+  <input type="hidden" name="guid" value="sim-{vacancy_id}">
+  <input type="hidden" name="startTime" value="{start_time}">
+  <input type="hidden" name="testRequired" value="true">
+  <div data-qa="task-body">
+    <div data-qa="task-question">Сколько лет вы работаете с Python?</div>
+    <textarea name="task_1{vacancy_id}_text"></textarea>
+  </div>
+  <div data-qa="task-body">
+    <div data-qa="task-question">Готовы к удаленной работе?</div>
+    <label><input type="radio" name="task_2{vacancy_id}" value="1"><span data-qa="cell-text-content">Да</span></label>
+    <label><input type="radio" name="task_2{vacancy_id}" value="2"><span data-qa="cell-text-content">Нет</span></label>
+  </div>
+</form>
+</body></html>"""
+
+
+@dataclass(slots=True)
+class FakeHHSettings:
+    """Параметры заглушки HH.
+
+    latency_ms — задержка ответа на каждый запрос, latency_jitter — разброс
+    задержки (доля от latency_ms), vacancies_per_query — размер выдачи одного
+    текста запроса (дальше страницы пустые).
+    """
+
+    latency_ms: float = 150.0
+    latency_jitter: float = 0.2
+    vacancies_per_query: int = 100
+
+
+class _SearchPageTemplate:
+    """Записанная страница выдачи, сериализованная один раз.
+
+    На каждый запрос сериализуются только вакансии страницы, остальное
+    (справочники, меню и прочее состояние страницы) подставляется готовой строкой.
+    """
+
+    def __init__(self, path: Path) -> None:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        search_result = payload["vacancySearchResult"]
+        self.items: List[Dict[str, Any]] = list(search_result["vacancies"])
+        search_result["vacancies"] = _VACANCIES_PLACEHOLDER
+        prefix, suffix = json.dumps(payload, ensure_ascii=False).split(
+            json.dumps(_VACANCIES_PLACEHOLDER), 1
+        )
+        self._prefix = prefix.encode()
+        self._suffix = suffix.encode()
+
+    def render(self, items: List[Dict[str, Any]]) -> bytes:
+        return self._prefix + json.dumps(items, ensure_ascii=False).encode() + self._suffix
+
+
+def _query_base_id(text: str) -> int:
+    return 100_000_000 + (zlib.crc32(text.encode()) % 100_000) * 1_000
+
+
+def create_fake_hh_app(settings: FakeHHSettings, recorded_path: Path = RECORDED_SEARCH_PATH) -> FastAPI:
+    """ASGI приложение, отвечающее на запросы, которые делает конвейер автооткликов."""
+    template = _SearchPageTemplate(recorded_path)
+    page_size = len(template.items)
+    # Время публикации убывает с номером вакансии в выдаче (сортировка по дате)
+    newest_published = datetime.now(_MSK).replace(microsecond=0)
+    app = FastAPI()
+
+    async def delay() -> None:
+        jitter = settings.latency_jitter
+        factor = random.uniform(1 - jitter, 1 + jitter) if jitter > 0 else 1.0
+        await asyncio.sleep(settings.latency_ms * factor / 1000)
+
+    @app.get("/search/vacancy")
+    async def search_vacancy(text: str = "", page: int = 0) -> Response:
+        await delay()
+        base_id = _query_base_id(text)
+        start = page * page_size
+        stop = min(start + page_size, settings.vacancies_per_query)
+        items: List[Dict[str, Any]] = []
+        for index in range(start, stop):
+            vacancy_id = base_id + index
+            published = newest_published - timedelta(minutes=index)
+            item = dict(template.items[index % page_size])
+            item["vacancyId"] = vacancy_id
+            item["publicationTime"] = {
+                "@timestamp": int(published.timestamp()),
+                "$": published.isoformat(timespec="milliseconds"),
+            }
+            item["links"] = {"desktop": f"https://hh.ru/vacancy/{vacancy_id}"}
+            items.append(item)
+        return Response(content=template.render(items), media_type="application/json")
+
+    @app.get("/applicant/vacancy_response")
+    async def vacancy_test(vacancyId: int) -> HTMLResponse:
+        await delay()
+        return HTMLResponse(
+            _TEST_PAGE.format(vacancy_id=vacancyId, start_time=int(newest_published.timestamp()))
+        )
+
+    @app.post("/applicant/vacancy_response/popup")
+    async def respond(request: Request) -> JSONResponse:
+        await request.body()
+        await delay()
+        return JSONResponse({"success": "true", "responseStatus": {"negotiationsCount": 1}})
+
+    return app
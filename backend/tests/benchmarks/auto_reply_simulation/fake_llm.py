@@ -0,0 +1,166 @@
+"""OpenAI-совместимая заглушка LLM для симуляции автооткликов.
+
+POST /v1/chat/completions отвечает в формате, который разбирают агенты:
+фильтр списка вакансий получает JSON-массив оценок (confidence детерминирован
+по vacancy_id), генератор тестов — JSON-объект ответов, генератор писем — текст.
+Агент определяется по разделам промпта, которые он формирует.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+import socket
+import threading
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+_VACANCY_ID_RE = re.compile(r"^- id=(\d+)$", re.MULTILINE)
+_TEST_FIELD_RE = re.compile(r"^- field_name: (\S+)\n  Тип: (\w+)", re.MULTILINE)
+_TEST_OPTION_RE = re.compile(r"^    - value: ([^,]+),", re.MULTILINE)
+
+_COVER_LETTER = (
+    "Здравствуйте! Меня заинтересовала ваша вакансия: опыт и стек хорошо совпадают "
+    "с задачами команды. Буду рад обсудить детали на собеседовании."
+)
+
+
+@dataclass(slots=True)
+class FakeLLMSettings:
+    """Параметры заглушки LLM.
+
+    latency_ms — задержка ответа, latency_per_vacancy_ms — добавка за каждую
+    вакансию в запросе фильтрации (длинный ответ генерируется дольше).
+    """
+
+    latency_ms: float = 800.0
+    latency_per_vacancy_ms: float = 20.0
+    latency_jitter: float = 0.2
+
+
+def vacancy_confidence(vacancy_id: int) -> float:
+    """Детерминированная оценка вакансии (равномерно в [0, 1))."""
+    return (zlib.crc32(str(vacancy_id).encode()) % 100) / 100
+
+
+def _filter_answer(prompt: str) -> str:
+    return json.dumps(
+        [
+            {"vacancy_id": int(vacancy_id), "confidence": vacancy_confidence(int(vacancy_id)), "reason": "Симуляция"}
+            for vacancy_id in _VACANCY_ID_RE.findall(prompt)
+        ],
+        ensure_ascii=False,
+    )
+
+
+def _test_answer(prompt: str) -> str:
+    answers: Dict[str, Any] = {}
+    blocks = prompt.split("\n- field_name: ")
+    for field_name, question_type in _TEST_FIELD_RE.findall(prompt):
+        if question_type == "text":
+            answers[field_name] = "Пять лет, в основном backend на Python."
+            continue
+        block = next((b for b in blocks if b.startswith(field_name)), "")
+        options = _TEST_OPTION_RE.findall(block)
+        if not options:
+            continue
+        answers[field_name] = [options[0]] if question_type == "multiselect" else options[0]
+    return json.dumps(answers, ensure_ascii=False)
+
+
+def _completion(model: str, content: str, prompt_chars: int) -> Dict[str, Any]:
+    prompt_tokens = prompt_chars // 4
+    completion_tokens = len(content) // 4
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def create_fake_llm_app(settings: FakeLLMSettings) -> FastAPI:
+    """ASGI приложение с эндпоинтом chat.completions."""
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> JSONResponse:
+        body = await request.json()
+        messages: List[Dict[str, Any]] = body.get("messages") or []
+        prompt = "\n".join(str(m.get("content") or "") for m in messages if m.get("role") == "user")
+
+        latency_ms = settings.latency_ms
+        if "СПИСОК ВАКАНСИЙ:" in prompt:
+            content = _filter_answer(prompt)
+            latency_ms += settings.latency_per_vacancy_ms * len(_VACANCY_ID_RE.findall(prompt))
+        elif "ВОПРОСЫ ТЕСТА:" in prompt:
+            content = _test_answer(prompt)
+        else:
+            content = _COVER_LETTER
+
+        jitter = settings.latency_jitter
+        factor = random.uniform(1 - jitter, 1 + jitter) if jitter > 0 else 1.0
+        await asyncio.sleep(latency_ms * factor / 1000)
+        prompt_chars = sum(len(str(m.get("content") or "")) for m in messages)
+        return JSONResponse(_completion(body.get("model", "simulation"), content, prompt_chars))
+
+    return app
+
+
+class FakeLLMServer:
+    """Заглушка LLM на 127.0.0.1 в отдельном потоке со своим event loop.
+
+    Агенты создают AsyncOpenAI сами по OpenAIConfig.base_url, поэтому заглушка
+    слушает loopback-порт; внешняя сеть не нужна. Отдельный loop не дает
+    ожиданию заглушки конкурировать с конвейером за event loop воркера.
+    """
+
+    def __init__(self, settings: FakeLLMSettings) -> None:
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._server = uvicorn.Server(
+            uvicorn.Config(create_fake_llm_app(settings), log_level="warning", access_log=False)
+        )
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [self._socket]}, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._socket.getsockname()
+        return f"http://{host}:{port}/v1"
+
+    def start(self, timeout: float = 10.0) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Заглушка LLM не запустилась")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+        self._socket.close()
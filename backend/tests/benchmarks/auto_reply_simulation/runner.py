@@ -0,0 +1,406 @@
+"""Прогон конвейера автооткликов на заглушках HH и LLM.
+
+Собирает ProcessAutoRepliesUseCase так же, как воркер автооткликов, но HH
+подменяется ASGI-заглушкой через transport_factory пула соединений, а LLM —
+OpenAI-совместимой заглушкой на loopback. БД настоящая (локальный Postgres из
+DatabaseConfig): синтетические пользователи и резюме создаются перед прогоном
+и удаляются после него.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import resource
+import time
+import tracemalloc
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, List
+from uuid import UUID, uuid4
+
+import httpx
+from loguru import logger
+from sqlalchemy import delete, func, select
+
+from application.factories.database_factory import (
+    create_handled_vacancies_cache,
+    create_unit_of_work,
+)
+from application.factories.event_factory import create_event_publisher
+from application.factories.search_and_get_filtered_vacancy_list_factory import (
+    create_search_and_get_filtered_vacancy_list_usecase,
+)
+from config import AppConfig
+from domain.use_cases.generate_test_answers import GenerateTestAnswersUseCase
+from domain.use_cases.process_auto_replies import ProcessAutoRepliesUseCase
+from domain.use_cases.respond_to_vacancy import RespondToVacancyUseCase
+from infrastructure.agents.cover_letter_generator_agent import CoverLetterGeneratorAgent
+from infrastructure.agents.vacancy_list_filter_agent import VacancyListFilterAgent
+from infrastructure.agents.vacancy_test_agent import VacancyTestAgent
+from infrastructure.cache.resume_context_cache import get_resume_context_cache
+from infrastructure.cache.vacancy_discovery_watermark_store import get_vacancy_discovery_watermark_store
+from infrastructure.clients.hh_client import RateLimitedHHHttpClient
+from infrastructure.clients.hh_client_coalescing import CoalescingHHClient
+from infrastructure.clients.hh_connection_pool import (
+    close_hh_connection_pool,
+    configure_hh_connection_pool,
+)
+from infrastructure.clients.hh_rate_limiter import configure_hh_rate_limiter
+from infrastructure.clients.openai_client_registry import (
+    close_openai_client_registry,
+    configure_openai_client_registry,
+)
+from infrastructure.database.models.llm_call_model import LlmCallModel
+from infrastructure.database.models.resume_filter_settings_model import ResumeFilterSettingsModel
+from infrastructure.database.models.resume_model import ResumeModel
+from infrastructure.database.models.subscription_plan_model import SubscriptionPlanModel
+from infrastructure.database.models.user_hh_auth_data_model import UserHhAuthDataModel
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.models.user_subscription_model import UserSubscriptionModel
+from infrastructure.database.models.vacancy_response_model import VacancyResponseModel
+from infrastructure.database.session import create_session_factory, get_engine
+from infrastructure.quota.response_quota import configure_response_quota
+from infrastructure.scheduling.llm_scheduler import LlmPriority, set_llm_priority
+from infrastructure.scheduling.reply_send_scheduler import configure_reply_send_scheduler
+from tests.benchmarks.auto_reply_simulation.fake_hh import DOCS_HH_DIR, FakeHHSettings, create_fake_hh_app
+from tests.benchmarks.auto_reply_simulation.fake_llm import FakeLLMServer, FakeLLMSettings
+from tests.benchmarks.auto_reply_simulation.stage_metrics import (
+    PoolSampler,
+    StageRecorder,
+    StageSummary,
+    TimedProxy,
+    TimingTransport,
+    classify_hh_request,
+)
+
+_RESUME_CONTENT = (
+    "Python backend разработчик, 5 лет опыта. FastAPI, SQLAlchemy, PostgreSQL, "
+    "asyncio, Docker. Готов к удаленной работе."
+)
+
+
+@dataclass(slots=True)
+class SimulationSettings:
+    """Параметры прогона.
+
+    resumes — число синтетических резюме (у каждого свой пользователь),
+    distinct_queries — число разных текстов поиска среди них,
+    reply_interval_seconds — пауза между откликами пользователя в очереди
+    отправки (в проде 30 секунд; 0 — измерять пропускную способность конвейера).
+    """
+
+    resumes: int = 20
+    distinct_queries: int = 5
+    max_vacancies_per_resume: int = 20
+    autolike_threshold: int = 50
+    reply_interval_seconds: float = 0.0
+    trace_memory: bool = False
+    keep_data: bool = False
+    hh: FakeHHSettings = field(default_factory=FakeHHSettings)
+    llm: FakeLLMSettings = field(default_factory=FakeLLMSettings)
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    """Результат прогона."""
+
+    resumes: int
+    duration_seconds: float
+    responses: int
+    responses_per_minute: float
+    stages: Dict[str, StageSummary]
+    db_pool_size: int
+    db_peak_checked_out: int
+    db_peak_open: int
+    peak_rss_mb: float
+    traced_peak_mb: float | None = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "resumes": self.resumes,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "responses": self.responses,
+            "responses_per_minute": round(self.responses_per_minute, 2),
+            "stages": {
+                stage: {
+                    "count": s.count,
+                    "errors": s.errors,
+                    "p50_ms": round(s.p50_ms, 1),
+                    "p99_ms": round(s.p99_ms, 1),
+                    "max_ms": round(s.max_ms, 1),
+                }
+                for stage, s in sorted(self.stages.items())
+            },
+            "db_pool_size": self.db_pool_size,
+            "db_peak_checked_out": self.db_peak_checked_out,
+            "db_peak_open": self.db_peak_open,
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+            "traced_peak_mb": round(self.traced_peak_mb, 1) if self.traced_peak_mb is not None else None,
+        }
+
+    def format_text(self) -> str:
+        lines = [
+            f"Резюме: {self.resumes}, длительность: {self.duration_seconds:.1f} с",
+            f"Откликов: {self.responses} ({self.responses_per_minute:.1f} в минуту)",
+            f"БД: пул {self.db_pool_size}, занято соединений в пике {self.db_peak_checked_out}, "
+            f"открыто в пике {self.db_peak_open}",
+            f"Память: max RSS {self.peak_rss_mb:.1f} МБ"
+            + (f", пик tracemalloc {self.traced_peak_mb:.1f} МБ" if self.traced_peak_mb is not None else ""),
+            "",
+            f"{'этап':<20}{'вызовов':>9}{'ошибок':>8}{'p50, мс':>10}{'p99, мс':>10}{'max, мс':>10}",
+        ]
+        for stage, s in sorted(self.stages.items()):
+            lines.append(
+                f"{stage:<20}{s.count:>9}{s.errors:>8}{s.p50_ms:>10.1f}{s.p99_ms:>10.1f}{s.max_ms:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class _SeededData:
+    plan_id: UUID
+    user_ids: List[UUID]
+    resume_ids: List[UUID]
+
+
+class _TimedReplyScheduler:
+    """Очередь откликов, замеряющая выполнение каждого задания (этап reply)."""
+
+    def __init__(self, scheduler: Any, recorder: StageRecorder) -> None:
+        self._scheduler = scheduler
+        self._recorder = recorder
+
+    def submit(self, *, run: Callable[[], Awaitable[None]], **kwargs: Any) -> asyncio.Future:
+        return self._scheduler.submit(run=self._recorder.timed("reply", run), **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._scheduler, name)
+
+
+def _load_recorded(name: str) -> Dict[str, str]:
+    return json.loads((DOCS_HH_DIR / name).read_text(encoding="utf-8"))
+
+
+async def _seed(config: AppConfig, settings: SimulationSettings, run_id: str) -> _SeededData:
+    """Создает план подписки, пользователей, резюме, фильтры и auth данные."""
+    headers = _load_recorded("default_headers.json")
+    cookies = _load_recorded("default_cookies.json")
+    session_factory = create_session_factory(config.database)
+    seeded = _SeededData(plan_id=uuid4(), user_ids=[], resume_ids=[])
+    async with session_factory() as session:
+        session.add(
+            SubscriptionPlanModel(
+                id=seeded.plan_id,
+                name=f"simulation-{run_id}",
+                response_limit=1_000_000,
+                reset_period_seconds=86400,
+                duration_days=0,
+                price=0,
+                is_active=True,
+            )
+        )
+        await session.flush()
+        for index in range(settings.resumes):
+            user_id, resume_id = uuid4(), uuid4()
+            seeded.user_ids.append(user_id)
+            seeded.resume_ids.append(resume_id)
+            session.add(
+                UserModel(
+                    id=user_id,
+                    email=f"sim-{run_id}-{index}@simulation.local",
+                    hashed_password="simulation",
+                )
+            )
+            session.add(UserHhAuthDataModel(user_id=user_id, headers=headers, cookies=cookies))
+            session.add(
+                UserSubscriptionModel(
+                    user_id=user_id, subscription_plan_id=seeded.plan_id, responses_count=0
+                )
+            )
+            session.add(
+                ResumeModel(
+                    id=resume_id,
+                    user_id=user_id,
+                    content=_RESUME_CONTENT,
+                    headhunter_hash=f"sim{resume_id.hex}",
+                    is_auto_reply=True,
+                    autolike_threshold=settings.autolike_threshold,
+                )
+            )
+            await session.flush()
+            session.add(
+                ResumeFilterSettingsModel(
+                    resume_id=resume_id,
+                    text=f"python simulation {index % max(settings.distinct_queries, 1)}",
+                    area="1",
+                    salary=100000,
+                )
+            )
+        await session.commit()
+    return seeded
+
+
+async def _cleanup(config: AppConfig, seeded: _SeededData) -> None:
+    """Удаляет созданные данные (резюме, отклики и подписки удаляются каскадно)."""
+    session_factory = create_session_factory(config.database)
+    async with session_factory() as session:
+        await session.execute(delete(LlmCallModel).where(LlmCallModel.user_id.in_(seeded.user_ids)))
+        await session.execute(delete(UserModel).where(UserModel.id.in_(seeded.user_ids)))
+        await session.execute(delete(SubscriptionPlanModel).where(SubscriptionPlanModel.id == seeded.plan_id))
+        await session.commit()
+
+
+async def _count_responses(config: AppConfig, resume_ids: List[UUID]) -> int:
+    session_factory = create_session_factory(config.database)
+    async with session_factory() as session:
+        result = await session.execute(
+            select(func.count())
+            .select_from(VacancyResponseModel)
+            .where(
+                VacancyResponseModel.resume_id.in_(resume_ids),
+                VacancyResponseModel.status == "success",
+            )
+        )
+        return int(result.scalar_one())
+
+
+async def _drive(
+    config: AppConfig,
+    settings: SimulationSettings,
+    resume_ids: List[UUID],
+    recorder: StageRecorder,
+) -> None:
+    """Обрабатывает все резюме по одному циклу, как задачи воркера автооткликов."""
+    # Как в воркере: вызовы LLM планируются с фоновым приоритетом
+    set_llm_priority(LlmPriority.BACKGROUND)
+    hh_client = CoalescingHHClient(RateLimitedHHHttpClient(base_url=config.hh.base_url))
+    respond_to_vacancy_uc = RespondToVacancyUseCase(hh_client)
+    event_publisher = create_event_publisher(config)
+    reply_scheduler = _TimedReplyScheduler(configure_reply_send_scheduler(config.hh), recorder)
+    discovery_watermarks = get_vacancy_discovery_watermark_store(config.hh)
+    handled_vacancies = create_handled_vacancies_cache(config)
+    resume_contexts = get_resume_context_cache(config.hh)
+    response_quota = configure_response_quota(config.hh, lambda: create_unit_of_work(config.database))
+    slots = asyncio.Semaphore(max(config.worker.auto_reply_max_resumes, 1))
+
+    async def process(resume_id: UUID) -> None:
+        async with slots:
+            unit_of_work = create_unit_of_work(config.database)
+            async with unit_of_work:
+                resume = await unit_of_work.resume_repository.get_by_id(resume_id)
+                filter_agent = TimedProxy(
+                    VacancyListFilterAgent(config.openai, unit_of_work=unit_of_work),
+                    recorder,
+                    {"filter_vacancy_list": "llm_filter"},
+                )
+                cover_letter_generator = TimedProxy(
+                    CoverLetterGeneratorAgent(config.openai, unit_of_work=unit_of_work),
+                    recorder,
+                    {"generate": "llm_cover_letter"},
+                )
+                generate_test_answers_uc = TimedProxy(
+                    GenerateTestAnswersUseCase(VacancyTestAgent(config.openai, unit_of_work=unit_of_work)),
+                    recorder,
+                    {"execute": "llm_test_answers"},
+                )
+                process_auto_replies_uc = ProcessAutoRepliesUseCase(
+                    resume_repository=unit_of_work.resume_repository,
+                    user_hh_auth_data_repository=unit_of_work.user_hh_auth_data_repository,
+                    resume_filter_settings_repository=unit_of_work.resume_filter_settings_repository,
+                    search_and_get_filtered_vacancy_list_uc=create_search_and_get_filtered_vacancy_list_usecase(
+                        config, unit_of_work=unit_of_work, vacancy_list_filter_service=filter_agent
+                    ),
+                    cover_letter_generator=cover_letter_generator,
+                    create_unit_of_work_factory=lambda: create_unit_of_work(config.database),
+                    respond_to_vacancy_uc=respond_to_vacancy_uc,
+                    hh_client=hh_client,
+                    generate_test_answers_uc=generate_test_answers_uc,
+                    event_publisher=event_publisher,
+                    standalone_cookies_uow_factory=lambda: create_unit_of_work(config.database),
+                    max_vacancies_per_resume=settings.max_vacancies_per_resume,
+                    reply_scheduler=reply_scheduler,
+                    prepare_lookahead=config.hh.reply_prepare_lookahead,
+                    discovery_watermarks=discovery_watermarks,
+                    discovery_wave_pages=config.hh.discovery_wave_pages,
+                    handled_vacancies=handled_vacancies,
+                    resume_contexts=resume_contexts,
+                    response_quota=response_quota,
+                )
+                await recorder.timed("resume_cycle", process_auto_replies_uc.process_single_resume)(resume)
+
+    try:
+        results = await asyncio.gather(*(process(resume_id) for resume_id in resume_ids), return_exceptions=True)
+        for resume_id, result in zip(resume_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"[simulation] Ошибка обработки резюме {resume_id}: {result!r}")
+    finally:
+        await response_quota.close()
+
+
+async def run_simulation(config: AppConfig, settings: SimulationSettings) -> SimulationReport:
+    """Прогнать settings.resumes резюме через конвейер автооткликов и собрать отчет.
+
+    Процесс должен быть новым: пул HH, очередь откликов и кеши — синглтоны уровня
+    процесса и настраиваются здесь под заглушки.
+    """
+    llm_server = FakeLLMServer(settings.llm)
+    llm_server.start()
+    config = replace(
+        config,
+        openai=replace(config.openai, base_url=llm_server.base_url, api_key="simulation"),
+        hh=replace(config.hh, reply_user_interval_seconds=settings.reply_interval_seconds),
+        telegram=replace(config.telegram, bot_token=None),
+    )
+
+    recorder = StageRecorder()
+    hh_app = create_fake_hh_app(settings.hh)
+    configure_hh_connection_pool(
+        config.hh,
+        transport_factory=lambda host: TimingTransport(
+            httpx.ASGITransport(app=hh_app), recorder, classify_hh_request
+        ),
+    )
+    configure_hh_rate_limiter(config.hh)
+    configure_openai_client_registry(config.openai)
+    pool = get_engine(config.database).sync_engine.pool
+    sampler = PoolSampler(pool)
+    run_id = uuid4().hex[:8]
+
+    try:
+        seeded = await _seed(config, settings, run_id)
+        try:
+            if settings.trace_memory:
+                tracemalloc.start()
+            sampler.start()
+            started = time.perf_counter()
+            await _drive(config, settings, seeded.resume_ids, recorder)
+            duration = time.perf_counter() - started
+            await sampler.stop()
+            traced_peak_mb = None
+            if settings.trace_memory:
+                traced_peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+                tracemalloc.stop()
+            responses = await _count_responses(config, seeded.resume_ids)
+        finally:
+            if settings.keep_data:
+                logger.info(f"[simulation] Данные прогона {run_id} сохранены в БД")
+            else:
+                await _cleanup(config, seeded)
+    finally:
+        await close_hh_connection_pool()
+        await close_openai_client_registry()
+        llm_server.stop()
+
+    return SimulationReport(
+        resumes=settings.resumes,
+        duration_seconds=duration,
+        responses=responses,
+        responses_per_minute=responses / duration * 60 if duration > 0 else 0.0,
+        stages=recorder.summary(),
+        db_pool_size=pool.size(),
+        db_peak_checked_out=sampler.peak_checked_out,
+        db_peak_open=sampler.peak_open,
+        # На Linux ru_maxrss в килобайтах; включает поток заглушки LLM
+        peak_rss_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        traced_peak_mb=traced_peak_mb,
+    )
@@ -0,0 +1,182 @@
+"""Замеры этапов конвейера автооткликов в симуляции."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import httpx
+
+
+@dataclass(slots=True)
+class StageSummary:
+    """Сводка по этапу: количество вызовов, ошибки и перцентили длительности (мс)."""
+
+    count: int
+    errors: int
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Перцентиль q (0..100) методом ближайшего ранга."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class StageRecorder:
+    """Собирает длительности этапов (в секундах) и количество ошибок."""
+
+    def __init__(self) -> None:
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, stage: str, seconds: float, ok: bool = True) -> None:
+        self._samples[stage].append(seconds)
+        if not ok:
+            self._errors[stage] += 1
+
+    def count(self, stage: str, ok_only: bool = False) -> int:
+        total = len(self._samples.get(stage, ()))
+        return total - self._errors.get(stage, 0) if ok_only else total
+
+    def summary(self) -> Dict[str, StageSummary]:
+        return {
+            stage: StageSummary(
+                count=len(samples),
+                errors=self._errors.get(stage, 0),
+                p50_ms=percentile(samples, 50) * 1000,
+                p99_ms=percentile(samples, 99) * 1000,
+                max_ms=max(samples) * 1000,
+            )
+            for stage, samples in self._samples.items()
+        }
+
+    def timed(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Обертка корутинной функции, записывающая ее длительность в этап stage."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            ok = False
+            try:
+                result = await func(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                self.record(stage, time.perf_counter() - started, ok)
+
+        return wrapper
+
+
+class TimedProxy:
+    """Прокси объекта, замеряющий вызовы перечисленных async методов.
+
+    Остальные атрибуты (в том числе set_unit_of_work у агентов) отдаются как есть.
+    """
+
+    def __init__(self, target: Any, recorder: StageRecorder, stages: Mapping[str, str]) -> None:
+        self._target = target
+        self._wrapped: Dict[str, Callable[..., Any]] = {}
+        for method_name, stage in stages.items():
+            method = getattr(target, method_name)
+            if not inspect.iscoroutinefunction(method):
+                raise TypeError(f"{type(target).__name__}.{method_name} не корутина")
+            self._wrapped[method_name] = recorder.timed(stage, method)
+
+    def __getattr__(self, name: str) -> Any:
+        wrapped = self._wrapped.get(name)
+        return wrapped if wrapped is not None else getattr(self._target, name)
+
+
+class TimingTransport(httpx.AsyncBaseTransport):
+    """Транспорт, замеряющий запросы к HH по этапам (search, test, respond).
+
+    Ответ с кодом 4xx/5xx записывается как ошибка этапа.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.AsyncBaseTransport,
+        recorder: StageRecorder,
+        classify: Callable[[httpx.Request], Optional[str]],
+    ) -> None:
+        self._inner = inner
+        self._recorder = recorder
+        self._classify = classify
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stage = self._classify(request)
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = await self._inner.handle_async_request(request)
+            ok = response.status_code < 400
+            return response
+        finally:
+            if stage is not None:
+                self._recorder.record(stage, time.perf_counter() - started, ok)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def classify_hh_request(request: httpx.Request) -> Optional[str]:
+    """Этап конвейера по пути запроса к HH."""
+    path = request.url.path
+    if path == "/search/vacancy":
+        # HTML страницы поиска запрашивает только обновление версии фронта
+        return None if "text/html" in request.headers.get("accept", "") else "hh_search"
+    if path == "/applicant/vacancy_response/popup":
+        return "hh_respond"
+    if path == "/applicant/vacancy_response":
+        return "hh_test"
+    return None
+
+
+class PoolSampler:
+    """Периодически снимает число занятых соединений пула SQLAlchemy.
+
+    pool — синхронный пул engine (engine.sync_engine.pool). Пиковое значение
+    checkedout показывает, сколько соединений БД реально понадобилось.
+    """
+
+    def __init__(self, pool: Any, interval_seconds: float = 0.05) -> None:
+        self._pool = pool
+        self._interval_seconds = interval_seconds
+        self.peak_checked_out = 0
+        self.peak_open = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def sample(self) -> None:
+        checked_out = self._pool.checkedout()
+        self.peak_checked_out = max(self.peak_checked_out, checked_out)
+        # Открытые соединения: свободные в пуле плюс выданные
+        self.peak_open = max(self.peak_open, self._pool.checkedin() + checked_out)
+
+    async def _run(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self._interval_seconds)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.sample()
@@ -0,0 +1,62 @@
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from config import OpenAIConfig
+from infrastructure.agents.vacancy_list_filter_agent import VacancyListFilterAgent
+from infrastructure.agents.vacancy_test_agent import VacancyTestAgent
+from infrastructure.clients.hh_client import HHHttpClient
+from infrastructure.clients.hh_connection_pool import HHConnectionPool
+from tests.benchmarks.auto_reply_simulation.fake_hh import FakeHHSettings, create_fake_hh_app
+from tests.benchmarks.auto_reply_simulation.fake_llm import (
+    FakeLLMSettings,
+    create_fake_llm_app,
+    vacancy_confidence,
+)
+from tests.benchmarks.auto_reply_simulation.stage_metrics import (
+    StageRecorder,
+    TimingTransport,
+    classify_hh_request,
+)
+
+
+@pytest.mark.asyncio
+async def test_fake_hh_and_llm_are_understood_by_real_clients(monkeypatch):
+    recorder = StageRecorder()
+    hh_app = create_fake_hh_app(FakeHHSettings(latency_ms=0, vacancies_per_query=60))
+    pool = HHConnectionPool(
+        transport_factory=lambda host: TimingTransport(
+            httpx.ASGITransport(app=hh_app), recorder, classify_hh_request
+        )
+    )
+    for module in ("hh_base_mixin", "hh_front_version"):
+        monkeypatch.setattr(f"infrastructure.clients.{module}.get_hh_connection_pool", lambda: pool)
+    hh = HHHttpClient()
+
+    first = await hh.fetch_vacancy_list_front({}, {}, {"text": "python", "page": "0"})
+    second = await hh.fetch_vacancy_list_front({}, {}, {"text": "python", "page": "1"})
+    assert len(first.items) == 50 and len(second.items) == 10
+    assert len({v.vacancy_id for v in first.items + second.items}) == 60
+    assert first.items[0].publication_time_iso > second.items[0].publication_time_iso
+
+    vacancy_id = first.items[0].vacancy_id
+    test = await hh.get_vacancy_test(vacancy_id, {}, {})
+    assert [q.question_type for q in test.questions] == ["text", "select"]
+    assert await hh.respond_to_vacancy(vacancy_id, "hash", {}, {"_xsrf": "x"})
+    assert (recorder.count("hh_search"), recorder.count("hh_test"), recorder.count("hh_respond", ok_only=True)) == (2, 1, 1)
+
+    llm = AsyncOpenAI(
+        base_url="http://fake-llm/v1",
+        api_key="simulation",
+        http_client=httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_fake_llm_app(FakeLLMSettings(latency_ms=0, latency_per_vacancy_ms=0)))
+        ),
+    )
+    config = OpenAIConfig(api_key="simulation")
+    filtered = await VacancyListFilterAgent(config, client=llm).filter_vacancy_list(first.items[:5], "resume")
+    assert {f.vacancy_id: f.confidence for f in filtered} == {
+        v.vacancy_id: vacancy_confidence(v.vacancy_id) for v in first.items[:5]
+    }
+    answers = await VacancyTestAgent(config, client=llm).generate_test_answers(test, "resume")
+    assert set(answers) == {q.field_name for q in test.questions}
+    await pool.aclose()
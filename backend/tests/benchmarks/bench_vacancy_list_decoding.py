@@ -0,0 +1,54 @@
+"""Микро-бенчмарк декодирования и маппинга выдачи /search/vacancy.
+
+Сравнивает на одном и том же ответе HH прежний путь (стандартный json и маппинг
+до оптимизации, см. legacy_vacancy_list_mapping) с текущим (hh_json — orjson, если
+установлен, — и HHVacancyClient._map_front_vacancy_list). По умолчанию
+используется синтетический ответ в формате внутреннего API (50 вакансий +
+справочники), можно передать записанный ответ:
+
+    cd backend
+    python -m tests.benchmarks.bench_vacancy_list_decoding [path/to/search_vacancy.json]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from infrastructure.clients import hh_json
+from infrastructure.clients.hh_vacancy_client import HHVacancyClient
+from tests.benchmarks.legacy_vacancy_list_mapping import legacy_map_front_vacancy_list
+from tests.fixtures.hh_vacancy_payloads import build_front_payload
+
+
+def _bench(label: str, fn: Callable[[], Any], number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{label:<32} {best * 1e6:10.1f} us/page")
+    return best
+
+
+def main(argv: list[str]) -> None:
+    if len(argv) > 1:
+        content = Path(argv[1]).read_bytes()
+    else:
+        content = json.dumps(build_front_payload(), ensure_ascii=False).encode()
+    print(f"payload: {len(content) / 1024:.1f} KiB, hh_json backend: {hh_json.JSON_BACKEND}")
+
+    number = 200
+    payload = hh_json.loads(content)
+    # Оба пути должны давать одинаковый результат, иначе сравнение бессмысленно
+    assert legacy_map_front_vacancy_list(json.loads(content)) == HHVacancyClient._map_front_vacancy_list(payload)
+
+    stdlib_decode = _bench("json.loads", lambda: json.loads(content), number)
+    fast_decode = _bench("hh_json.loads", lambda: hh_json.loads(content), number)
+    legacy_mapping = _bench("legacy mapping", lambda: legacy_map_front_vacancy_list(payload), number)
+    mapping = _bench("_map_front_vacancy_list", lambda: HHVacancyClient._map_front_vacancy_list(payload), number)
+    before = stdlib_decode + legacy_mapping
+    after = fast_decode + mapping
+    print(f"decode+map: {before * 1e6:.1f} us -> {after * 1e6:.1f} us (x{before / after:.2f})")
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,257 @@
+"""Маппинг /search/vacancy до оптимизации (снимок для сравнения в бенчмарке).
+
+Код перенесен без изменений из HHVacancyClient.fetch_vacancy_list_front до
+выноса маппинга в HHVacancyClient._map_front_vacancy_list: справочник
+professional_role целиком разбирается на каждой странице выдачи. Не используется
+приложением; нужен только bench_vacancy_list_decoding.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from loguru import logger
+
+from domain.entities.vacancy_list import VacancyList, VacancyListItem
+
+
+def legacy_map_front_vacancy_list(payload: Dict[str, Any]) -> VacancyList:
+    """Маппинг ответа /search/vacancy в том виде, в каком он был до оптимизации."""
+    # Структура внутреннего API: vacancySearchResult -> vacancies: [ { vacancyId, name, company, ... } ]
+    vacancy_search_result = payload.get("vacancySearchResult")
+    if not isinstance(vacancy_search_result, dict):
+        raise RuntimeError(
+            "[list-front] Ожидался объект vacancySearchResult в корне ответа"
+        )
+
+    raw_vacancies = vacancy_search_result.get("vacancies") or []
+    if not isinstance(raw_vacancies, list):
+        raw_vacancies = []
+
+    # Создаем справочник professional_role ID -> название для маппинга
+    professional_role_map: Dict[int, str] = {}
+    professional_role_clusters = payload.get("vacancySearchDictionaries", {}).get("professional_role")
+    if isinstance(professional_role_clusters, dict):
+        groups = professional_role_clusters.get("groups")
+        if isinstance(groups, dict):
+            for role_id_str, role_data in groups.items():
+                if isinstance(role_data, dict):
+                    role_title = role_data.get("title")
+                    if isinstance(role_title, str):
+                        try:
+                            role_id = int(role_id_str)
+                            professional_role_map[role_id] = role_title
+                        except (ValueError, TypeError) as exc:
+                            logger.debug(
+                                f"Не удалось распарсить role_id (ожидаемое поведение при некорректных данных от API): "
+                                f"role_id_str={role_id_str}, error={exc}"
+                            )
+
+    items: list[VacancyListItem] = []
+    for raw in raw_vacancies:
+        if not isinstance(raw, dict):
+            continue
+
+        # vacancyId во внутреннем API - число
+        vacancy_id = raw.get("vacancyId")
+        if not isinstance(vacancy_id, int):
+            continue
+
+        name = raw.get("name") or ""
+
+        # Компания
+        company_name = None
+        company = raw.get("company")
+        if isinstance(company, dict):
+            company_name = company.get("visibleName") or company.get("name") or None
+
+        # Публикация - берем из publicationTime
+        publication_time_iso = None
+        publication_time = raw.get("publicationTime")
+        if isinstance(publication_time, dict):
+            publication_time_iso = publication_time.get("$") or None
+
+        # Ссылка
+        alternate_url = None
+        links = raw.get("links")
+        if isinstance(links, dict):
+            alternate_url = links.get("desktop") or None
+
+        # Зарплата - структура compensation может быть разной
+        salary_from = None
+        salary_to = None
+        salary_currency = None
+        salary_gross = None
+        compensation = raw.get("compensation")
+        if isinstance(compensation, dict):
+            # Проверяем, есть ли noCompensation (зарплата не указана)
+            # noCompensation может быть пустым объектом {} - это означает, что зарплата не указана
+            has_no_compensation = "noCompensation" in compensation
+
+            # Если нет noCompensation, парсим зарплату
+            if not has_no_compensation:
+                # Пытаемся получить from/to
+                from_val = compensation.get("from")
+                if from_val is not None:
+                    try:
+                        if isinstance(from_val, (int, float)):
+                            salary_from = int(from_val)
+                        elif isinstance(from_val, str) and from_val.strip():
+                            salary_from = int(from_val)
+                    except (ValueError, TypeError) as exc:
+                        logger.debug(
+                            f"Не удалось распарсить salary_from (ожидаемое поведение при некорректных данных от API): "
+                            f"from_val={from_val}, error={exc}"
+                        )
+                        # salary_from остается None
+
+                to_val = compensation.get("to")
+                if to_val is not None:
+                    try:
+                        if isinstance(to_val, (int, float)):
+                            salary_to = int(to_val)
+                        elif isinstance(to_val, str) and to_val.strip():
+                            salary_to = int(to_val)
+                    except (ValueError, TypeError) as exc:
+                        logger.debug(
+                            f"Не удалось распарсить salary_to (ожидаемое поведение при некорректных данных от API): "
+                            f"to_val={to_val}, error={exc}"
+                        )
+                        # salary_to остается None
+
+                # Во внутреннем API используется currencyCode (не currency)
+                salary_currency = compensation.get("currencyCode")
+                if not salary_currency:
+                    salary_currency = compensation.get("currency")
+
+                # gross - булево значение (может отсутствовать)
+                gross_val = compensation.get("gross")
+                if isinstance(gross_val, bool):
+                    salary_gross = gross_val
+
+        # Регион
+        area_name = None
+        area = raw.get("area")
+        if isinstance(area, dict):
+            area_name = area.get("name") or None
+
+        # Адрес - может отсутствовать (например, только contactInfo: null)
+        address_city = None
+        address_street = None
+        address = raw.get("address")
+        if address is not None and isinstance(address, dict):
+            # city и street могут быть пустыми строками, проверяем на None
+            city_val = address.get("city")
+            if isinstance(city_val, str) and city_val:
+                address_city = city_val
+
+            street_val = address.get("street")
+            if isinstance(street_val, str) and street_val:
+                address_street = street_val
+
+        # График работы - из @workSchedule (например, "remote", "fullDay")
+        schedule_name = None
+        work_schedule_attr = raw.get("@workSchedule")
+        if isinstance(work_schedule_attr, str) and work_schedule_attr.strip():
+            # @workSchedule содержит коды типа "remote", "fullDay" и т.д.
+            schedule_name = work_schedule_attr
+        # Если нет @workSchedule, можно попробовать из workScheduleByDays
+        # но там коды типа "FIVE_ON_TWO_OFF", что менее читаемо
+        if not schedule_name:
+            work_schedule_by_days = raw.get("workScheduleByDays")
+            if isinstance(work_schedule_by_days, list) and work_schedule_by_days:
+                schedule_elem = work_schedule_by_days[0]
+                if isinstance(schedule_elem, dict):
+                    schedule_elements = schedule_elem.get("workScheduleByDaysElement")
+                    if isinstance(schedule_elements, list) and schedule_elements:
+                        first_elem = schedule_elements[0]
+                        if isinstance(first_elem, str) and first_elem:
+                            schedule_name = first_elem
+
+        # Профессиональные роли - из professionalRoleIds получаем ID, затем маппим на названия из справочника
+        professional_roles: list[str] = []
+        professional_role_ids_list = raw.get("professionalRoleIds")
+        if isinstance(professional_role_ids_list, list):
+            for role_item in professional_role_ids_list:
+                if isinstance(role_item, dict):
+                    role_id_list = role_item.get("professionalRoleId")
+                    if isinstance(role_id_list, list):
+                        for role_id in role_id_list:
+                            if isinstance(role_id, int):
+                                role_name = professional_role_map.get(role_id)
+                                if role_name and role_name not in professional_roles:
+                                    professional_roles.append(role_name)
+                            elif isinstance(role_id, str):
+                                try:
+                                    role_id_int = int(role_id)
+                                    role_name = professional_role_map.get(role_id_int)
+                                    if role_name and role_name not in professional_roles:
+                                        professional_roles.append(role_name)
+                                except (ValueError, TypeError):
+                                    pass
+
+        # Сниппеты требований/обязанностей
+        # Когда enable_snippets=true, в вакансии появляется поле snippet
+        snippet_requirement = None
+        snippet_responsibility = None
+        snippet = raw.get("snippet")
+        if isinstance(snippet, dict):
+            # req - требования (requirement)
+            req_val = snippet.get("req")
+            if isinstance(req_val, str) and req_val.strip():
+                snippet_requirement = req_val.strip()
+
+            # resp - обязанности (responsibility)
+            resp_val = snippet.get("resp")
+            if isinstance(resp_val, str) and resp_val.strip():
+                snippet_responsibility = resp_val.strip()
+
+        # responseLetterRequired - из атрибута @responseLetterRequired
+        response_letter_required = raw.get("@responseLetterRequired")
+        if not isinstance(response_letter_required, bool):
+            response_letter_required = None
+
+        # has_test - может быть userTestPresent
+        has_test = raw.get("userTestPresent")
+        if not isinstance(has_test, bool):
+            has_test = None
+
+        # Тип вакансии - во внутреннем API может быть в разных местах
+        # Например, в employmentForm или других полях
+        vacancy_type_name = None
+        employment_form = raw.get("employmentForm")
+        if isinstance(employment_form, str) and employment_form:
+            vacancy_type_name = employment_form
+        # Также можно взять из employment.@type
+        if not vacancy_type_name:
+            employment = raw.get("employment")
+            if isinstance(employment, dict):
+                emp_type = employment.get("@type")
+                if isinstance(emp_type, str) and emp_type:
+                    vacancy_type_name = emp_type
+
+        items.append(
+            VacancyListItem(
+                vacancy_id=vacancy_id,
+                name=name,
+                area_name=area_name,
+                publication_time_iso=publication_time_iso,
+                alternate_url=alternate_url,
+                company_name=company_name,
+                salary_from=salary_from,
+                salary_to=salary_to,
+                salary_currency=salary_currency,
+                salary_gross=salary_gross,
+                schedule_name=schedule_name,
+                snippet_requirement=snippet_requirement,
+                snippet_responsibility=snippet_responsibility,
+                vacancy_type_name=vacancy_type_name,
+                response_letter_required=response_letter_required,
+                has_test=has_test,
+                address_city=address_city,
+                address_street=address_street,
+                professional_roles=professional_roles if professional_roles else None,
+            )
+        )
+
+    return VacancyList(items=items)
@@ -0,0 +1,75 @@
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.filtered_vacancy_list import FilteredVacancyListDto
+from domain.entities.vacancy_list import VacancyListItem
+from domain.use_cases.get_filtered_vacancy_list_with_cache import (
+    GetFilteredVacancyListWithCacheUseCase,
+)
+
+
+class _MatchRepository:
+    def __init__(self):
+        self.rows = {}
+
+    async def get_batch_by_context_and_vacancy_hashes(self, context_hash, vacancy_hashes):
+        return {
+            vacancy_hash: self.rows[(context_hash, vacancy_hash)]
+            for vacancy_hash in vacancy_hashes
+            if (context_hash, vacancy_hash) in self.rows
+        }
+
+    async def create_batch(self, matches):
+        for match in matches:
+            self.rows.setdefault((match.context_hash, match.vacancy_hash), match)
+        return matches
+
+
+class _UnitOfWork:
+    def __init__(self, repository):
+        self.resume_to_vacancy_match_repository = repository
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def commit(self):
+        return None
+
+
+class _FilterService:
+    def __init__(self):
+        self.scored = []
+
+    def match_cache_version(self):
+        return "VacancyListFilterAgent:model:v1"
+
+    def plan_batches(self, vacancies, resume, user_filter_params=None, max_batch_size=50):
+        return [vacancies[i : i + max_batch_size] for i in range(0, len(vacancies), max_batch_size)]
+
+    async def filter_vacancy_list(self, vacancies, resume, user_filter_params=None, user_id=None):
+        self.scored.extend(v.vacancy_id for v in vacancies)
+        return [FilteredVacancyListDto(v.vacancy_id, 0.9, "ok") for v in vacancies]
+
+
+@pytest.mark.asyncio
+async def test_matches_are_shared_by_content_and_invalidated_by_edits():
+    repository = _MatchRepository()
+    service = _FilterService()
+    use_case = GetFilteredVacancyListWithCacheUseCase(
+        lambda: _UnitOfWork(repository), service, minimal_confidence=0.5
+    )
+    vacancies = [VacancyListItem(vacancy_id=1, name="Python"), VacancyListItem(vacancy_id=2, name="Go")]
+
+    first = await use_case.execute(vacancies, uuid4(), "Резюме", "удаленка")
+    # Другое резюме с тем же содержимым и требованиями не вызывает LLM
+    duplicate = await use_case.execute(vacancies, uuid4(), " Резюме ", "удаленка")
+    assert [v.vacancy_id for v in first] == [v.vacancy_id for v in duplicate] == [1, 2]
+    assert service.scored == [1, 2]
+
+    await use_case.execute(vacancies, uuid4(), "Резюме", "только офис")
+    await use_case.execute(vacancies[:1], uuid4(), "Резюме после правки", "удаленка")
+    assert service.scored == [1, 2, 1, 2, 1]
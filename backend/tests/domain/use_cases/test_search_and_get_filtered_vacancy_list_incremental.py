@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.filtered_vacancy_list import FilteredVacancyListItem
+from domain.entities.resume_filter_settings import ResumeFilterSettings
+from domain.entities.vacancy_list import VacancyList, VacancyListItem
+from domain.use_cases.search_and_get_filtered_vacancy_list import SearchAndGetFilteredVacancyListUseCase
+from infrastructure.cache.vacancy_discovery_watermark_store import InMemoryVacancyDiscoveryWatermarkStore
+
+
+def _item(vacancy_id, hour):
+    return VacancyListItem(
+        vacancy_id=vacancy_id,
+        name=f"v{vacancy_id}",
+        publication_time_iso=f"2024-05-01T{hour:02d}:00:00+0300",
+    )
+
+
+class _FakeFilteredListUseCase:
+    """Выдача по дате: страницы по 2 вакансии, фильтр пропускает все с confidence 1."""
+
+    def __init__(self, items):
+        self.items = items
+        self.pages = []
+        self.filtered = []
+
+    async def fetch(self, *, page, order_by, **_):
+        assert order_by == "publication_time"
+        self.pages.append(int(page))
+        start = int(page) * 2
+        return VacancyList(items=self.items[start : start + 2])
+
+    async def filter(self, *, vacancies, **_):
+        self.filtered.extend(v.vacancy_id for v in vacancies)
+        return [FilteredVacancyListItem.from_list_item(v, confidence=1.0) for v in vacancies]
+
+
+async def _run(uc, store, resume_id):
+    return await uc.execute_incremental(
+        user_resume="resume",
+        headers={},
+        cookies={},
+        settings=ResumeFilterSettings(resume_id=resume_id, text="python"),
+        max_pages=5,
+        search_session_id="s",
+        resume_id=resume_id,
+        watermarks=store,
+        wave_pages=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_second_cycle_fetches_only_until_seen_vacancies():
+    store = InMemoryVacancyDiscoveryWatermarkStore(full_rescan_seconds=60)
+    resume_id = uuid4()
+    fake = _FakeFilteredListUseCase([_item(i, 20 - i) for i in range(1, 7)])
+    uc = SearchAndGetFilteredVacancyListUseCase(fake)
+
+    first = await _run(uc, store, resume_id)
+    assert [v.vacancy_id for v in first] == [1, 2, 3, 4, 5, 6]
+
+    # Появились две новые вакансии: хватает одной страницы
+    fake.items = [_item(8, 23), _item(7, 22)] + fake.items
+    fake.pages.clear()
+    fake.filtered.clear()
+    second = await _run(uc, store, resume_id)
+
+    assert [v.vacancy_id for v in second] == [8, 7]
+    assert fake.pages == [0, 1]
+    assert fake.filtered == [8, 7]
+    watermark = await store.get(resume_id)
+    assert watermark.newest_publication_time_iso == "2024-05-01T23:00:00+0300"
+    assert watermark.seen_vacancy_ids[:3] == [8, 7, 1]
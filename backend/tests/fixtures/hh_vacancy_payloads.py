@@ -0,0 +1,51 @@
+"""Синтетические ответы HH для тестов и бенчмарков клиента вакансий."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def build_front_payload(vacancies: int = 50, roles: int = 600) -> Dict[str, Any]:
+    """Синтетический ответ /search/vacancy, повторяющий структуру реального."""
+    items = []
+    for i in range(vacancies):
+        items.append(
+            {
+                "vacancyId": 100_000_000 + i,
+                "name": f"Python разработчик {i}",
+                "company": {"id": i, "name": f"Компания {i}", "visibleName": f"Компания {i}"},
+                "publicationTime": {"@timestamp": 1760000000 + i, "$": "2025-10-10T10:00:00+0300"},
+                "links": {"desktop": f"https://hh.ru/vacancy/{100_000_000 + i}"},
+                "compensation": {"from": 150000 + i, "to": 250000, "currencyCode": "RUR", "gross": False},
+                "area": {"@id": 54, "name": "Красноярск", "path": ".113.1146.54."},
+                "address": {"city": "Красноярск", "street": "проспект Мира", "building": str(i)},
+                "@workSchedule": "remote",
+                "workScheduleByDays": [{"workScheduleByDaysElement": ["FIVE_ON_TWO_OFF"]}],
+                "professionalRoleIds": [{"professionalRoleId": [96, 104]}],
+                "snippet": {
+                    "req": "Опыт коммерческой разработки на <highlighttext>Python</highlighttext> от 3 лет. " * 3,
+                    "resp": "Разработка и поддержка backend сервисов, code review, участие в проектировании. " * 3,
+                },
+                "@responseLetterRequired": False,
+                "userTestPresent": i % 7 == 0,
+                "employmentForm": "FULL",
+                "employment": {"@type": "FULL"},
+                "userLabels": [],
+                "acceptTemporary": False,
+                "@showContact": True,
+                "contactInfo": None,
+                "metallic": "PLATINUM",
+            }
+        )
+    groups = {
+        str(role_id): {"id": str(role_id), "title": f"Профессиональная роль {role_id}", "count": role_id}
+        for role_id in range(roles)
+    }
+    return {
+        "vacancySearchResult": {"vacancies": items, "totalResults": 2000},
+        "vacancySearchDictionaries": {"professional_role": {"groups": groups}},
+        "searchClusters": [
+            {"name": f"cluster-{c}", "items": [{"name": f"item-{c}-{k}", "count": k} for k in range(50)]}
+            for c in range(20)
+        ],
+    }
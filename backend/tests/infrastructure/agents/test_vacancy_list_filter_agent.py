@@ -0,0 +1,74 @@
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from config import OpenAIConfig
+from domain.entities.vacancy_list import VacancyListItem
+from domain.exceptions.agent_exceptions import AgentParseError
+from infrastructure.agents.token_estimator import estimate_messages_tokens, estimate_text_tokens
+from infrastructure.agents.vacancy_list_filter_agent import VacancyListFilterAgent
+
+
+class _FakeCompletions:
+    """Оценивает все вакансии промпта; если среди них есть poison_id — отвечает не JSON."""
+
+    def __init__(self, poison_id=None):
+        self.poison_id = poison_id
+        self.batches = []
+
+    async def create(self, **kwargs):
+        ids = [int(value) for value in re.findall(r"- id=(\d+)", kwargs["messages"][-1]["content"])]
+        self.batches.append(ids)
+        if self.poison_id in ids:
+            content = "не могу оценить"
+        else:
+            content = json.dumps([{"vacancy_id": i, "confidence": 0.9, "reason": "ok"} for i in ids])
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def _agent(completions, config=None):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return VacancyListFilterAgent(config or OpenAIConfig(api_key="test"), client=client)
+
+
+def _vacancies(count):
+    return [VacancyListItem(vacancy_id=i, name=f"Вакансия {i}") for i in range(1, count + 1)]
+
+
+@pytest.mark.asyncio
+async def test_unparsed_batch_is_split_and_only_failing_half_is_retried():
+    completions = _FakeCompletions(poison_id=3)
+
+    result = await _agent(completions).filter_vacancy_list(_vacancies(4), "Резюме")
+
+    assert sorted(dto.vacancy_id for dto in result) == [1, 2, 4]
+    # Весь батч — один раз, затем половины; повторы только для одной вакансии
+    assert sorted(completions.batches) == [[1, 2], [1, 2, 3, 4], [3], [3], [3], [3, 4], [4]]
+
+
+@pytest.mark.asyncio
+async def test_single_unparsed_vacancy_raises_after_retries():
+    completions = _FakeCompletions(poison_id=1)
+
+    with pytest.raises(AgentParseError):
+        await _agent(completions).filter_vacancy_list(_vacancies(1), "Резюме")
+    assert len(completions.batches) == VacancyListFilterAgent.MAX_RETRIES
+
+
+def test_plan_batches_packs_by_prompt_tokens():
+    agent = _agent(_FakeCompletions())
+    vacancies = [
+        VacancyListItem(vacancy_id=i, name="Вакансия", snippet_requirement="Python " * 100)
+        for i in range(1, 11)
+    ]
+    base_tokens = estimate_messages_tokens(agent._build_messages([], "Резюме"))
+    vacancy_tokens = estimate_text_tokens("\n".join(agent._format_vacancy(vacancies[0])))
+    agent._config.filter_batch_max_prompt_tokens = base_tokens + 3 * vacancy_tokens
+
+    batches = agent.plan_batches(vacancies, "Резюме", max_batch_size=50)
+
+    assert [[v.vacancy_id for v in batch] for batch in batches] == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+    assert [len(batch) for batch in agent.plan_batches(vacancies, "Резюме", max_batch_size=2)] == [2] * 5
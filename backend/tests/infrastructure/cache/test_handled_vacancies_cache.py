@@ -0,0 +1,37 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.cache.handled_vacancies_cache import InMemoryHandledVacanciesCache
+
+
+class _FakeRepository:
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = 0
+
+    async def get_handled_vacancy_ids(self, resume_id):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return set(self.ids)
+
+
+@pytest.mark.asyncio
+async def test_single_query_per_resume_and_marks_are_kept():
+    repository = _FakeRepository({1, 2})
+    cache = InMemoryHandledVacanciesCache(repository, ttl_seconds=60)
+    resume_id = uuid4()
+
+    loading = asyncio.gather(*(cache.get_handled_ids(resume_id) for _ in range(3)))
+    await asyncio.sleep(0)
+    # Отклик сохранен, пока множество загружается из БД
+    cache.mark_handled(resume_id, 3)
+    results = await loading
+
+    assert repository.calls == 1
+    assert all(r == {1, 2, 3} for r in results)
+
+    cache.mark_handled(resume_id, 4)
+    assert await cache.get_handled_ids(resume_id) == {1, 2, 3, 4}
+    assert repository.calls == 1
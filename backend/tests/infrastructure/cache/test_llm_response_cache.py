@@ -0,0 +1,90 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from config import OpenAIConfig
+from infrastructure.agents.vacancy_test_agent import VacancyTestAgent
+from infrastructure.cache import llm_response_cache
+
+
+class _FakeCompletions:
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+class _FakeStore:
+    def __init__(self):
+        self.rows = {}
+        self.purges = 0
+
+    async def get_fresh(self, cache_key, max_age_seconds):
+        return self.rows.get(cache_key)
+
+    async def upsert(self, cache_key, agent_name, model, content):
+        self.rows[cache_key] = content
+
+    async def delete_expired(self, max_age_seconds):
+        self.purges += 1
+        return 0
+
+
+def _agent(config, completions):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return VacancyTestAgent(config, client=client)
+
+
+async def _call(agent):
+    return await agent._call_llm_with_retry(
+        messages=[{"role": "user", "content": "вопрос"}],
+        parse_func=json.loads,
+        response_format={"type": "json_object"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_prompt_is_served_from_cache_when_enabled(monkeypatch):
+    monkeypatch.setattr(llm_response_cache, "_LLM_RESPONSE_CACHE", None)
+    config = OpenAIConfig(api_key="key", response_cache_agents={"VacancyTestAgent": True})
+    completions = _FakeCompletions('{"answer": 1}')
+    agent = _agent(config, completions)
+
+    assert await _call(agent) == {"answer": 1}
+    assert await _call(agent) == {"answer": 1}
+    assert completions.calls == 1
+
+    other = _agent(OpenAIConfig(api_key="key"), completions)
+    await _call(other)
+    assert completions.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_persistent_store_is_consulted_after_memory():
+    store = _FakeStore()
+    key = llm_response_cache.llm_response_cache_key("m", [{"role": "user", "content": "x"}], 0.3, None)
+
+    await llm_response_cache.LlmResponseCache().set(key, "ответ", "Agent", "m", store)
+    # Новый процесс: память пуста, ответ находится в БД
+    restarted = llm_response_cache.LlmResponseCache()
+    assert await restarted.get(key, "Agent", store) == "ответ"
+    assert await restarted.get(key, "Agent") == "ответ"
+
+
+@pytest.mark.asyncio
+async def test_expired_rows_are_purged_at_most_once_per_interval():
+    store = _FakeStore()
+    cache = llm_response_cache.LlmResponseCache(purge_interval_seconds=3600.0)
+
+    await cache.set("a", "1", "Agent", "m", store)
+    await cache.set("b", "2", "Agent", "m", store)
+    assert store.purges == 1
+
+    cache._last_purge_at -= 3600.0
+    await cache.set("c", "3", "Agent", "m", store)
+    assert store.purges == 2
@@ -0,0 +1,74 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.resume import Resume
+from domain.entities.resume_context import ResumeContext
+from infrastructure.cache.resume_context_cache import InMemoryResumeContextCache
+
+
+def _loader(resume, calls, is_auto_reply=True):
+    async def load():
+        calls.append(resume.id)
+        await asyncio.sleep(0.01)
+        resume.is_auto_reply = is_auto_reply
+        return ResumeContext(resume=resume, responses_count=9, response_limit=10)
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_loads_once_and_counts_sent_replies():
+    cache = InMemoryResumeContextCache(ttl_seconds=60)
+    resume = Resume(id=uuid4(), user_id=uuid4(), content="text")
+    calls = []
+
+    contexts = await asyncio.gather(
+        *(cache.get_or_load(resume.id, _loader(resume, calls)) for _ in range(3))
+    )
+    assert len(calls) == 1
+    assert all(c is contexts[0] for c in contexts)
+    assert not contexts[0].limit_exhausted
+
+    cache.note_reply_sent(resume.user_id)
+    context = await cache.get_or_load(resume.id, _loader(resume, calls))
+    assert context.limit_exhausted
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_is_not_cached():
+    cache = InMemoryResumeContextCache(ttl_seconds=60)
+    resume = Resume(id=uuid4(), user_id=uuid4(), content="text")
+    calls = []
+
+    loading = asyncio.ensure_future(cache.get_or_load(resume.id, _loader(resume, calls)))
+    await asyncio.sleep(0.005)
+    # Автоотклик выключили, пока шла загрузка
+    cache.invalidate(resume.id)
+    await loading
+
+    context = await cache.get_or_load(resume.id, _loader(resume, calls, is_auto_reply=False))
+    assert len(calls) == 2
+    assert not context.is_auto_reply
+
+
+@pytest.mark.asyncio
+async def test_user_index_forgets_invalidated_and_evicted_resumes():
+    cache = InMemoryResumeContextCache(ttl_seconds=60)
+    user_id = uuid4()
+    first = Resume(id=uuid4(), user_id=user_id, content="text")
+    second = Resume(id=uuid4(), user_id=user_id, content="text")
+    calls = []
+    await cache.get_or_load(first.id, _loader(first, calls))
+    await cache.get_or_load(second.id, _loader(second, calls))
+
+    cache.invalidate(first.id)
+    assert cache._resumes_by_user == {user_id: {second.id}}
+
+    # Вытеснение по TTL замечается при следующем отклике пользователя
+    cache._cache.pop(second.id)
+    cache.note_reply_sent(user_id)
+    assert cache._resumes_by_user == {}
+    assert cache._user_by_resume == {}
@@ -0,0 +1,30 @@
+import time
+
+from infrastructure.cache.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries_and_counts_hits():
+    cache = TTLCache(ttl_seconds=0.05, max_size=10)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.hit_ratio == 0.5
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl_seconds=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from domain.entities.vacancy_detail import VacancyDetail
+from infrastructure.cache.vacancy_detail_cache import InMemoryVacancyDetailCache
+
+
+class _FakeStore:
+    def __init__(self):
+        self.rows = {}
+        self.purges = 0
+
+    async def get_fresh(self, vacancy_id, max_age_seconds):
+        return self.rows.get(vacancy_id)
+
+    async def upsert(self, detail):
+        self.rows[detail.vacancy_id] = detail
+
+    async def delete_expired(self, max_age_seconds):
+        self.purges += 1
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_single_fetch():
+    cache = InMemoryVacancyDetailCache(ttl_seconds=60, max_entries=10)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return VacancyDetail(vacancy_id=1, name="Python developer")
+
+    results = await asyncio.gather(*(cache.get_or_fetch(1, fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r.name == "Python developer" for r in results)
+    assert len({id(r) for r in results}) == 5
+
+    await cache.get_or_fetch(1, fetch)
+    assert calls == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached():
+    cache = InMemoryVacancyDetailCache(ttl_seconds=60, max_entries=10)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return None
+
+    assert await cache.get_or_fetch(2, fetch) is None
+    assert await cache.get_or_fetch(2, fetch) is None
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_rows_are_purged_at_most_once_per_interval():
+    store = _FakeStore()
+    cache = InMemoryVacancyDetailCache(ttl_seconds=60, max_entries=10, store=store)
+
+    async def fetch(vacancy_id):
+        return VacancyDetail(vacancy_id=vacancy_id, name="Python developer")
+
+    await cache.get_or_fetch(1, lambda: fetch(1))
+    await cache.get_or_fetch(2, lambda: fetch(2))
+    assert store.purges == 1
+    assert set(store.rows) == {1, 2}
+
+    cache._last_purge_at -= 3600.0
+    await cache.get_or_fetch(3, lambda: fetch(3))
+    assert store.purges == 2
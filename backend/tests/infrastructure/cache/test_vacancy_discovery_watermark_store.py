@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.vacancy_discovery_watermark import VacancyDiscoveryWatermark
+from infrastructure.cache import ttl_cache
+from infrastructure.cache.vacancy_discovery_watermark_store import InMemoryVacancyDiscoveryWatermarkStore
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_get_returns_copies_of_stored_watermark():
+    store = InMemoryVacancyDiscoveryWatermarkStore(full_rescan_seconds=60)
+    resume_id = uuid4()
+    assert await store.get(resume_id) is None
+
+    watermark = VacancyDiscoveryWatermark("2024-05-01T10:00:00+0300", [3, 2])
+    await store.set(resume_id, watermark)
+    watermark.seen_vacancy_ids.append(1)
+
+    stored = await store.get(resume_id)
+    assert stored == VacancyDiscoveryWatermark("2024-05-01T10:00:00+0300", [3, 2])
+    stored.seen_vacancy_ids.clear()
+    assert (await store.get(resume_id)).seen_vacancy_ids == [3, 2]
+
+
+@pytest.mark.asyncio
+async def test_updates_keep_ttl_of_first_full_scan(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=clock))
+    store = InMemoryVacancyDiscoveryWatermarkStore(full_rescan_seconds=60)
+    resume_id = uuid4()
+
+    await store.set(resume_id, VacancyDiscoveryWatermark("2024-05-01T10:00:00+0300", [1]))
+    clock.now += 50
+    await store.set(resume_id, VacancyDiscoveryWatermark("2024-05-01T11:00:00+0300", [2, 1]))
+    assert (await store.get(resume_id)).seen_vacancy_ids == [2, 1]
+
+    # Обновление границы не продлевает TTL: через 60 секунд от первой записи — полный просмотр
+    clock.now += 11
+    assert await store.get(resume_id) is None
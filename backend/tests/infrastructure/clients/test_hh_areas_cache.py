@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from infrastructure.clients.hh_areas_cache import HHAreasCache, build_areas_index
+
+AREAS = [
+    {
+        "id": "113",
+        "name": "Россия",
+        "areas": [
+            {"id": "1146", "name": "Красноярский край", "areas": [{"id": "54", "name": "Красноярск", "areas": []}]},
+        ],
+    },
+    {"id": "40", "name": "Казахстан", "areas": []},
+]
+
+
+def test_build_areas_index_flattens_tree_with_parents_and_paths():
+    index = build_areas_index(AREAS)
+
+    assert set(index) == {"113", "1146", "54", "40"}
+    city = index["54"]
+    assert city.name == "Красноярск"
+    assert city.parent_id == "1146"
+    assert city.path == ["Россия", "Красноярский край"]
+    assert city.has_children is False
+    assert index["113"].parent_id is None
+    assert index["113"].has_children is True
+
+
+@pytest.mark.asyncio
+async def test_areas_cache_is_restored_from_disk(tmp_path):
+    cache_path = tmp_path / "areas.json"
+    first = HHAreasCache(cache_path=str(cache_path))
+    first._etag = '"abc"'
+    first._validated_at = 4102444800.0  # далекое будущее: ревалидация не нужна
+    first._save_to_disk(json.dumps(AREAS).encode())
+
+    second = HHAreasCache(cache_path=str(cache_path))
+    area = await second.get_area("1146")
+
+    assert area is not None and area.name == "Красноярский край"
+    assert await second.get_tree() == AREAS
+    assert second._etag == '"abc"'
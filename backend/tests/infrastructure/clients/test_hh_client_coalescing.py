@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from domain.entities.vacancy_detail import VacancyDetail
+from infrastructure.clients.hh_client_coalescing import CoalescingHHClient, HHRequestCoalescer
+
+
+class _FakeHHClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch_vacancy_detail(self, vacancy_id, headers, cookies, *, return_cookies=False):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return VacancyDetail(vacancy_id=vacancy_id, name="Backend"), {"hhtoken": cookies["hhtoken"], "fresh": "1"}
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_reads_are_coalesced_per_session():
+    inner = _FakeHHClient()
+    coalescer = HHRequestCoalescer()
+    client = CoalescingHHClient(inner, coalescer)
+    alice = {"hhtoken": "alice"}
+    bob = {"hhtoken": "bob"}
+
+    results = await asyncio.gather(
+        client.fetch_vacancy_detail(1, {}, alice),
+        client.fetch_vacancy_detail(1, {}, alice, return_cookies=True),
+        client.fetch_vacancy_detail(1, {}, alice),
+        client.fetch_vacancy_detail(1, {}, bob),
+    )
+
+    assert inner.calls == 2
+    assert results[0].name == "Backend"
+    detail, cookies = results[1]
+    assert detail.vacancy_id == 1 and cookies["fresh"] == "1"
+    stats = coalescer.stats()["fetch_vacancy_detail"]
+    assert (stats.calls, stats.coalesced) == (2, 2)
+
+    await client.fetch_vacancy_detail(1, {}, alice)
+    assert inner.calls == 3
@@ -0,0 +1,54 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from infrastructure.clients.hh_base_mixin import HHBaseMixin
+from infrastructure.clients.hh_connection_pool import HHConnectionPool
+
+
+class _EchoCookieHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "server=1")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def echo_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoCookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_connection_and_isolates_cookies(echo_server, monkeypatch):
+    pool = HHConnectionPool()
+    monkeypatch.setattr(
+        "infrastructure.clients.hh_base_mixin.get_hh_connection_pool", lambda: pool
+    )
+    client = HHBaseMixin()
+
+    bodies = []
+    for user in ("alice", "bob"):
+        async with client._create_client(cookies={"user": user}) as http:
+            resp = await http.get(echo_server)
+            bodies.append(resp.text)
+            assert HHBaseMixin._extract_cookies(http) == {"user": user, "server": "1"}
+
+    assert bodies == ["user=alice", "user=bob"]
+    stats = pool.stats
+    assert stats.requests == 2
+    assert stats.connections_opened == 1
+    assert stats.pool_hits == 1
+    await pool.aclose()
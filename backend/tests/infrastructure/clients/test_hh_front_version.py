@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from infrastructure.clients import hh_front_version
+from infrastructure.clients.hh_front_version import (
+    DEFAULT_HH_FRONT_BUILD_VERSION,
+    HHFrontBuildVersionRefresher,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _serve(monkeypatch, handler):
+    """Подменяет пул соединений HH транспортом, отвечающим handler."""
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    pool = SimpleNamespace(transport=httpx.MockTransport(record))
+    monkeypatch.setattr(hh_front_version, "get_hh_connection_pool", lambda: pool)
+    return requests
+
+
+def _page(build):
+    return httpx.Response(200, text=f'<script>window.globalVars = {{build: "{build}", lang: "RU"}}</script>')
+
+
+@pytest.mark.asyncio
+async def test_refresh_parses_build_version_from_search_page(monkeypatch):
+    requests = _serve(monkeypatch, lambda request: _page("26.3.1"))
+    refresher = HHFrontBuildVersionRefresher()
+
+    assert await refresher.refresh() == "26.3.1"
+    assert refresher.get() == "26.3.1"
+    assert not refresher.is_stale
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_serves_cached_value_and_refreshes_in_background_after_ttl(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(hh_front_version, "time", SimpleNamespace(monotonic=clock))
+    builds = iter(["26.3.1", "26.4.0"])
+    requests = _serve(monkeypatch, lambda request: _page(next(builds)))
+    refresher = HHFrontBuildVersionRefresher(ttl_seconds=60)
+    await refresher.refresh()
+
+    clock.now += 30
+    assert refresher.get() == "26.3.1"
+    assert len(requests) == 1
+
+    # После TTL отдается прежнее значение, а обновление идет фоном
+    clock.now += 31
+    assert refresher.get() == "26.3.1"
+    await refresher._refresh_task
+    assert refresher.get() == "26.4.0"
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_keeps_previous_value_until_next_ttl(monkeypatch):
+    requests = _serve(monkeypatch, lambda request: httpx.Response(503))
+    refresher = HHFrontBuildVersionRefresher()
+
+    assert await refresher.refresh() == DEFAULT_HH_FRONT_BUILD_VERSION
+    # Ошибка не повторяется на каждом запросе
+    assert not refresher.is_stale
+    refresher.get()
+    await asyncio.sleep(0)
+    assert len(requests) == 1
+
+    _serve(monkeypatch, lambda request: httpx.Response(200, text="<html>без версии</html>"))
+    refresher._value = "26.3.1"
+    assert await refresher.refresh() == "26.3.1"
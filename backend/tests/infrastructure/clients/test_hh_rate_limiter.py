@@ -0,0 +1,68 @@
+import time
+
+import httpx
+import pytest
+
+from infrastructure.clients.hh_rate_limiter import HHRateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=20.0, burst=2)
+
+    assert await bucket.acquire() == 0.0
+    assert await bucket.acquire() == 0.0
+    started = time.monotonic()
+    waited = await bucket.acquire()
+
+    assert waited == pytest.approx(0.05, abs=0.02)
+    assert time.monotonic() - started >= 0.04
+    assert bucket.stats.acquired == 3
+    assert bucket.stats.waited == 1
+
+
+@pytest.mark.asyncio
+async def test_user_buckets_are_independent():
+    limiter = HHRateLimiter(user_rate=1.0, user_burst=1, host_rate=100.0, host_burst=100)
+    url = "https://krasnoyarsk.hh.ru/search/vacancy"
+
+    assert await limiter.acquire(url, {"hhtoken": "alice"}) == 0.0
+    assert await limiter.acquire(url, {"hhtoken": "bob"}) == 0.0
+
+    stats = limiter.stats()
+    assert stats["host:krasnoyarsk.hh.ru"].acquired == 2
+    assert len([key for key in stats if key.startswith("user:")]) == 2
+
+
+def test_session_key_does_not_expose_cookie_value():
+    key = HHRateLimiter.session_key({"hhtoken": "secret-token"})
+
+    assert "secret" not in key
+    assert key == HHRateLimiter.session_key({"hhtoken": "secret-token", "_xsrf": "x"})
+    assert HHRateLimiter.session_key({}) == "anonymous"
+
+
+@pytest.mark.asyncio
+async def test_observe_response_backs_off_and_recovers():
+    limiter = HHRateLimiter(user_rate=10.0, user_burst=1, host_rate=10.0, host_burst=1)
+    request = httpx.Request(
+        "GET", "https://api.hh.ru/vacancies", headers={"cookie": "hhtoken=alice; _xsrf=1"}
+    )
+    user_key = HHRateLimiter.session_key({"hhtoken": "alice"})
+
+    await limiter.observe_response(
+        httpx.Response(429, headers={"Retry-After": "0.2"}, request=request)
+    )
+    stats = limiter.stats()
+    assert stats[f"user:{user_key}"].rate_factor == 0.5
+    assert stats["host:api.hh.ru"].backoffs == 1
+    assert await limiter.acquire("https://api.hh.ru/vacancies", {"hhtoken": "alice"}) >= 0.15
+
+    await limiter.observe_response(
+        httpx.Response(403, content=b'{"error": "captcha_required"}', request=request)
+    )
+    assert limiter.stats()[f"user:{user_key}"].rate_factor == 0.25
+    assert limiter.stats()["host:api.hh.ru"].backoffs == 1
+
+    await limiter.observe_response(httpx.Response(200, request=request))
+    assert limiter.stats()[f"user:{user_key}"].rate_factor == pytest.approx(0.3)
@@ -0,0 +1,27 @@
+import json
+
+from infrastructure.clients import hh_json
+from infrastructure.clients.hh_vacancy_client import HHVacancyClient
+from tests.fixtures.hh_vacancy_payloads import build_front_payload
+
+
+def test_front_mapping_is_same_for_stdlib_and_fast_decoder():
+    content = json.dumps(build_front_payload(vacancies=5, roles=200), ensure_ascii=False).encode()
+
+    expected = HHVacancyClient._map_front_vacancy_list(json.loads(content))
+    actual = HHVacancyClient._map_front_vacancy_list(hh_json.loads(content))
+
+    assert actual == expected
+    assert len(actual.items) == 5
+    first = actual.items[0]
+    assert first.company_name == "Компания 0"
+    assert first.salary_from == 150000
+    assert first.professional_roles == ["Профессиональная роль 96", "Профессиональная роль 104"]
+
+
+def test_front_mapping_skips_unknown_roles():
+    payload = build_front_payload(vacancies=1, roles=10)
+
+    items = HHVacancyClient._map_front_vacancy_list(payload).items
+
+    assert items[0].professional_roles is None
@@ -0,0 +1,70 @@
+import pytest
+
+from infrastructure.clients.hh_vacancy_test_parser import VacancyTestParser, slice_element
+
+PAGE_TEMPLATE = """
+<html><body>
+<div class="header"><div>Отклик на вакансию</div></div>
+<div data-qa="test-description"><div>Ответьте, <b>пожалуйста</b>, на вопросы</div></div>
+<form id="RESPONSE_MODAL_FORM_ID" method="post">
+  <input type="hidden" name="uidPk" value="111">
+  <input type="hidden" name="guid" value="{guid}">
+  <input type="hidden" name="startTime" value="1700000000">
+  <input type="hidden" name="testRequired" value="true">
+  <div data-qa="task-body">
+    <div data-qa="task-question">Сколько лет опыта с Python?</div>
+    <textarea name="task_100_text"></textarea>
+  </div>
+  <div data-qa="task-body">
+    <div data-qa="task-question">Готовы к переезду?</div>
+    <label><input type="radio" name="task_200" value="201"><span data-qa="cell-text-content">Да</span></label>
+    <label><input type="radio" name="task_200" value="202"><span data-qa="cell-text-content">Нет</span></label>
+  </div>
+  <div data-qa="task-body">
+    <div data-qa="task-question">Какие СУБД знаете?</div>
+    <label><input type="checkbox" name="task_300" value="301"><span data-qa="cell-text-content">PostgreSQL</span></label>
+    <label><input type="checkbox" name="task_300" value="302"><span data-qa="cell-text-content">MySQL</span></label>
+  </div>
+</form>
+<div class="footer"></div>
+</body></html>
+"""
+
+
+def test_slice_element_handles_nested_tags():
+    page = PAGE_TEMPLATE.format(guid="g")
+
+    fragment = slice_element(page, 'data-qa="test-description"', "div")
+
+    assert fragment == '<div data-qa="test-description"><div>Ответьте, <b>пожалуйста</b>, на вопросы</div></div>'
+    assert slice_element(page, 'id="missing"', "div") is None
+
+
+@pytest.mark.asyncio
+async def test_parser_extracts_questions_and_session_fields():
+    parser = VacancyTestParser()
+
+    test = await parser.parse(1, PAGE_TEMPLATE.format(guid="first"))
+
+    assert test is not None
+    assert (test.uid_pk, test.guid, test.start_time, test.test_required) == ("111", "first", "1700000000", True)
+    assert test.description == "Ответьте,пожалуйста, на вопросы"
+    assert [(q.task_id, q.question_type) for q in test.questions] == [
+        ("100", "text"),
+        ("200", "select"),
+        ("300", "multiselect"),
+    ]
+    assert [o.text for o in test.questions[2].options] == ["PostgreSQL", "MySQL"]
+
+
+@pytest.mark.asyncio
+async def test_parser_reuses_cached_questions_but_reads_fresh_session_fields():
+    parser = VacancyTestParser()
+    await parser.parse(1, PAGE_TEMPLATE.format(guid="first"))
+
+    second = await parser.parse(1, PAGE_TEMPLATE.format(guid="second"))
+
+    assert second.guid == "second"
+    assert len(second.questions) == 3
+    assert parser._cache.stats.hits == 1
+    assert await parser.parse(2, "<html><body>нет теста</body></html>") is None
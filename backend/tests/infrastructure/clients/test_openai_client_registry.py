@@ -0,0 +1,33 @@
+import pytest
+
+from config import OpenAIConfig
+from infrastructure.agents.vacancy_list_filter_agent import VacancyListFilterAgent
+from infrastructure.agents.vacancy_test_agent import VacancyTestAgent
+from infrastructure.clients import openai_client_registry
+from infrastructure.clients.openai_client_registry import (
+    OpenAIClientRegistry,
+    close_openai_client_registry,
+)
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_client_per_base_url_and_key():
+    registry = OpenAIClientRegistry(max_connections=5)
+    client = registry.get_client("http://llm/v1", "key")
+
+    assert registry.get_client("http://llm/v1", "key") is client
+    assert registry.get_client("http://llm/v1", "other") is not client
+    assert client._client is registry.get_http_client("http://llm/v1", "key")
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_agents_use_process_wide_client(monkeypatch):
+    monkeypatch.setattr(openai_client_registry, "_REGISTRY", None)
+    config = OpenAIConfig(base_url="http://llm/v1", api_key="key")
+
+    filter_agent = VacancyListFilterAgent(config)
+    test_agent = VacancyTestAgent(config)
+
+    assert filter_agent._client is test_agent._client
+    await close_openai_client_registry()
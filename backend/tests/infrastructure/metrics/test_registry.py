@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from infrastructure.metrics.registry import MetricsRegistry, _Metric, set_metrics_worker
+
+
+@pytest.mark.asyncio
+async def test_histogram_renders_cumulative_buckets_labelled_by_worker():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "Stage duration", ("stage",), buckets=(0.1, 1.0))
+
+    async def worker_task():
+        set_metrics_worker("auto_reply")
+        histogram.observe(0.05, stage="hh_search_page")
+        histogram.observe(0.5, stage="hh_search_page")
+
+    await asyncio.create_task(worker_task())
+    histogram.observe(2.0, stage="hh_respond")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE stage_seconds histogram" in lines
+    assert 'stage_seconds_bucket{worker="auto_reply",stage="hh_search_page",le="0.1"} 1' in lines
+    assert 'stage_seconds_bucket{worker="auto_reply",stage="hh_search_page",le="+Inf"} 2' in lines
+    assert 'stage_seconds_sum{worker="auto_reply",stage="hh_search_page"} 0.55' in lines
+    assert 'stage_seconds_count{worker="api",stage="hh_respond"} 1' in lines
+
+
+def test_gauge_callback_is_evaluated_on_render():
+    registry = MetricsRegistry()
+    jobs = {"queued": 3}
+    registry.gauge("queue_jobs", "Jobs", ("state",)).set_function(
+        lambda: {(state,): count for state, count in jobs.items()}
+    )
+    jobs["queued"] = 5
+
+    assert 'queue_jobs{worker="api",state="queued"} 5' in registry.render().splitlines()
+
+
+def test_metric_without_render_cannot_be_created():
+    class _Broken(_Metric):
+        TYPE = "untyped"
+
+    with pytest.raises(TypeError):
+        _Broken("broken", "No render", ())
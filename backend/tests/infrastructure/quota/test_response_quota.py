@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.subscription_plan import SubscriptionPlan
+from domain.entities.user_subscription import UserSubscription
+from domain.exceptions.subscription_limit_exceeded import SubscriptionLimitExceededError
+from infrastructure.quota.response_quota import LeasedResponseQuota
+
+
+class _FakeSubscriptions:
+    def __init__(self, subscription):
+        self.subscription = subscription
+        self.reserve_calls = 0
+
+    async def get_by_user_id(self, user_id):
+        return self.subscription
+
+    async def reserve_responses(self, user_id, limit, count=1):
+        self.reserve_calls += 1
+        await asyncio.sleep(0)
+        granted = max(0, min(count, limit - self.subscription.responses_count))
+        self.subscription.responses_count += granted
+        return granted
+
+    async def release_responses(self, user_id, count):
+        self.subscription.responses_count = max(0, self.subscription.responses_count - count)
+
+
+class _FakePlans:
+    def __init__(self, plan):
+        self.plan = plan
+
+    async def get_by_id(self, plan_id):
+        return self.plan
+
+
+class _FakeUnitOfWork:
+    def __init__(self, subscriptions, plans):
+        self.user_subscription_repository = subscriptions
+        self.subscription_plan_repository = plans
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_leased_tokens_never_exceed_limit_and_unused_are_returned():
+    user_id = uuid4()
+    plan = SubscriptionPlan(
+        id=uuid4(), name="PRO", response_limit=4, reset_period_seconds=86400,
+        duration_days=30, price=Decimal("0"),
+    )
+    subscriptions = _FakeSubscriptions(UserSubscription(
+        user_id=user_id,
+        subscription_plan_id=plan.id,
+        responses_count=0,
+        period_started_at=datetime.now(timezone.utc),
+        started_at=datetime.now(timezone.utc),
+    ))
+    quota = LeasedResponseQuota(
+        lambda: _FakeUnitOfWork(subscriptions, _FakePlans(plan)), lease_size=3
+    )
+
+    results = await asyncio.gather(
+        *(quota.acquire(user_id) for _ in range(5)), return_exceptions=True
+    )
+
+    assert results.count(True) == 4
+    assert sum(isinstance(r, SubscriptionLimitExceededError) for r in results) == 1
+    assert subscriptions.subscription.responses_count == 4
+    # Пачки по 3: второй запрос получил только оставшийся 1 токен, третий — 0
+    assert subscriptions.reserve_calls == 3
+
+    # Неотправленный отклик возвращает квоту, close() отдает ее в БД
+    await quota.refund(user_id)
+    await quota.close()
+    assert subscriptions.subscription.responses_count == 3
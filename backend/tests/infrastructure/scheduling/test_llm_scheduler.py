@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from infrastructure.scheduling.llm_scheduler import LlmPriority, LlmScheduler
+
+
+async def _hold(scheduler, priority, order, release):
+    async with scheduler.slot("model", 100, priority):
+        order.append(priority)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_waiting_calls_start_in_priority_order():
+    scheduler = LlmScheduler(max_concurrency=1, interactive_reserved_slots=0)
+    order, release = [], asyncio.Event()
+    first = asyncio.create_task(_hold(scheduler, LlmPriority.BACKGROUND, order, release))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(_hold(scheduler, priority, order, release))
+        for priority in (LlmPriority.BACKGROUND, LlmPriority.CHAT, LlmPriority.INTERACTIVE)
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.waiting_by_model()[("model", "background")] == 1
+
+    release.set()
+    await asyncio.gather(first, *waiting)
+    assert order == [
+        LlmPriority.BACKGROUND,
+        LlmPriority.INTERACTIVE,
+        LlmPriority.CHAT,
+        LlmPriority.BACKGROUND,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_background_load_leaves_reserved_slot_for_interactive():
+    scheduler = LlmScheduler(max_concurrency=2, interactive_reserved_slots=1)
+    order, release = [], asyncio.Event()
+    tasks = [
+        asyncio.create_task(_hold(scheduler, LlmPriority.BACKGROUND, order, release))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(_hold(scheduler, LlmPriority.INTERACTIVE, order, release))
+    await asyncio.sleep(0)
+
+    assert order == [LlmPriority.BACKGROUND, LlmPriority.INTERACTIVE]
+    release.set()
+    await asyncio.gather(interactive, *tasks)
+
+
+@pytest.mark.asyncio
+async def test_token_budget_delays_call_until_refill():
+    # 6000 токенов в минуту = 100 в секунду
+    scheduler = LlmScheduler(tokens_per_minute=6000)
+    async with scheduler.slot("model", 6000, LlmPriority.INTERACTIVE) as lease:
+        lease.used_tokens = 5990
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with scheduler.slot("model", 20, LlmPriority.INTERACTIVE):
+        pass
+    assert 0.05 <= loop.time() - started < 1.0
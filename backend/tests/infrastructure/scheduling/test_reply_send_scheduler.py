@@ -0,0 +1,57 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.scheduling.reply_send_scheduler import ReplySendScheduler
+
+
+def _job(order, name, delay=0.0):
+    async def run():
+        order.append(name)
+        await asyncio.sleep(delay)
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_by_confidence_with_global_cap_and_user_pacing():
+    scheduler = ReplySendScheduler(max_concurrency=1, user_interval_seconds=0.05)
+    alice, bob = uuid4(), uuid4()
+    resume_a, resume_b = uuid4(), uuid4()
+    order = []
+
+    futures = [
+        scheduler.submit(user_id=alice, resume_id=resume_a, vacancy_id=1, confidence=0.5, run=_job(order, "a1")),
+        scheduler.submit(user_id=alice, resume_id=resume_a, vacancy_id=2, confidence=0.9, run=_job(order, "a2")),
+        scheduler.submit(user_id=bob, resume_id=resume_b, vacancy_id=3, confidence=0.7, run=_job(order, "b1")),
+    ]
+    await asyncio.gather(*futures)
+
+    # a1 уже запущен при постановке; затем bob, так как alice ждет паузу
+    assert order == ["a1", "b1", "a2"]
+    stats = scheduler.stats()
+    assert (stats.queued, stats.running, stats.completed) == (0, 0, 3)
+
+
+@pytest.mark.asyncio
+async def test_cancel_resume_drops_pending_jobs_and_failures_reach_caller():
+    scheduler = ReplySendScheduler(max_concurrency=2, user_interval_seconds=10.0)
+    user, resume = uuid4(), uuid4()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    first = scheduler.submit(user_id=user, resume_id=resume, vacancy_id=1, confidence=0.9, run=fail)
+    rest = [
+        scheduler.submit(user_id=user, resume_id=resume, vacancy_id=i, confidence=0.5, run=_job([], i))
+        for i in range(2, 5)
+    ]
+
+    with pytest.raises(RuntimeError):
+        await first
+    assert scheduler.cancel_resume(resume) == 3
+    assert all(f.cancelled() for f in rest)
+    await asyncio.sleep(0)  # done-колбэки future
+    stats = scheduler.stats()
+    assert (stats.queued, stats.failed, stats.cancelled) == (0, 1, 3)
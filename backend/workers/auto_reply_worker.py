@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import multiprocessing
+import os
 import signal
+import socket
 import sys
+import time
 from pathlib import Path
-from typing import Dict
-from uuid import UUID
+from typing import Dict, List
+from uuid import UUID, uuid4
 
 from loguru import logger
 
@@ -24,7 +29,31 @@ from domain.use_cases.respond_to_vacancy_and_save import RespondToVacancyAndSave
 from infrastructure.agents.cover_letter_generator_agent import CoverLetterGeneratorAgent
 from infrastructure.agents.vacancy_test_agent import VacancyTestAgent
 from infrastructure.clients.hh_client import RateLimitedHHHttpClient
-from application.factories.database_factory import create_unit_of_work
+from infrastructure.clients.hh_client_coalescing import CoalescingHHClient
+from infrastructure.clients.hh_connection_pool import (
+    close_hh_connection_pool,
+    configure_hh_connection_pool,
+)
+from infrastructure.clients.hh_front_version import get_hh_front_build_version_refresher
+from infrastructure.clients.hh_rate_limiter import configure_hh_rate_limiter
+from infrastructure.clients.openai_client_registry import (
+    close_openai_client_registry,
+    configure_openai_client_registry,
+)
+from infrastructure.cache.resume_context_cache import get_resume_context_cache
+from infrastructure.cache.vacancy_discovery_watermark_store import get_vacancy_discovery_watermark_store
+from infrastructure.metrics.http_exporter import start_metrics_server
+from infrastructure.metrics.pipeline_metrics import ACTIVE_RESUME_TASKS
+from infrastructure.metrics.registry import set_metrics_worker
+from infrastructure.quota.response_quota import configure_response_quota
+from infrastructure.scheduling.llm_scheduler import LlmPriority, set_llm_priority
+from infrastructure.scheduling.reply_send_scheduler import configure_reply_send_scheduler
+from application.factories.database_factory import (
+    create_auto_reply_change_feed,
+    create_handled_vacancies_cache,
+    create_resume_lease_repository,
+    create_unit_of_work,
+)
 from application.factories.event_factory import create_event_publisher
 from application.factories.search_and_get_filtered_vacancy_list_factory import (
     create_search_and_get_filtered_vacancy_list_usecase,
@@ -46,6 +75,23 @@ shutdown_event = asyncio.Event()
 _sigint_count = 0
 
 
+async def _wait_for_wake(
+    shutdown_event: asyncio.Event,
+    wake_event: asyncio.Event,
+    timeout: float,
+) -> None:
+    """Ждать остановки, сигнала пробуждения или истечения timeout."""
+    waiters = [
+        asyncio.create_task(shutdown_event.wait()),
+        asyncio.create_task(wake_event.wait()),
+    ]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
 def setup_signal_handlers(loop: asyncio.AbstractEventLoop, shutdown_event: asyncio.Event) -> None:
     """Настройка обработчиков сигналов для корректного завершения."""
     global _sigint_count
@@ -91,11 +137,27 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
         shutdown_event = globals()["shutdown_event"]
     
     logger.info("Запуск воркера автооткликов")
+    # Метрики, записанные в задачах воркера, получают метку worker="auto_reply",
+    # а вызовы LLM идут с фоновым приоритетом
+    set_metrics_worker("auto_reply")
+    set_llm_priority(LlmPriority.BACKGROUND)
 
     # Создаем зависимости, которые не требуют UnitOfWork
-    hh_client = RateLimitedHHHttpClient(base_url=config.hh.base_url)
+    hh_client = CoalescingHHClient(RateLimitedHHHttpClient(base_url=config.hh.base_url))
     respond_to_vacancy_uc = RespondToVacancyUseCase(hh_client)
     event_publisher = create_event_publisher(config)
+    # Общая очередь откликов всех резюме: приоритет по confidence, паузы по пользователю
+    reply_scheduler = configure_reply_send_scheduler(config.hh)
+    # Границы просмотренной выдачи: цикл запрашивает только новые страницы
+    discovery_watermarks = get_vacancy_discovery_watermark_store(config.hh)
+    # Вакансии с прежними откликами отсеиваются до LLM-фильтрации и очереди
+    handled_vacancies = create_handled_vacancies_cache(config)
+    # Состояние резюме для проверок перед каждым откликом (сбрасывается по уведомлениям из БД)
+    resume_contexts = get_resume_context_cache(config.hh)
+    # Лимит откликов занимается атомарно до отправки (при lease_size > 1 — пачками)
+    response_quota = configure_response_quota(
+        config.hh, lambda: create_unit_of_work(config.database)
+    )
 
     # Фабрика для создания use case с unit_of_work (будет создаваться внутри контекста)
     def create_search_and_get_filtered_vacancy_list_usecase_with_uow(uow):
@@ -104,6 +166,65 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
     # Словарь для отслеживания активных задач по resume_id
     active_tasks: Dict[UUID, asyncio.Task] = {}
 
+    # Резюме делятся между процессами через аренду в БД: процесс обрабатывает
+    # только захваченные им резюме и продлевает аренду, пока обработка идет
+    owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+    lease_repository = create_resume_lease_repository(config.database)
+    lease_seconds = config.worker.auto_reply_lease_seconds
+    max_resumes = config.worker.auto_reply_max_resumes
+    logger.info(f"Владелец аренды резюме: {owner}, не более {max_resumes} резюме")
+
+    # Цикл просыпается по уведомлениям из БД (включение автооткликов, смена фильтров)
+    # и по завершении задач; полная сверка — раз в reconcile_seconds
+    wake_event = asyncio.Event()
+    change_feed = (
+        create_auto_reply_change_feed(config.database)
+        if config.worker.auto_reply_change_feed
+        else None
+    )
+    reconcile_seconds = config.worker.auto_reply_reconcile_seconds
+    resume_cooldown_seconds = config.worker.auto_reply_resume_cooldown_seconds
+
+    def on_auto_reply_change(resume_id: UUID | None) -> None:
+        if resume_id is not None:
+            logger.debug(f"Изменены настройки автооткликов резюме {resume_id}")
+        # None: уведомления могли быть потеряны, сбрасываем все контексты
+        resume_contexts.invalidate(resume_id)
+        wake_event.set()
+
+    async def release_leases(resume_ids: List[UUID]) -> None:
+        """Освободить аренду резюме, не прерывая работу при ошибке БД."""
+        try:
+            await lease_repository.release(owner, resume_ids)
+        except Exception as exc:
+            logger.warning(f"Не удалось освободить аренду резюме {resume_ids}: {exc}")
+
+    async def heartbeat_leases() -> None:
+        """Продлевать аренду резюме в обработке и останавливать задачи, аренду которых потеряли."""
+        interval = max(lease_seconds / 3, 1.0)
+        last_renewed_at = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            held_ids = [resume_id for resume_id, task in active_tasks.items() if not task.done()]
+            if not held_ids:
+                last_renewed_at = time.monotonic()
+                continue
+            try:
+                renewed_ids = await lease_repository.renew(owner, held_ids, lease_seconds)
+            except Exception as exc:
+                logger.warning(f"Не удалось продлить аренду резюме: {exc}")
+                if time.monotonic() - last_renewed_at < lease_seconds:
+                    continue
+                # Аренда уже могла истечь и достаться другому процессу
+                renewed_ids = set()
+            else:
+                last_renewed_at = time.monotonic()
+            for resume_id in held_ids:
+                task = active_tasks.get(resume_id)
+                if resume_id not in renewed_ids and task is not None and not task.done():
+                    logger.warning(f"Аренда резюме {resume_id} потеряна, останавливаем его обработку")
+                    task.cancel()
+
     async def process_resume_task(resume_id: UUID, resume_data) -> None:
         """Обработать одно резюме в отдельной задаче.
         
@@ -149,6 +270,13 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
                     standalone_cookies_uow_factory=lambda: create_unit_of_work(config.database),
                     max_vacancies_per_resume=200,
                     delay_between_replies_seconds=30,
+                    reply_scheduler=reply_scheduler,
+                    prepare_lookahead=config.hh.reply_prepare_lookahead,
+                    discovery_watermarks=discovery_watermarks,
+                    discovery_wave_pages=config.hh.discovery_wave_pages,
+                    handled_vacancies=handled_vacancies,
+                    resume_contexts=resume_contexts,
+                    response_quota=response_quota,
                 )
                 
                 # Обрабатываем только это резюме
@@ -164,60 +292,80 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
         finally:
             # Удаляем задачу из словаря активных задач
             active_tasks.pop(resume_id, None)
+            ACTIVE_RESUME_TASKS.set(len(active_tasks))
+            await release_leases([resume_id])
+            # Резюме снова станет доступно для захвата: проверим его после паузы
+            asyncio.get_running_loop().call_later(resume_cooldown_seconds, wake_event.set)
             logger.info(f"Задача для резюме {resume_id} завершена и удалена из активных")
 
     # Основной цикл работы
-    cycle_delay_seconds = 10  # 10 секунд между циклами
+    cycle_delay_seconds = 10  # Опрос каждые 10 секунд, если лента изменений недоступна
+
+    heartbeat_task = asyncio.create_task(heartbeat_leases())
+    change_feed_task = (
+        asyncio.create_task(change_feed.run(on_auto_reply_change, shutdown_event))
+        if change_feed is not None
+        else None
+    )
 
     try:
         while not shutdown_event.is_set():
+            # Уведомления, пришедшие во время цикла, запустят следующий цикл
+            wake_event.clear()
             try:
-                # Получаем список резюме с автооткликом
+                # Сначала очищаем завершенные задачи из словаря
+                completed_resume_ids = [
+                    resume_id 
+                    for resume_id, task in active_tasks.items() 
+                    if task.done()
+                ]
+                for resume_id in completed_resume_ids:
+                    active_tasks.pop(resume_id, None)
+                    logger.debug(f"Удалена завершенная задача для резюме {resume_id}")
+
+                # Захватываем свободные резюме с автооткликом в пределах емкости процесса
+                capacity = max_resumes - len(active_tasks)
+                claimed_ids = await lease_repository.claim(owner, capacity, lease_seconds)
+                logger.info(
+                    f"Захвачено резюме с автооткликом: {len(claimed_ids)}, "
+                    f"свободных слотов было: {max(capacity, 0)}"
+                )
+
+                unstarted_ids: List[UUID] = []
+                new_tasks_count = 0
                 unit_of_work = create_unit_of_work(config.database)
                 async with unit_of_work:
-                    resumes = await unit_of_work.resume_repository.get_all_active_auto_reply_resumes()
-                    logger.info(f"Найдено резюме с автооткликом: {len(resumes)}")
-
-                    # Сначала очищаем завершенные задачи из словаря
-                    completed_resume_ids = [
-                        resume_id 
-                        for resume_id, task in active_tasks.items() 
-                        if task.done()
-                    ]
-                    for resume_id in completed_resume_ids:
-                        active_tasks.pop(resume_id, None)
-                        logger.debug(f"Удалена завершенная задача для резюме {resume_id}")
-
-                    # Проверяем shutdown_event перед запуском новых задач
-                    if shutdown_event.is_set():
-                        logger.info("Получен сигнал завершения, не запускаем новые задачи")
-                        break
-
-                    # Запускаем задачи только для резюме, у которых еще нет активной задачи
-                    new_tasks_count = 0
-                    for resume in resumes:
+                    for resume_id in claimed_ids:
+                        # Проверяем shutdown_event перед запуском новых задач
                         if shutdown_event.is_set():
                             logger.info("Получен сигнал завершения, прерываем запуск задач")
-                            break
-                        if resume.id not in active_tasks:
-                            # Создаем новую задачу для этого резюме
-                            task = asyncio.create_task(process_resume_task(resume.id, resume))
-                            active_tasks[resume.id] = task
-                            new_tasks_count += 1
-                            logger.info(f"Запущена задача для резюме {resume.id}")
-                        else:
+                            unstarted_ids.append(resume_id)
+                            continue
+                        if resume_id in active_tasks:
                             logger.debug(
-                                f"Для резюме {resume.id} уже есть активная задача, пропускаем"
+                                f"Для резюме {resume_id} уже есть активная задача, пропускаем"
                             )
-
-                    logger.info(
-                        f"Запущено новых задач: {new_tasks_count}, "
-                        f"активных задач: {len(active_tasks)}"
-                    )
-
+                            continue
+                        resume = await unit_of_work.resume_repository.get_by_id(resume_id)
+                        if resume is None or not resume.is_auto_reply:
+                            unstarted_ids.append(resume_id)
+                            continue
+                        # Создаем новую задачу для этого резюме
+                        task = asyncio.create_task(process_resume_task(resume.id, resume))
+                        active_tasks[resume.id] = task
+                        new_tasks_count += 1
+                        logger.info(f"Запущена задача для резюме {resume.id}")
+
+                if unstarted_ids:
+                    await release_leases(unstarted_ids)
+
+                ACTIVE_RESUME_TASKS.set(len(active_tasks))
                 logger.info(
-                    f"Цикл проверки завершен. Ожидание {cycle_delay_seconds} секунд до следующего цикла..."
+                    f"Запущено новых задач: {new_tasks_count}, "
+                    f"активных задач: {len(active_tasks)}"
                 )
+
+                logger.info("Цикл проверки завершен")
             except Exception as exc:
                 logger.error(
                     f"Ошибка в цикле обработки автооткликов: {exc}",
@@ -225,17 +373,13 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
                 )
                 # Продолжаем работу даже при ошибке
 
-            # Ожидание до следующего цикла или сигнала завершения
-            try:
-                await asyncio.wait_for(
-                    shutdown_event.wait(),
-                    timeout=cycle_delay_seconds,
-                )
-                # Если событие установлено, выходим из цикла
-                break
-            except asyncio.TimeoutError:
-                # Таймаут истек, продолжаем цикл
-                continue
+            # Ожидание изменений, освобождения резюме или сверки; без ленты — обычный опрос
+            if change_feed is not None and change_feed.is_listening:
+                wait_seconds = reconcile_seconds
+            else:
+                wait_seconds = cycle_delay_seconds
+            logger.info(f"Ожидание изменений (не дольше {wait_seconds} секунд)...")
+            await _wait_for_wake(shutdown_event, wake_event, wait_seconds)
 
     except KeyboardInterrupt:
         logger.info("Получен сигнал прерывания (Ctrl+C)")
@@ -244,6 +388,9 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
         raise
     finally:
         logger.info("Воркер завершает работу. Отмена всех задач...")
+        heartbeat_task.cancel()
+        if change_feed_task is not None:
+            change_feed_task.cancel()
         
         try:
             current_task = asyncio.current_task()
@@ -271,12 +418,22 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
                 logger.info("Нет активных задач для отмены")
         except Exception as exc:
             logger.error(f"Ошибка при завершении воркера: {exc}", exc_info=True)
+
+        # Задачи, прерванные по таймауту, не успели освободить аренду сами
+        if active_tasks:
+            await release_leases(list(active_tasks))
+        # Неиспользованные зарезервированные отклики возвращаются в лимит пользователей
+        await response_quota.close()
             
         logger.info("Воркер завершил работу")
 
 
-async def main() -> None:
-    """Главная функция воркера (используется при запуске как отдельного процесса)."""
+async def main(process_index: int = 0) -> None:
+    """Главная функция воркера (используется при запуске как отдельного процесса).
+
+    Args:
+        process_index: Номер процесса среди запущенных run_processes (сдвиг порта метрик).
+    """
     # Получаем текущий event loop
     loop = asyncio.get_running_loop()
     
@@ -285,13 +442,78 @@ async def main() -> None:
 
     # Загружаем конфигурацию
     config = load_config()
+    configure_hh_connection_pool(config.hh)
+    configure_hh_rate_limiter(config.hh)
+    configure_openai_client_registry(config.openai)
+    front_version_task = asyncio.create_task(
+        get_hh_front_build_version_refresher().run(shutdown_event)
+    )
+    # Вне API у процесса свой /metrics: у каждого процесса свой порт
+    metrics_server = None
+    if config.worker.auto_reply_metrics_port > 0:
+        metrics_server = await start_metrics_server(
+            config.worker.metrics_host, config.worker.auto_reply_metrics_port + process_index
+        )
 
     try:
         await run_worker(config, shutdown_event)
     except Exception as exc:
         logger.error(f"Критическая ошибка: {exc}", exc_info=True)
         sys.exit(1)
+    finally:
+        front_version_task.cancel()
+        if metrics_server is not None:
+            metrics_server.close()
+        await close_hh_connection_pool()
+        await close_openai_client_registry()
+
+
+def _run_process(process_index: int) -> None:
+    """Точка входа дочернего процесса воркера."""
+    asyncio.run(main(process_index))
+
+
+def run_processes(count: int) -> None:
+    """Запустить count независимых процессов воркера и дождаться их завершения.
+
+    Процессы не пересекаются по резюме благодаря аренде в БД. SIGINT и SIGTERM
+    родителя пересылаются дочерним процессам как SIGTERM (мягкая остановка).
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_run_process, args=(index,), name=f"auto-reply-worker-{index + 1}"
+        )
+        for index in range(count)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Запущено процессов воркера автооткликов: {count}")
+
+    def forward_signal(signum: int, frame) -> None:
+        logger.info(f"Получен сигнал {signum}, останавливаем процессы воркера...")
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGINT, forward_signal)
+    signal.signal(signal.SIGTERM, forward_signal)
+    for process in processes:
+        process.join()
+    logger.info("Все процессы воркера автооткликов завершены")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Воркер автооткликов")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Количество процессов (по умолчанию AUTO_REPLY_WORKER_PROCESSES)",
+    )
+    args = parser.parse_args()
+    processes_count = args.processes or load_config().worker.auto_reply_processes
+    if processes_count > 1:
+        run_processes(processes_count)
+    else:
+        asyncio.run(main())
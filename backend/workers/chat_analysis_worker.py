@@ -36,8 +36,20 @@ from domain.use_cases.send_chat_message import SendChatMessageUseCase
 from domain.use_cases.mark_agent_action_as_sent import MarkAgentActionAsSentUseCase
 from infrastructure.agents.messages_agent import MessagesAgent
 from infrastructure.clients.hh_client import HHHttpClient
+from infrastructure.clients.hh_connection_pool import (
+    close_hh_connection_pool,
+    configure_hh_connection_pool,
+)
+from infrastructure.clients.hh_front_version import get_hh_front_build_version_refresher
+from infrastructure.clients.hh_rate_limiter import configure_hh_rate_limiter
+from infrastructure.clients.openai_client_registry import (
+    close_openai_client_registry,
+    configure_openai_client_registry,
+)
 from infrastructure.database.session import create_session_factory
 from infrastructure.database.unit_of_work import UnitOfWork
+from infrastructure.metrics.registry import set_metrics_worker
+from infrastructure.scheduling.llm_scheduler import LlmPriority, set_llm_priority
 
 # Настройка loguru
 logger.add(
@@ -433,6 +445,8 @@ async def run_worker(config: AppConfig, shutdown_event: asyncio.Event | None = N
         shutdown_event = globals()["shutdown_event"]
     
     logger.info("Запуск воркера анализа чатов")
+    set_metrics_worker("chat_analysis")
+    set_llm_priority(LlmPriority.CHAT)
     
     # Интервал между циклами (в секундах)
     cycle_delay_seconds = 60  # 1 минута между циклами
@@ -481,12 +495,22 @@ async def main() -> None:
     
     # Загружаем конфигурацию
     config = load_config()
+    configure_hh_connection_pool(config.hh)
+    configure_hh_rate_limiter(config.hh)
+    configure_openai_client_registry(config.openai)
+    front_version_task = asyncio.create_task(
+        get_hh_front_build_version_refresher().run(shutdown_event)
+    )
     
     try:
         await run_worker(config, shutdown_event)
     except Exception as exc:
         logger.error(f"Критическая ошибка: {exc}", exc_info=True)
         sys.exit(1)
+    finally:
+        front_version_task.cancel()
+        await close_hh_connection_pool()
+        await close_openai_client_registry()
 
 
 if __name__ == "__main__":